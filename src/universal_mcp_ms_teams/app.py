@@ -1,13 +1,480 @@
-from typing import Any, Optional, List
+import os
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Optional
+
+import httpx
 from universal_mcp.applications import APIApplication
 from universal_mcp.integrations import Integration
+from universal_mcp.stores import BaseStore, MemoryStore
+
+from universal_mcp_ms_teams.batch import MAX_BATCH_SIZE, Batch
+from universal_mcp_ms_teams.broadcast import Broadcast, PostLimiter
+from universal_mcp_ms_teams.cache import ResponseCache
+from universal_mcp_ms_teams.coalescing import RequestCoalescer
+from universal_mcp_ms_teams.credentials import (
+    DEFAULT_TOKEN_CACHE,
+    TokenCache,
+    principal_of,
+)
+from universal_mcp_ms_teams.delta import (
+    DELTA_LINK,
+    SyncState,
+    advance_watermark,
+    summarize,
+    watermark_filter,
+    watermark_of,
+)
+from universal_mcp_ms_teams.downloads import (
+    DEFAULT_CONCURRENCY as DOWNLOAD_CONCURRENCY,
+)
+from universal_mcp_ms_teams.downloads import (
+    Downloader,
+    attachment_download,
+    hosted_content_download,
+)
+from universal_mcp_ms_teams.idempotency import DONE, IdempotencyKeys, fingerprint
+from universal_mcp_ms_teams.instrumentation import Instrumentation, current_trace
+from universal_mcp_ms_teams.pagination import PageIterator, StreamingPageIterator
+from universal_mcp_ms_teams.projection import (
+    DEFAULT_PROFILE,
+    PROFILES,
+    Projection,
+    projection_for,
+)
+from universal_mcp_ms_teams.request import GraphRequest, current_interceptor
+from universal_mcp_ms_teams.resolvers import NameResolver
+from universal_mcp_ms_teams.streaming import CollectionDecoder
+from universal_mcp_ms_teams.threads import (
+    DEFAULT_CONCURRENCY as THREAD_CONCURRENCY,
+)
+from universal_mcp_ms_teams.threads import (
+    ThreadFetcher,
+)
+from universal_mcp_ms_teams.throttling import ThrottleScheduler
+from universal_mcp_ms_teams.topology import TopologyCache
+from universal_mcp_ms_teams.uploads import Uploader, file_message, upload_name
+
+if TYPE_CHECKING:
+    # Annotation only, so apps without a message index never load sqlite3.
+    from universal_mcp_ms_teams.message_index import MessageIndex
+
+DEFAULT_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+
 
 class MsTeamsApp(APIApplication):
-    def __init__(self, integration: Integration = None, **kwargs) -> None:
-        super().__init__(name='microsoft-teams', integration=integration, **kwargs)
+    def __init__(
+        self,
+        integration: Integration = None,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+        throttle: ThrottleScheduler | None = None,
+        cache: ResponseCache | None = None,
+        state_store: BaseStore | None = None,
+        instrumentation: Instrumentation | None = None,
+        projection: str = DEFAULT_PROFILE,
+        idempotency_store: BaseStore | None = None,
+        index: Optional["MessageIndex"] = None,
+        warm_topology: bool = False,
+        token_cache: TokenCache | None = None,
+        coalesce: bool = True,
+        **kwargs,
+    ) -> None:
+        super().__init__(name="microsoft-teams", integration=integration, **kwargs)
         self.base_url = "https://graph.microsoft.com/v1.0"
+        self.limits = limits or DEFAULT_LIMITS
+        self.http2 = http2
+        # Pass one scheduler to every app of a tenant so they share its rate limit.
+        self.throttle = throttle or ThrottleScheduler()
+        self.cache = cache
+        # Concurrent identical GETs, e.g. from several sessions listing the same team's
+        # channels, share one request.
+        self.coalescer = RequestCoalescer() if coalesce else None
+        self.sync_state = SyncState(state_store or MemoryStore())
+        self.instrumentation = instrumentation
+        # Shared by every broadcast so concurrent calls do not flood the same
+        # conversation.
+        self.post_limiter = PostLimiter()
+        self.idempotency = IdempotencyKeys(idempotency_store or MemoryStore())
+        # Optional local full-text index fed with every message the tools fetch.
+        self.index = index
+        # Profile used by tools called without `profile`; see `projection.PROFILES`.
+        if projection not in PROFILES:
+            raise ValueError(
+                f"Unknown projection profile '{projection}'; expected one of {', '.join(PROFILES)}."
+            )
+        self.projection = projection
+        self._client: httpx.Client | None = None
+        # Access tokens are reused across requests, and across apps sharing an
+        # integration, until shortly before they expire.
+        self.tokens = token_cache or DEFAULT_TOKEN_CACHE
+        # Teams, channels and chats by id and name; built on first use unless warmed
+        # now.
+        self.topology = TopologyCache(self)
+        # Lets the write tools take display names, chat topics and email addresses
+        # instead of ids.
+        self.resolver = NameResolver(self)
+        if warm_topology:
+            self.topology.warm_in_background()
+
+    @property
+    def client(self) -> httpx.Client:
+        """Long-lived pooled client shared by every tool call, so connections are reused across requests."""
+        if self._client is None:
+            self._client = httpx.Client(
+                timeout=self.default_timeout, limits=self.limits, http2=self.http2
+            )
+        return self._client
+
+    def close(self) -> None:
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    def _get(self, url: str, params: dict[str, Any] | None = None) -> httpx.Response:
+        return self._request(GraphRequest("GET", url, params=params))
+
+    def _post(
+        self,
+        url: str,
+        data: Any,
+        params: dict[str, Any] | None = None,
+        content_type: str = "application/json",
+        files: dict[str, Any] | None = None,
+    ) -> httpx.Response:
+        return self._request(
+            GraphRequest(
+                "POST",
+                url,
+                params=params,
+                data=data,
+                content_type=content_type,
+                files=files,
+            )
+        )
+
+    def _put(
+        self,
+        url: str,
+        data: Any,
+        params: dict[str, Any] | None = None,
+        content_type: str = "application/json",
+        files: dict[str, Any] | None = None,
+    ) -> httpx.Response:
+        return self._request(
+            GraphRequest(
+                "PUT",
+                url,
+                params=params,
+                data=data,
+                content_type=content_type,
+                files=files,
+            )
+        )
+
+    def _patch(
+        self, url: str, data: Any, params: dict[str, Any] | None = None
+    ) -> httpx.Response:
+        return self._request(GraphRequest("PATCH", url, params=params, data=data))
+
+    def _delete(self, url: str, params: dict[str, Any] | None = None) -> httpx.Response:
+        return self._request(GraphRequest("DELETE", url, params=params))
+
+    def _request(self, request: GraphRequest) -> httpx.Response:
+        # Batching and other deferred execution modes take over the request here.
+        interceptor = current_interceptor()
+        if interceptor is not None:
+            return interceptor(request)
+        if self.cache is not None:
+            return self.cache.fetch(request, self._cache_identity, self._coalesce)
+        return self._coalesce(request)
+
+    def _coalesce(self, request: GraphRequest) -> httpx.Response:
+        if self.coalescer is None:
+            return self._execute(request)
+        return self.coalescer.fetch(request, self._cache_identity, self._execute)
+
+    def _get_headers(self) -> dict[str, str]:
+        if not self.integration:
+            return {}
+        return self.tokens.headers(self.integration)
+
+    def _cache_identity(self) -> str:
+        # Entries are scoped to the caller's user so apps sharing a cache never see each
+        # other's data.
+        return principal_of(self._get_headers().get("Authorization", ""))
+
+    def _execute(self, request: GraphRequest) -> httpx.Response:
+        if self.instrumentation is None:
+            return self.throttle.execute(request, self._send_authorized)
+        return self.instrumentation.observe(
+            request,
+            lambda request: self.throttle.execute(
+                request, self._send_authorized, trace=current_trace()
+            ),
+        )
+
+    def _send_authorized(self, request: GraphRequest) -> httpx.Response:
+        response = self._send(request)
+        if (
+            response.status_code != httpx.codes.UNAUTHORIZED
+            or not self.integration
+            or not request.authorize
+        ):
+            return response
+        # The cached token was revoked or expired early: fetch a new one and send once
+        # more.
+        rejected = response.request.headers.get("Authorization")
+        response.close()
+        self.tokens.invalidate(self.integration, rejected)
+        return self._send(request)
+
+    def _send(self, request: GraphRequest) -> httpx.Response:
+        kwargs = request.send_kwargs()
+        headers = {
+            **(self._get_headers() if request.authorize else {}),
+            **kwargs.pop("headers", {}),
+        }
+        if request.stream:
+            return self.client.send(
+                self.client.build_request(
+                    request.method, request.url, headers=headers, **kwargs
+                ),
+                stream=True,
+            )
+        return self.client.request(
+            request.method, request.url, headers=headers, **kwargs
+        )
+
+    def batch(self, max_batch_size: int = MAX_BATCH_SIZE) -> Batch:
+        """
+        Starts a JSON `$batch` that groups calls to this app's tools into envelopes of up
+        to 20 Graph requests. See `Batch` for usage.
+        """
+        return Batch(self, max_batch_size=max_batch_size)
+
+    def _get_page(
+        self, url: str, params: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        response = self._get(url, params=params)
+        return self._handle_response(response)
 
-    def list_chats(self, top: Optional[int] = None, skip: Optional[int] = None, search: Optional[str] = None, filter: Optional[str] = None, count: Optional[bool] = None, orderby: Optional[List[str]] = None, select: Optional[List[str]] = None, expand: Optional[List[str]] = None) -> dict[str, Any]:
+    @contextmanager
+    def _open_stream(
+        self, url: str, params: dict[str, Any] | None = None
+    ) -> Iterator[CollectionDecoder]:
+        response = self._request(GraphRequest("GET", url, params=params, stream=True))
+        try:
+            if response.is_error:
+                response.read()
+            response.raise_for_status()
+            yield CollectionDecoder(response.iter_bytes())
+        finally:
+            response.close()
+
+    def _paginate(
+        self,
+        url: str,
+        params: dict[str, Any] | None = None,
+        max_items: int | None = None,
+        max_pages: int | None = None,
+        projection: Projection | None = None,
+        stream: bool = False,
+        scope: dict[str, str] | None = None,
+    ) -> PageIterator:
+        # `scope` names the chat or channel whose messages are being listed, for the
+        # local index.
+        trims = projection is not None and projection.trims
+        indexed = scope is not None and self.index is not None
+        if stream:
+
+            def transform(item: Any) -> Any:
+                if indexed:
+                    self.index.add([item], **scope)
+                return projection.shape(item) if trims else item
+
+            return StreamingPageIterator(
+                self._open_stream,
+                url,
+                params,
+                max_items=max_items,
+                max_pages=max_pages,
+                transform=transform if trims or indexed else None,
+            )
+        if not trims and not indexed:
+            return PageIterator(
+                self._get_page, url, params, max_items=max_items, max_pages=max_pages
+            )
+
+        def fetch(url: str, params: dict[str, Any] | None) -> dict[str, Any]:
+            page = self._indexed(self._get_page(url, params), **(scope or {}))
+            return projection.apply(page) if trims else page
+
+        return PageIterator(
+            fetch, url, params, max_items=max_items, max_pages=max_pages
+        )
+
+    def _handle_response(self, response: httpx.Response) -> dict[str, Any]:
+        # Responses that went through the cache carry its entry, which parses the body
+        # only once.
+        entry = getattr(response, "cache_entry", None)
+        if entry is not None and response.is_success:
+            try:
+                return entry.json()
+            except ValueError:
+                pass
+        return super()._handle_response(response)
+
+    def _indexed(self, payload: Any, **scope: str) -> Any:
+        """Adds the messages of a page (or a single message) to the local index, if any, and returns it."""
+        if self.index is not None and scope and isinstance(payload, dict):
+            self.index.add(
+                payload["value"]
+                if isinstance(payload.get("value"), list)
+                else [payload],
+                **scope,
+            )
+        return payload
+
+    def _projection(
+        self,
+        entity_type: str,
+        profile: str | None,
+        select: Any | None = None,
+        expand: Any | None = None,
+    ) -> Projection:
+        return projection_for(entity_type, profile or self.projection, select, expand)
+
+    def _post_message(
+        self,
+        url: str,
+        payload: dict[str, Any],
+        idempotency_key: str | None = None,
+        request_fingerprint: str | None = None,
+    ) -> dict[str, Any]:
+        # Inside a batch the post is only captured, so there is no outcome to record.
+        if idempotency_key is None or current_interceptor() is not None:
+            response = self._post(url, data=payload)
+            return self._handle_response(response)
+        request_fingerprint = request_fingerprint or fingerprint(url, payload)
+        with self.idempotency.lock(idempotency_key):
+            replayed = self._replay_posted(
+                url, payload, idempotency_key, request_fingerprint
+            )
+            if replayed is not None:
+                return replayed
+            started_at = time.time()
+            self.idempotency.pending(idempotency_key, request_fingerprint, started_at)
+            # A post that timed out or failed with 5xx may still have been accepted, so
+            # look for it before posting again. The key stays pending while in doubt.
+            policy = self.throttle.retry
+            attempt = 0
+            while True:
+                try:
+                    response = self._post(url, data=payload)
+                except httpx.TransportError:
+                    if attempt >= policy.max_retries:
+                        raise
+                    response = None
+                else:
+                    if response.is_success:
+                        return self.idempotency.complete(
+                            idempotency_key,
+                            request_fingerprint,
+                            self._handle_response(response),
+                        )["result"]
+                    if response.status_code < httpx.codes.INTERNAL_SERVER_ERROR:
+                        self.idempotency.discard(idempotency_key)
+                    if (
+                        response.status_code < httpx.codes.INTERNAL_SERVER_ERROR
+                        or attempt >= policy.max_retries
+                    ):
+                        return self._handle_response(response)
+                self.throttle.wait_before_retry(attempt, response)
+                posted = self._find_posted(url, payload, started_at)
+                if posted is not None:
+                    return self.idempotency.complete(
+                        idempotency_key, request_fingerprint, posted
+                    )["result"]
+                attempt += 1
+
+    def _replay_posted(
+        self,
+        url: str,
+        payload: dict[str, Any],
+        idempotency_key: str,
+        request_fingerprint: str,
+    ) -> dict[str, Any] | None:
+        """Returns the message an earlier post with `idempotency_key` created, or None if it has to be posted (again)."""
+        record = self._idempotency_record(idempotency_key, request_fingerprint)
+        if record is None:
+            return None
+        if record["state"] == DONE:
+            return record["result"]
+        posted = self._find_posted(url, payload, record["started_at"])
+        if posted is None:
+            return None
+        return self.idempotency.complete(idempotency_key, request_fingerprint, posted)[
+            "result"
+        ]
+
+    def _idempotency_record(
+        self, idempotency_key: str, request_fingerprint: str
+    ) -> dict[str, Any] | None:
+        record = self.idempotency.get(idempotency_key)
+        if record is not None and record["fingerprint"] != request_fingerprint:
+            raise ValueError(
+                f"Idempotency key '{idempotency_key}' was already used for a different message."
+            )
+        return record
+
+    def _find_posted(
+        self, url: str, payload: dict[str, Any], since: float
+    ) -> dict[str, Any] | None:
+        """Finds the message an earlier attempt of an ambiguous post created, if any."""
+        try:
+            page = self._handle_response(self._get(url, params={"$top": 20}))
+        except httpx.HTTPError:
+            return None
+        content = payload["body"]["content"]
+        for message in page.get("value", []):
+            created = message.get("createdDateTime")
+            # Allow for clock skew between this host and Graph.
+            if (
+                (message.get("body") or {}).get("content") == content
+                and created
+                and datetime.fromisoformat(created.replace("Z", "+00:00")).timestamp()
+                >= since - 60
+            ):
+                return message
+        return None
+
+    def _drain_delta(
+        self, url: str, params: dict[str, Any] | None = None
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        items: list[dict[str, Any]] = []
+        page: dict[str, Any] = {}
+        for page in self._paginate(url, params).iter_pages():
+            items.extend(page.get("value", []))
+        return items, page.get(DELTA_LINK)
+
+    def list_chats(
+        self,
+        top: int | None = None,
+        skip: int | None = None,
+        search: str | None = None,
+        filter: str | None = None,
+        count: bool | None = None,
+        orderby: list[str] | None = None,
+        select: list[str] | None = None,
+        expand: list[str] | None = None,
+        profile: str | None = None,
+        all: bool = False,
+        max_items: int | None = None,
+        max_pages: int | None = None,
+    ) -> dict[str, Any]:
         """
         List chats
 
@@ -20,6 +487,10 @@ class MsTeamsApp(APIApplication):
             orderby (array): Order items by property values
             select (array): Select properties to be returned
             expand (array): Expand related entities
+            profile (string): Projection profile, one of 'minimal', 'summary' or 'full'; fills in select/expand and trims the result
+            all (boolean): Follow '@odata.nextLink' and return every page as one collection
+            max_items (integer): With 'all', stop after this many items; a result cut short carries 'truncated'
+            max_pages (integer): With 'all', stop after this many pages
 
         Returns:
             dict[str, Any]: Retrieved collection
@@ -31,10 +502,92 @@ class MsTeamsApp(APIApplication):
             chats.chat, important
         """
         url = f"{self.base_url}/chats"
-        query_params = {k: v for k, v in [('$top', top), ('$skip', skip), ('$search', search), ('$filter', filter), ('$count', count), ('$orderby', orderby), ('$select', select), ('$expand', expand)] if v is not None}
+        projection = self._projection("chat", profile, select, expand)
+        query_params = {
+            k: v
+            for k, v in [
+                ("$top", top),
+                ("$skip", skip),
+                ("$search", search),
+                ("$filter", filter),
+                ("$count", count),
+                ("$orderby", orderby),
+                ("$select", projection.select(select)),
+                ("$expand", projection.expand(expand)),
+            ]
+            if v is not None
+        }
+        if all:
+            return self._paginate(
+                url,
+                query_params,
+                max_items=max_items,
+                max_pages=max_pages,
+                projection=projection,
+            ).collect()
         response = self._get(url, params=query_params)
-        return self._handle_response(response)
-    
+        return projection.apply(self._handle_response(response))
+
+    def iter_chats(
+        self,
+        top: int | None = None,
+        skip: int | None = None,
+        search: str | None = None,
+        filter: str | None = None,
+        count: bool | None = None,
+        orderby: list[str] | None = None,
+        select: list[str] | None = None,
+        expand: list[str] | None = None,
+        profile: str | None = None,
+        max_items: int | None = None,
+        max_pages: int | None = None,
+    ) -> PageIterator:
+        """
+        List chats, lazily following '@odata.nextLink' across pages
+
+        Args:
+            top (integer): Page size requested from the server Example: '50'.
+            skip (integer): Skip the first n items
+            search (string): Search items by search phrases
+            filter (string): Filter items by property values
+            count (boolean): Include count of items
+            orderby (array): Order items by property values
+            select (array): Select properties to be returned
+            expand (array): Expand related entities
+            profile (string): Projection profile, one of 'minimal', 'summary' or 'full'; fills in select/expand and trims the result
+            max_items (integer): Stop after yielding this many items
+            max_pages (integer): Stop after fetching this many pages
+
+        Returns:
+            PageIterator: Iterable of collection items; pages are fetched on demand
+
+        Raises:
+            HTTPStatusError: Raised when the API request fails with detailed error information including status code and response body.
+        """
+        url = f"{self.base_url}/chats"
+        projection = self._projection("chat", profile, select, expand)
+        query_params = {
+            k: v
+            for k, v in [
+                ("$top", top),
+                ("$skip", skip),
+                ("$search", search),
+                ("$filter", filter),
+                ("$count", count),
+                ("$orderby", orderby),
+                ("$select", projection.select(select)),
+                ("$expand", projection.expand(expand)),
+            ]
+            if v is not None
+        }
+        return self._paginate(
+            url,
+            query_params,
+            max_items=max_items,
+            max_pages=max_pages,
+            projection=projection,
+        )
+
     def get_joined_teams(self) -> list[dict[str, Any]]:
         """
         Fetches a list of the Microsoft Teams the user has joined.
@@ -54,7 +607,22 @@ class MsTeamsApp(APIApplication):
         # The API returns the list of teams under the "value" key.
         return data.get("value", [])
 
-    def list_channels_for_team(self, team_id: str, top: Optional[int] = None, skip: Optional[int] = None, search: Optional[str] = None, filter: Optional[str] = None, count: Optional[bool] = None, orderby: Optional[List[str]] = None, select: Optional[List[str]] = None, expand: Optional[List[str]] = None) -> dict[str, Any]:
+    def list_channels_for_team(
+        self,
+        team_id: str,
+        top: int | None = None,
+        skip: int | None = None,
+        search: str | None = None,
+        filter: str | None = None,
+        count: bool | None = None,
+        orderby: list[str] | None = None,
+        select: list[str] | None = None,
+        expand: list[str] | None = None,
+        profile: str | None = None,
+        all: bool = False,
+        max_items: int | None = None,
+        max_pages: int | None = None,
+    ) -> dict[str, Any]:
         """
         List channels
 
@@ -68,6 +636,10 @@ class MsTeamsApp(APIApplication):
             orderby (array): Order items by property values
             select (array): Select properties to be returned
             expand (array): Expand related entities
+            profile (string): Projection profile, one of 'minimal', 'summary' or 'full'; fills in select/expand and trims the result
+            all (boolean): Follow '@odata.nextLink' and return every page as one collection
+            max_items (integer): With 'all', stop after this many items; a result cut short carries 'truncated'
+            max_pages (integer): With 'all', stop after this many pages
 
         Returns:
             dict[str, Any]: Retrieved collection
@@ -81,80 +653,232 @@ class MsTeamsApp(APIApplication):
         if team_id is None:
             raise ValueError("Missing required parameter 'team-id'.")
         url = f"{self.base_url}/teams/{team_id}/channels"
-        query_params = {k: v for k, v in [('$top', top), ('$skip', skip), ('$search', search), ('$filter', filter), ('$count', count), ('$orderby', orderby), ('$select', select), ('$expand', expand)] if v is not None}
+        projection = self._projection("channel", profile, select, expand)
+        query_params = {
+            k: v
+            for k, v in [
+                ("$top", top),
+                ("$skip", skip),
+                ("$search", search),
+                ("$filter", filter),
+                ("$count", count),
+                ("$orderby", orderby),
+                ("$select", projection.select(select)),
+                ("$expand", projection.expand(expand)),
+            ]
+            if v is not None
+        }
+        if all:
+            return self._paginate(
+                url,
+                query_params,
+                max_items=max_items,
+                max_pages=max_pages,
+                projection=projection,
+            ).collect()
         response = self._get(url, params=query_params)
-        return self._handle_response(response)
+        return projection.apply(self._handle_response(response))
+
+    def iter_channels_for_team(
+        self,
+        team_id: str,
+        top: int | None = None,
+        skip: int | None = None,
+        search: str | None = None,
+        filter: str | None = None,
+        count: bool | None = None,
+        orderby: list[str] | None = None,
+        select: list[str] | None = None,
+        expand: list[str] | None = None,
+        profile: str | None = None,
+        max_items: int | None = None,
+        max_pages: int | None = None,
+    ) -> PageIterator:
+        """
+        List channels, lazily following '@odata.nextLink' across pages
 
-    def send_chat_message(self, chat_id: str, content: str) -> dict[str, Any]:
+        Args:
+            team_id (string): team-id
+            top (integer): Page size requested from the server Example: '50'.
+            skip (integer): Skip the first n items
+            search (string): Search items by search phrases
+            filter (string): Filter items by property values
+            count (boolean): Include count of items
+            orderby (array): Order items by property values
+            select (array): Select properties to be returned
+            expand (array): Expand related entities
+            profile (string): Projection profile, one of 'minimal', 'summary' or 'full'; fills in select/expand and trims the result
+            max_items (integer): Stop after yielding this many items
+            max_pages (integer): Stop after fetching this many pages
+
+        Returns:
+            PageIterator: Iterable of collection items; pages are fetched on demand
+
+        Raises:
+            HTTPStatusError: Raised when the API request fails with detailed error information including status code and response body.
+        """
+        if team_id is None:
+            raise ValueError("Missing required parameter 'team-id'.")
+        url = f"{self.base_url}/teams/{team_id}/channels"
+        projection = self._projection("channel", profile, select, expand)
+        query_params = {
+            k: v
+            for k, v in [
+                ("$top", top),
+                ("$skip", skip),
+                ("$search", search),
+                ("$filter", filter),
+                ("$count", count),
+                ("$orderby", orderby),
+                ("$select", projection.select(select)),
+                ("$expand", projection.expand(expand)),
+            ]
+            if v is not None
+        }
+        return self._paginate(
+            url,
+            query_params,
+            max_items=max_items,
+            max_pages=max_pages,
+            projection=projection,
+        )
+
+    def send_chat_message(
+        self, chat_id: str, content: str, idempotency_key: str | None = None
+    ) -> dict[str, Any]:
         """
         Sends a message to a specific chat.
 
         Args:
-            chat_id: The unique identifier of the chat.
+            chat_id: The unique identifier of the chat, or its topic.
             content: The message content to send (can be plain text or HTML).
+            idempotency_key: Optional key identifying this post; retries with the same key return the original message instead of posting again.
 
         Returns:
             A dictionary containing the API response for the sent message, including its ID.
 
         Raises:
             httpx.HTTPStatusError: If the API request fails due to invalid ID, permissions, etc.
+            ValueError: If the topic matches no chat or several chats.
 
         Tags:
             create, send, message, chat, microsoft-teams, api, important
         """
+        chat_id = self.resolver.chat(chat_id)
         url = f"{self.base_url}/chats/{chat_id}/messages"
         payload = {"body": {"content": content}}
-        response = self._post(url, data=payload)
-        return self._handle_response(response)
-
-    def send_channel_message(self, team_id: str, channel_id: str, content: str) -> dict[str, Any]:
+        return self._post_message(url, payload, idempotency_key)
+
+    def send_channel_message(
+        self,
+        team_id: str,
+        channel_id: str,
+        content: str,
+        idempotency_key: str | None = None,
+    ) -> dict[str, Any]:
         """
         Sends a message to a specific channel in a Microsoft Teams team.
 
         Args:
-            team_id: The unique identifier of the team.
-            channel_id: The unique identifier of the channel within the team.
+            team_id: The unique identifier of the team, or its display name.
+            channel_id: The unique identifier of the channel within the team, or its display name.
             content: The message content to send (can be plain text or HTML).
+            idempotency_key: Optional key identifying this post; retries with the same key return the original message instead of posting again.
 
         Returns:
             A dictionary containing the API response for the sent message, including its ID.
 
         Raises:
             httpx.HTTPStatusError: If the API request fails due to invalid IDs, permissions, etc.
+            ValueError: If a name matches no team or channel, or several.
 
         Tags:
             create, send, message, channel, microsoft-teams, api, important
         """
+        team_id = self.resolver.team(team_id)
+        channel_id = self.resolver.channel(team_id, channel_id)
         url = f"{self.base_url}/teams/{team_id}/channels/{channel_id}/messages"
         payload = {"body": {"content": content}}
-        response = self._post(url, data=payload)
-        return self._handle_response(response)
-    
-    def reply_to_channel_message(self, team_id: str, channel_id: str, message_id: str, content: str) -> dict[str, Any]:
+        return self._post_message(url, payload, idempotency_key)
+
+    def reply_to_channel_message(
+        self,
+        team_id: str,
+        channel_id: str,
+        message_id: str,
+        content: str,
+        idempotency_key: str | None = None,
+    ) -> dict[str, Any]:
         """
         Sends a reply to a specific message in a channel.
 
         Args:
-            team_id: The unique identifier of the team.
-            channel_id: The unique identifier of the channel.
+            team_id: The unique identifier of the team, or its display name.
+            channel_id: The unique identifier of the channel, or its display name.
             message_id: The unique identifier of the message to reply to.
             content: The reply message content (can be plain text or HTML).
+            idempotency_key: Optional key identifying this post; retries with the same key return the original message instead of posting again.
 
         Returns:
             A dictionary containing the API response for the sent reply, including its ID.
 
         Raises:
             httpx.HTTPStatusError: If the API request fails due to invalid IDs, permissions, etc.
+            ValueError: If a name matches no team or channel, or several.
 
         Tags:
             create, send, reply, message, channel, microsoft-teams, api, important
         """
+        team_id = self.resolver.team(team_id)
+        channel_id = self.resolver.channel(team_id, channel_id)
         url = f"{self.base_url}/teams/{team_id}/channels/{channel_id}/messages/{message_id}/replies"
         payload = {"body": {"content": content}}
-        response = self._post(url, data=payload)
-        return self._handle_response(response)
+        return self._post_message(url, payload, idempotency_key)
 
-    def create_chat_operation(self, id: Optional[str] = None, chatType: Optional[str] = None, createdDateTime: Optional[str] = None, isHiddenForAllMembers: Optional[bool] = None, lastUpdatedDateTime: Optional[str] = None, onlineMeetingInfo: Optional[dict[str, dict[str, Any]]] = None, tenantId: Optional[str] = None, topic: Optional[str] = None, viewpoint: Optional[dict[str, dict[str, Any]]] = None, webUrl: Optional[str] = None, installedApps: Optional[List[Any]] = None, lastMessagePreview: Optional[Any] = None, members: Optional[List[Any]] = None, messages: Optional[List[Any]] = None, permissionGrants: Optional[List[Any]] = None, pinnedMessages: Optional[List[Any]] = None, tabs: Optional[List[Any]] = None) -> Any:
+    def broadcast_message(
+        self, targets: list[dict[str, str]], content: str, max_concurrency: int = 4
+    ) -> dict[str, Any]:
+        """
+        Posts the same message to many chats, channels or channel threads at once, batching the posts.
+
+        Args:
+            targets: Where to post. Each target is {"chat_id": ...} for a chat, {"team_id": ..., "channel_id": ...} for a channel, or {"team_id": ..., "channel_id": ..., "message_id": ...} to reply in a channel thread. Chats may be given by topic, and teams and channels by display name.
+            content: The message content to send (can be plain text or HTML).
+            max_concurrency: How many batches of up to 20 posts are sent in parallel.
+
+        Returns:
+            A dictionary with the number of posts sent and failed, and under "results" one entry per target (in input order) with "ok", "status_code" and either "message_id" or "error".
+
+        Raises:
+            ValueError: If a target names neither a chat nor a team channel, or a name matches no chat, team or channel, or several; nothing is sent in that case.
+
+        Tags:
+            create, send, message, broadcast, chat, channel, microsoft-teams, api
+        """
+        return Broadcast(
+            self, max_concurrency=max_concurrency, limiter=self.post_limiter
+        ).send(targets, content)
+
+    def create_chat_operation(
+        self,
+        id: str | None = None,
+        chatType: str | None = None,
+        createdDateTime: str | None = None,
+        isHiddenForAllMembers: bool | None = None,
+        lastUpdatedDateTime: str | None = None,
+        onlineMeetingInfo: dict[str, dict[str, Any]] | None = None,
+        tenantId: str | None = None,
+        topic: str | None = None,
+        viewpoint: dict[str, dict[str, Any]] | None = None,
+        webUrl: str | None = None,
+        installedApps: list[Any] | None = None,
+        lastMessagePreview: Any | None = None,
+        members: list[Any] | None = None,
+        messages: list[Any] | None = None,
+        permissionGrants: list[Any] | None = None,
+        pinnedMessages: list[Any] | None = None,
+        tabs: list[Any] | None = None,
+    ) -> Any:
         """
         Create chat
 
@@ -188,31 +912,44 @@ class MsTeamsApp(APIApplication):
         """
         request_body_data = None
         request_body_data = {
-            'id': id,
-            'chatType': chatType,
-            'createdDateTime': createdDateTime,
-            'isHiddenForAllMembers': isHiddenForAllMembers,
-            'lastUpdatedDateTime': lastUpdatedDateTime,
-            'onlineMeetingInfo': onlineMeetingInfo,
-            'tenantId': tenantId,
-            'topic': topic,
-            'viewpoint': viewpoint,
-            'webUrl': webUrl,
-            'installedApps': installedApps,
-            'lastMessagePreview': lastMessagePreview,
-            'members': members,
-            'messages': messages,
-            'permissionGrants': permissionGrants,
-            'pinnedMessages': pinnedMessages,
-            'tabs': tabs,
+            "id": id,
+            "chatType": chatType,
+            "createdDateTime": createdDateTime,
+            "isHiddenForAllMembers": isHiddenForAllMembers,
+            "lastUpdatedDateTime": lastUpdatedDateTime,
+            "onlineMeetingInfo": onlineMeetingInfo,
+            "tenantId": tenantId,
+            "topic": topic,
+            "viewpoint": viewpoint,
+            "webUrl": webUrl,
+            "installedApps": installedApps,
+            "lastMessagePreview": lastMessagePreview,
+            "members": members,
+            "messages": messages,
+            "permissionGrants": permissionGrants,
+            "pinnedMessages": pinnedMessages,
+            "tabs": tabs,
+        }
+        request_body_data = {
+            k: v for k, v in request_body_data.items() if v is not None
         }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
         url = f"{self.base_url}/chats"
         query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
+        response = self._post(
+            url,
+            data=request_body_data,
+            params=query_params,
+            content_type="application/json",
+        )
         return self._handle_response(response)
 
-    def get_chat(self, chat_id: str, select: Optional[List[str]] = None, expand: Optional[List[str]] = None) -> Any:
+    def get_chat(
+        self,
+        chat_id: str,
+        select: list[str] | None = None,
+        expand: list[str] | None = None,
+        profile: str | None = None,
+    ) -> Any:
         """
         Get chat
 
@@ -220,6 +957,7 @@ class MsTeamsApp(APIApplication):
             chat_id (string): chat-id
             select (array): Select properties to be returned
             expand (array): Expand related entities
+            profile (string): Projection profile, one of 'minimal', 'summary' or 'full'; fills in select/expand and trims the result
 
         Returns:
             Any: Retrieved entity
@@ -233,11 +971,39 @@ class MsTeamsApp(APIApplication):
         if chat_id is None:
             raise ValueError("Missing required parameter 'chat-id'.")
         url = f"{self.base_url}/chats/{chat_id}"
-        query_params = {k: v for k, v in [('$select', select), ('$expand', expand)] if v is not None}
+        projection = self._projection("chat", profile, select, expand)
+        query_params = {
+            k: v
+            for k, v in [
+                ("$select", projection.select(select)),
+                ("$expand", projection.expand(expand)),
+            ]
+            if v is not None
+        }
         response = self._get(url, params=query_params)
-        return self._handle_response(response)
-
-    def update_chat_details(self, chat_id: str, id: Optional[str] = None, chatType: Optional[str] = None, createdDateTime: Optional[str] = None, isHiddenForAllMembers: Optional[bool] = None, lastUpdatedDateTime: Optional[str] = None, onlineMeetingInfo: Optional[dict[str, dict[str, Any]]] = None, tenantId: Optional[str] = None, topic: Optional[str] = None, viewpoint: Optional[dict[str, dict[str, Any]]] = None, webUrl: Optional[str] = None, installedApps: Optional[List[Any]] = None, lastMessagePreview: Optional[Any] = None, members: Optional[List[Any]] = None, messages: Optional[List[Any]] = None, permissionGrants: Optional[List[Any]] = None, pinnedMessages: Optional[List[Any]] = None, tabs: Optional[List[Any]] = None) -> Any:
+        return projection.apply(self._handle_response(response))
+
+    def update_chat_details(
+        self,
+        chat_id: str,
+        id: str | None = None,
+        chatType: str | None = None,
+        createdDateTime: str | None = None,
+        isHiddenForAllMembers: bool | None = None,
+        lastUpdatedDateTime: str | None = None,
+        onlineMeetingInfo: dict[str, dict[str, Any]] | None = None,
+        tenantId: str | None = None,
+        topic: str | None = None,
+        viewpoint: dict[str, dict[str, Any]] | None = None,
+        webUrl: str | None = None,
+        installedApps: list[Any] | None = None,
+        lastMessagePreview: Any | None = None,
+        members: list[Any] | None = None,
+        messages: list[Any] | None = None,
+        permissionGrants: list[Any] | None = None,
+        pinnedMessages: list[Any] | None = None,
+        tabs: list[Any] | None = None,
+    ) -> Any:
         """
         Update chat
 
@@ -274,31 +1040,48 @@ class MsTeamsApp(APIApplication):
             raise ValueError("Missing required parameter 'chat-id'.")
         request_body_data = None
         request_body_data = {
-            'id': id,
-            'chatType': chatType,
-            'createdDateTime': createdDateTime,
-            'isHiddenForAllMembers': isHiddenForAllMembers,
-            'lastUpdatedDateTime': lastUpdatedDateTime,
-            'onlineMeetingInfo': onlineMeetingInfo,
-            'tenantId': tenantId,
-            'topic': topic,
-            'viewpoint': viewpoint,
-            'webUrl': webUrl,
-            'installedApps': installedApps,
-            'lastMessagePreview': lastMessagePreview,
-            'members': members,
-            'messages': messages,
-            'permissionGrants': permissionGrants,
-            'pinnedMessages': pinnedMessages,
-            'tabs': tabs,
+            "id": id,
+            "chatType": chatType,
+            "createdDateTime": createdDateTime,
+            "isHiddenForAllMembers": isHiddenForAllMembers,
+            "lastUpdatedDateTime": lastUpdatedDateTime,
+            "onlineMeetingInfo": onlineMeetingInfo,
+            "tenantId": tenantId,
+            "topic": topic,
+            "viewpoint": viewpoint,
+            "webUrl": webUrl,
+            "installedApps": installedApps,
+            "lastMessagePreview": lastMessagePreview,
+            "members": members,
+            "messages": messages,
+            "permissionGrants": permissionGrants,
+            "pinnedMessages": pinnedMessages,
+            "tabs": tabs,
+        }
+        request_body_data = {
+            k: v for k, v in request_body_data.items() if v is not None
         }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
         url = f"{self.base_url}/chats/{chat_id}"
         query_params = {}
         response = self._patch(url, data=request_body_data, params=query_params)
         return self._handle_response(response)
 
-    def list_chat_apps(self, chat_id: str, top: Optional[int] = None, skip: Optional[int] = None, search: Optional[str] = None, filter: Optional[str] = None, count: Optional[bool] = None, orderby: Optional[List[str]] = None, select: Optional[List[str]] = None, expand: Optional[List[str]] = None) -> dict[str, Any]:
+    def list_chat_apps(
+        self,
+        chat_id: str,
+        top: int | None = None,
+        skip: int | None = None,
+        search: str | None = None,
+        filter: str | None = None,
+        count: bool | None = None,
+        orderby: list[str] | None = None,
+        select: list[str] | None = None,
+        expand: list[str] | None = None,
+        profile: str | None = None,
+        all: bool = False,
+        max_items: int | None = None,
+        max_pages: int | None = None,
+    ) -> dict[str, Any]:
         """
         List apps in chat
 
@@ -312,6 +1095,10 @@ class MsTeamsApp(APIApplication):
             orderby (array): Order items by property values
             select (array): Select properties to be returned
             expand (array): Expand related entities
+            profile (string): Projection profile, one of 'minimal', 'summary' or 'full'; fills in select/expand and trims the result
+            all (boolean): Follow '@odata.nextLink' and return every page as one collection
+            max_items (integer): With 'all', stop after this many items; a result cut short carries 'truncated'
+            max_pages (integer): With 'all', stop after this many pages
 
         Returns:
             dict[str, Any]: Retrieved collection
@@ -325,11 +1112,112 @@ class MsTeamsApp(APIApplication):
         if chat_id is None:
             raise ValueError("Missing required parameter 'chat-id'.")
         url = f"{self.base_url}/chats/{chat_id}/installedApps"
-        query_params = {k: v for k, v in [('$top', top), ('$skip', skip), ('$search', search), ('$filter', filter), ('$count', count), ('$orderby', orderby), ('$select', select), ('$expand', expand)] if v is not None}
+        projection = self._projection("teamsAppInstallation", profile, select, expand)
+        query_params = {
+            k: v
+            for k, v in [
+                ("$top", top),
+                ("$skip", skip),
+                ("$search", search),
+                ("$filter", filter),
+                ("$count", count),
+                ("$orderby", orderby),
+                ("$select", projection.select(select)),
+                ("$expand", projection.expand(expand)),
+            ]
+            if v is not None
+        }
+        if all:
+            return self._paginate(
+                url,
+                query_params,
+                max_items=max_items,
+                max_pages=max_pages,
+                projection=projection,
+            ).collect()
         response = self._get(url, params=query_params)
-        return self._handle_response(response)
+        return projection.apply(self._handle_response(response))
+
+    def iter_chat_apps(
+        self,
+        chat_id: str,
+        top: int | None = None,
+        skip: int | None = None,
+        search: str | None = None,
+        filter: str | None = None,
+        count: bool | None = None,
+        orderby: list[str] | None = None,
+        select: list[str] | None = None,
+        expand: list[str] | None = None,
+        profile: str | None = None,
+        max_items: int | None = None,
+        max_pages: int | None = None,
+    ) -> PageIterator:
+        """
+        List apps in chat, lazily following '@odata.nextLink' across pages
+
+        Args:
+            chat_id (string): chat-id
+            top (integer): Page size requested from the server Example: '50'.
+            skip (integer): Skip the first n items
+            search (string): Search items by search phrases
+            filter (string): Filter items by property values
+            count (boolean): Include count of items
+            orderby (array): Order items by property values
+            select (array): Select properties to be returned
+            expand (array): Expand related entities
+            profile (string): Projection profile, one of 'minimal', 'summary' or 'full'; fills in select/expand and trims the result
+            max_items (integer): Stop after yielding this many items
+            max_pages (integer): Stop after fetching this many pages
 
-    def list_chat_members(self, chat_id: str, top: Optional[int] = None, skip: Optional[int] = None, search: Optional[str] = None, filter: Optional[str] = None, count: Optional[bool] = None, orderby: Optional[List[str]] = None, select: Optional[List[str]] = None, expand: Optional[List[str]] = None) -> dict[str, Any]:
+        Returns:
+            PageIterator: Iterable of collection items; pages are fetched on demand
+
+        Raises:
+            HTTPStatusError: Raised when the API request fails with detailed error information including status code and response body.
+        """
+        if chat_id is None:
+            raise ValueError("Missing required parameter 'chat-id'.")
+        url = f"{self.base_url}/chats/{chat_id}/installedApps"
+        projection = self._projection("teamsAppInstallation", profile, select, expand)
+        query_params = {
+            k: v
+            for k, v in [
+                ("$top", top),
+                ("$skip", skip),
+                ("$search", search),
+                ("$filter", filter),
+                ("$count", count),
+                ("$orderby", orderby),
+                ("$select", projection.select(select)),
+                ("$expand", projection.expand(expand)),
+            ]
+            if v is not None
+        }
+        return self._paginate(
+            url,
+            query_params,
+            max_items=max_items,
+            max_pages=max_pages,
+            projection=projection,
+        )
+
+    def list_chat_members(
+        self,
+        chat_id: str,
+        top: int | None = None,
+        skip: int | None = None,
+        search: str | None = None,
+        filter: str | None = None,
+        count: bool | None = None,
+        orderby: list[str] | None = None,
+        select: list[str] | None = None,
+        expand: list[str] | None = None,
+        profile: str | None = None,
+        all: bool = False,
+        max_items: int | None = None,
+        max_pages: int | None = None,
+    ) -> dict[str, Any]:
         """
         List conversationMembers
 
@@ -343,6 +1231,10 @@ class MsTeamsApp(APIApplication):
             orderby (array): Order items by property values
             select (array): Select properties to be returned
             expand (array): Expand related entities
+            profile (string): Projection profile, one of 'minimal', 'summary' or 'full'; fills in select/expand and trims the result
+            all (boolean): Follow '@odata.nextLink' and return every page as one collection
+            max_items (integer): With 'all', stop after this many items; a result cut short carries 'truncated'
+            max_pages (integer): With 'all', stop after this many pages
 
         Returns:
             dict[str, Any]: Retrieved collection
@@ -356,46 +1248,165 @@ class MsTeamsApp(APIApplication):
         if chat_id is None:
             raise ValueError("Missing required parameter 'chat-id'.")
         url = f"{self.base_url}/chats/{chat_id}/members"
-        query_params = {k: v for k, v in [('$top', top), ('$skip', skip), ('$search', search), ('$filter', filter), ('$count', count), ('$orderby', orderby), ('$select', select), ('$expand', expand)] if v is not None}
+        projection = self._projection("conversationMember", profile, select, expand)
+        query_params = {
+            k: v
+            for k, v in [
+                ("$top", top),
+                ("$skip", skip),
+                ("$search", search),
+                ("$filter", filter),
+                ("$count", count),
+                ("$orderby", orderby),
+                ("$select", projection.select(select)),
+                ("$expand", projection.expand(expand)),
+            ]
+            if v is not None
+        }
+        if all:
+            return self._paginate(
+                url,
+                query_params,
+                max_items=max_items,
+                max_pages=max_pages,
+                projection=projection,
+            ).collect()
         response = self._get(url, params=query_params)
-        return self._handle_response(response)
+        return projection.apply(self._handle_response(response))
+
+    def iter_chat_members(
+        self,
+        chat_id: str,
+        top: int | None = None,
+        skip: int | None = None,
+        search: str | None = None,
+        filter: str | None = None,
+        count: bool | None = None,
+        orderby: list[str] | None = None,
+        select: list[str] | None = None,
+        expand: list[str] | None = None,
+        profile: str | None = None,
+        max_items: int | None = None,
+        max_pages: int | None = None,
+    ) -> PageIterator:
+        """
+        List conversationMembers, lazily following '@odata.nextLink' across pages
 
-    def add_member_to_chat(self, chat_id: str, id: Optional[str] = None, displayName: Optional[str] = None, roles: Optional[List[str]] = None, visibleHistoryStartDateTime: Optional[str] = None) -> Any:
+        Args:
+            chat_id (string): chat-id
+            top (integer): Page size requested from the server Example: '50'.
+            skip (integer): Skip the first n items
+            search (string): Search items by search phrases
+            filter (string): Filter items by property values
+            count (boolean): Include count of items
+            orderby (array): Order items by property values
+            select (array): Select properties to be returned
+            expand (array): Expand related entities
+            profile (string): Projection profile, one of 'minimal', 'summary' or 'full'; fills in select/expand and trims the result
+            max_items (integer): Stop after yielding this many items
+            max_pages (integer): Stop after fetching this many pages
+
+        Returns:
+            PageIterator: Iterable of collection items; pages are fetched on demand
+
+        Raises:
+            HTTPStatusError: Raised when the API request fails with detailed error information including status code and response body.
+        """
+        if chat_id is None:
+            raise ValueError("Missing required parameter 'chat-id'.")
+        url = f"{self.base_url}/chats/{chat_id}/members"
+        projection = self._projection("conversationMember", profile, select, expand)
+        query_params = {
+            k: v
+            for k, v in [
+                ("$top", top),
+                ("$skip", skip),
+                ("$search", search),
+                ("$filter", filter),
+                ("$count", count),
+                ("$orderby", orderby),
+                ("$select", projection.select(select)),
+                ("$expand", projection.expand(expand)),
+            ]
+            if v is not None
+        }
+        return self._paginate(
+            url,
+            query_params,
+            max_items=max_items,
+            max_pages=max_pages,
+            projection=projection,
+        )
+
+    def add_member_to_chat(
+        self,
+        chat_id: str,
+        id: str | None = None,
+        displayName: str | None = None,
+        roles: list[str] | None = None,
+        visibleHistoryStartDateTime: str | None = None,
+        user: str | None = None,
+    ) -> Any:
         """
         Add member to a chat
 
         Args:
-            chat_id (string): chat-id
+            chat_id (string): chat-id, or the chat's topic
             id (string): The unique identifier for an entity. Read-only.
             displayName (string): The display name of the user.
             roles (array): The roles for that user. This property contains more qualifiers only when relevant - for example, if the member has owner privileges, the roles property contains owner as one of the values. Similarly, if the member is an in-tenant guest, the roles property contains guest as one of the values. A basic member shouldn't have any values specified in the roles property. An Out-of-tenant external member is assigned the owner role.
             visibleHistoryStartDateTime (string): The timestamp denoting how far back a conversation's history is shared with the conversation member. This property is settable only for members of a chat.
+            user (string): Id, email address or display name of the user to add; binds the user as the member, with the 'owner' role unless roles are given
 
         Returns:
             Any: Created navigation property.
 
         Raises:
             HTTPStatusError: Raised when the API request fails with detailed error information including status code and response body.
+            ValueError: Raised when the chat topic or user matches nothing, or several.
 
         Tags:
             chats.conversationMember
         """
         if chat_id is None:
             raise ValueError("Missing required parameter 'chat-id'.")
+        chat_id = self.resolver.chat(chat_id)
         request_body_data = None
         request_body_data = {
-            'id': id,
-            'displayName': displayName,
-            'roles': roles,
-            'visibleHistoryStartDateTime': visibleHistoryStartDateTime,
+            "id": id,
+            "displayName": displayName,
+            "roles": roles,
+            "visibleHistoryStartDateTime": visibleHistoryStartDateTime,
+        }
+        if user is not None:
+            request_body_data["@odata.type"] = (
+                "#microsoft.graph.aadUserConversationMember"
+            )
+            request_body_data["user@odata.bind"] = (
+                f"{self.base_url}/users('{self.resolver.user(user)}')"
+            )
+            request_body_data["roles"] = roles if roles is not None else ["owner"]
+        request_body_data = {
+            k: v for k, v in request_body_data.items() if v is not None
         }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
         url = f"{self.base_url}/chats/{chat_id}/members"
         query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
+        response = self._post(
+            url,
+            data=request_body_data,
+            params=query_params,
+            content_type="application/json",
+        )
         return self._handle_response(response)
 
-    def get_chat_member_details(self, chat_id: str, conversationMember_id: str, select: Optional[List[str]] = None, expand: Optional[List[str]] = None) -> Any:
+    def get_chat_member_details(
+        self,
+        chat_id: str,
+        conversationMember_id: str,
+        select: list[str] | None = None,
+        expand: list[str] | None = None,
+        profile: str | None = None,
+    ) -> Any:
         """
         Get conversationMember
 
@@ -404,6 +1415,7 @@ class MsTeamsApp(APIApplication):
             conversationMember_id (string): conversationMember-id
             select (array): Select properties to be returned
             expand (array): Expand related entities
+            profile (string): Projection profile, one of 'minimal', 'summary' or 'full'; fills in select/expand and trims the result
 
         Returns:
             Any: Retrieved navigation property
@@ -419,9 +1431,17 @@ class MsTeamsApp(APIApplication):
         if conversationMember_id is None:
             raise ValueError("Missing required parameter 'conversationMember-id'.")
         url = f"{self.base_url}/chats/{chat_id}/members/{conversationMember_id}"
-        query_params = {k: v for k, v in [('$select', select), ('$expand', expand)] if v is not None}
+        projection = self._projection("conversationMember", profile, select, expand)
+        query_params = {
+            k: v
+            for k, v in [
+                ("$select", projection.select(select)),
+                ("$expand", projection.expand(expand)),
+            ]
+            if v is not None
+        }
         response = self._get(url, params=query_params)
-        return self._handle_response(response)
+        return projection.apply(self._handle_response(response))
 
     def delete_chat_member(self, chat_id: str, conversationMember_id: str) -> Any:
         """
@@ -449,7 +1469,23 @@ class MsTeamsApp(APIApplication):
         response = self._delete(url, params=query_params)
         return self._handle_response(response)
 
-    def list_chat_messages(self, chat_id: str, top: Optional[int] = None, skip: Optional[int] = None, search: Optional[str] = None, filter: Optional[str] = None, count: Optional[bool] = None, orderby: Optional[List[str]] = None, select: Optional[List[str]] = None, expand: Optional[List[str]] = None) -> dict[str, Any]:
+    def list_chat_messages(
+        self,
+        chat_id: str,
+        top: int | None = None,
+        skip: int | None = None,
+        search: str | None = None,
+        filter: str | None = None,
+        count: bool | None = None,
+        orderby: list[str] | None = None,
+        select: list[str] | None = None,
+        expand: list[str] | None = None,
+        profile: str | None = None,
+        stream: bool = False,
+        all: bool = False,
+        max_items: int | None = None,
+        max_pages: int | None = None,
+    ) -> dict[str, Any]:
         """
         List messages in a chat
 
@@ -463,6 +1499,11 @@ class MsTeamsApp(APIApplication):
             orderby (array): Order items by property values
             select (array): Select properties to be returned
             expand (array): Expand related entities
+            profile (string): Projection profile, one of 'minimal', 'summary' or 'full'; fills in select/expand and trims the result
+            stream (boolean): With 'all', decode pages incrementally instead of loading each one whole; combine with 'profile' so only trimmed messages are kept
+            all (boolean): Follow '@odata.nextLink' and return every page as one collection
+            max_items (integer): With 'all', stop after this many items; a result cut short carries 'truncated'
+            max_pages (integer): With 'all', stop after this many pages
 
         Returns:
             dict[str, Any]: Retrieved collection
@@ -476,11 +1517,112 @@ class MsTeamsApp(APIApplication):
         if chat_id is None:
             raise ValueError("Missing required parameter 'chat-id'.")
         url = f"{self.base_url}/chats/{chat_id}/messages"
-        query_params = {k: v for k, v in [('$top', top), ('$skip', skip), ('$search', search), ('$filter', filter), ('$count', count), ('$orderby', orderby), ('$select', select), ('$expand', expand)] if v is not None}
+        projection = self._projection("chatMessage", profile, select, expand)
+        query_params = {
+            k: v
+            for k, v in [
+                ("$top", top),
+                ("$skip", skip),
+                ("$search", search),
+                ("$filter", filter),
+                ("$count", count),
+                ("$orderby", orderby),
+                ("$select", projection.select(select)),
+                ("$expand", projection.expand(expand)),
+            ]
+            if v is not None
+        }
+        if all:
+            return self._paginate(
+                url,
+                query_params,
+                max_items=max_items,
+                max_pages=max_pages,
+                projection=projection,
+                stream=stream,
+                scope={"chat_id": chat_id},
+            ).collect()
         response = self._get(url, params=query_params)
-        return self._handle_response(response)
+        return projection.apply(
+            self._indexed(self._handle_response(response), chat_id=chat_id)
+        )
+
+    def iter_chat_messages(
+        self,
+        chat_id: str,
+        top: int | None = None,
+        skip: int | None = None,
+        search: str | None = None,
+        filter: str | None = None,
+        count: bool | None = None,
+        orderby: list[str] | None = None,
+        select: list[str] | None = None,
+        expand: list[str] | None = None,
+        profile: str | None = None,
+        stream: bool = False,
+        max_items: int | None = None,
+        max_pages: int | None = None,
+    ) -> PageIterator:
+        """
+        List messages in a chat, lazily following '@odata.nextLink' across pages
+
+        Args:
+            chat_id (string): chat-id
+            top (integer): Page size requested from the server Example: '50'.
+            skip (integer): Skip the first n items
+            search (string): Search items by search phrases
+            filter (string): Filter items by property values
+            count (boolean): Include count of items
+            orderby (array): Order items by property values
+            select (array): Select properties to be returned
+            expand (array): Expand related entities
+            profile (string): Projection profile, one of 'minimal', 'summary' or 'full'; fills in select/expand and trims the result
+            stream (boolean): Decode each page incrementally, yielding messages as they arrive instead of loading whole pages
+            max_items (integer): Stop after yielding this many items
+            max_pages (integer): Stop after fetching this many pages
+
+        Returns:
+            PageIterator: Iterable of collection items; pages are fetched on demand
 
-    def get_chat_message_detail(self, chat_id: str, chatMessage_id: str, select: Optional[List[str]] = None, expand: Optional[List[str]] = None) -> Any:
+        Raises:
+            HTTPStatusError: Raised when the API request fails with detailed error information including status code and response body.
+        """
+        if chat_id is None:
+            raise ValueError("Missing required parameter 'chat-id'.")
+        url = f"{self.base_url}/chats/{chat_id}/messages"
+        projection = self._projection("chatMessage", profile, select, expand)
+        query_params = {
+            k: v
+            for k, v in [
+                ("$top", top),
+                ("$skip", skip),
+                ("$search", search),
+                ("$filter", filter),
+                ("$count", count),
+                ("$orderby", orderby),
+                ("$select", projection.select(select)),
+                ("$expand", projection.expand(expand)),
+            ]
+            if v is not None
+        }
+        return self._paginate(
+            url,
+            query_params,
+            max_items=max_items,
+            max_pages=max_pages,
+            projection=projection,
+            stream=stream,
+            scope={"chat_id": chat_id},
+        )
+
+    def get_chat_message_detail(
+        self,
+        chat_id: str,
+        chatMessage_id: str,
+        select: list[str] | None = None,
+        expand: list[str] | None = None,
+        profile: str | None = None,
+    ) -> Any:
         """
         Get chatMessage in a channel or chat
 
@@ -489,6 +1631,7 @@ class MsTeamsApp(APIApplication):
             chatMessage_id (string): chatMessage-id
             select (array): Select properties to be returned
             expand (array): Expand related entities
+            profile (string): Projection profile, one of 'minimal', 'summary' or 'full'; fills in select/expand and trims the result
 
         Returns:
             Any: Retrieved navigation property
@@ -504,11 +1647,38 @@ class MsTeamsApp(APIApplication):
         if chatMessage_id is None:
             raise ValueError("Missing required parameter 'chatMessage-id'.")
         url = f"{self.base_url}/chats/{chat_id}/messages/{chatMessage_id}"
-        query_params = {k: v for k, v in [('$select', select), ('$expand', expand)] if v is not None}
+        projection = self._projection("chatMessage", profile, select, expand)
+        query_params = {
+            k: v
+            for k, v in [
+                ("$select", projection.select(select)),
+                ("$expand", projection.expand(expand)),
+            ]
+            if v is not None
+        }
         response = self._get(url, params=query_params)
-        return self._handle_response(response)
-
-    def read_chat_replies(self, chat_id: str, chatMessage_id: str, top: Optional[int] = None, skip: Optional[int] = None, search: Optional[str] = None, filter: Optional[str] = None, count: Optional[bool] = None, orderby: Optional[List[str]] = None, select: Optional[List[str]] = None, expand: Optional[List[str]] = None) -> dict[str, Any]:
+        return projection.apply(
+            self._indexed(self._handle_response(response), chat_id=chat_id)
+        )
+
+    def read_chat_replies(
+        self,
+        chat_id: str,
+        chatMessage_id: str,
+        top: int | None = None,
+        skip: int | None = None,
+        search: str | None = None,
+        filter: str | None = None,
+        count: bool | None = None,
+        orderby: list[str] | None = None,
+        select: list[str] | None = None,
+        expand: list[str] | None = None,
+        profile: str | None = None,
+        stream: bool = False,
+        all: bool = False,
+        max_items: int | None = None,
+        max_pages: int | None = None,
+    ) -> dict[str, Any]:
         """
         Get replies from chats
 
@@ -523,6 +1693,11 @@ class MsTeamsApp(APIApplication):
             orderby (array): Order items by property values
             select (array): Select properties to be returned
             expand (array): Expand related entities
+            profile (string): Projection profile, one of 'minimal', 'summary' or 'full'; fills in select/expand and trims the result
+            stream (boolean): With 'all', decode pages incrementally instead of loading each one whole; combine with 'profile' so only trimmed messages are kept
+            all (boolean): Follow '@odata.nextLink' and return every page as one collection
+            max_items (integer): With 'all', stop after this many items; a result cut short carries 'truncated'
+            max_pages (integer): With 'all', stop after this many pages
 
         Returns:
             dict[str, Any]: Retrieved collection
@@ -538,11 +1713,138 @@ class MsTeamsApp(APIApplication):
         if chatMessage_id is None:
             raise ValueError("Missing required parameter 'chatMessage-id'.")
         url = f"{self.base_url}/chats/{chat_id}/messages/{chatMessage_id}/replies"
-        query_params = {k: v for k, v in [('$top', top), ('$skip', skip), ('$search', search), ('$filter', filter), ('$count', count), ('$orderby', orderby), ('$select', select), ('$expand', expand)] if v is not None}
+        projection = self._projection("chatMessage", profile, select, expand)
+        query_params = {
+            k: v
+            for k, v in [
+                ("$top", top),
+                ("$skip", skip),
+                ("$search", search),
+                ("$filter", filter),
+                ("$count", count),
+                ("$orderby", orderby),
+                ("$select", projection.select(select)),
+                ("$expand", projection.expand(expand)),
+            ]
+            if v is not None
+        }
+        if all:
+            return self._paginate(
+                url,
+                query_params,
+                max_items=max_items,
+                max_pages=max_pages,
+                projection=projection,
+                stream=stream,
+                scope={"chat_id": chat_id},
+            ).collect()
         response = self._get(url, params=query_params)
-        return self._handle_response(response)
+        return projection.apply(
+            self._indexed(self._handle_response(response), chat_id=chat_id)
+        )
+
+    def iter_chat_replies(
+        self,
+        chat_id: str,
+        chatMessage_id: str,
+        top: int | None = None,
+        skip: int | None = None,
+        search: str | None = None,
+        filter: str | None = None,
+        count: bool | None = None,
+        orderby: list[str] | None = None,
+        select: list[str] | None = None,
+        expand: list[str] | None = None,
+        profile: str | None = None,
+        stream: bool = False,
+        max_items: int | None = None,
+        max_pages: int | None = None,
+    ) -> PageIterator:
+        """
+        Get replies from chats, lazily following '@odata.nextLink' across pages
 
-    def create_chat_reply(self, chat_id: str, chatMessage_id: str, id: Optional[str] = None, attachments: Optional[List[dict[str, dict[str, Any]]]] = None, body: Optional[dict[str, dict[str, Any]]] = None, channelIdentity: Optional[dict[str, dict[str, Any]]] = None, chatId: Optional[str] = None, createdDateTime: Optional[str] = None, deletedDateTime: Optional[str] = None, etag: Optional[str] = None, eventDetail: Optional[dict[str, dict[str, Any]]] = None, from_: Optional[Any] = None, importance: Optional[str] = None, lastEditedDateTime: Optional[str] = None, lastModifiedDateTime: Optional[str] = None, locale: Optional[str] = None, mentions: Optional[List[dict[str, dict[str, Any]]]] = None, messageHistory: Optional[List[dict[str, dict[str, Any]]]] = None, messageType: Optional[str] = None, policyViolation: Optional[dict[str, dict[str, Any]]] = None, reactions: Optional[List[dict[str, dict[str, Any]]]] = None, replyToId: Optional[str] = None, subject: Optional[str] = None, summary: Optional[str] = None, webUrl: Optional[str] = None, hostedContents: Optional[List[Any]] = None, replies: Optional[List[Any]] = None) -> Any:
+        Args:
+            chat_id (string): chat-id
+            chatMessage_id (string): chatMessage-id
+            top (integer): Page size requested from the server Example: '50'.
+            skip (integer): Skip the first n items
+            search (string): Search items by search phrases
+            filter (string): Filter items by property values
+            count (boolean): Include count of items
+            orderby (array): Order items by property values
+            select (array): Select properties to be returned
+            expand (array): Expand related entities
+            profile (string): Projection profile, one of 'minimal', 'summary' or 'full'; fills in select/expand and trims the result
+            stream (boolean): Decode each page incrementally, yielding messages as they arrive instead of loading whole pages
+            max_items (integer): Stop after yielding this many items
+            max_pages (integer): Stop after fetching this many pages
+
+        Returns:
+            PageIterator: Iterable of collection items; pages are fetched on demand
+
+        Raises:
+            HTTPStatusError: Raised when the API request fails with detailed error information including status code and response body.
+        """
+        if chat_id is None:
+            raise ValueError("Missing required parameter 'chat-id'.")
+        if chatMessage_id is None:
+            raise ValueError("Missing required parameter 'chatMessage-id'.")
+        url = f"{self.base_url}/chats/{chat_id}/messages/{chatMessage_id}/replies"
+        projection = self._projection("chatMessage", profile, select, expand)
+        query_params = {
+            k: v
+            for k, v in [
+                ("$top", top),
+                ("$skip", skip),
+                ("$search", search),
+                ("$filter", filter),
+                ("$count", count),
+                ("$orderby", orderby),
+                ("$select", projection.select(select)),
+                ("$expand", projection.expand(expand)),
+            ]
+            if v is not None
+        }
+        return self._paginate(
+            url,
+            query_params,
+            max_items=max_items,
+            max_pages=max_pages,
+            projection=projection,
+            stream=stream,
+            scope={"chat_id": chat_id},
+        )
+
+    def create_chat_reply(
+        self,
+        chat_id: str,
+        chatMessage_id: str,
+        id: str | None = None,
+        attachments: list[dict[str, dict[str, Any]]] | None = None,
+        body: dict[str, dict[str, Any]] | None = None,
+        channelIdentity: dict[str, dict[str, Any]] | None = None,
+        chatId: str | None = None,
+        createdDateTime: str | None = None,
+        deletedDateTime: str | None = None,
+        etag: str | None = None,
+        eventDetail: dict[str, dict[str, Any]] | None = None,
+        from_: Any | None = None,
+        importance: str | None = None,
+        lastEditedDateTime: str | None = None,
+        lastModifiedDateTime: str | None = None,
+        locale: str | None = None,
+        mentions: list[dict[str, dict[str, Any]]] | None = None,
+        messageHistory: list[dict[str, dict[str, Any]]] | None = None,
+        messageType: str | None = None,
+        policyViolation: dict[str, dict[str, Any]] | None = None,
+        reactions: list[dict[str, dict[str, Any]]] | None = None,
+        replyToId: str | None = None,
+        subject: str | None = None,
+        summary: str | None = None,
+        webUrl: str | None = None,
+        hostedContents: list[Any] | None = None,
+        replies: list[Any] | None = None,
+    ) -> Any:
         """
         Create new navigation property to replies for chats
 
@@ -590,39 +1892,54 @@ class MsTeamsApp(APIApplication):
             raise ValueError("Missing required parameter 'chatMessage-id'.")
         request_body_data = None
         request_body_data = {
-            'id': id,
-            'attachments': attachments,
-            'body': body,
-            'channelIdentity': channelIdentity,
-            'chatId': chatId,
-            'createdDateTime': createdDateTime,
-            'deletedDateTime': deletedDateTime,
-            'etag': etag,
-            'eventDetail': eventDetail,
-            'from': from_,
-            'importance': importance,
-            'lastEditedDateTime': lastEditedDateTime,
-            'lastModifiedDateTime': lastModifiedDateTime,
-            'locale': locale,
-            'mentions': mentions,
-            'messageHistory': messageHistory,
-            'messageType': messageType,
-            'policyViolation': policyViolation,
-            'reactions': reactions,
-            'replyToId': replyToId,
-            'subject': subject,
-            'summary': summary,
-            'webUrl': webUrl,
-            'hostedContents': hostedContents,
-            'replies': replies,
+            "id": id,
+            "attachments": attachments,
+            "body": body,
+            "channelIdentity": channelIdentity,
+            "chatId": chatId,
+            "createdDateTime": createdDateTime,
+            "deletedDateTime": deletedDateTime,
+            "etag": etag,
+            "eventDetail": eventDetail,
+            "from": from_,
+            "importance": importance,
+            "lastEditedDateTime": lastEditedDateTime,
+            "lastModifiedDateTime": lastModifiedDateTime,
+            "locale": locale,
+            "mentions": mentions,
+            "messageHistory": messageHistory,
+            "messageType": messageType,
+            "policyViolation": policyViolation,
+            "reactions": reactions,
+            "replyToId": replyToId,
+            "subject": subject,
+            "summary": summary,
+            "webUrl": webUrl,
+            "hostedContents": hostedContents,
+            "replies": replies,
+        }
+        request_body_data = {
+            k: v for k, v in request_body_data.items() if v is not None
         }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
         url = f"{self.base_url}/chats/{chat_id}/messages/{chatMessage_id}/replies"
         query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
+        response = self._post(
+            url,
+            data=request_body_data,
+            params=query_params,
+            content_type="application/json",
+        )
         return self._handle_response(response)
 
-    def get_chat_replies(self, chat_id: str, chatMessage_id: str, chatMessage_id1: str, select: Optional[List[str]] = None, expand: Optional[List[str]] = None) -> Any:
+    def get_chat_replies(
+        self,
+        chat_id: str,
+        chatMessage_id: str,
+        chatMessage_id1: str,
+        select: list[str] | None = None,
+        expand: list[str] | None = None,
+        profile: str | None = None,
+    ) -> Any:
         """
         Get replies from chats
 
@@ -632,6 +1949,7 @@ class MsTeamsApp(APIApplication):
             chatMessage_id1 (string): chatMessage-id1
             select (array): Select properties to be returned
             expand (array): Expand related entities
+            profile (string): Projection profile, one of 'minimal', 'summary' or 'full'; fills in select/expand and trims the result
 
         Returns:
             Any: Retrieved navigation property
@@ -649,11 +1967,54 @@ class MsTeamsApp(APIApplication):
         if chatMessage_id1 is None:
             raise ValueError("Missing required parameter 'chatMessage-id1'.")
         url = f"{self.base_url}/chats/{chat_id}/messages/{chatMessage_id}/replies/{chatMessage_id1}"
-        query_params = {k: v for k, v in [('$select', select), ('$expand', expand)] if v is not None}
+        projection = self._projection("chatMessage", profile, select, expand)
+        query_params = {
+            k: v
+            for k, v in [
+                ("$select", projection.select(select)),
+                ("$expand", projection.expand(expand)),
+            ]
+            if v is not None
+        }
         response = self._get(url, params=query_params)
-        return self._handle_response(response)
-
-    def create_team_from_group(self, group_id: str, id: Optional[str] = None, classification: Optional[str] = None, createdDateTime: Optional[str] = None, description: Optional[str] = None, displayName: Optional[str] = None, firstChannelName: Optional[str] = None, funSettings: Optional[dict[str, dict[str, Any]]] = None, guestSettings: Optional[dict[str, dict[str, Any]]] = None, internalId: Optional[str] = None, isArchived: Optional[bool] = None, memberSettings: Optional[dict[str, dict[str, Any]]] = None, messagingSettings: Optional[dict[str, dict[str, Any]]] = None, specialization: Optional[str] = None, summary: Optional[dict[str, dict[str, Any]]] = None, tenantId: Optional[str] = None, visibility: Optional[str] = None, webUrl: Optional[str] = None, allChannels: Optional[List[Any]] = None, channels: Optional[List[Any]] = None, group: Optional[Any] = None, incomingChannels: Optional[List[Any]] = None, installedApps: Optional[List[Any]] = None, members: Optional[List[Any]] = None, operations: Optional[List[Any]] = None, permissionGrants: Optional[List[Any]] = None, photo: Optional[Any] = None, primaryChannel: Optional[Any] = None, schedule: Optional[Any] = None, tags: Optional[List[Any]] = None, template: Optional[Any] = None) -> Any:
+        return projection.apply(
+            self._indexed(self._handle_response(response), chat_id=chat_id)
+        )
+
+    def create_team_from_group(
+        self,
+        group_id: str,
+        id: str | None = None,
+        classification: str | None = None,
+        createdDateTime: str | None = None,
+        description: str | None = None,
+        displayName: str | None = None,
+        firstChannelName: str | None = None,
+        funSettings: dict[str, dict[str, Any]] | None = None,
+        guestSettings: dict[str, dict[str, Any]] | None = None,
+        internalId: str | None = None,
+        isArchived: bool | None = None,
+        memberSettings: dict[str, dict[str, Any]] | None = None,
+        messagingSettings: dict[str, dict[str, Any]] | None = None,
+        specialization: str | None = None,
+        summary: dict[str, dict[str, Any]] | None = None,
+        tenantId: str | None = None,
+        visibility: str | None = None,
+        webUrl: str | None = None,
+        allChannels: list[Any] | None = None,
+        channels: list[Any] | None = None,
+        group: Any | None = None,
+        incomingChannels: list[Any] | None = None,
+        installedApps: list[Any] | None = None,
+        members: list[Any] | None = None,
+        operations: list[Any] | None = None,
+        permissionGrants: list[Any] | None = None,
+        photo: Any | None = None,
+        primaryChannel: Any | None = None,
+        schedule: Any | None = None,
+        tags: list[Any] | None = None,
+        template: Any | None = None,
+    ) -> Any:
         """
         Create team from group
 
@@ -703,44 +2064,83 @@ class MsTeamsApp(APIApplication):
             raise ValueError("Missing required parameter 'group-id'.")
         request_body_data = None
         request_body_data = {
-            'id': id,
-            'classification': classification,
-            'createdDateTime': createdDateTime,
-            'description': description,
-            'displayName': displayName,
-            'firstChannelName': firstChannelName,
-            'funSettings': funSettings,
-            'guestSettings': guestSettings,
-            'internalId': internalId,
-            'isArchived': isArchived,
-            'memberSettings': memberSettings,
-            'messagingSettings': messagingSettings,
-            'specialization': specialization,
-            'summary': summary,
-            'tenantId': tenantId,
-            'visibility': visibility,
-            'webUrl': webUrl,
-            'allChannels': allChannels,
-            'channels': channels,
-            'group': group,
-            'incomingChannels': incomingChannels,
-            'installedApps': installedApps,
-            'members': members,
-            'operations': operations,
-            'permissionGrants': permissionGrants,
-            'photo': photo,
-            'primaryChannel': primaryChannel,
-            'schedule': schedule,
-            'tags': tags,
-            'template': template,
+            "id": id,
+            "classification": classification,
+            "createdDateTime": createdDateTime,
+            "description": description,
+            "displayName": displayName,
+            "firstChannelName": firstChannelName,
+            "funSettings": funSettings,
+            "guestSettings": guestSettings,
+            "internalId": internalId,
+            "isArchived": isArchived,
+            "memberSettings": memberSettings,
+            "messagingSettings": messagingSettings,
+            "specialization": specialization,
+            "summary": summary,
+            "tenantId": tenantId,
+            "visibility": visibility,
+            "webUrl": webUrl,
+            "allChannels": allChannels,
+            "channels": channels,
+            "group": group,
+            "incomingChannels": incomingChannels,
+            "installedApps": installedApps,
+            "members": members,
+            "operations": operations,
+            "permissionGrants": permissionGrants,
+            "photo": photo,
+            "primaryChannel": primaryChannel,
+            "schedule": schedule,
+            "tags": tags,
+            "template": template,
+        }
+        request_body_data = {
+            k: v for k, v in request_body_data.items() if v is not None
         }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
         url = f"{self.base_url}/groups/{group_id}/team"
         query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
+        response = self._put(
+            url,
+            data=request_body_data,
+            params=query_params,
+            content_type="application/json",
+        )
         return self._handle_response(response)
 
-    def create_team(self, id: Optional[str] = None, classification: Optional[str] = None, createdDateTime: Optional[str] = None, description: Optional[str] = None, displayName: Optional[str] = None, firstChannelName: Optional[str] = None, funSettings: Optional[dict[str, dict[str, Any]]] = None, guestSettings: Optional[dict[str, dict[str, Any]]] = None, internalId: Optional[str] = None, isArchived: Optional[bool] = None, memberSettings: Optional[dict[str, dict[str, Any]]] = None, messagingSettings: Optional[dict[str, dict[str, Any]]] = None, specialization: Optional[str] = None, summary: Optional[dict[str, dict[str, Any]]] = None, tenantId: Optional[str] = None, visibility: Optional[str] = None, webUrl: Optional[str] = None, allChannels: Optional[List[Any]] = None, channels: Optional[List[Any]] = None, group: Optional[Any] = None, incomingChannels: Optional[List[Any]] = None, installedApps: Optional[List[Any]] = None, members: Optional[List[Any]] = None, operations: Optional[List[Any]] = None, permissionGrants: Optional[List[Any]] = None, photo: Optional[Any] = None, primaryChannel: Optional[Any] = None, schedule: Optional[Any] = None, tags: Optional[List[Any]] = None, template: Optional[Any] = None) -> Any:
+    def create_team(
+        self,
+        id: str | None = None,
+        classification: str | None = None,
+        createdDateTime: str | None = None,
+        description: str | None = None,
+        displayName: str | None = None,
+        firstChannelName: str | None = None,
+        funSettings: dict[str, dict[str, Any]] | None = None,
+        guestSettings: dict[str, dict[str, Any]] | None = None,
+        internalId: str | None = None,
+        isArchived: bool | None = None,
+        memberSettings: dict[str, dict[str, Any]] | None = None,
+        messagingSettings: dict[str, dict[str, Any]] | None = None,
+        specialization: str | None = None,
+        summary: dict[str, dict[str, Any]] | None = None,
+        tenantId: str | None = None,
+        visibility: str | None = None,
+        webUrl: str | None = None,
+        allChannels: list[Any] | None = None,
+        channels: list[Any] | None = None,
+        group: Any | None = None,
+        incomingChannels: list[Any] | None = None,
+        installedApps: list[Any] | None = None,
+        members: list[Any] | None = None,
+        operations: list[Any] | None = None,
+        permissionGrants: list[Any] | None = None,
+        photo: Any | None = None,
+        primaryChannel: Any | None = None,
+        schedule: Any | None = None,
+        tags: list[Any] | None = None,
+        template: Any | None = None,
+    ) -> Any:
         """
         Create team
 
@@ -787,44 +2187,58 @@ class MsTeamsApp(APIApplication):
         """
         request_body_data = None
         request_body_data = {
-            'id': id,
-            'classification': classification,
-            'createdDateTime': createdDateTime,
-            'description': description,
-            'displayName': displayName,
-            'firstChannelName': firstChannelName,
-            'funSettings': funSettings,
-            'guestSettings': guestSettings,
-            'internalId': internalId,
-            'isArchived': isArchived,
-            'memberSettings': memberSettings,
-            'messagingSettings': messagingSettings,
-            'specialization': specialization,
-            'summary': summary,
-            'tenantId': tenantId,
-            'visibility': visibility,
-            'webUrl': webUrl,
-            'allChannels': allChannels,
-            'channels': channels,
-            'group': group,
-            'incomingChannels': incomingChannels,
-            'installedApps': installedApps,
-            'members': members,
-            'operations': operations,
-            'permissionGrants': permissionGrants,
-            'photo': photo,
-            'primaryChannel': primaryChannel,
-            'schedule': schedule,
-            'tags': tags,
-            'template': template,
+            "id": id,
+            "classification": classification,
+            "createdDateTime": createdDateTime,
+            "description": description,
+            "displayName": displayName,
+            "firstChannelName": firstChannelName,
+            "funSettings": funSettings,
+            "guestSettings": guestSettings,
+            "internalId": internalId,
+            "isArchived": isArchived,
+            "memberSettings": memberSettings,
+            "messagingSettings": messagingSettings,
+            "specialization": specialization,
+            "summary": summary,
+            "tenantId": tenantId,
+            "visibility": visibility,
+            "webUrl": webUrl,
+            "allChannels": allChannels,
+            "channels": channels,
+            "group": group,
+            "incomingChannels": incomingChannels,
+            "installedApps": installedApps,
+            "members": members,
+            "operations": operations,
+            "permissionGrants": permissionGrants,
+            "photo": photo,
+            "primaryChannel": primaryChannel,
+            "schedule": schedule,
+            "tags": tags,
+            "template": template,
+        }
+        request_body_data = {
+            k: v for k, v in request_body_data.items() if v is not None
         }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
         url = f"{self.base_url}/teams"
         query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
+        response = self._post(
+            url,
+            data=request_body_data,
+            params=query_params,
+            content_type="application/json",
+        )
         return self._handle_response(response)
 
-    def get_team_channel_info(self, team_id: str, channel_id: str, select: Optional[List[str]] = None, expand: Optional[List[str]] = None) -> Any:
+    def get_team_channel_info(
+        self,
+        team_id: str,
+        channel_id: str,
+        select: list[str] | None = None,
+        expand: list[str] | None = None,
+        profile: str | None = None,
+    ) -> Any:
         """
         Get channel
 
@@ -833,6 +2247,7 @@ class MsTeamsApp(APIApplication):
             channel_id (string): channel-id
             select (array): Select properties to be returned
             expand (array): Expand related entities
+            profile (string): Projection profile, one of 'minimal', 'summary' or 'full'; fills in select/expand and trims the result
 
         Returns:
             Any: Retrieved navigation property
@@ -848,11 +2263,49 @@ class MsTeamsApp(APIApplication):
         if channel_id is None:
             raise ValueError("Missing required parameter 'channel-id'.")
         url = f"{self.base_url}/teams/{team_id}/channels/{channel_id}"
-        query_params = {k: v for k, v in [('$select', select), ('$expand', expand)] if v is not None}
+        projection = self._projection("channel", profile, select, expand)
+        query_params = {
+            k: v
+            for k, v in [
+                ("$select", projection.select(select)),
+                ("$expand", projection.expand(expand)),
+            ]
+            if v is not None
+        }
         response = self._get(url, params=query_params)
-        return self._handle_response(response)
-
-    def update_chat_message_by_team_channel(self, team_id: str, channel_id: str, chatMessage_id: str, id: Optional[str] = None, attachments: Optional[List[dict[str, dict[str, Any]]]] = None, body: Optional[dict[str, dict[str, Any]]] = None, channelIdentity: Optional[dict[str, dict[str, Any]]] = None, chatId: Optional[str] = None, createdDateTime: Optional[str] = None, deletedDateTime: Optional[str] = None, etag: Optional[str] = None, eventDetail: Optional[dict[str, dict[str, Any]]] = None, from_: Optional[Any] = None, importance: Optional[str] = None, lastEditedDateTime: Optional[str] = None, lastModifiedDateTime: Optional[str] = None, locale: Optional[str] = None, mentions: Optional[List[dict[str, dict[str, Any]]]] = None, messageHistory: Optional[List[dict[str, dict[str, Any]]]] = None, messageType: Optional[str] = None, policyViolation: Optional[dict[str, dict[str, Any]]] = None, reactions: Optional[List[dict[str, dict[str, Any]]]] = None, replyToId: Optional[str] = None, subject: Optional[str] = None, summary: Optional[str] = None, webUrl: Optional[str] = None, hostedContents: Optional[List[Any]] = None, replies: Optional[List[Any]] = None) -> Any:
+        return projection.apply(self._handle_response(response))
+
+    def update_chat_message_by_team_channel(
+        self,
+        team_id: str,
+        channel_id: str,
+        chatMessage_id: str,
+        id: str | None = None,
+        attachments: list[dict[str, dict[str, Any]]] | None = None,
+        body: dict[str, dict[str, Any]] | None = None,
+        channelIdentity: dict[str, dict[str, Any]] | None = None,
+        chatId: str | None = None,
+        createdDateTime: str | None = None,
+        deletedDateTime: str | None = None,
+        etag: str | None = None,
+        eventDetail: dict[str, dict[str, Any]] | None = None,
+        from_: Any | None = None,
+        importance: str | None = None,
+        lastEditedDateTime: str | None = None,
+        lastModifiedDateTime: str | None = None,
+        locale: str | None = None,
+        mentions: list[dict[str, dict[str, Any]]] | None = None,
+        messageHistory: list[dict[str, dict[str, Any]]] | None = None,
+        messageType: str | None = None,
+        policyViolation: dict[str, dict[str, Any]] | None = None,
+        reactions: list[dict[str, dict[str, Any]]] | None = None,
+        replyToId: str | None = None,
+        subject: str | None = None,
+        summary: str | None = None,
+        webUrl: str | None = None,
+        hostedContents: list[Any] | None = None,
+        replies: list[Any] | None = None,
+    ) -> Any:
         """
         Update chatMessage
 
@@ -903,39 +2356,72 @@ class MsTeamsApp(APIApplication):
             raise ValueError("Missing required parameter 'chatMessage-id'.")
         request_body_data = None
         request_body_data = {
-            'id': id,
-            'attachments': attachments,
-            'body': body,
-            'channelIdentity': channelIdentity,
-            'chatId': chatId,
-            'createdDateTime': createdDateTime,
-            'deletedDateTime': deletedDateTime,
-            'etag': etag,
-            'eventDetail': eventDetail,
-            'from': from_,
-            'importance': importance,
-            'lastEditedDateTime': lastEditedDateTime,
-            'lastModifiedDateTime': lastModifiedDateTime,
-            'locale': locale,
-            'mentions': mentions,
-            'messageHistory': messageHistory,
-            'messageType': messageType,
-            'policyViolation': policyViolation,
-            'reactions': reactions,
-            'replyToId': replyToId,
-            'subject': subject,
-            'summary': summary,
-            'webUrl': webUrl,
-            'hostedContents': hostedContents,
-            'replies': replies,
+            "id": id,
+            "attachments": attachments,
+            "body": body,
+            "channelIdentity": channelIdentity,
+            "chatId": chatId,
+            "createdDateTime": createdDateTime,
+            "deletedDateTime": deletedDateTime,
+            "etag": etag,
+            "eventDetail": eventDetail,
+            "from": from_,
+            "importance": importance,
+            "lastEditedDateTime": lastEditedDateTime,
+            "lastModifiedDateTime": lastModifiedDateTime,
+            "locale": locale,
+            "mentions": mentions,
+            "messageHistory": messageHistory,
+            "messageType": messageType,
+            "policyViolation": policyViolation,
+            "reactions": reactions,
+            "replyToId": replyToId,
+            "subject": subject,
+            "summary": summary,
+            "webUrl": webUrl,
+            "hostedContents": hostedContents,
+            "replies": replies,
+        }
+        request_body_data = {
+            k: v for k, v in request_body_data.items() if v is not None
         }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
         url = f"{self.base_url}/teams/{team_id}/channels/{channel_id}/messages/{chatMessage_id}"
         query_params = {}
         response = self._patch(url, data=request_body_data, params=query_params)
         return self._handle_response(response)
 
-    def update_message_reply(self, team_id: str, channel_id: str, chatMessage_id: str, chatMessage_id1: str, id: Optional[str] = None, attachments: Optional[List[dict[str, dict[str, Any]]]] = None, body: Optional[dict[str, dict[str, Any]]] = None, channelIdentity: Optional[dict[str, dict[str, Any]]] = None, chatId: Optional[str] = None, createdDateTime: Optional[str] = None, deletedDateTime: Optional[str] = None, etag: Optional[str] = None, eventDetail: Optional[dict[str, dict[str, Any]]] = None, from_: Optional[Any] = None, importance: Optional[str] = None, lastEditedDateTime: Optional[str] = None, lastModifiedDateTime: Optional[str] = None, locale: Optional[str] = None, mentions: Optional[List[dict[str, dict[str, Any]]]] = None, messageHistory: Optional[List[dict[str, dict[str, Any]]]] = None, messageType: Optional[str] = None, policyViolation: Optional[dict[str, dict[str, Any]]] = None, reactions: Optional[List[dict[str, dict[str, Any]]]] = None, replyToId: Optional[str] = None, subject: Optional[str] = None, summary: Optional[str] = None, webUrl: Optional[str] = None, hostedContents: Optional[List[Any]] = None, replies: Optional[List[Any]] = None) -> Any:
+    def update_message_reply(
+        self,
+        team_id: str,
+        channel_id: str,
+        chatMessage_id: str,
+        chatMessage_id1: str,
+        id: str | None = None,
+        attachments: list[dict[str, dict[str, Any]]] | None = None,
+        body: dict[str, dict[str, Any]] | None = None,
+        channelIdentity: dict[str, dict[str, Any]] | None = None,
+        chatId: str | None = None,
+        createdDateTime: str | None = None,
+        deletedDateTime: str | None = None,
+        etag: str | None = None,
+        eventDetail: dict[str, dict[str, Any]] | None = None,
+        from_: Any | None = None,
+        importance: str | None = None,
+        lastEditedDateTime: str | None = None,
+        lastModifiedDateTime: str | None = None,
+        locale: str | None = None,
+        mentions: list[dict[str, dict[str, Any]]] | None = None,
+        messageHistory: list[dict[str, dict[str, Any]]] | None = None,
+        messageType: str | None = None,
+        policyViolation: dict[str, dict[str, Any]] | None = None,
+        reactions: list[dict[str, dict[str, Any]]] | None = None,
+        replyToId: str | None = None,
+        subject: str | None = None,
+        summary: str | None = None,
+        webUrl: str | None = None,
+        hostedContents: list[Any] | None = None,
+        replies: list[Any] | None = None,
+    ) -> Any:
         """
         Update the navigation property replies in teams
 
@@ -989,39 +2475,57 @@ class MsTeamsApp(APIApplication):
             raise ValueError("Missing required parameter 'chatMessage-id1'.")
         request_body_data = None
         request_body_data = {
-            'id': id,
-            'attachments': attachments,
-            'body': body,
-            'channelIdentity': channelIdentity,
-            'chatId': chatId,
-            'createdDateTime': createdDateTime,
-            'deletedDateTime': deletedDateTime,
-            'etag': etag,
-            'eventDetail': eventDetail,
-            'from': from_,
-            'importance': importance,
-            'lastEditedDateTime': lastEditedDateTime,
-            'lastModifiedDateTime': lastModifiedDateTime,
-            'locale': locale,
-            'mentions': mentions,
-            'messageHistory': messageHistory,
-            'messageType': messageType,
-            'policyViolation': policyViolation,
-            'reactions': reactions,
-            'replyToId': replyToId,
-            'subject': subject,
-            'summary': summary,
-            'webUrl': webUrl,
-            'hostedContents': hostedContents,
-            'replies': replies,
+            "id": id,
+            "attachments": attachments,
+            "body": body,
+            "channelIdentity": channelIdentity,
+            "chatId": chatId,
+            "createdDateTime": createdDateTime,
+            "deletedDateTime": deletedDateTime,
+            "etag": etag,
+            "eventDetail": eventDetail,
+            "from": from_,
+            "importance": importance,
+            "lastEditedDateTime": lastEditedDateTime,
+            "lastModifiedDateTime": lastModifiedDateTime,
+            "locale": locale,
+            "mentions": mentions,
+            "messageHistory": messageHistory,
+            "messageType": messageType,
+            "policyViolation": policyViolation,
+            "reactions": reactions,
+            "replyToId": replyToId,
+            "subject": subject,
+            "summary": summary,
+            "webUrl": webUrl,
+            "hostedContents": hostedContents,
+            "replies": replies,
+        }
+        request_body_data = {
+            k: v for k, v in request_body_data.items() if v is not None
         }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
         url = f"{self.base_url}/teams/{team_id}/channels/{channel_id}/messages/{chatMessage_id}/replies/{chatMessage_id1}"
         query_params = {}
         response = self._patch(url, data=request_body_data, params=query_params)
         return self._handle_response(response)
 
-    def get_channel_tabs(self, team_id: str, channel_id: str, top: Optional[int] = None, skip: Optional[int] = None, search: Optional[str] = None, filter: Optional[str] = None, count: Optional[bool] = None, orderby: Optional[List[str]] = None, select: Optional[List[str]] = None, expand: Optional[List[str]] = None) -> dict[str, Any]:
+    def get_channel_tabs(
+        self,
+        team_id: str,
+        channel_id: str,
+        top: int | None = None,
+        skip: int | None = None,
+        search: str | None = None,
+        filter: str | None = None,
+        count: bool | None = None,
+        orderby: list[str] | None = None,
+        select: list[str] | None = None,
+        expand: list[str] | None = None,
+        profile: str | None = None,
+        all: bool = False,
+        max_items: int | None = None,
+        max_pages: int | None = None,
+    ) -> dict[str, Any]:
         """
         List tabs in channel
 
@@ -1036,6 +2540,10 @@ class MsTeamsApp(APIApplication):
             orderby (array): Order items by property values
             select (array): Select properties to be returned
             expand (array): Expand related entities
+            profile (string): Projection profile, one of 'minimal', 'summary' or 'full'; fills in select/expand and trims the result
+            all (boolean): Follow '@odata.nextLink' and return every page as one collection
+            max_items (integer): With 'all', stop after this many items; a result cut short carries 'truncated'
+            max_pages (integer): With 'all', stop after this many pages
 
         Returns:
             dict[str, Any]: Retrieved collection
@@ -1051,17 +2559,116 @@ class MsTeamsApp(APIApplication):
         if channel_id is None:
             raise ValueError("Missing required parameter 'channel-id'.")
         url = f"{self.base_url}/teams/{team_id}/channels/{channel_id}/tabs"
-        query_params = {k: v for k, v in [('$top', top), ('$skip', skip), ('$search', search), ('$filter', filter), ('$count', count), ('$orderby', orderby), ('$select', select), ('$expand', expand)] if v is not None}
+        projection = self._projection("teamsTab", profile, select, expand)
+        query_params = {
+            k: v
+            for k, v in [
+                ("$top", top),
+                ("$skip", skip),
+                ("$search", search),
+                ("$filter", filter),
+                ("$count", count),
+                ("$orderby", orderby),
+                ("$select", projection.select(select)),
+                ("$expand", projection.expand(expand)),
+            ]
+            if v is not None
+        }
+        if all:
+            return self._paginate(
+                url,
+                query_params,
+                max_items=max_items,
+                max_pages=max_pages,
+                projection=projection,
+            ).collect()
         response = self._get(url, params=query_params)
-        return self._handle_response(response)
-
-    def add_channel_tab(self, team_id: str, channel_id: str, id: Optional[str] = None, configuration: Optional[dict[str, dict[str, Any]]] = None, displayName: Optional[str] = None, webUrl: Optional[str] = None, teamsApp: Optional[Any] = None) -> Any:
+        return projection.apply(self._handle_response(response))
+
+    def iter_channel_tabs(
+        self,
+        team_id: str,
+        channel_id: str,
+        top: int | None = None,
+        skip: int | None = None,
+        search: str | None = None,
+        filter: str | None = None,
+        count: bool | None = None,
+        orderby: list[str] | None = None,
+        select: list[str] | None = None,
+        expand: list[str] | None = None,
+        profile: str | None = None,
+        max_items: int | None = None,
+        max_pages: int | None = None,
+    ) -> PageIterator:
         """
-        Add tab to channel
+        List tabs in channel, lazily following '@odata.nextLink' across pages
 
         Args:
             team_id (string): team-id
             channel_id (string): channel-id
+            top (integer): Page size requested from the server Example: '50'.
+            skip (integer): Skip the first n items
+            search (string): Search items by search phrases
+            filter (string): Filter items by property values
+            count (boolean): Include count of items
+            orderby (array): Order items by property values
+            select (array): Select properties to be returned
+            expand (array): Expand related entities
+            profile (string): Projection profile, one of 'minimal', 'summary' or 'full'; fills in select/expand and trims the result
+            max_items (integer): Stop after yielding this many items
+            max_pages (integer): Stop after fetching this many pages
+
+        Returns:
+            PageIterator: Iterable of collection items; pages are fetched on demand
+
+        Raises:
+            HTTPStatusError: Raised when the API request fails with detailed error information including status code and response body.
+        """
+        if team_id is None:
+            raise ValueError("Missing required parameter 'team-id'.")
+        if channel_id is None:
+            raise ValueError("Missing required parameter 'channel-id'.")
+        url = f"{self.base_url}/teams/{team_id}/channels/{channel_id}/tabs"
+        projection = self._projection("teamsTab", profile, select, expand)
+        query_params = {
+            k: v
+            for k, v in [
+                ("$top", top),
+                ("$skip", skip),
+                ("$search", search),
+                ("$filter", filter),
+                ("$count", count),
+                ("$orderby", orderby),
+                ("$select", projection.select(select)),
+                ("$expand", projection.expand(expand)),
+            ]
+            if v is not None
+        }
+        return self._paginate(
+            url,
+            query_params,
+            max_items=max_items,
+            max_pages=max_pages,
+            projection=projection,
+        )
+
+    def add_channel_tab(
+        self,
+        team_id: str,
+        channel_id: str,
+        id: str | None = None,
+        configuration: dict[str, dict[str, Any]] | None = None,
+        displayName: str | None = None,
+        webUrl: str | None = None,
+        teamsApp: Any | None = None,
+    ) -> Any:
+        """
+        Add tab to channel
+
+        Args:
+            team_id (string): team-id, or the team's display name
+            channel_id (string): channel-id, or the channel's display name
             id (string): The unique identifier for an entity. Read-only.
             configuration (object): configuration
             displayName (string): Name of the tab.
@@ -1073,6 +2680,7 @@ class MsTeamsApp(APIApplication):
 
         Raises:
             HTTPStatusError: Raised when the API request fails with detailed error information including status code and response body.
+            ValueError: Raised when a name matches no team or channel, or several.
 
         Tags:
             teams.channel
@@ -1081,21 +2689,39 @@ class MsTeamsApp(APIApplication):
             raise ValueError("Missing required parameter 'team-id'.")
         if channel_id is None:
             raise ValueError("Missing required parameter 'channel-id'.")
+        team_id = self.resolver.team(team_id)
+        channel_id = self.resolver.channel(team_id, channel_id)
         request_body_data = None
         request_body_data = {
-            'id': id,
-            'configuration': configuration,
-            'displayName': displayName,
-            'webUrl': webUrl,
-            'teamsApp': teamsApp,
+            "id": id,
+            "configuration": configuration,
+            "displayName": displayName,
+            "webUrl": webUrl,
+            "teamsApp": teamsApp,
+        }
+        request_body_data = {
+            k: v for k, v in request_body_data.items() if v is not None
         }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
         url = f"{self.base_url}/teams/{team_id}/channels/{channel_id}/tabs"
         query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
+        response = self._post(
+            url,
+            data=request_body_data,
+            params=query_params,
+            content_type="application/json",
+        )
+        self.resolver.invalidate(team_id, channel_id)
         return self._handle_response(response)
 
-    def get_team_tab_info(self, team_id: str, channel_id: str, teamsTab_id: str, select: Optional[List[str]] = None, expand: Optional[List[str]] = None) -> Any:
+    def get_team_tab_info(
+        self,
+        team_id: str,
+        channel_id: str,
+        teamsTab_id: str,
+        select: list[str] | None = None,
+        expand: list[str] | None = None,
+        profile: str | None = None,
+    ) -> Any:
         """
         Get tab
 
@@ -1105,6 +2731,7 @@ class MsTeamsApp(APIApplication):
             teamsTab_id (string): teamsTab-id
             select (array): Select properties to be returned
             expand (array): Expand related entities
+            profile (string): Projection profile, one of 'minimal', 'summary' or 'full'; fills in select/expand and trims the result
 
         Returns:
             Any: Retrieved navigation property
@@ -1121,19 +2748,39 @@ class MsTeamsApp(APIApplication):
             raise ValueError("Missing required parameter 'channel-id'.")
         if teamsTab_id is None:
             raise ValueError("Missing required parameter 'teamsTab-id'.")
-        url = f"{self.base_url}/teams/{team_id}/channels/{channel_id}/tabs/{teamsTab_id}"
-        query_params = {k: v for k, v in [('$select', select), ('$expand', expand)] if v is not None}
+        url = (
+            f"{self.base_url}/teams/{team_id}/channels/{channel_id}/tabs/{teamsTab_id}"
+        )
+        projection = self._projection("teamsTab", profile, select, expand)
+        query_params = {
+            k: v
+            for k, v in [
+                ("$select", projection.select(select)),
+                ("$expand", projection.expand(expand)),
+            ]
+            if v is not None
+        }
         response = self._get(url, params=query_params)
-        return self._handle_response(response)
-
-    def update_tab_info(self, team_id: str, channel_id: str, teamsTab_id: str, id: Optional[str] = None, configuration: Optional[dict[str, dict[str, Any]]] = None, displayName: Optional[str] = None, webUrl: Optional[str] = None, teamsApp: Optional[Any] = None) -> Any:
+        return projection.apply(self._handle_response(response))
+
+    def update_tab_info(
+        self,
+        team_id: str,
+        channel_id: str,
+        teamsTab_id: str,
+        id: str | None = None,
+        configuration: dict[str, dict[str, Any]] | None = None,
+        displayName: str | None = None,
+        webUrl: str | None = None,
+        teamsApp: Any | None = None,
+    ) -> Any:
         """
         Update tab
 
         Args:
-            team_id (string): team-id
-            channel_id (string): channel-id
-            teamsTab_id (string): teamsTab-id
+            team_id (string): team-id, or the team's display name
+            channel_id (string): channel-id, or the channel's display name
+            teamsTab_id (string): teamsTab-id, or the tab's display name
             id (string): The unique identifier for an entity. Read-only.
             configuration (object): configuration
             displayName (string): Name of the tab.
@@ -1145,6 +2792,7 @@ class MsTeamsApp(APIApplication):
 
         Raises:
             HTTPStatusError: Raised when the API request fails with detailed error information including status code and response body.
+            ValueError: Raised when a name matches no team, channel or tab, or several.
 
         Tags:
             teams.channel
@@ -1155,21 +2803,31 @@ class MsTeamsApp(APIApplication):
             raise ValueError("Missing required parameter 'channel-id'.")
         if teamsTab_id is None:
             raise ValueError("Missing required parameter 'teamsTab-id'.")
+        team_id = self.resolver.team(team_id)
+        channel_id = self.resolver.channel(team_id, channel_id)
+        teamsTab_id = self.resolver.tab(team_id, channel_id, teamsTab_id)
         request_body_data = None
         request_body_data = {
-            'id': id,
-            'configuration': configuration,
-            'displayName': displayName,
-            'webUrl': webUrl,
-            'teamsApp': teamsApp,
+            "id": id,
+            "configuration": configuration,
+            "displayName": displayName,
+            "webUrl": webUrl,
+            "teamsApp": teamsApp,
         }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/teams/{team_id}/channels/{channel_id}/tabs/{teamsTab_id}"
+        request_body_data = {
+            k: v for k, v in request_body_data.items() if v is not None
+        }
+        url = (
+            f"{self.base_url}/teams/{team_id}/channels/{channel_id}/tabs/{teamsTab_id}"
+        )
         query_params = {}
         response = self._patch(url, data=request_body_data, params=query_params)
+        self.resolver.invalidate(team_id, channel_id)
         return self._handle_response(response)
 
-    def delete_channel_tab_by_id(self, team_id: str, channel_id: str, teamsTab_id: str) -> Any:
+    def delete_channel_tab_by_id(
+        self, team_id: str, channel_id: str, teamsTab_id: str
+    ) -> Any:
         """
         Delete tab from channel
 
@@ -1193,12 +2851,21 @@ class MsTeamsApp(APIApplication):
             raise ValueError("Missing required parameter 'channel-id'.")
         if teamsTab_id is None:
             raise ValueError("Missing required parameter 'teamsTab-id'.")
-        url = f"{self.base_url}/teams/{team_id}/channels/{channel_id}/tabs/{teamsTab_id}"
+        url = (
+            f"{self.base_url}/teams/{team_id}/channels/{channel_id}/tabs/{teamsTab_id}"
+        )
         query_params = {}
         response = self._delete(url, params=query_params)
+        self.resolver.invalidate(team_id, channel_id)
         return self._handle_response(response)
 
-    def get_primary_team_channel(self, team_id: str, select: Optional[List[str]] = None, expand: Optional[List[str]] = None) -> Any:
+    def get_primary_team_channel(
+        self,
+        team_id: str,
+        select: list[str] | None = None,
+        expand: list[str] | None = None,
+        profile: str | None = None,
+    ) -> Any:
         """
         Get primaryChannel
 
@@ -1206,6 +2873,7 @@ class MsTeamsApp(APIApplication):
             team_id (string): team-id
             select (array): Select properties to be returned
             expand (array): Expand related entities
+            profile (string): Projection profile, one of 'minimal', 'summary' or 'full'; fills in select/expand and trims the result
 
         Returns:
             Any: Retrieved navigation property
@@ -1219,11 +2887,34 @@ class MsTeamsApp(APIApplication):
         if team_id is None:
             raise ValueError("Missing required parameter 'team-id'.")
         url = f"{self.base_url}/teams/{team_id}/primaryChannel"
-        query_params = {k: v for k, v in [('$select', select), ('$expand', expand)] if v is not None}
+        projection = self._projection("channel", profile, select, expand)
+        query_params = {
+            k: v
+            for k, v in [
+                ("$select", projection.select(select)),
+                ("$expand", projection.expand(expand)),
+            ]
+            if v is not None
+        }
         response = self._get(url, params=query_params)
-        return self._handle_response(response)
-
-    def get_user_installed_apps(self, user_id: str, top: Optional[int] = None, skip: Optional[int] = None, search: Optional[str] = None, filter: Optional[str] = None, count: Optional[bool] = None, orderby: Optional[List[str]] = None, select: Optional[List[str]] = None, expand: Optional[List[str]] = None) -> dict[str, Any]:
+        return projection.apply(self._handle_response(response))
+
+    def get_user_installed_apps(
+        self,
+        user_id: str,
+        top: int | None = None,
+        skip: int | None = None,
+        search: str | None = None,
+        filter: str | None = None,
+        count: bool | None = None,
+        orderby: list[str] | None = None,
+        select: list[str] | None = None,
+        expand: list[str] | None = None,
+        profile: str | None = None,
+        all: bool = False,
+        max_items: int | None = None,
+        max_pages: int | None = None,
+    ) -> dict[str, Any]:
         """
         List apps installed for user
 
@@ -1237,6 +2928,10 @@ class MsTeamsApp(APIApplication):
             orderby (array): Order items by property values
             select (array): Select properties to be returned
             expand (array): Expand related entities
+            profile (string): Projection profile, one of 'minimal', 'summary' or 'full'; fills in select/expand and trims the result
+            all (boolean): Follow '@odata.nextLink' and return every page as one collection
+            max_items (integer): With 'all', stop after this many items; a result cut short carries 'truncated'
+            max_pages (integer): With 'all', stop after this many pages
 
         Returns:
             dict[str, Any]: Retrieved collection
@@ -1250,12 +2945,493 @@ class MsTeamsApp(APIApplication):
         if user_id is None:
             raise ValueError("Missing required parameter 'user-id'.")
         url = f"{self.base_url}/users/{user_id}/teamwork/installedApps"
-        query_params = {k: v for k, v in [('$top', top), ('$skip', skip), ('$search', search), ('$filter', filter), ('$count', count), ('$orderby', orderby), ('$select', select), ('$expand', expand)] if v is not None}
+        projection = self._projection("teamsAppInstallation", profile, select, expand)
+        query_params = {
+            k: v
+            for k, v in [
+                ("$top", top),
+                ("$skip", skip),
+                ("$search", search),
+                ("$filter", filter),
+                ("$count", count),
+                ("$orderby", orderby),
+                ("$select", projection.select(select)),
+                ("$expand", projection.expand(expand)),
+            ]
+            if v is not None
+        }
+        if all:
+            return self._paginate(
+                url,
+                query_params,
+                max_items=max_items,
+                max_pages=max_pages,
+                projection=projection,
+            ).collect()
         response = self._get(url, params=query_params)
-        return self._handle_response(response)
+        return projection.apply(self._handle_response(response))
+
+    def iter_user_installed_apps(
+        self,
+        user_id: str,
+        top: int | None = None,
+        skip: int | None = None,
+        search: str | None = None,
+        filter: str | None = None,
+        count: bool | None = None,
+        orderby: list[str] | None = None,
+        select: list[str] | None = None,
+        expand: list[str] | None = None,
+        profile: str | None = None,
+        max_items: int | None = None,
+        max_pages: int | None = None,
+    ) -> PageIterator:
+        """
+        List apps installed for user, lazily following '@odata.nextLink' across pages
+
+        Args:
+            user_id (string): user-id
+            top (integer): Page size requested from the server Example: '50'.
+            skip (integer): Skip the first n items
+            search (string): Search items by search phrases
+            filter (string): Filter items by property values
+            count (boolean): Include count of items
+            orderby (array): Order items by property values
+            select (array): Select properties to be returned
+            expand (array): Expand related entities
+            profile (string): Projection profile, one of 'minimal', 'summary' or 'full'; fills in select/expand and trims the result
+            max_items (integer): Stop after yielding this many items
+            max_pages (integer): Stop after fetching this many pages
+
+        Returns:
+            PageIterator: Iterable of collection items; pages are fetched on demand
+
+        Raises:
+            HTTPStatusError: Raised when the API request fails with detailed error information including status code and response body.
+        """
+        if user_id is None:
+            raise ValueError("Missing required parameter 'user-id'.")
+        url = f"{self.base_url}/users/{user_id}/teamwork/installedApps"
+        projection = self._projection("teamsAppInstallation", profile, select, expand)
+        query_params = {
+            k: v
+            for k, v in [
+                ("$top", top),
+                ("$skip", skip),
+                ("$search", search),
+                ("$filter", filter),
+                ("$count", count),
+                ("$orderby", orderby),
+                ("$select", projection.select(select)),
+                ("$expand", projection.expand(expand)),
+            ]
+            if v is not None
+        }
+        return self._paginate(
+            url,
+            query_params,
+            max_items=max_items,
+            max_pages=max_pages,
+            projection=projection,
+        )
+
+    def get_thread(
+        self,
+        team_id: str,
+        channel_id: str,
+        message_id: str,
+        profile: str | None = None,
+    ) -> dict[str, Any]:
+        """
+        Get channel thread
+
+        Returns a channel message with all of its replies, oldest first. The thread is fetched with
+        '$expand=replies', usually in a single request; replies beyond what Graph embeds are paged in.
+
+        Args:
+            team_id (string): team-id or team name
+            channel_id (string): channel-id or channel name
+            message_id (string): Id of the thread's root message
+            profile (string): Projection profile, one of 'minimal', 'summary' or 'full'; trims the root and every reply
+
+        Returns:
+            dict[str, Any]: The root message under 'message', its replies under 'replies' and their number under 'replyCount'
+
+        Raises:
+            HTTPStatusError: Raised when the API request fails with detailed error information including status code and response body.
+            ValueError: Raised when a team or channel name matches no team or channel, or several.
+
+        Tags:
+            teams.channel, chatMessage, read
+        """
+        if team_id is None:
+            raise ValueError("Missing required parameter 'team-id'.")
+        if channel_id is None:
+            raise ValueError("Missing required parameter 'channel-id'.")
+        if message_id is None:
+            raise ValueError("Missing required parameter 'message-id'.")
+        team_id = self.resolver.team(team_id, exact=False)
+        channel_id = self.resolver.channel(team_id, channel_id, exact=False)
+        return ThreadFetcher(self, self._projection("chatMessage", profile)).fetch(
+            team_id, channel_id, message_id
+        )
+
+    def get_threads(
+        self,
+        team_id: str,
+        channel_id: str,
+        message_ids: list[str],
+        profile: str | None = None,
+        max_concurrency: int = THREAD_CONCURRENCY,
+    ) -> dict[str, Any]:
+        """
+        Get channel threads
+
+        Returns several channel threads, each root message with all of its replies, fetched concurrently. Threads
+        come back in the order of 'message_ids', once each; roots that cannot be fetched are listed under 'errors'.
+
+        Args:
+            team_id (string): team-id or team name
+            channel_id (string): channel-id or channel name
+            message_ids (array): Ids of the threads' root messages
+            profile (string): Projection profile, one of 'minimal', 'summary' or 'full'; trims every root and reply
+            max_concurrency (integer): Threads fetched at the same time
+
+        Returns:
+            dict[str, Any]: Threads under 'value', each with 'message', 'replies' and 'replyCount', and failed roots under 'errors' if any
+
+        Raises:
+            ValueError: Raised when a team or channel name matches no team or channel, or several.
+
+        Tags:
+            teams.channel, chatMessage, read
+        """
+        if team_id is None:
+            raise ValueError("Missing required parameter 'team-id'.")
+        if channel_id is None:
+            raise ValueError("Missing required parameter 'channel-id'.")
+        if not message_ids:
+            raise ValueError("Missing required parameter 'message-ids'.")
+        team_id = self.resolver.team(team_id, exact=False)
+        channel_id = self.resolver.channel(team_id, channel_id, exact=False)
+        return ThreadFetcher(
+            self, self._projection("chatMessage", profile), max_concurrency
+        ).fetch_many(team_id, channel_id, message_ids)
+
+    def download_message_files(
+        self,
+        message_id: str,
+        destination: str,
+        chat_id: str | None = None,
+        team_id: str | None = None,
+        channel_id: str | None = None,
+        hosted_contents: bool = True,
+        attachments: bool = True,
+        max_concurrency: int = DOWNLOAD_CONCURRENCY,
+        overwrite: bool = False,
+    ) -> dict[str, Any]:
+        """
+        Download message files
+
+        Saves the hosted contents (inline images and the like) and the file attachments of a chat or channel message
+        into a local directory. Files are streamed to disk in chunks and downloaded in parallel; a download that was
+        interrupted, or left behind as '.part' by an earlier call, resumes where it stopped, unless the file changed
+        since. Files already in the directory are kept, and a new file with the same name is saved as 'name (2).ext'.
+
+        Args:
+            message_id (string): Id of the message
+            destination (string): Directory the files are written to; created if missing
+            chat_id (string): chat-id or chat topic, for a chat message
+            team_id (string): team-id or team name, for a channel message
+            channel_id (string): channel-id or channel name, for a channel message
+            hosted_contents (boolean): Download the message's hosted contents
+            attachments (boolean): Download the message's file attachments
+            max_concurrency (integer): Files downloaded at the same time
+            overwrite (boolean): Replace files of the same name in the directory instead of saving under a numbered name
+
+        Returns:
+            dict[str, Any]: Downloaded files under 'value', each with 'name', 'path', 'bytes' and 'content_type', and failed ones under 'errors' if any
+
+        Raises:
+            HTTPStatusError: Raised when fetching the message or its hosted contents fails.
+            ValueError: Raised when neither a chat nor a team and channel are given, or a name matches none or several.
+
+        Tags:
+            chats.chatMessage, teams.channel, download
+        """
+        if message_id is None:
+            raise ValueError("Missing required parameter 'message-id'.")
+        if destination is None:
+            raise ValueError("Missing required parameter 'destination'.")
+        if chat_id:
+            message_url = f"{self.base_url}/chats/{self.resolver.chat(chat_id, exact=False)}/messages/{message_id}"
+        elif team_id and channel_id:
+            team_id = self.resolver.team(team_id, exact=False)
+            message_url = f"{self.base_url}/teams/{team_id}/channels/{self.resolver.channel(team_id, channel_id, exact=False)}/messages/{message_id}"
+        else:
+            raise ValueError("Give a 'chat_id', or a 'team_id' and 'channel_id'.")
+        downloads = []
+        if hosted_contents:
+            downloads += [
+                hosted_content_download(message_url, content)
+                for content in self._paginate(f"{message_url}/hostedContents")
+            ]
+        if attachments:
+            message = self._handle_response(self._get(message_url))
+            downloads += [
+                download
+                for download in (
+                    attachment_download(self.base_url, attachment)
+                    for attachment in message.get("attachments") or []
+                )
+                if download is not None
+            ]
+        return Downloader(self, max_concurrency=max_concurrency).download_many(
+            downloads, destination, overwrite=overwrite
+        )
+
+    def send_file_message(
+        self,
+        file_path: str,
+        chat_id: str | None = None,
+        team_id: str | None = None,
+        channel_id: str | None = None,
+        content: str | None = None,
+        name: str | None = None,
+        idempotency_key: str | None = None,
+    ) -> dict[str, Any]:
+        """
+        Send file message
+
+        Uploads a local file and posts it as an attachment to a chat or channel, with optional message text. The file
+        is memory-mapped and sent in chunks through a resumable upload session, so files of any size are uploaded
+        without being read into memory. Chat files go to the sender's 'Microsoft Teams Chat Files' OneDrive folder and
+        the other chat members are given read access to them; channel files go to the channel's SharePoint folder,
+        which the channel's members can already read, as when sharing a file in Teams.
+
+        Args:
+            file_path (string): Path of the local file to send
+            chat_id (string): chat-id or chat topic, to send to a chat
+            team_id (string): team-id or team name, to send to a channel
+            channel_id (string): channel-id or channel name, to send to a channel
+            content (string): Message text (plain text or HTML) shown above the file
+            name (string): File name in Teams; defaults to the local file name
+            idempotency_key (string): Optional key identifying this post; retries with the same key replace the uploaded file and return the original message instead of posting again
+
+        Returns:
+            dict[str, Any]: The posted message, including its ID and attachment
+
+        Raises:
+            HTTPStatusError: Raised when the upload or the post fails.
+            ValueError: Raised when neither a chat nor a team and channel are given, the file is empty, or a name matches none or several.
+
+        Tags:
+            chats.chatMessage, teams.channel, create, send, upload
+        """
+        if file_path is None:
+            raise ValueError("Missing required parameter 'file-path'.")
+        name = upload_name(file_path, name)
+        uploader = Uploader(self)
+        if chat_id:
+            chat_id = self.resolver.chat(chat_id)
+            url = f"{self.base_url}/chats/{chat_id}/messages"
+            item_url = uploader.chat_item_url(name)
+        elif team_id and channel_id:
+            team_id = self.resolver.team(team_id)
+            channel_id = self.resolver.channel(team_id, channel_id)
+            url = f"{self.base_url}/teams/{team_id}/channels/{channel_id}/messages"
+            item_url = uploader.channel_item_url(team_id, channel_id, name)
+        else:
+            raise ValueError("Give a 'chat_id', or a 'team_id' and 'channel_id'.")
+        # The attachment id is only known after the upload, so the key is bound to the
+        # file's name and size instead.
+        request_fingerprint = fingerprint(
+            url, {"name": name, "size": os.path.getsize(file_path), "content": content}
+        )
+        if idempotency_key is not None and current_interceptor() is None:
+            record = self._idempotency_record(idempotency_key, request_fingerprint)
+            if record is not None and record["state"] == DONE:
+                return record["result"]
+        # A retried post replaces the file it uploaded before, which keeps the item, and
+        # so the attachment, the same.
+        item = uploader.upload(
+            file_path, item_url, "replace" if idempotency_key else "rename"
+        )
+        if chat_id:
+            uploader.share_with_chat(item, chat_id)
+        return self._post_message(
+            url, file_message(item, content), idempotency_key, request_fingerprint
+        )
+
+    def sync_channel_messages(
+        self,
+        team_id: str,
+        channel_id: str,
+        top: int | None = None,
+        reset: bool = False,
+    ) -> dict[str, Any]:
+        """
+        Sync channel messages
+
+        Returns only the messages created, edited or deleted in a channel since the previous sync, using the
+        Graph delta query. The first sync (or one with reset) returns the channel's current messages; the
+        resulting delta link is kept in the app's state store for the next call.
+
+        Args:
+            team_id (string): team-id
+            channel_id (string): channel-id
+            top (integer): Page size requested from the server Example: '50'.
+            reset (boolean): Discard the stored delta link and start over with a full sync
+
+        Returns:
+            dict[str, Any]: Changed messages under 'value' and the number of new, edited and deleted messages under 'counts'
+
+        Raises:
+            HTTPStatusError: Raised when the API request fails with detailed error information including status code and response body.
+
+        Tags:
+            teams.channel, sync
+        """
+        if team_id is None:
+            raise ValueError("Missing required parameter 'team-id'.")
+        if channel_id is None:
+            raise ValueError("Missing required parameter 'channel-id'.")
+        if reset:
+            self.sync_state.reset("channel", team_id, channel_id)
+        url = f"{self.base_url}/teams/{team_id}/channels/{channel_id}/messages/delta"
+        query_params = {k: v for k, v in [("$top", top)] if v is not None}
+        delta_link = self.sync_state.get("channel", team_id, channel_id)
+        if delta_link is None:
+            messages, delta_link = self._drain_delta(url, query_params)
+        else:
+            try:
+                messages, delta_link = self._drain_delta(delta_link)
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code not in (400, 410):
+                    raise
+                # Graph rejects expired delta links; the only way forward is a full
+                # resync.
+                messages, delta_link = self._drain_delta(url, query_params)
+        if delta_link:
+            self.sync_state.set(delta_link, "channel", team_id, channel_id)
+        if self.index is not None:
+            self.index.add(messages, team_id=team_id, channel_id=channel_id)
+        return summarize(messages)
+
+    def sync_chat_messages(
+        self, chat_id: str, top: int | None = None, reset: bool = False
+    ) -> dict[str, Any]:
+        """
+        Sync chat messages
+
+        Returns only the messages created, edited or deleted in a chat since the previous sync. Graph v1.0 has no
+        delta query for chat messages, so the sync keeps the latest 'lastModifiedDateTime' seen in the app's state
+        store and filters on it, reaching a second further back and skipping the messages it already returned from
+        there. The first sync (or one with reset) returns the chat's current messages.
+
+        Args:
+            chat_id (string): chat-id
+            top (integer): Page size requested from the server (at most 50) Example: '50'.
+            reset (boolean): Discard the stored watermark and start over with a full sync
+
+        Returns:
+            dict[str, Any]: Changed messages under 'value' and the number of new, edited and deleted messages under 'counts'
+
+        Raises:
+            HTTPStatusError: Raised when the API request fails with detailed error information including status code and response body.
+
+        Tags:
+            chats.chatMessage, sync
+        """
+        if chat_id is None:
+            raise ValueError("Missing required parameter 'chat-id'.")
+        if reset:
+            self.sync_state.reset("chat", chat_id)
+        watermark = watermark_of(self.sync_state.get("chat", chat_id))
+        url = f"{self.base_url}/chats/{chat_id}/messages"
+        query_params = {
+            k: v
+            for k, v in [
+                ("$top", top),
+                ("$orderby", "lastModifiedDateTime desc"),
+                ("$filter", watermark and watermark_filter(watermark)),
+            ]
+            if v
+        }
+        messages, advanced = advance_watermark(
+            watermark, list(self._paginate(url, query_params))
+        )
+        if advanced != watermark:
+            self.sync_state.set(advanced, "chat", chat_id)
+        if self.index is not None:
+            self.index.add(messages, chat_id=chat_id)
+        return summarize(messages)
+
+    def search_local_messages(
+        self,
+        query: str,
+        chat_id: str | None = None,
+        team_id: str | None = None,
+        channel_id: str | None = None,
+        top: int = 20,
+    ) -> dict[str, Any]:
+        """
+        Search local messages
+
+        Full-text search over the messages previously fetched by the chat, reply and sync tools, answered from the
+        local index without calling Graph. Only available when the app was created with a message index.
+
+        Args:
+            query (string): Words that must all appear in the message text, subject or sender name
+            chat_id (string): Only search this chat
+            team_id (string): Only search channels of this team
+            channel_id (string): Only search this channel
+            top (integer): Maximum number of hits Example: '20'.
+
+        Returns:
+            dict[str, Any]: Hits under 'value', best first, each with chat_id or team_id/channel_id, message_id, sender, created, a highlighted snippet and a score
+
+        Raises:
+            ValueError: Raised when the app has no local message index.
+
+        Tags:
+            chats.chatMessage, search, local
+        """
+        if self.index is None:
+            raise ValueError(
+                "Local message search needs a MessageIndex; create the app with index=MessageIndex(...)."
+            )
+        return {
+            "value": self.index.search(
+                query, chat_id=chat_id, team_id=team_id, channel_id=channel_id, top=top
+            )
+        }
+
+    def get_topology(self, refresh: bool = False) -> dict[str, Any]:
+        """
+        Get teams topology
+
+        Returns the joined teams with their channels and primary channel id, and the chats, from an in-memory
+        snapshot. The snapshot is built on first use with concurrent requests and refreshed in the background once
+        it is older than its TTL, so repeated calls do not go to Graph.
+
+        Args:
+            refresh (boolean): Rebuild the snapshot now instead of serving the cached one
+
+        Returns:
+            dict[str, Any]: Teams (each with 'primaryChannelId' and 'channels') under 'teams', chats under 'chats', and per-team fetch errors under 'errors' if any
+
+        Raises:
+            HTTPStatusError: Raised when listing the joined teams fails.
+
+        Tags:
+            teams.team, read, list, important
+        """
+        topology = self.topology.warm() if refresh else self.topology.get()
+        return topology.to_dict()
 
     def list_tools(self):
-        return [
+        tools = [
             self.list_chats,
             self.get_joined_teams,
             self.list_channels_for_team,
@@ -1286,5 +3462,18 @@ class MsTeamsApp(APIApplication):
             self.update_tab_info,
             self.delete_channel_tab_by_id,
             self.get_primary_team_channel,
-            self.get_user_installed_apps
+            self.get_user_installed_apps,
+            self.get_thread,
+            self.get_threads,
+            self.download_message_files,
+            self.send_file_message,
+            self.sync_channel_messages,
+            self.sync_chat_messages,
+            self.broadcast_message,
+            self.get_topology,
         ]
+        if self.index is not None:
+            tools.append(self.search_local_messages)
+        if self.instrumentation is not None:
+            return self.instrumentation.wrap_tools(tools)
+        return tools
@@ -0,0 +1,173 @@
+import asyncio
+import functools
+import importlib.util
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from typing import Any
+
+import httpx
+from universal_mcp.integrations import Integration
+
+from universal_mcp_ms_teams.app import MsTeamsApp
+from universal_mcp_ms_teams.request import GraphRequest, decoded_headers
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+_event_loop: ContextVar[asyncio.AbstractEventLoop | None] = ContextVar(
+    "ms_teams_event_loop", default=None
+)
+
+
+class _LoopByteStream(httpx.SyncByteStream):
+    """Synchronous view, for a worker thread, of a streamed response body read on the event loop."""
+
+    def __init__(
+        self, response: httpx.Response, loop: asyncio.AbstractEventLoop
+    ) -> None:
+        self._response = response
+        self._loop = loop
+
+    def __iter__(self) -> Iterator[bytes]:
+        chunks = self._response.aiter_bytes()
+        while True:
+            try:
+                yield asyncio.run_coroutine_threadsafe(
+                    chunks.__anext__(), self._loop
+                ).result()
+            except StopAsyncIteration:
+                return
+
+    def close(self) -> None:
+        asyncio.run_coroutine_threadsafe(self._response.aclose(), self._loop).result()
+
+
+class AsyncMsTeamsApp(MsTeamsApp):
+    """
+    `MsTeamsApp` whose tools are coroutines sharing one long-lived pooled
+    `httpx.AsyncClient` (HTTP/2 when the `h2` package is installed).
+
+    Each tool keeps its synchronous implementation: it runs on a worker thread
+    and its HTTP requests are handed back to the event loop, so concurrent tool
+    calls overlap their Graph I/O on the shared connection pool instead of
+    serializing on it. Calling a tool method directly (not through `list_tools`
+    or `arun`) still works synchronously.
+
+    Args:
+        integration: Integration providing Graph credentials.
+        limits: Connection pool limits shared by all concurrent calls.
+        http2: Negotiate HTTP/2; defaults to on when `h2` is available.
+        max_workers: Number of tool calls whose response handling can run at once.
+    """
+
+    def __init__(
+        self,
+        integration: Integration = None,
+        limits: httpx.Limits | None = None,
+        http2: bool | None = None,
+        max_workers: int | None = None,
+        **kwargs,
+    ) -> None:
+        http2 = HTTP2_AVAILABLE if http2 is None else http2
+        super().__init__(integration=integration, limits=limits, http2=http2, **kwargs)
+        self.max_workers = max_workers or self.limits.max_connections or 100
+        self._async_client: httpx.AsyncClient | None = None
+        self._executor: ThreadPoolExecutor | None = None
+
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(
+                timeout=self.default_timeout, limits=self.limits, http2=self.http2
+            )
+        return self._async_client
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="ms-teams"
+            )
+        return self._executor
+
+    async def arun(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Runs a tool (or any method of this app) without blocking the event loop.
+        """
+        loop = asyncio.get_running_loop()
+
+        def run() -> Any:
+            token = _event_loop.set(loop)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _event_loop.reset(token)
+
+        return await loop.run_in_executor(self.executor, run)
+
+    def _send(self, request: GraphRequest) -> httpx.Response:
+        loop = _event_loop.get()
+        if loop is None:
+            return super()._send(request)
+        # Credentials may need a blocking round trip, so resolve them on the worker
+        # thread.
+        kwargs = request.send_kwargs()
+        headers = {
+            **(self._get_headers() if request.authorize else {}),
+            **kwargs.pop("headers", {}),
+        }
+        if request.stream:
+            future = asyncio.run_coroutine_threadsafe(
+                self.async_client.send(
+                    self.async_client.build_request(
+                        request.method, request.url, headers=headers, **kwargs
+                    ),
+                    stream=True,
+                ),
+                loop,
+            )
+            response = future.result()
+            # The loop side already decodes the body, so the worker side must not decode
+            # it again.
+            return httpx.Response(
+                response.status_code,
+                headers=decoded_headers(response),
+                stream=_LoopByteStream(response, loop),
+                request=response.request,
+                extensions=response.extensions,
+            )
+        future = asyncio.run_coroutine_threadsafe(
+            self.async_client.request(
+                request.method, request.url, headers=headers, **kwargs
+            ),
+            loop,
+        )
+        return future.result()
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        super().close()
+
+    async def aclose(self) -> None:
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+        self.close()
+
+    async def __aenter__(self) -> "AsyncMsTeamsApp":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+
+    def _async_tool(self, tool: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(tool)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            return await self.arun(tool, *args, **kwargs)
+
+        return wrapper
+
+    def list_tools(self):
+        return [self._async_tool(tool) for tool in super().list_tools()]
@@ -0,0 +1,274 @@
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING, Any
+
+import httpx
+
+from universal_mcp_ms_teams.request import GraphRequest, capture, replay
+from universal_mcp_ms_teams.throttling import parse_retry_after
+
+if TYPE_CHECKING:
+    from universal_mcp_ms_teams.app import MsTeamsApp
+
+MAX_BATCH_SIZE = 20
+
+_UNSET = object()
+
+
+class BatchItem:
+    """
+    One tool call queued in a `Batch`. After the batch runs, `result()` returns
+    what the tool would have returned on its own, or raises what it would have raised.
+    """
+
+    def __init__(
+        self,
+        id: str,
+        func: Callable[..., Any],
+        args: tuple,
+        kwargs: dict[str, Any],
+        request: GraphRequest,
+        depends_on: list["BatchItem"],
+    ) -> None:
+        self.id = id
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.request = request
+        self.depends_on = depends_on
+        self.response: httpx.Response | None = None
+        self._result: Any = _UNSET
+        self._error: BaseException | None = None
+
+    @property
+    def done(self) -> bool:
+        return self._result is not _UNSET or self._error is not None
+
+    @property
+    def ok(self) -> bool:
+        return self._result is not _UNSET
+
+    def result(self) -> Any:
+        if self._error is not None:
+            raise self._error
+        if self._result is _UNSET:
+            raise RuntimeError(f"Batch item {self.id} has not been executed yet.")
+        return self._result
+
+    def exception(self) -> BaseException | None:
+        return self._error
+
+    def _resolve(self, response: httpx.Response) -> None:
+        self.response = response
+        try:
+            self._result = replay(self.func, response, *self.args, **self.kwargs)
+        except Exception as e:
+            self._error = e
+
+
+class Batch:
+    """
+    Collects calls to `MsTeamsApp` tools and sends them through Graph's JSON `$batch`
+    endpoint, at most `MAX_BATCH_SIZE` sub-requests per envelope.
+
+    Usage:
+        with app.batch() as batch:
+            chats = [batch.add(app.get_chat, chat_id) for chat_id in chat_ids]
+        details = [item.result() for item in chats if item.ok]
+
+    Items may declare `depends_on` other items. Dependencies in the same envelope are
+    sent as `dependsOn`; dependencies from an earlier envelope are already resolved, and
+    an item whose dependency failed is failed locally with status 424 without being sent.
+    Throttled sub-requests are retried per the app's `ThrottleScheduler` retry policy.
+    """
+
+    def __init__(self, app: "MsTeamsApp", max_batch_size: int = MAX_BATCH_SIZE) -> None:
+        if not 1 <= max_batch_size <= MAX_BATCH_SIZE:
+            raise ValueError(f"max_batch_size must be between 1 and {MAX_BATCH_SIZE}.")
+        self.app = app
+        self.max_batch_size = max_batch_size
+        self.items: list[BatchItem] = []
+        self._executed = 0
+
+    def add(
+        self,
+        func: Callable[..., Any],
+        *args: Any,
+        depends_on: Iterable[BatchItem] | None = None,
+        **kwargs: Any,
+    ) -> BatchItem:
+        """
+        Queues a tool call. The tool runs immediately up to the point where it would send
+        its request, so argument validation errors surface here rather than at execution.
+
+        Raises:
+            ValueError: If the tool uploads files, which `$batch` cannot carry.
+        """
+        request = capture(func, *args, **kwargs)
+        if request.files is not None or (
+            request.data is not None and request.content_type != "application/json"
+        ):
+            raise ValueError(
+                f"{request.method} {request.url} has a non-JSON body and cannot be batched."
+            )
+        item = BatchItem(
+            str(len(self.items) + 1),
+            func,
+            args,
+            kwargs,
+            request,
+            list(depends_on or []),
+        )
+        for dependency in item.depends_on:
+            if dependency not in self.items:
+                raise ValueError(
+                    f"Batch item {dependency.id} is not part of this batch."
+                )
+        self.items.append(item)
+        return item
+
+    def execute(self) -> list[BatchItem]:
+        """
+        Sends every queued item not yet executed and resolves their results.
+
+        Returns:
+            list[BatchItem]: All items of the batch, in the order they were added.
+
+        Raises:
+            HTTPStatusError: If a `$batch` envelope itself is rejected.
+        """
+        pending = self.items[self._executed :]
+        self._executed = len(self.items)
+        chunk: list[BatchItem] = []
+        for item in pending:
+            failed = [
+                dependency
+                for dependency in item.depends_on
+                if dependency.done and not dependency.ok
+            ]
+            if failed:
+                item._resolve(self._failed_dependency(item, failed[0]))
+                continue
+            chunk.append(item)
+            if len(chunk) == self.max_batch_size:
+                self._send(chunk)
+                chunk = []
+        if chunk:
+            self._send(chunk)
+        return self.items
+
+    def __enter__(self) -> "Batch":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.execute()
+
+    def _send(self, chunk: list[BatchItem]) -> None:
+        # Sub-requests throttled inside an otherwise successful envelope are re-sent,
+        # along with the items Graph failed with 424 because they depended on them.
+        policy = self.app.throttle.retry
+        attempt = 0
+        while chunk:
+            responses = self._send_envelope(chunk)
+            retry: list[BatchItem] = []
+            throttled: httpx.Response | None = None
+            for item in chunk:
+                response = responses[item.id]
+                retryable = policy.should_retry(
+                    item.request.method, response.status_code
+                ) or (
+                    response.status_code == httpx.codes.FAILED_DEPENDENCY
+                    and any(dependency in retry for dependency in item.depends_on)
+                )
+                if attempt < policy.max_retries and retryable:
+                    retry.append(item)
+                    if response.status_code != httpx.codes.FAILED_DEPENDENCY and (
+                        throttled is None
+                        or (parse_retry_after(response) or 0)
+                        > (parse_retry_after(throttled) or 0)
+                    ):
+                        throttled = response
+                else:
+                    if (
+                        self.app.cache is not None
+                        and item.request.method != "GET"
+                        and response.is_success
+                    ):
+                        self.app.cache.invalidate(item.request.url)
+                    item._resolve(response)
+            if retry:
+                self.app.throttle.wait_before_retry(attempt, throttled)
+            chunk = retry
+            attempt += 1
+
+    def _send_envelope(self, chunk: list[BatchItem]) -> dict[str, httpx.Response]:
+        in_chunk = {id(item) for item in chunk}
+        envelope = {"requests": [self._sub_request(item, in_chunk) for item in chunk]}
+        response = self.app._execute(
+            GraphRequest("POST", f"{self.app.base_url}/$batch", data=envelope)
+        )
+        body = self.app._handle_response(response)
+        by_id = {str(entry.get("id")): entry for entry in body.get("responses", [])}
+        responses = {}
+        for item in chunk:
+            entry = by_id.get(item.id)
+            if entry is None:
+                entry = {
+                    "status": 500,
+                    "body": {
+                        "error": {
+                            "code": "missingBatchResponse",
+                            "message": f"No response for batch item {item.id}.",
+                        }
+                    },
+                }
+            responses[item.id] = self._sub_response(item, entry)
+        return responses
+
+    def _sub_request(self, item: BatchItem, in_chunk: set[int]) -> dict[str, Any]:
+        url = item.request.full_url
+        if url.startswith(self.app.base_url):
+            url = url[len(self.app.base_url) :]
+        sub_request: dict[str, Any] = {
+            "id": item.id,
+            "method": item.request.method,
+            "url": url,
+        }
+        if item.request.data is not None:
+            sub_request["body"] = item.request.data
+            sub_request["headers"] = {"Content-Type": "application/json"}
+        depends_on = [
+            dependency.id
+            for dependency in item.depends_on
+            if id(dependency) in in_chunk
+        ]
+        if depends_on:
+            sub_request["dependsOn"] = depends_on
+        return sub_request
+
+    def _sub_response(self, item: BatchItem, entry: dict[str, Any]) -> httpx.Response:
+        request = httpx.Request(item.request.method, item.request.full_url)
+        headers = entry.get("headers") or {}
+        body = entry.get("body")
+        if body is None:
+            return httpx.Response(
+                int(entry.get("status", 500)), headers=headers, request=request
+            )
+        return httpx.Response(
+            int(entry.get("status", 500)), headers=headers, json=body, request=request
+        )
+
+    def _failed_dependency(
+        self, item: BatchItem, dependency: BatchItem
+    ) -> httpx.Response:
+        error = {
+            "error": {
+                "code": "failedDependency",
+                "message": f"Batch item {dependency.id} failed.",
+            }
+        }
+        return httpx.Response(
+            424,
+            json=error,
+            request=httpx.Request(item.request.method, item.request.full_url),
+        )
@@ -0,0 +1,239 @@
+import contextvars
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+import httpx
+
+from universal_mcp_ms_teams.batch import MAX_BATCH_SIZE, BatchItem
+from universal_mcp_ms_teams.throttling import TokenBucket
+
+if TYPE_CHECKING:
+    from universal_mcp_ms_teams.app import MsTeamsApp
+
+# Teams accepts about one message per second into the same chat or channel before
+# throttling.
+POSTS_PER_CONVERSATION_PER_SECOND = 1.0
+POST_BURST = 3.0
+
+
+def conversation_of(target: dict[str, str]) -> str:
+    """
+    Chat or channel a broadcast target posts into, e.g. 'chats/{id}' or 'teams/{id}/channels/{id}'.
+
+    Raises:
+        ValueError: If the target names neither a chat nor a team channel.
+    """
+    if target.get("chat_id"):
+        return f"chats/{target['chat_id']}"
+    if target.get("team_id") and target.get("channel_id"):
+        return f"teams/{target['team_id']}/channels/{target['channel_id']}"
+    raise ValueError(
+        f"Broadcast target {target!r} needs a 'chat_id', or a 'team_id' and 'channel_id'."
+    )
+
+
+class PostLimiter:
+    """Per-conversation token buckets spacing out posts into the same chat or channel."""
+
+    def __init__(
+        self,
+        rate: float = POSTS_PER_CONVERSATION_PER_SECOND,
+        burst: float = POST_BURST,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.rate = rate
+        self.burst = burst
+        self._sleep = sleep
+        self._buckets: dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def wait(self, conversations: list[str]) -> float:
+        """Takes one token for each conversation and sleeps until all of them may be used."""
+        with self._lock:
+            buckets = [
+                self._buckets.setdefault(
+                    conversation, TokenBucket(self.rate, self.burst)
+                )
+                for conversation in conversations
+            ]
+        delay = max((bucket.reserve() for bucket in buckets), default=0.0)
+        if delay > 0:
+            self._sleep(delay)
+        return delay
+
+
+class Broadcast:
+    """
+    Posts one message to many chats, channels and channel threads.
+
+    Targets are packed into `$batch` envelopes, with at most one post per conversation in
+    each envelope. Up to `max_concurrency` envelopes are in flight at once, and each
+    waits for `limiter` before it is sent. Throttled posts are retried by the batch, and
+    the rest of the broadcast continues whatever fails.
+
+    Args:
+        app: App whose `send_chat_message`, `send_channel_message` and
+            `reply_to_channel_message` tools perform the posts.
+        max_concurrency: Envelopes sent in parallel.
+        max_batch_size: Posts per envelope.
+        limiter: Per-conversation rate limit shared with other broadcasts.
+    """
+
+    def __init__(
+        self,
+        app: "MsTeamsApp",
+        max_concurrency: int = 4,
+        max_batch_size: int = MAX_BATCH_SIZE,
+        limiter: PostLimiter | None = None,
+    ) -> None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be a positive integer.")
+        self.app = app
+        self.max_concurrency = max_concurrency
+        self.max_batch_size = max_batch_size
+        self.limiter = limiter or PostLimiter()
+
+    def plan(self, targets: list[dict[str, str]]) -> list[list[int]]:
+        """Groups target indexes into envelopes so no conversation appears twice in one envelope."""
+        envelopes: list[list[int]] = []
+        members: list[set[str]] = []
+        next_envelope: dict[str, int] = {}
+        first_open = 0
+        for index, target in enumerate(targets):
+            conversation = conversation_of(target)
+            slot = max(first_open, next_envelope.get(conversation, 0))
+            while slot < len(envelopes) and (
+                len(envelopes[slot]) >= self.max_batch_size
+                or conversation in members[slot]
+            ):
+                slot += 1
+            if slot == len(envelopes):
+                envelopes.append([])
+                members.append(set())
+            envelopes[slot].append(index)
+            members[slot].add(conversation)
+            next_envelope[conversation] = slot + 1
+            while (
+                first_open < len(envelopes)
+                and len(envelopes[first_open]) >= self.max_batch_size
+            ):
+                first_open += 1
+        return envelopes
+
+    def resolve(self, target: dict[str, str]) -> dict[str, str]:
+        """Target with its chat topic, or team and channel names, replaced by ids."""
+        resolver = self.app.resolver
+        if target.get("chat_id"):
+            return {**target, "chat_id": resolver.chat(target["chat_id"])}
+        team_id = resolver.team(target["team_id"])
+        return {
+            **target,
+            "team_id": team_id,
+            "channel_id": resolver.channel(team_id, target["channel_id"]),
+        }
+
+    def _post(self, batch: Any, target: dict[str, str], content: str) -> BatchItem:
+        if target.get("chat_id"):
+            return batch.add(self.app.send_chat_message, target["chat_id"], content)
+        if target.get("message_id"):
+            return batch.add(
+                self.app.reply_to_channel_message,
+                target["team_id"],
+                target["channel_id"],
+                target["message_id"],
+                content,
+            )
+        return batch.add(
+            self.app.send_channel_message,
+            target["team_id"],
+            target["channel_id"],
+            content,
+        )
+
+    def _send_envelope(
+        self,
+        targets: list[dict[str, str]],
+        resolved: list[dict[str, str]],
+        indexes: list[int],
+        content: str,
+    ) -> list[dict[str, Any]]:
+        self.limiter.wait([conversation_of(resolved[index]) for index in indexes])
+        batch = self.app.batch(max_batch_size=self.max_batch_size)
+        items = [self._post(batch, resolved[index], content) for index in indexes]
+        try:
+            batch.execute()
+        except httpx.HTTPError as e:
+            return [self._failure(targets[index], e) for index in indexes]
+        return [
+            self._result(targets[index], item) for index, item in zip(indexes, items)
+        ]
+
+    def _result(self, target: dict[str, str], item: BatchItem) -> dict[str, Any]:
+        if not item.ok:
+            return self._failure(target, item.exception(), item.response)
+        message = item.result()
+        return {
+            "target": target,
+            "ok": True,
+            "status_code": item.response.status_code,
+            "message_id": message.get("id") if isinstance(message, dict) else None,
+        }
+
+    def _failure(
+        self,
+        target: dict[str, str],
+        error: BaseException | None,
+        response: httpx.Response | None = None,
+    ) -> dict[str, Any]:
+        if response is None and isinstance(error, httpx.HTTPStatusError):
+            response = error.response
+        return {
+            "target": target,
+            "ok": False,
+            "status_code": response.status_code if response is not None else None,
+            "error": str(error),
+        }
+
+    def send(self, targets: list[dict[str, str]], content: str) -> dict[str, Any]:
+        """
+        Posts `content` to every target.
+
+        Returns:
+            dict[str, Any]: Counts of sent and failed posts, and one result per target in input order.
+
+        Raises:
+            ValueError: If a target names neither a chat nor a team channel, or one of its names
+                matches nothing or several conversations; nothing is sent then.
+        """
+        for target in targets:
+            conversation_of(target)
+        # Resolve names first so a conversation given once by name and once by id is
+        # still planned as one.
+        resolved = [self.resolve(target) for target in targets]
+        envelopes = self.plan(resolved)
+        results: list[dict[str, Any] | None] = [None] * len(targets)
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_concurrency, max(1, len(envelopes))),
+            thread_name_prefix="ms-teams-broadcast",
+        ) as pool:
+            # Run each envelope in a copy of the caller's context so instrumentation and
+            # the async app's event-loop bridging carry over to the worker threads.
+            futures = [
+                pool.submit(
+                    contextvars.copy_context().run,
+                    self._send_envelope,
+                    targets,
+                    resolved,
+                    indexes,
+                    content,
+                )
+                for indexes in envelopes
+            ]
+            for indexes, future in zip(envelopes, futures):
+                for index, result in zip(indexes, future.result()):
+                    results[index] = result
+        sent = sum(1 for result in results if result["ok"])
+        return {"sent": sent, "failed": len(targets) - sent, "results": results}
@@ -0,0 +1,260 @@
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field, replace
+from typing import Any
+
+import httpx
+
+from universal_mcp_ms_teams.request import GraphRequest, decoded_headers, graph_path
+
+# Read-only lookups whose results change rarely, keyed by the tool that issues them.
+# Values are (path pattern relative to the API version, default TTL in seconds).
+CACHEABLE_ENDPOINTS: dict[str, tuple[str, float]] = {
+    "get_joined_teams": (r"/me/joinedTeams", 300),
+    "get_team_channel_info": (r"/teams/[^/]+/channels/[^/]+", 300),
+    "get_primary_team_channel": (r"/teams/[^/]+/primaryChannel", 600),
+    "get_chat": (r"/chats/[^/]+", 120),
+    "get_chat_member_details": (r"/chats/[^/]+/members/[^/]+", 300),
+    "get_team_tab_info": (r"/teams/[^/]+/channels/[^/]+/tabs/[^/]+", 300),
+    "get_chat_message_detail": (r"/chats/[^/]+/messages/[^/]+", 0),
+}
+
+# Endpoints whose expired entries are kept and revalidated with `If-None-Match`
+# instead of being downloaded again. A TTL of 0 revalidates on every lookup.
+REVALIDATED_ENDPOINTS = frozenset(
+    {"get_chat", "get_team_channel_info", "get_chat_message_detail"}
+)
+
+
+def etag_of(response: httpx.Response, entry: "CachedResponse") -> str | None:
+    etag = response.headers.get("ETag")
+    if etag:
+        return etag
+    try:
+        return entry.json().get("@odata.etag")
+    except (ValueError, AttributeError):
+        return None
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+    revalidations: int = 0
+    bytes_saved: int = 0
+
+
+@dataclass
+class CachedResponse:
+    path: str
+    status_code: int
+    headers: list[tuple[str, str]]
+    content: bytes
+    expires_at: float
+    etag: str | None = None
+    # Parsed on first use and kept, so hits and 304s never parse the same body twice.
+    body: Any = field(default=None, repr=False, compare=False)
+
+    def json(self) -> Any:
+        """The parsed body, shared by every response served from this entry; do not modify it."""
+        if self.body is None:
+            self.body = json.loads(self.content)
+        return self.body
+
+    def to_response(self, request: GraphRequest) -> httpx.Response:
+        response = httpx.Response(
+            self.status_code,
+            headers=self.headers,
+            content=self.content,
+            request=httpx.Request(request.method, request.full_url),
+        )
+        response.cache_entry = self
+        return response
+
+
+class ResponseCache:
+    """
+    In-process LRU cache with per-endpoint TTLs for successful GET responses.
+
+    Only endpoints listed in `CACHEABLE_ENDPOINTS` are cached. Entries are keyed by
+    caller identity and full URL (query parameters included), and any successful
+    write to a resource drops the cached entries for that resource, its
+    sub-resources and its parents.
+
+    For `REVALIDATED_ENDPOINTS`, an expired entry carrying an ETag is revalidated
+    with `If-None-Match`; a 304 renews it and serves the stored body, so unchanged
+    resources are never downloaded twice. Each entry keeps its body once parsed, so
+    hits and renewed entries are served without parsing the JSON again.
+
+    Args:
+        max_entries: Entries kept before the least recently used one is evicted.
+        ttls: Per-endpoint TTL overrides in seconds, keyed by tool name; 0 disables an
+            endpoint unless it is revalidated.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttls: dict[str, float] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be a positive integer.")
+        self.max_entries = max_entries
+        self._clock = clock
+        self._rules: list[tuple[re.Pattern, float, bool]] = []
+        for name, (pattern, default_ttl) in CACHEABLE_ENDPOINTS.items():
+            ttl = (ttls or {}).get(name, default_ttl)
+            revalidate = name in REVALIDATED_ENDPOINTS
+            if ttl > 0 or revalidate:
+                self._rules.append((re.compile(pattern), ttl, revalidate))
+        self._entries: OrderedDict[tuple[str, str], CachedResponse] = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = CacheStats()
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            stats = asdict(self._stats)
+        return {**stats, "size": len(self)}
+
+    def _record(self, **increments: int) -> None:
+        with self._lock:
+            for name, value in increments.items():
+                setattr(self._stats, name, getattr(self._stats, name) + value)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def rule_for(self, url: str) -> tuple[float, bool] | None:
+        """(TTL, revalidate) for a cacheable URL, or None if responses from `url` are never cached."""
+        path = graph_path(url)
+        for pattern, ttl, revalidate in self._rules:
+            if pattern.fullmatch(path):
+                return ttl, revalidate
+        return None
+
+    def _lookup(
+        self, key: tuple[str, str], revalidate: bool
+    ) -> tuple[CachedResponse | None, bool]:
+        """Returns the entry for `key` (kept past expiry when it can be revalidated) and whether it is fresh."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None, False
+            self._entries.move_to_end(key)
+            if entry.expires_at > self._clock():
+                return entry, True
+            if revalidate and entry.etag:
+                return entry, False
+            del self._entries[key]
+            self._stats.expirations += 1
+            return None, False
+
+    def _put(
+        self,
+        key: tuple[str, str],
+        request: GraphRequest,
+        response: httpx.Response,
+        ttl: float,
+    ) -> None:
+        if response.status_code != httpx.codes.OK:
+            return
+        content = response.read()
+        entry = CachedResponse(
+            graph_path(request.url),
+            response.status_code,
+            decoded_headers(response),
+            content,
+            self._clock() + ttl,
+        )
+        entry.etag = etag_of(response, entry)
+        self._store(key, entry)
+        # The caller reads the body parsed here (or parses it into the entry) instead of
+        # parsing it again.
+        response.cache_entry = entry
+
+    def _store(self, key: tuple[str, str], entry: CachedResponse) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats.evictions += 1
+
+    def _renew(
+        self, key: tuple[str, str], entry: CachedResponse, expires_at: float
+    ) -> None:
+        with self._lock:
+            entry.expires_at = expires_at
+
+    def invalidate(self, url: str) -> int:
+        """Drops every entry for the resource at `url`, its sub-resources and its parents."""
+        path = graph_path(url)
+        with self._lock:
+            stale = [
+                key
+                for key, entry in self._entries.items()
+                if entry.path == path
+                or entry.path.startswith(path + "/")
+                or path.startswith(entry.path + "/")
+            ]
+            for key in stale:
+                del self._entries[key]
+            self._stats.invalidations += len(stale)
+        return len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def fetch(
+        self,
+        request: GraphRequest,
+        identity: Callable[[], str],
+        send: Callable[[GraphRequest], httpx.Response],
+    ) -> httpx.Response:
+        """
+        Serves a cacheable GET from the cache or through `send`, and invalidates
+        affected entries after a successful write.
+        """
+        if request.method != "GET":
+            response = send(request)
+            if response.is_success:
+                self.invalidate(request.url)
+            return response
+        rule = self.rule_for(request.url)
+        if rule is None:
+            return send(request)
+        ttl, revalidate = rule
+        key = (identity(), request.full_url)
+        entry, fresh = self._lookup(key, revalidate)
+        if entry is not None and fresh:
+            self._record(hits=1)
+            return entry.to_response(request)
+        if entry is None:
+            self._record(misses=1)
+            response = send(request)
+            self._put(key, request, response, ttl)
+            return response
+        response = send(
+            replace(
+                request,
+                headers={**(request.headers or {}), "If-None-Match": entry.etag},
+            )
+        )
+        if response.status_code != httpx.codes.NOT_MODIFIED:
+            self._record(misses=1)
+            self._put(key, request, response, ttl)
+            return response
+        response.close()
+        self._renew(key, entry, self._clock() + ttl)
+        self._record(hits=1, revalidations=1, bytes_saved=len(entry.content))
+        return entry.to_response(request)
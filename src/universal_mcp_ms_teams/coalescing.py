@@ -0,0 +1,97 @@
+import threading
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+import httpx
+
+from universal_mcp_ms_teams.request import GraphRequest, decoded_headers
+
+
+@dataclass
+class CoalescingStats:
+    # Requests that went to Graph, and requests answered with another caller's response.
+    sent: int = 0
+    shared: int = 0
+
+
+@dataclass
+class _Flight:
+    done: threading.Event = field(default_factory=threading.Event)
+    status_code: int = 0
+    headers: list[tuple[str, str]] = field(default_factory=list)
+    content: bytes = b""
+    error: BaseException | None = None
+
+    def to_response(self, request: GraphRequest) -> httpx.Response:
+        return httpx.Response(
+            self.status_code,
+            headers=self.headers,
+            content=self.content,
+            request=httpx.Request(request.method, request.full_url),
+        )
+
+
+class RequestCoalescer:
+    """
+    Single-flight deduplication of concurrent identical GET requests.
+
+    While a GET is in flight, every other caller asking for the same URL (query
+    parameters included) with the same headers and caller identity waits for it
+    and gets its own copy of the same response, or the same exception, instead of
+    sending a request of its own. Nothing is kept once the request completes;
+    see `ResponseCache` for reusing responses over time. Streamed requests are
+    never coalesced, since their body can only be read once.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._flights: dict[tuple[str, str, tuple[tuple[str, str], ...]], _Flight] = {}
+        self._stats = CoalescingStats()
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {**asdict(self._stats), "in_flight": len(self._flights)}
+
+    def fetch(
+        self,
+        request: GraphRequest,
+        identity: Callable[[], str],
+        send: Callable[[GraphRequest], httpx.Response],
+    ) -> httpx.Response:
+        if request.method != "GET" or request.stream:
+            return send(request)
+        key = (
+            identity(),
+            request.full_url,
+            tuple(sorted((request.headers or {}).items())),
+        )
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+                self._stats.sent += 1
+            else:
+                self._stats.shared += 1
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.to_response(request)
+        try:
+            response = send(request)
+            flight.content = response.read()
+            flight.status_code, flight.headers = (
+                response.status_code,
+                decoded_headers(response),
+            )
+            return response
+        except BaseException as error:
+            flight.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
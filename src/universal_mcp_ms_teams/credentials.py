@@ -0,0 +1,313 @@
+import base64
+import hashlib
+import json
+import threading
+import time
+import weakref
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+from loguru import logger
+from universal_mcp.integrations import AgentRIntegration, Integration
+
+# Tokens are refreshed this many seconds before they expire.
+REFRESH_MARGIN = 5 * 60
+
+# Lifetime assumed for credentials that carry no expiry: Graph's shortest access token
+# lifetime.
+DEFAULT_LIFETIME = 60 * 60
+
+# Larger `expires_at` values are milliseconds since the epoch; seconds reach this in 5138.
+MILLISECONDS_AFTER = 1e11
+
+
+def identity(integration: Integration) -> str | None:
+    """
+    Key under which an integration's token is shared with other integration objects: AgentR
+    integrations of the same API key, endpoint and name fetch the same credentials. None for
+    other integrations, whose tokens are cached per integration object.
+    """
+    client = getattr(integration, "client", None)
+    api_key = getattr(client, "api_key", None)
+    if not isinstance(api_key, str):
+        return None
+    return f"{type(integration).__qualname__}:{getattr(client, 'base_url', '')}:{hashlib.sha256(api_key.encode()).hexdigest()}:{integration.name}"
+
+
+def _jwt_claims(token: str) -> dict[str, Any]:
+    # Graph access tokens are JWTs; only their payload is read here, never trusted for
+    # authorization.
+    try:
+        _, payload, _ = token.split(".")
+        claims = json.loads(
+            base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4))
+        )
+    except ValueError:
+        return {}
+    return claims if isinstance(claims, dict) else {}
+
+
+def _jwt_expiry(token: str) -> float | None:
+    # The `exp` claim is the expiry when the credentials omit it.
+    try:
+        return float(_jwt_claims(token)["exp"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def principal_of(authorization: str) -> str:
+    """
+    Digest identifying whom an Authorization header acts for: the tenant and user (or app)
+    of a Graph token, so every token of the same principal, across refreshes and processes,
+    maps to the same digest. Other headers are identified by their value.
+    """
+    token = authorization.removeprefix("Bearer ")
+    claims = _jwt_claims(token)
+    subject = claims.get("oid") or claims.get("appid") or claims.get("azp")
+    principal = (
+        f"{claims['tid']}:{subject}" if claims.get("tid") and subject else authorization
+    )
+    return hashlib.sha256(principal.encode()).hexdigest()
+
+
+def expiry_of(
+    credentials: dict[str, Any],
+    fetched_at: float,
+    default_lifetime: float = DEFAULT_LIFETIME,
+) -> float:
+    """Epoch seconds at which credentials expire, from `expires_at`, `expires_in` or the token's own `exp` claim."""
+    expires_at = credentials.get("expires_at")
+    if isinstance(expires_at, (int, float)):
+        return (
+            expires_at / 1000 if expires_at > MILLISECONDS_AFTER else float(expires_at)
+        )
+    if isinstance(expires_at, str):
+        try:
+            return datetime.fromisoformat(expires_at.replace("Z", "+00:00")).timestamp()
+        except ValueError:
+            pass
+    expires_in = credentials.get("expires_in")
+    if expires_in is not None:
+        try:
+            return fetched_at + float(expires_in)
+        except (TypeError, ValueError):
+            pass
+    token = credentials.get("access_token")
+    if isinstance(token, str):
+        expiry = _jwt_expiry(token)
+        if expiry is not None:
+            return expiry
+    return fetched_at + default_lifetime
+
+
+def headers_for(credentials: dict[str, Any]) -> dict[str, str]:
+    """Request headers for credentials, derived the way `APIApplication._get_headers` derives them."""
+    headers = credentials.get("headers")
+    if headers:
+        return headers
+    token = (
+        credentials.get("api_key")
+        or credentials.get("API_KEY")
+        or credentials.get("apiKey")
+        or credentials.get("access_token")
+    )
+    if token:
+        return {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
+    return {}
+
+
+def bearer_of(headers: dict[str, str]) -> str | None:
+    authorization = headers.get("Authorization") or headers.get("authorization")
+    return authorization or None
+
+
+@dataclass
+class _Entry:
+    credentials: dict[str, Any] | None = None
+    headers: dict[str, str] = field(default_factory=dict)
+    expires_at: float = 0.0
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    # Set while a fetch is running; callers without a usable token wait on it.
+    fetching: threading.Event | None = None
+    error: BaseException | None = None
+
+
+def forget_memoized_credentials(integration: Integration) -> None:
+    """
+    Makes the next `get_credentials()` of an AgentR integration fetch again.
+
+    `AgentRIntegration` (universal_mcp 0.1.23) memoizes the first credentials it fetched
+    in `_credentials` for its lifetime and has no public way to refresh them, so a
+    refreshed token would never be seen. This is the one place relying on that attribute.
+    """
+    if (
+        isinstance(integration, AgentRIntegration)
+        and getattr(integration, "_credentials", None) is not None
+    ):
+        integration._credentials = None
+
+
+class TokenCache:
+    """
+    In-process cache of integration credentials, shared by every app using the same integration identity.
+
+    A token is reused until `refresh_margin` seconds before it expires. Inside that
+    window the cached token keeps being served while one background thread fetches
+    the next; once it has expired, or before the first fetch, one caller fetches and
+    every concurrent caller waits for that fetch, so the credential endpoint sees a
+    single request however many tool calls arrive together.
+
+    Args:
+        refresh_margin: Seconds before expiry at which the token is refreshed in the background.
+        default_lifetime: Seconds credentials without any expiry are treated as valid.
+        clock: Wall clock, in epoch seconds; credential expiries are absolute times.
+    """
+
+    def __init__(
+        self,
+        refresh_margin: float = REFRESH_MARGIN,
+        default_lifetime: float = DEFAULT_LIFETIME,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.refresh_margin = refresh_margin
+        self.default_lifetime = default_lifetime
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._shared: dict[str, _Entry] = {}
+        self._private: weakref.WeakKeyDictionary[Integration, _Entry] = (
+            weakref.WeakKeyDictionary()
+        )
+        self.fetches = 0
+
+    def _entry(self, integration: Integration) -> _Entry:
+        key = identity(integration)
+        with self._lock:
+            entries: Any = self._private if key is None else self._shared
+            key = integration if key is None else key
+            entry = entries.get(key)
+            if entry is None:
+                entry = entries[key] = _Entry()
+            return entry
+
+    def _fetch(self, integration: Integration) -> dict[str, Any]:
+        forget_memoized_credentials(integration)
+        self.fetches += 1
+        return integration.get_credentials()
+
+    def _run_fetch(
+        self, integration: Integration, entry: _Entry, done: threading.Event
+    ) -> tuple[dict[str, Any], dict[str, str]]:
+        try:
+            credentials = self._fetch(integration)
+        except BaseException as error:
+            with entry.lock:
+                entry.error = error
+                entry.fetching = None
+            done.set()
+            raise
+        headers = headers_for(credentials)
+        with entry.lock:
+            entry.credentials = credentials
+            entry.headers = headers
+            entry.expires_at = expiry_of(
+                credentials, self._clock(), self.default_lifetime
+            )
+            entry.fetching = None
+        done.set()
+        return credentials, headers
+
+    def _refresh(
+        self, integration: Integration, entry: _Entry, done: threading.Event
+    ) -> None:
+        try:
+            self._run_fetch(integration, entry, done)
+        except Exception as error:
+            # The current token is still valid; the next call past expiry fetches again
+            # and surfaces the error.
+            logger.warning(
+                f"Background credential refresh for {integration.name} failed: {error}"
+            )
+
+    def _start_fetch(self, entry: _Entry) -> threading.Event | None:
+        """Event of a fetch this caller must now run, or None if another caller's fetch is already running."""
+        with entry.lock:
+            if entry.fetching is not None:
+                return None
+            entry.fetching = threading.Event()
+            entry.error = None
+            return entry.fetching
+
+    def get(self, integration: Integration) -> dict[str, Any]:
+        """The integration's current credentials, fetching them only when they are missing or about to expire."""
+        return self._get(integration)[0]
+
+    def headers(self, integration: Integration) -> dict[str, str]:
+        """Request headers for the integration's current credentials."""
+        return self._get(integration)[1]
+
+    def _get(self, integration: Integration) -> tuple[dict[str, Any], dict[str, str]]:
+        entry = self._entry(integration)
+        while True:
+            now = self._clock()
+            with entry.lock:
+                credentials, headers, expires_at, fetching = (
+                    entry.credentials,
+                    entry.headers,
+                    entry.expires_at,
+                    entry.fetching,
+                )
+            if credentials is not None and now < expires_at:
+                if now >= expires_at - self.refresh_margin:
+                    done = self._start_fetch(entry)
+                    if done is not None:
+                        threading.Thread(
+                            target=self._refresh,
+                            args=(integration, entry, done),
+                            name="ms-teams-token-refresh",
+                            daemon=True,
+                        ).start()
+                return credentials, headers
+            if fetching is None:
+                done = self._start_fetch(entry)
+                if done is not None:
+                    # Returned even if already expired: they are the newest there are,
+                    # and Graph will say if they are not good.
+                    return self._run_fetch(integration, entry, done)
+                continue
+            # Another caller's fetch, or a background refresh, is running: wait for its
+            # result instead of fetching too.
+            fetching.wait()
+            with entry.lock:
+                credentials, headers, error = (
+                    entry.credentials,
+                    entry.headers,
+                    entry.error,
+                )
+            if error is not None:
+                raise error
+            if credentials is not None:
+                return credentials, headers
+
+    def invalidate(self, integration: Integration, rejected: str | None = None) -> None:
+        """
+        Forgets the integration's cached token, so the next call fetches a new one. With
+        `rejected`, the Authorization header Graph refused, the token is only forgotten while
+        it is still the cached one, so concurrent 401s for one token cause a single fetch.
+        """
+        entry = self._entry(integration)
+        with entry.lock:
+            if rejected is None or bearer_of(entry.headers) == rejected:
+                entry.credentials = None
+                entry.headers = {}
+                entry.expires_at = 0.0
+
+    def clear(self) -> None:
+        with self._lock:
+            self._shared.clear()
+            self._private.clear()
+
+
+# Shared by every app in the process unless one is given its own.
+DEFAULT_TOKEN_CACHE = TokenCache()
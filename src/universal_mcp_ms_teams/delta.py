@@ -0,0 +1,115 @@
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from universal_mcp.exceptions import KeyNotFoundError
+from universal_mcp.stores import BaseStore
+
+DELTA_LINK = "@odata.deltaLink"
+
+
+def change_type(message: dict[str, Any]) -> str:
+    """Classifies a message returned by a sync as 'deleted', 'edited' or 'new'."""
+    if "@removed" in message or message.get("deletedDateTime"):
+        return "deleted"
+    if message.get("lastEditedDateTime"):
+        return "edited"
+    return "new"
+
+
+def summarize(messages: list[dict[str, Any]], **extra: Any) -> dict[str, Any]:
+    counts = {"new": 0, "edited": 0, "deleted": 0}
+    for message in messages:
+        counts[change_type(message)] += 1
+    return {"value": messages, "counts": counts, **extra}
+
+
+# A chat sync filters on `lastModifiedDateTime gt` this many seconds before the
+# watermark, so messages that become visible late with a timestamp at or just before it
+# are still returned.
+WATERMARK_OVERLAP = 1.0
+
+
+def _timestamp(value: str) -> datetime:
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def watermark_of(state: str | dict[str, Any] | None) -> dict[str, Any] | None:
+    """The stored watermark as {'at': timestamp, 'seen': {id: timestamp}}; syncs stored before ids were kept hold only the timestamp."""
+    if isinstance(state, str):
+        return {"at": state, "seen": {}}
+    return state
+
+
+def watermark_filter(watermark: dict[str, Any]) -> str:
+    """`$filter` of a chat sync from `watermark`; Graph supports only `gt` and `lt` on lastModifiedDateTime there."""
+    since = (
+        _timestamp(watermark["at"]) - timedelta(seconds=WATERMARK_OVERLAP)
+    ).astimezone(UTC)
+    return f"lastModifiedDateTime gt {since.strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3]}Z"
+
+
+def advance_watermark(
+    watermark: dict[str, Any] | None, messages: list[dict[str, Any]]
+) -> tuple[list[dict[str, Any]], dict[str, Any] | None]:
+    """
+    Drops the messages a sync filtered with `watermark_filter` returns again, unchanged, from the
+    overlap before the watermark, and moves the watermark to the latest modification seen,
+    remembering the ids and timestamps of the messages inside the new overlap.
+    """
+    seen = dict(watermark["seen"]) if watermark else {}
+
+    def unchanged(message: dict[str, Any]) -> bool:
+        previous = seen.get(message.get("id"))
+        return (
+            previous is not None
+            and bool(message.get("lastModifiedDateTime"))
+            and _timestamp(previous) == _timestamp(message["lastModifiedDateTime"])
+        )
+
+    fresh = [message for message in messages if not unchanged(message)]
+    modified = [
+        message
+        for message in fresh
+        if message.get("id") and message.get("lastModifiedDateTime")
+    ]
+    if not modified:
+        return fresh, watermark
+    latest = max(
+        ([watermark["at"]] if watermark else [])
+        + [message["lastModifiedDateTime"] for message in modified],
+        key=_timestamp,
+    )
+    seen.update(
+        (message["id"], message["lastModifiedDateTime"]) for message in modified
+    )
+    horizon = _timestamp(latest) - timedelta(seconds=WATERMARK_OVERLAP)
+    return fresh, {
+        "at": latest,
+        "seen": {id: at for id, at in sorted(seen.items()) if _timestamp(at) > horizon},
+    }
+
+
+class SyncState:
+    """Namespaced access to the sync cursors (delta links or watermarks) kept in a store."""
+
+    def __init__(self, store: BaseStore, prefix: str = "ms-teams-sync") -> None:
+        self.store = store
+        self.prefix = prefix
+
+    def _key(self, *parts: str) -> str:
+        return ":".join((self.prefix, *parts))
+
+    def get(self, *parts: str) -> Any | None:
+        try:
+            return self.store.get(self._key(*parts))
+        except KeyNotFoundError:
+            return None
+
+    def set(self, value: Any, *parts: str) -> None:
+        self.store.set(self._key(*parts), value)
+
+    def reset(self, *parts: str) -> None:
+        try:
+            self.store.delete(self._key(*parts))
+        except KeyNotFoundError:
+            pass
@@ -0,0 +1,353 @@
+import base64
+import contextvars
+import hashlib
+import json
+import mimetypes
+import os
+import re
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, BinaryIO
+
+import httpx
+
+from universal_mcp_ms_teams.request import GraphRequest
+
+if TYPE_CHECKING:
+    from universal_mcp_ms_teams.app import MsTeamsApp
+
+# Bytes of response bodies held in memory at once across all concurrent downloads.
+DEFAULT_MAX_MEMORY = 8 * 1024 * 1024
+MIN_CHUNK_SIZE = 64 * 1024
+
+DEFAULT_CONCURRENCY = 4
+
+# Times an interrupted download is resumed with a range request before giving up.
+MAX_RESUMES = 3
+
+REDIRECTS = frozenset({301, 302, 303, 307, 308})
+
+_UNSAFE = re.compile(r"[^\w.\- ]+")
+
+Sink = str | os.PathLike | BinaryIO | Callable[[bytes], Any]
+
+
+def total_size(response: httpx.Response) -> int | None:
+    """Size of the whole file behind a response, full or ranged, if the server tells."""
+    if response.status_code in (206, 416):
+        total = response.headers.get("Content-Range", "").rpartition("/")[2]
+    else:
+        total = response.headers.get("Content-Length", "")
+    return int(total) if total.isdigit() else None
+
+
+def share_id(url: str) -> str:
+    """Graph `shares` id of a sharing or SharePoint URL, e.g. an attachment's `contentUrl`."""
+    return "u!" + base64.urlsafe_b64encode(url.encode()).decode().rstrip("=")
+
+
+def safe_name(name: str) -> str:
+    name = _UNSAFE.sub("_", Path(name).name).strip(" .")
+    return name or "download"
+
+
+@dataclass
+class Download:
+    """What to fetch: a Graph URL answering with the content itself or a redirect to it."""
+
+    url: str
+    name: str
+    content_type: str | None = None
+
+
+@dataclass
+class DownloadResult:
+    name: str
+    bytes: int
+    path: str | None = None
+    content_type: str | None = None
+    # Bytes already on disk from an earlier, interrupted attempt.
+    resumed_from: int = 0
+    resumes: int = 0
+
+
+class Downloader:
+    """
+    Streams message files from Graph to disk or to any byte sink, never holding a whole file in memory.
+
+    Bodies are read in chunks of `max_memory / max_concurrency` bytes, so at most
+    `max_memory` bytes are buffered however many downloads run at once. A download
+    to a path is written to '{path}.part' and renamed when complete; a later download
+    to the same path resumes from the partial file with a range request, as does a
+    download interrupted mid-stream. The source URL, size and ETag of a partial file
+    are kept in '{path}.part.json', and a partial file of another source, or of a
+    file that changed since, is discarded and downloaded again. Redirects to pre-authenticated download URLs
+    (SharePoint files) are followed without sending the Graph token along.
+
+    Args:
+        app: App whose requests and HTTP client fetch the files.
+        max_memory: Bytes of response bodies buffered at once across all downloads.
+        max_concurrency: Downloads running at the same time in `download_many`.
+        max_resumes: Range requests made to resume one interrupted download.
+    """
+
+    def __init__(
+        self,
+        app: "MsTeamsApp",
+        max_memory: int = DEFAULT_MAX_MEMORY,
+        max_concurrency: int = DEFAULT_CONCURRENCY,
+        max_resumes: int = MAX_RESUMES,
+    ) -> None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be a positive integer.")
+        self.app = app
+        self.max_memory = max_memory
+        self.max_concurrency = max_concurrency
+        self.max_resumes = max_resumes
+
+    @property
+    def chunk_size(self) -> int:
+        return max(MIN_CHUNK_SIZE, self.max_memory // self.max_concurrency)
+
+    def _open(self, url: str, start: int) -> httpx.Response:
+        # Ranges count encoded bytes, so ask for the file as stored to resume at the
+        # right offset.
+        headers = {
+            "Accept-Encoding": "identity",
+            **({"Range": f"bytes={start}-"} if start else {}),
+        }
+        response = self.app._request(
+            GraphRequest("GET", url, headers=headers, stream=True)
+        )
+        location = response.headers.get("Location")
+        if response.status_code in REDIRECTS and location:
+            response.close()
+            # The redirect target is pre-authenticated and must not receive the Graph
+            # token.
+            client = self.app.client
+            response = client.send(
+                client.build_request("GET", location, headers=headers), stream=True
+            )
+        if (
+            response.is_error
+            and response.status_code != httpx.codes.REQUESTED_RANGE_NOT_SATISFIABLE
+        ):
+            response.read()
+            response.raise_for_status()
+        return response
+
+    def download(self, download: Download, sink: Sink) -> DownloadResult:
+        """
+        Streams one file into `sink`: a file path, a binary file object or a callable taking each chunk.
+
+        Raises:
+            HTTPStatusError: If Graph or the storage serving the file rejects the request.
+            TransportError: If the download is interrupted more than `max_resumes` times.
+        """
+        if isinstance(sink, (str, os.PathLike)):
+            return self._download_to_path(download, Path(sink))
+        write = sink.write if hasattr(sink, "write") else sink
+        rewind = None
+        if hasattr(sink, "seek") and hasattr(sink, "truncate"):
+            start = sink.tell()
+
+            def rewind() -> None:
+                sink.seek(start)
+                sink.truncate()
+
+        written, resumes = self._stream(download.url, write, 0, rewind)
+        return DownloadResult(
+            download.name, written, content_type=download.content_type, resumes=resumes
+        )
+
+    def _download_to_path(self, download: Download, path: Path) -> DownloadResult:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        part = path.with_name(path.name + ".part")
+        state = part.with_name(part.name + ".json")
+        try:
+            source = json.loads(state.read_text())
+        except (OSError, ValueError):
+            source = {}
+        # Bytes of another file, or of one whose source is unknown, must not be resumed.
+        start = (
+            part.stat().st_size
+            if part.exists() and source.get("url") == download.url
+            else 0
+        )
+        with open(part, "ab" if start else "wb") as file:
+
+            def rewind() -> None:
+                nonlocal source, start
+                file.seek(0)
+                file.truncate()
+                source, start = {}, 0
+
+            def matches(response: httpx.Response) -> bool:
+                nonlocal source
+                current = {
+                    "url": download.url,
+                    "size": total_size(response),
+                    "etag": response.headers.get("ETag"),
+                }
+                if any(
+                    source.get(key) is not None
+                    and current[key] is not None
+                    and source[key] != current[key]
+                    for key in ("size", "etag")
+                ):
+                    return False
+                if current != source:
+                    source = current
+                    state.write_text(json.dumps(source))
+                return True
+
+            written, resumes = self._stream(
+                download.url, file.write, start, rewind, matches
+            )
+        os.replace(part, path)
+        state.unlink(missing_ok=True)
+        return DownloadResult(
+            download.name, written, str(path), download.content_type, start, resumes
+        )
+
+    def _stream(
+        self,
+        url: str,
+        write: Callable[[bytes], Any],
+        start: int,
+        rewind: Callable[[], None] | None,
+        matches: Callable[[httpx.Response], bool] | None = None,
+    ) -> tuple[int, int]:
+        """
+        Writes the body of `url` from byte `start` on; returns the total size and how often it resumed.
+        When `matches` rejects a response, the file changed since the bytes written so far and is fetched again.
+        """
+        written = start
+        resumes = 0
+        while True:
+            try:
+                response = self._open(url, written)
+                if matches is not None and not matches(response):
+                    response.close()
+                    written = self._restart(rewind, f"{url} changed")
+                    continue
+                try:
+                    if (
+                        response.status_code
+                        == httpx.codes.REQUESTED_RANGE_NOT_SATISFIABLE
+                    ):
+                        # Nothing left after `written`: an earlier attempt already
+                        # fetched everything.
+                        return written, resumes
+                    if written and response.status_code != httpx.codes.PARTIAL_CONTENT:
+                        # The server ignored the range and sent the whole file again.
+                        written = self._restart(rewind, f"{url} cannot be resumed")
+                    buffer = bytearray()
+                    try:
+                        for data in response.iter_bytes():
+                            buffer += data
+                            while len(buffer) >= self.chunk_size:
+                                write(bytes(buffer[: self.chunk_size]))
+                                written += self.chunk_size
+                                del buffer[: self.chunk_size]
+                    finally:
+                        # Keep what arrived before an interruption, so the resume starts
+                        # right after it.
+                        if buffer:
+                            write(bytes(buffer))
+                            written += len(buffer)
+                finally:
+                    response.close()
+                return written, resumes
+            except httpx.TransportError:
+                if resumes >= self.max_resumes:
+                    raise
+                resumes += 1
+
+    @staticmethod
+    def _restart(rewind: Callable[[], None] | None, reason: str) -> int:
+        """Empties the sink for a download starting over; returns the bytes now written."""
+        if rewind is None:
+            raise httpx.HTTPError(f"{reason} and the sink cannot be rewound.")
+        rewind()
+        return 0
+
+    def download_many(
+        self,
+        downloads: list[Download],
+        directory: str | os.PathLike,
+        overwrite: bool = False,
+    ) -> dict[str, Any]:
+        """
+        Downloads files into `directory` concurrently, each under its (sanitized, de-duplicated)
+        name. Files that fail are reported under 'errors' instead of failing the others.
+        Unless `overwrite` is set, a file already in `directory` is kept and the new one is
+        saved under a numbered name, as 'report (2).pdf'.
+        """
+        directory = Path(directory)
+        paths, taken = [], set()
+        for download in downloads:
+            name = safe_name(download.name)
+            stem, suffix = os.path.splitext(name)
+            candidate, n = name, 1
+            while candidate.lower() in taken or (
+                not overwrite and (directory / candidate).exists()
+            ):
+                n += 1
+                candidate = f"{stem} ({n}){suffix}"
+            taken.add(candidate.lower())
+            paths.append(directory / candidate)
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(self.max_concurrency, len(downloads)))
+        ) as pool:
+            futures = [
+                pool.submit(
+                    contextvars.copy_context().run, self.download, download, path
+                )
+                for download, path in zip(downloads, paths)
+            ]
+        results, errors = [], []
+        for download, future in zip(downloads, futures):
+            try:
+                results.append(asdict(future.result()))
+            except httpx.HTTPStatusError as e:
+                errors.append(
+                    {
+                        "name": download.name,
+                        "status": e.response.status_code,
+                        "error": str(e),
+                    }
+                )
+            except (httpx.HTTPError, OSError) as e:
+                errors.append({"name": download.name, "status": None, "error": str(e)})
+        result: dict[str, Any] = {"value": results}
+        if errors:
+            result["errors"] = errors
+        return result
+
+
+def hosted_content_download(
+    message_url: str, hosted_content: dict[str, Any]
+) -> Download:
+    content_type = hosted_content.get("contentType")
+    extension = (
+        mimetypes.guess_extension(content_type) if content_type else None
+    ) or ""
+    # Hosted content ids are long opaque strings; a digest makes a stable, short file
+    # name.
+    name = f"hostedContent-{hashlib.sha1(hosted_content['id'].encode()).hexdigest()[:12]}{extension}"
+    return Download(
+        f"{message_url}/hostedContents/{hosted_content['id']}/$value",
+        name,
+        content_type,
+    )
+
+
+def attachment_download(base_url: str, attachment: dict[str, Any]) -> Download | None:
+    """Download for a file attachment (`contentType` 'reference'), or None for cards and other inline attachments."""
+    if attachment.get("contentType") != "reference" or not attachment.get("contentUrl"):
+        return None
+    url = f"{base_url}/shares/{share_id(attachment['contentUrl'])}/driveItem/content"
+    return Download(url, attachment.get("name") or attachment.get("id") or "attachment")
@@ -0,0 +1,115 @@
+import hashlib
+import heapq
+import json
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from universal_mcp.exceptions import KeyNotFoundError
+from universal_mcp.stores import BaseStore
+
+DEFAULT_TTL = 24 * 60 * 60
+
+PENDING = "pending"
+DONE = "done"
+
+
+def fingerprint(url: str, payload: Any) -> str:
+    """Identifies the post an idempotency key was first used for."""
+    return hashlib.sha256(
+        json.dumps([url, payload], sort_keys=True).encode()
+    ).hexdigest()
+
+
+class IdempotencyKeys:
+    """
+    Records of message posts made with an idempotency key, kept in a store for `ttl` seconds.
+
+    A record is `pending` while its post's outcome is unknown (the request was sent
+    but no answer came back) and `done` with the created message once Graph
+    accepted it. Calls sharing a key are serialized with a per-key lock.
+
+    Args:
+        store: Where records live; use a persistent store to dedupe across restarts.
+        ttl: Seconds a key is remembered after its last use.
+        prefix: Namespace of the keys written to `store`.
+    """
+
+    def __init__(
+        self,
+        store: BaseStore,
+        ttl: float = DEFAULT_TTL,
+        prefix: str = "ms-teams-idempotency",
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.store = store
+        self.ttl = ttl
+        self.prefix = prefix
+        self._clock = clock
+        self._locks: dict[str, threading.Lock] = {}
+        self._users: dict[str, int] = {}
+        self._lock = threading.Lock()
+        # Expiry times of the keys written by this process, so they are evicted even
+        # if nobody reads them again (stores cannot be enumerated).
+        self._expiry: list[tuple[float, str]] = []
+
+    def _key(self, key: str) -> str:
+        return f"{self.prefix}:{key}"
+
+    @contextmanager
+    def lock(self, key: str) -> Iterator[None]:
+        with self._lock:
+            lock = self._locks.setdefault(key, threading.Lock())
+            self._users[key] = self._users.get(key, 0) + 1
+        try:
+            with lock:
+                yield
+        finally:
+            with self._lock:
+                self._users[key] -= 1
+                if not self._users[key]:
+                    del self._users[key]
+                    del self._locks[key]
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        try:
+            record = self.store.get(self._key(key))
+        except KeyNotFoundError:
+            return None
+        if record["expires_at"] <= self._clock():
+            self.discard(key)
+            return None
+        return record
+
+    def _put(self, key: str, record: dict[str, Any]) -> dict[str, Any]:
+        now = self._clock()
+        record = {**record, "expires_at": now + self.ttl}
+        self.store.set(self._key(key), record)
+        with self._lock:
+            heapq.heappush(self._expiry, (record["expires_at"], key))
+            expired = []
+            while self._expiry and self._expiry[0][0] <= now:
+                expired.append(heapq.heappop(self._expiry)[1])
+        for stale in expired:
+            # `get` only deletes the record if it has not been renewed since.
+            self.get(stale)
+        return record
+
+    def pending(self, key: str, fingerprint: str, started_at: float) -> dict[str, Any]:
+        return self._put(
+            key,
+            {"state": PENDING, "fingerprint": fingerprint, "started_at": started_at},
+        )
+
+    def complete(self, key: str, fingerprint: str, result: Any) -> dict[str, Any]:
+        return self._put(
+            key, {"state": DONE, "fingerprint": fingerprint, "result": result}
+        )
+
+    def discard(self, key: str) -> None:
+        try:
+            self.store.delete(self._key(key))
+        except KeyNotFoundError:
+            pass
@@ -0,0 +1,569 @@
+"""
+Latency and request-count instrumentation for `MsTeamsApp`.
+
+An `Instrumentation` wraps every tool returned by `list_tools()` and every Graph
+request the app sends, and hands a `ToolEvent` / `RequestEvent` to each of its
+sinks. Requests are attributed to the tool that issued them, so the sinks can
+tell which tools dominate quota and wall time.
+
+Sinks shipped here:
+
+- `InMemorySink`: per-tool and per-endpoint histograms, read with `snapshot()`.
+- `PrometheusSink`: the same data rendered in the Prometheus text format, optionally
+  served on a local `/metrics` endpoint.
+- `OpenTelemetrySink`: one span per tool call with a child span per Graph request
+  (requires `opentelemetry-api`).
+
+Apps without an `Instrumentation` skip all of this; their tools and requests run
+unwrapped.
+"""
+
+import bisect
+import functools
+import threading
+import time
+from collections.abc import Callable, Iterable
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+import httpx
+
+from universal_mcp_ms_teams.request import GraphRequest, RequestTrace
+from universal_mcp_ms_teams.throttling import resource_of
+
+if TYPE_CHECKING:
+    from http.server import ThreadingHTTPServer
+
+# Upper bounds, in seconds, of the latency histogram buckets.
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+@dataclass
+class RequestEvent:
+    """One Graph request, including every retry it took to complete."""
+
+    tool: str | None
+    method: str
+    resource: str
+    status: int | None
+    duration: float
+    response_bytes: int = 0
+    attempts: int = 0
+    retries: int = 0
+    throttle_wait: float = 0.0
+    queue_wait: float = 0.0
+    error: str | None = None
+
+
+@dataclass
+class ToolEvent:
+    """One tool call with the totals of the Graph requests it issued."""
+
+    tool: str
+    duration: float
+    ok: bool
+    requests: int = 0
+    retries: int = 0
+    throttle_wait: float = 0.0
+    response_bytes: int = 0
+    error: str | None = None
+
+
+@dataclass
+class _ToolCall:
+    name: str
+    requests: int = 0
+    retries: int = 0
+    throttle_wait: float = 0.0
+    response_bytes: int = 0
+
+
+_current_tool: ContextVar[_ToolCall | None] = ContextVar(
+    "ms_teams_current_tool", default=None
+)
+_current_trace: ContextVar[RequestTrace | None] = ContextVar(
+    "ms_teams_current_trace", default=None
+)
+
+
+def current_trace() -> RequestTrace | None:
+    """Trace of the request being instrumented in this context, if any."""
+    return _current_trace.get()
+
+
+def response_size(response: httpx.Response) -> int:
+    try:
+        return len(response.content)
+    except httpx.ResponseNotRead:
+        return int(response.headers.get("Content-Length") or 0)
+
+
+class Sink:
+    """
+    Receives instrumentation events. Subclasses override the hooks they need.
+
+    `tool_started` may return a handle, which is passed back to `tool_finished`
+    for the same call.
+    """
+
+    def tool_started(self, tool: str) -> Any:
+        return None
+
+    def tool_finished(self, event: ToolEvent, handle: Any) -> None:
+        pass
+
+    def request_finished(self, event: RequestEvent) -> None:
+        pass
+
+
+class Instrumentation:
+    """
+    Times tools and Graph requests and reports them to `sinks`.
+
+    Args:
+        sinks: Receivers of every `ToolEvent` and `RequestEvent`.
+    """
+
+    def __init__(self, *sinks: Sink) -> None:
+        self.sinks = list(sinks)
+
+    def wrap_tool(self, tool: Callable[..., Any]) -> Callable[..., Any]:
+        name = tool.__name__
+
+        @functools.wraps(tool)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            call = _ToolCall(name)
+            token = _current_tool.set(call)
+            handles = [sink.tool_started(name) for sink in self.sinks]
+            started = time.perf_counter()
+            error = None
+            try:
+                return tool(*args, **kwargs)
+            except Exception as e:
+                error = type(e).__name__
+                raise
+            finally:
+                event = ToolEvent(
+                    name,
+                    time.perf_counter() - started,
+                    error is None,
+                    call.requests,
+                    call.retries,
+                    call.throttle_wait,
+                    call.response_bytes,
+                    error,
+                )
+                _current_tool.reset(token)
+                for sink, handle in zip(self.sinks, handles):
+                    sink.tool_finished(event, handle)
+
+        return wrapper
+
+    def wrap_tools(
+        self, tools: Iterable[Callable[..., Any]]
+    ) -> list[Callable[..., Any]]:
+        return [self.wrap_tool(tool) for tool in tools]
+
+    def observe(
+        self, request: GraphRequest, send: Callable[[GraphRequest], httpx.Response]
+    ) -> httpx.Response:
+        """
+        Sends `request` through `send` and reports it. `send` can pick up the trace
+        to fill in with `current_trace()`.
+        """
+        trace = RequestTrace()
+        token = _current_trace.set(trace)
+        started = time.perf_counter()
+        response = None
+        error = None
+        try:
+            response = send(request)
+            return response
+        except Exception as e:
+            error = type(e).__name__
+            raise
+        finally:
+            duration = time.perf_counter() - started
+            _current_trace.reset(token)
+            size = response_size(response) if response is not None else 0
+            call = _current_tool.get()
+            if call is not None:
+                call.requests += 1
+                call.retries += trace.retries
+                call.throttle_wait += trace.throttle_wait
+                call.response_bytes += size
+            event = RequestEvent(
+                call.name if call is not None else None,
+                request.method,
+                resource_of(request.url),
+                response.status_code if response is not None else None,
+                duration,
+                size,
+                trace.attempts,
+                trace.retries,
+                trace.throttle_wait,
+                trace.queue_wait,
+                error,
+            )
+            for sink in self.sinks:
+                sink.request_finished(event)
+
+
+class Histogram:
+    """Fixed-bucket histogram; quantiles are estimated as the upper bound of their bucket."""
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> float:
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def summary(self) -> dict[str, float]:
+        return {
+            "count": self.count,
+            "mean_ms": self.sum / self.count * 1000 if self.count else 0.0,
+            "p50_ms": self.quantile(0.5) * 1000,
+            "p95_ms": self.quantile(0.95) * 1000,
+            "p99_ms": self.quantile(0.99) * 1000,
+            "max_ms": self.max * 1000,
+        }
+
+
+@dataclass
+class ToolMetrics:
+    calls: int = 0
+    errors: int = 0
+    requests: int = 0
+    retries: int = 0
+    throttle_wait: float = 0.0
+    response_bytes: int = 0
+    duration: Histogram = field(default_factory=Histogram)
+
+
+@dataclass
+class RequestMetrics:
+    requests: int = 0
+    attempts: int = 0
+    retries: int = 0
+    throttle_wait: float = 0.0
+    response_bytes: int = 0
+    statuses: dict[str, int] = field(default_factory=dict)
+    duration: Histogram = field(default_factory=Histogram)
+
+
+class InMemorySink(Sink):
+    """
+    Aggregates events into per-tool and per-endpoint counters and latency histograms.
+
+    Endpoints are keyed by (tool, method, resource family); requests issued
+    outside any tool are attributed to the tool name ''.
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        self.buckets = buckets
+        self.tools: dict[str, ToolMetrics] = {}
+        self.requests: dict[tuple[str, str, str], RequestMetrics] = {}
+        self._lock = threading.Lock()
+
+    def tool_finished(self, event: ToolEvent, handle: Any) -> None:
+        with self._lock:
+            metrics = self.tools.get(event.tool)
+            if metrics is None:
+                metrics = self.tools[event.tool] = ToolMetrics(
+                    duration=Histogram(self.buckets)
+                )
+            metrics.calls += 1
+            metrics.errors += not event.ok
+            metrics.requests += event.requests
+            metrics.retries += event.retries
+            metrics.throttle_wait += event.throttle_wait
+            metrics.response_bytes += event.response_bytes
+            metrics.duration.observe(event.duration)
+
+    def request_finished(self, event: RequestEvent) -> None:
+        key = (event.tool or "", event.method, event.resource)
+        status = str(event.status) if event.status is not None else "error"
+        with self._lock:
+            metrics = self.requests.get(key)
+            if metrics is None:
+                metrics = self.requests[key] = RequestMetrics(
+                    duration=Histogram(self.buckets)
+                )
+            metrics.requests += 1
+            metrics.attempts += event.attempts
+            metrics.retries += event.retries
+            metrics.throttle_wait += event.throttle_wait
+            metrics.response_bytes += event.response_bytes
+            metrics.statuses[status] = metrics.statuses.get(status, 0) + 1
+            metrics.duration.observe(event.duration)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Per-tool and per-endpoint totals with latency percentiles in milliseconds."""
+        with self._lock:
+            tools = {
+                name: {
+                    "calls": metrics.calls,
+                    "errors": metrics.errors,
+                    "requests": metrics.requests,
+                    "retries": metrics.retries,
+                    "throttle_wait_seconds": metrics.throttle_wait,
+                    "response_bytes": metrics.response_bytes,
+                    **metrics.duration.summary(),
+                }
+                for name, metrics in self.tools.items()
+            }
+            requests = {
+                " ".join(part for part in key if part): {
+                    "requests": metrics.requests,
+                    "attempts": metrics.attempts,
+                    "retries": metrics.retries,
+                    "throttle_wait_seconds": metrics.throttle_wait,
+                    "response_bytes": metrics.response_bytes,
+                    "statuses": dict(metrics.statuses),
+                    **metrics.duration.summary(),
+                }
+                for key, metrics in self.requests.items()
+            }
+        return {"tools": tools, "requests": requests}
+
+    def reset(self) -> None:
+        with self._lock:
+            self.tools.clear()
+            self.requests.clear()
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: str) -> str:
+    return (
+        "{"
+        + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items())
+        + "}"
+    )
+
+
+class PrometheusSink(InMemorySink):
+    """
+    `InMemorySink` exposing its data in the Prometheus text exposition format.
+
+    Use `render()` to embed the metrics in an existing endpoint, or `serve()` to
+    start a standalone `/metrics` endpoint.
+
+    Args:
+        namespace: Prefix of every metric name.
+        buckets: Upper bounds of the latency histogram buckets, in seconds.
+    """
+
+    def __init__(
+        self, namespace: str = "ms_teams", buckets: tuple[float, ...] = DEFAULT_BUCKETS
+    ) -> None:
+        super().__init__(buckets)
+        self.namespace = namespace
+
+    def _histogram(
+        self, lines: list[str], name: str, labels: dict[str, str], histogram: Histogram
+    ) -> None:
+        cumulative = 0
+        for bound, count in zip(histogram.buckets, histogram.counts):
+            cumulative += count
+            lines.append(
+                f"{name}_bucket{_labels(**labels, le=repr(bound))} {cumulative}"
+            )
+        lines.append(f"{name}_bucket{_labels(**labels, le='+Inf')} {histogram.count}")
+        lines.append(f"{name}_sum{_labels(**labels)} {histogram.sum}")
+        lines.append(f"{name}_count{_labels(**labels)} {histogram.count}")
+
+    def render(self) -> str:
+        ns = self.namespace
+        lines: list[str] = []
+        with self._lock:
+            tools = list(self.tools.items())
+            requests = list(self.requests.items())
+
+            lines += [
+                f"# HELP {ns}_tool_calls_total Tool calls by outcome.",
+                f"# TYPE {ns}_tool_calls_total counter",
+            ]
+            for tool, metrics in tools:
+                lines.append(
+                    f"{ns}_tool_calls_total{_labels(tool=tool, outcome='ok')} {metrics.calls - metrics.errors}"
+                )
+                lines.append(
+                    f"{ns}_tool_calls_total{_labels(tool=tool, outcome='error')} {metrics.errors}"
+                )
+            lines += [
+                f"# HELP {ns}_tool_duration_seconds Tool call latency.",
+                f"# TYPE {ns}_tool_duration_seconds histogram",
+            ]
+            for tool, metrics in tools:
+                self._histogram(
+                    lines,
+                    f"{ns}_tool_duration_seconds",
+                    {"tool": tool},
+                    metrics.duration,
+                )
+
+            lines += [
+                f"# HELP {ns}_graph_requests_total Graph requests by response status.",
+                f"# TYPE {ns}_graph_requests_total counter",
+            ]
+            for (tool, method, resource), metrics in requests:
+                for status, count in metrics.statuses.items():
+                    lines.append(
+                        f"{ns}_graph_requests_total{_labels(tool=tool, method=method, resource=resource, status=status)} {count}"
+                    )
+            lines += [
+                f"# HELP {ns}_graph_request_duration_seconds Graph request latency, retries included.",
+                f"# TYPE {ns}_graph_request_duration_seconds histogram",
+            ]
+            for (tool, method, resource), metrics in requests:
+                self._histogram(
+                    lines,
+                    f"{ns}_graph_request_duration_seconds",
+                    {"tool": tool, "method": method, "resource": resource},
+                    metrics.duration,
+                )
+            for metric, kind, description, attribute in (
+                (
+                    "graph_retries_total",
+                    "counter",
+                    "Graph requests re-sent after throttling or a transient failure.",
+                    "retries",
+                ),
+                (
+                    "graph_throttle_wait_seconds_total",
+                    "counter",
+                    "Time spent waiting before retries.",
+                    "throttle_wait",
+                ),
+                (
+                    "graph_response_bytes_total",
+                    "counter",
+                    "Graph response body bytes received.",
+                    "response_bytes",
+                ),
+            ):
+                lines += [
+                    f"# HELP {ns}_{metric} {description}",
+                    f"# TYPE {ns}_{metric} {kind}",
+                ]
+                for (tool, method, resource), metrics in requests:
+                    lines.append(
+                        f"{ns}_{metric}{_labels(tool=tool, method=method, resource=resource)} {getattr(metrics, attribute)}"
+                    )
+        return "\n".join(lines) + "\n"
+
+    def serve(self, host: str = "127.0.0.1", port: int = 9464) -> "ThreadingHTTPServer":
+        """Serves `render()` on `http://{host}:{port}/metrics` from a background thread."""
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer  # noqa: PLC0415
+
+        sink = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.split("?", 1)[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = sink.render().encode()
+                self.send_response(200)
+                self.send_header(
+                    "Content-Type", "text/plain; version=0.0.4; charset=utf-8"
+                )
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return server
+
+
+class OpenTelemetrySink(Sink):
+    """
+    Emits an OpenTelemetry span per tool call and a child CLIENT span per Graph request.
+
+    Args:
+        tracer: Tracer to use; defaults to the global tracer provider's.
+    """
+
+    def __init__(self, tracer: Any = None) -> None:
+        try:
+            from opentelemetry import context, trace  # noqa: PLC0415
+        except ImportError as e:
+            raise ImportError(
+                "OpenTelemetrySink requires opentelemetry-api: pip install 'universal-mcp-ms-teams[otel]'"
+            ) from e
+        self._context = context
+        self._trace = trace
+        self.tracer = tracer or trace.get_tracer("universal_mcp_ms_teams")
+
+    def tool_started(self, tool: str) -> Any:
+        span = self.tracer.start_span(
+            f"ms_teams.{tool}", attributes={"ms_teams.tool": tool}
+        )
+        return span, self._context.attach(self._trace.set_span_in_context(span))
+
+    def tool_finished(self, event: ToolEvent, handle: Any) -> None:
+        span, token = handle
+        span.set_attributes(
+            {
+                "ms_teams.requests": event.requests,
+                "ms_teams.retries": event.retries,
+                "ms_teams.throttle_wait": event.throttle_wait,
+                "ms_teams.response_bytes": event.response_bytes,
+            }
+        )
+        if not event.ok:
+            span.set_status(
+                self._trace.Status(self._trace.StatusCode.ERROR, event.error)
+            )
+        self._context.detach(token)
+        span.end()
+
+    def request_finished(self, event: RequestEvent) -> None:
+        ended = time.time_ns()
+        attributes = {
+            "http.request.method": event.method,
+            "ms_teams.resource": event.resource,
+            "ms_teams.attempts": event.attempts,
+            "ms_teams.retries": event.retries,
+            "ms_teams.throttle_wait": event.throttle_wait,
+            "ms_teams.response_bytes": event.response_bytes,
+        }
+        if event.status is not None:
+            attributes["http.response.status_code"] = event.status
+        span = self.tracer.start_span(
+            f"{event.method} {event.resource}",
+            kind=self._trace.SpanKind.CLIENT,
+            attributes=attributes,
+            start_time=ended - int(event.duration * 1e9),
+        )
+        if event.error is not None or (event.status or 0) >= httpx.codes.BAD_REQUEST:
+            span.set_status(
+                self._trace.Status(self._trace.StatusCode.ERROR, event.error)
+            )
+        span.end(end_time=ended)
@@ -0,0 +1,182 @@
+"""
+Precomputed tool schemas for a fast server cold start.
+
+Registering a tool normally means introspecting its signature and parsing its
+docstring into a pydantic argument model, for every tool, before the server
+can answer anything. `tool_manifest.json` holds the result of that work for
+`AsyncMsTeamsApp`'s tools, so the server registers `LazyTool`s straight from
+JSON and builds the app, its credentials and a tool's argument model only
+when that tool is first called.
+
+Regenerate the manifest whenever a tool changes:
+
+    python -m universal_mcp_ms_teams.manifest
+
+A manifest that no longer matches the modules defining the tools (or the
+installed universal_mcp) is ignored by `load_manifest` with a warning, and the
+server falls back to introspecting the tools.
+"""
+
+import argparse
+import hashlib
+import importlib.metadata
+import json
+import threading
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+from pydantic import Field
+from universal_mcp.tools.func_metadata import FuncMetadata
+from universal_mcp.tools.manager import TOOL_NAME_SEPARATOR
+from universal_mcp.tools.tools import Tool
+
+PACKAGE_DIR = Path(__file__).parent
+MANIFEST_PATH = PACKAGE_DIR / "tool_manifest.json"
+
+# Modules whose source defines the tools, their signatures and docstrings; editing any
+# other module keeps the manifest current.
+TOOL_MODULES = ("app.py", "async_app.py")
+
+
+def source_hash() -> str:
+    """Digest of the modules the tool schemas are derived from."""
+    digest = hashlib.sha256()
+    for name in TOOL_MODULES:
+        digest.update(name.encode())
+        digest.update((PACKAGE_DIR / name).read_bytes())
+    return digest.hexdigest()
+
+
+def universal_mcp_version() -> str:
+    return importlib.metadata.version("universal_mcp")
+
+
+def build_manifest(app: Any = None) -> dict[str, Any]:
+    """Introspects every tool of `app` (by default an `AsyncMsTeamsApp` without integration)."""
+    if app is None:
+        from universal_mcp_ms_teams.async_app import AsyncMsTeamsApp  # noqa: PLC0415
+
+        app = AsyncMsTeamsApp(integration=None)
+    tools = [
+        Tool.from_function(function).model_dump(exclude={"fn", "fn_metadata"})
+        for function in app.list_tools()
+    ]
+    return {
+        "app": app.name,
+        "source_hash": source_hash(),
+        "universal_mcp": universal_mcp_version(),
+        "tools": tools,
+    }
+
+
+def write_manifest(path: Path = MANIFEST_PATH, app: Any = None) -> dict[str, Any]:
+    manifest = build_manifest(app)
+    path.write_text(json.dumps(manifest, indent=1, sort_keys=True) + "\n")
+    return manifest
+
+
+def is_current(manifest: dict[str, Any]) -> bool:
+    return (
+        manifest.get("source_hash") == source_hash()
+        and manifest.get("universal_mcp") == universal_mcp_version()
+    )
+
+
+def load_manifest(path: Path = MANIFEST_PATH) -> dict[str, Any] | None:
+    """The manifest, or None if it is missing or was generated from other sources."""
+    try:
+        manifest = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+    if not is_current(manifest):
+        logger.warning(
+            f"{path} is stale, so tools are introspected at startup; regenerate it with: python -m universal_mcp_ms_teams.manifest"
+        )
+        return None
+    return manifest
+
+
+class LazyTool(Tool):
+    """
+    Tool registered from its manifest entry. The function it wraps, and the
+    argument model validating its calls, are only built on the first call.
+    """
+
+    fn: Callable[..., Any] | None = Field(default=None, exclude=True)
+    fn_metadata: FuncMetadata | None = Field(default=None, exclude=True)
+    resolve: Callable[[], Callable[..., Any]] = Field(exclude=True)
+
+    def bind(self) -> None:
+        if self.fn_metadata is None:
+            tool = Tool.from_function(self.resolve())
+            self.fn, self.fn_metadata = tool.fn, tool.fn_metadata
+
+    async def run(
+        self, arguments: dict[str, Any], context: dict[str, Any] | None = None
+    ) -> Any:
+        self.bind()
+        return await super().run(arguments, context)
+
+
+def lazy_tools(
+    manifest: dict[str, Any], app_factory: Callable[[], Any]
+) -> list[LazyTool]:
+    """
+    Tools described by `manifest`, named and tagged the way `ToolManager.register_tools_from_app`
+    names them. `app_factory` is called on the first tool call and must return the same app every time.
+    """
+    functions: dict[str, Callable[..., Any]] = {}
+    lock = threading.Lock()
+
+    def function(name: str) -> Callable[..., Any]:
+        with lock:
+            if not functions:
+                functions.update(
+                    (tool.__name__, tool) for tool in app_factory().list_tools()
+                )
+        return functions[name]
+
+    app_name = manifest["app"]
+    tools = []
+    for entry in manifest["tools"]:
+        tags = (
+            entry["tags"] if app_name in entry["tags"] else [*entry["tags"], app_name]
+        )
+        name = entry["name"]
+        tools.append(
+            LazyTool(
+                **{
+                    **entry,
+                    "name": f"{app_name}{TOOL_NAME_SEPARATOR}{name}",
+                    "tags": tags,
+                },
+                resolve=lambda name=name: function(name),
+            )
+        )
+    return tools
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Generate the precomputed tool manifest used by the MCP server."
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Only check that the manifest is up to date.",
+    )
+    parser.add_argument("--output", type=Path, default=MANIFEST_PATH)
+    args = parser.parse_args(argv)
+    if args.check:
+        current = load_manifest(args.output) is not None
+        print(f"{args.output} is {'up to date' if current else 'stale or missing'}")  # noqa: T201 - CLI output
+        return 0 if current else 1
+    manifest = write_manifest(args.output)
+    print(f"Wrote {len(manifest['tools'])} tools to {args.output}")  # noqa: T201 - CLI output
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
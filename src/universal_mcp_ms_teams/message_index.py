@@ -0,0 +1,182 @@
+import sqlite3
+import threading
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from universal_mcp_ms_teams.delta import change_type
+from universal_mcp_ms_teams.projection import html_to_text
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS messages (
+    id INTEGER PRIMARY KEY,
+    conversation TEXT NOT NULL,
+    message_id TEXT NOT NULL,
+    chat_id TEXT,
+    team_id TEXT,
+    channel_id TEXT,
+    reply_to_id TEXT,
+    sender TEXT,
+    subject TEXT,
+    text TEXT,
+    created TEXT,
+    modified TEXT,
+    UNIQUE (conversation, message_id)
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS messages_fts USING fts5(
+    subject, text, sender,
+    content='messages', content_rowid='id', tokenize='unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER IF NOT EXISTS messages_ai AFTER INSERT ON messages BEGIN
+    INSERT INTO messages_fts(rowid, subject, text, sender) VALUES (new.id, new.subject, new.text, new.sender);
+END;
+CREATE TRIGGER IF NOT EXISTS messages_ad AFTER DELETE ON messages BEGIN
+    INSERT INTO messages_fts(messages_fts, rowid, subject, text, sender) VALUES ('delete', old.id, old.subject, old.text, old.sender);
+END;
+CREATE TRIGGER IF NOT EXISTS messages_au AFTER UPDATE ON messages BEGIN
+    INSERT INTO messages_fts(messages_fts, rowid, subject, text, sender) VALUES ('delete', old.id, old.subject, old.text, old.sender);
+    INSERT INTO messages_fts(rowid, subject, text, sender) VALUES (new.id, new.subject, new.text, new.sender);
+END;
+"""
+
+UPSERT = """
+INSERT INTO messages (conversation, message_id, chat_id, team_id, channel_id, reply_to_id, sender, subject, text, created, modified)
+VALUES (:conversation, :message_id, :chat_id, :team_id, :channel_id, :reply_to_id, :sender, :subject, :text, :created, :modified)
+ON CONFLICT (conversation, message_id) DO UPDATE SET
+    reply_to_id = excluded.reply_to_id, sender = excluded.sender, subject = excluded.subject,
+    text = excluded.text, created = excluded.created, modified = excluded.modified
+WHERE excluded.modified IS NOT messages.modified
+"""
+
+
+def sender_of(message: dict[str, Any]) -> str | None:
+    identity = message.get("from") or {}
+    for kind in ("user", "application", "device"):
+        if identity.get(kind):
+            return identity[kind].get("displayName")
+    return None
+
+
+def match_expression(query: str) -> str:
+    """Turns free text into an FTS5 query matching messages that contain every word."""
+    return " ".join('"' + word.replace('"', '""') + '"' for word in query.split())
+
+
+class MessageIndex:
+    """
+    Local SQLite FTS5 index of the chat and channel messages the app has fetched.
+
+    Messages are upserted as tools return them (re-indexed only when their
+    `lastModifiedDateTime` changes) and removed once Graph reports them deleted,
+    so searches never leave the machine.
+
+    Args:
+        path: Database file; the default keeps the index in memory for the life of the app.
+    """
+
+    def __init__(self, path: str | Path = ":memory:") -> None:
+        self.path = str(path)
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._connection.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        with self._lock, self._connection:
+            if self.path != ":memory:":
+                self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.executescript(SCHEMA)
+
+    def add(
+        self,
+        messages: Iterable[dict[str, Any]],
+        chat_id: str | None = None,
+        team_id: str | None = None,
+        channel_id: str | None = None,
+    ) -> int:
+        """
+        Indexes messages of one chat or channel, dropping those that were deleted.
+
+        Returns:
+            int: Number of messages inserted, updated or removed.
+        """
+        conversation = (
+            f"chats/{chat_id}" if chat_id else f"teams/{team_id}/channels/{channel_id}"
+        )
+        changed = 0
+        with self._lock, self._connection:
+            for message in messages:
+                if not isinstance(message, dict) or not message.get("id"):
+                    continue
+                if change_type(message) == "deleted":
+                    cursor = self._connection.execute(
+                        "DELETE FROM messages WHERE conversation = ? AND message_id = ?",
+                        (conversation, message["id"]),
+                    )
+                    changed += cursor.rowcount
+                    continue
+                body = message.get("body") or {}
+                text = body.get("content") or ""
+                if body.get("contentType") == "html":
+                    text = html_to_text(text)
+                cursor = self._connection.execute(
+                    UPSERT,
+                    {
+                        "conversation": conversation,
+                        "message_id": message["id"],
+                        "chat_id": chat_id or message.get("chatId"),
+                        "team_id": team_id,
+                        "channel_id": channel_id,
+                        "reply_to_id": message.get("replyToId"),
+                        "sender": sender_of(message),
+                        "subject": message.get("subject"),
+                        "text": text,
+                        "created": message.get("createdDateTime"),
+                        "modified": message.get("lastModifiedDateTime")
+                        or message.get("createdDateTime"),
+                    },
+                )
+                changed += cursor.rowcount
+        return changed
+
+    def search(
+        self,
+        query: str,
+        chat_id: str | None = None,
+        team_id: str | None = None,
+        channel_id: str | None = None,
+        top: int = 20,
+    ) -> list[dict[str, Any]]:
+        """Best matches first, each with its chat/channel/message ids and a highlighted snippet."""
+        expression = match_expression(query)
+        if not expression:
+            return []
+        conditions = ["messages_fts MATCH ?"]
+        arguments: list[Any] = [expression]
+        for column, value in (
+            ("chat_id", chat_id),
+            ("team_id", team_id),
+            ("channel_id", channel_id),
+        ):
+            if value is not None:
+                conditions.append(f"m.{column} = ?")
+                arguments.append(value)
+        sql = (
+            "SELECT m.chat_id, m.team_id, m.channel_id, m.message_id, m.reply_to_id, m.sender, m.subject, m.created,"
+            " snippet(messages_fts, 1, '[', ']', '…', 16) AS snippet, -bm25(messages_fts) AS score"
+            " FROM messages_fts JOIN messages m ON m.id = messages_fts.rowid"
+            f" WHERE {' AND '.join(conditions)} ORDER BY score DESC LIMIT ?"
+        )
+        with self._lock:
+            rows = self._connection.execute(sql, (*arguments, top)).fetchall()
+        return [
+            {key: row[key] for key in row.keys() if row[key] is not None}
+            for row in rows
+        ]
+
+    def count(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT count(*) FROM messages").fetchone()[
+                0
+            ]
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
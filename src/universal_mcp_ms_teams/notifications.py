@@ -0,0 +1,583 @@
+"""
+Change notifications (webhooks) for new and changed messages, instead of polling.
+
+`SubscriptionManager` creates Graph subscriptions on chat and channel messages
+and renews them before they expire. `NotificationReceiver` is the endpoint Graph
+posts to: it answers the validation handshake, checks each notification's
+`clientState`, decrypts resource data with a `NotificationDecryptor` and pushes
+`ChangeEvent`s onto an asyncio queue consumers read from.
+
+    receiver = NotificationReceiver(client_state=secret, decryptor=decryptor)
+    server = receiver.serve(port=8443)  # behind the public notification URL
+    manager = SubscriptionManager(app, "https://bot.example.com/notifications", secret, decryptor=decryptor)
+    receiver.on_lifecycle = manager.handle_lifecycle
+    manager.subscribe_chat("Product launch")
+    manager.start()
+    async for event in receiver.events():
+        ...
+
+Decrypting resource data requires the `cryptography` package:
+`pip install 'universal-mcp-ms-teams[notifications]'`.
+"""
+
+import asyncio
+import base64
+import hashlib
+import hmac
+import json
+import threading
+import time
+from collections.abc import AsyncIterator, Callable
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
+from urllib.parse import parse_qs
+
+import httpx
+from loguru import logger
+
+if TYPE_CHECKING:
+    from http.server import ThreadingHTTPServer
+
+    from universal_mcp_ms_teams.app import MsTeamsApp
+
+CHAT_MESSAGES = "/chats/{chat_id}/messages"
+CHANNEL_MESSAGES = "/teams/{team_id}/channels/{channel_id}/messages"
+
+# Graph caps chat and channel message subscriptions at 60 minutes.
+DEFAULT_LIFETIME = 55 * 60
+RENEW_MARGIN = 15 * 60
+
+# Lifecycle events Graph sends to the lifecycle notification URL.
+REAUTHORIZATION_REQUIRED = "reauthorizationRequired"
+SUBSCRIPTION_REMOVED = "subscriptionRemoved"
+MISSED = "missed"
+
+
+def graph_datetime(timestamp: float) -> str:
+    return (
+        datetime.fromtimestamp(timestamp, UTC)
+        .isoformat(timespec="seconds")
+        .replace("+00:00", "Z")
+    )
+
+
+def parse_graph_datetime(value: str) -> float:
+    return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+
+
+class NotificationDecryptor:
+    """
+    Decrypts the `encryptedContent` of notifications sent with resource data.
+
+    Graph encrypts each notification's data with a random AES key, itself
+    encrypted with the public key of the certificate given when subscribing.
+
+    Args:
+        private_key_pem: PEM private key of the certificate.
+        certificate_pem: PEM X.509 certificate sent to Graph with each subscription.
+        certificate_id: Id identifying the certificate, echoed back in every notification.
+        password: Password of the private key, if it is encrypted.
+    """
+
+    def __init__(
+        self,
+        private_key_pem: bytes,
+        certificate_pem: bytes,
+        certificate_id: str,
+        password: bytes | None = None,
+    ) -> None:
+        try:
+            from cryptography import x509  # noqa: PLC0415
+            from cryptography.hazmat.primitives import serialization  # noqa: PLC0415
+        except ImportError as e:
+            raise ImportError(
+                "NotificationDecryptor requires cryptography: pip install 'universal-mcp-ms-teams[notifications]'"
+            ) from e
+        self._private_key = serialization.load_pem_private_key(
+            private_key_pem, password=password
+        )
+        certificate = x509.load_pem_x509_certificate(certificate_pem)
+        self.certificate = base64.b64encode(
+            certificate.public_bytes(serialization.Encoding.DER)
+        ).decode()
+        self.certificate_id = certificate_id
+
+    def decrypt(self, encrypted: dict[str, Any]) -> dict[str, Any]:
+        """
+        The resource carried by an `encryptedContent` object.
+
+        Raises:
+            ValueError: If it was encrypted for another certificate or its signature does not match.
+        """
+        from cryptography.hazmat.primitives import hashes, padding  # noqa: PLC0415
+        from cryptography.hazmat.primitives.asymmetric import padding as asymmetric  # noqa: PLC0415
+        from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes  # noqa: PLC0415
+
+        if encrypted.get("encryptionCertificateId") != self.certificate_id:
+            raise ValueError(
+                f"Notification was encrypted for certificate '{encrypted.get('encryptionCertificateId')}', not '{self.certificate_id}'."
+            )
+        key = self._private_key.decrypt(
+            base64.b64decode(encrypted["dataKey"]),
+            asymmetric.OAEP(
+                mgf=asymmetric.MGF1(hashes.SHA1()), algorithm=hashes.SHA1(), label=None
+            ),
+        )
+        data = base64.b64decode(encrypted["data"])
+        if not hmac.compare_digest(
+            hmac.new(key, data, hashlib.sha256).digest(),
+            base64.b64decode(encrypted["dataSignature"]),
+        ):
+            raise ValueError("Notification data signature does not match its content.")
+        decryptor = Cipher(algorithms.AES(key), modes.CBC(key[:16])).decryptor()
+        unpadder = padding.PKCS7(128).unpadder()
+        plain = (
+            unpadder.update(decryptor.update(data) + decryptor.finalize())
+            + unpadder.finalize()
+        )
+        return json.loads(plain)
+
+
+@dataclass
+class Subscription:
+    id: str
+    resource: str
+    expires_at: float
+    change_type: str
+    include_resource_data: bool = False
+
+
+@dataclass
+class ChangeEvent:
+    """
+    One notification. `message` is the changed message when the subscription includes
+    resource data; otherwise fetch it from `resource`. Lifecycle notifications carry
+    `lifecycle_event` instead of a change.
+    """
+
+    subscription_id: str
+    change_type: str | None = None
+    resource: str | None = None
+    resource_data: dict[str, Any] = field(default_factory=dict)
+    message: dict[str, Any] | None = None
+    lifecycle_event: str | None = None
+    tenant_id: str | None = None
+    received_at: float = 0.0
+
+
+@dataclass
+class ReceiverStats:
+    received: int = 0
+    delivered: int = 0
+    # Notifications with a wrong clientState or undecryptable data, and events dropped
+    # on a full queue.
+    rejected: int = 0
+    dropped: int = 0
+
+
+class NotificationReceiver:
+    """
+    Endpoint for Graph change notifications, delivering them as `ChangeEvent`s on an asyncio queue.
+
+    `handle` implements the endpoint independently of any web framework; `serve` runs
+    it on a local HTTP server. Events are queued on the event loop `serve` (or
+    `attach`) was called from. When the queue is full the endpoint answers 503 and
+    Graph delivers the notifications again later.
+
+    Args:
+        client_state: Secret given when subscribing; notifications not carrying it are rejected.
+        decryptor: Decrypts resource data; required for subscriptions that include it.
+        max_queue: Events held before the endpoint pushes back.
+        token_validator: Called with the `validationTokens` of notifications with resource data;
+            returning False rejects them. Without one the tokens are not checked.
+        on_lifecycle: Called, on a thread of its own, with every lifecycle event, e.g.
+            `SubscriptionManager.handle_lifecycle`.
+    """
+
+    def __init__(
+        self,
+        client_state: str,
+        decryptor: NotificationDecryptor | None = None,
+        max_queue: int = 1000,
+        token_validator: Callable[[list[str]], bool] | None = None,
+        on_lifecycle: Callable[[ChangeEvent], None] | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.client_state = client_state
+        self.decryptor = decryptor
+        self.token_validator = token_validator
+        self.on_lifecycle = on_lifecycle
+        self.queue: asyncio.Queue[ChangeEvent] = asyncio.Queue(max_queue)
+        self._clock = clock
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._lock = threading.Lock()
+        self._stats = ReceiverStats()
+        # Events accepted with a 202 but not yet put on the queue by the loop; they
+        # count against `max_queue`.
+        self._pending = 0
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {**asdict(self._stats), "queued": self.queue.qsize()}
+
+    def _record(self, **increments: int) -> None:
+        with self._lock:
+            for name, value in increments.items():
+                setattr(self._stats, name, getattr(self._stats, name) + value)
+
+    def attach(self, loop: asyncio.AbstractEventLoop | None = None) -> None:
+        """Delivers events to the queue on `loop`, by default the running loop."""
+        self._loop = loop or asyncio.get_running_loop()
+
+    def _event(self, notification: dict[str, Any]) -> ChangeEvent | None:
+        if not hmac.compare_digest(
+            str(notification.get("clientState", "")), self.client_state
+        ):
+            logger.warning(
+                f"Rejected a notification for subscription {notification.get('subscriptionId')}: clientState does not match."
+            )
+            return None
+        event = ChangeEvent(
+            subscription_id=notification.get("subscriptionId", ""),
+            change_type=notification.get("changeType"),
+            resource=notification.get("resource"),
+            resource_data=notification.get("resourceData") or {},
+            lifecycle_event=notification.get("lifecycleEvent"),
+            tenant_id=notification.get("tenantId"),
+            received_at=self._clock(),
+        )
+        encrypted = notification.get("encryptedContent")
+        if encrypted is not None:
+            if self.decryptor is None:
+                logger.warning(
+                    f"Rejected a notification for subscription {event.subscription_id}: it carries resource data but no decryptor is configured."
+                )
+                return None
+            try:
+                event.message = self.decryptor.decrypt(encrypted)
+            except (ValueError, KeyError) as e:
+                logger.warning(
+                    f"Rejected a notification for subscription {event.subscription_id}: {e}"
+                )
+                return None
+        return event
+
+    def _lifecycle(self, event: ChangeEvent) -> None:
+        try:
+            self.on_lifecycle(event)
+        except Exception as e:
+            logger.warning(
+                f"Handling {event.lifecycle_event} for subscription {event.subscription_id} failed: {e}"
+            )
+
+    def _put(self, event: ChangeEvent) -> None:
+        # Release the reservation and fill it in one step, so `_reserve` never sees the
+        # event in neither place.
+        with self._lock:
+            self._pending -= 1
+            try:
+                self.queue.put_nowait(event)
+                self._stats.delivered += 1
+            except asyncio.QueueFull:
+                self._stats.dropped += 1
+
+    def _reserve(self, count: int) -> bool:
+        """Reserves queue slots for `count` events about to be put on the queue; False if they do not fit."""
+        with self._lock:
+            if self.queue.qsize() + self._pending + count > self.queue.maxsize > 0:
+                return False
+            self._pending += count
+            return True
+
+    def handle(self, query: str, body: bytes) -> tuple[int, str, bytes]:
+        """
+        Answers one POST to the notification URL: the query string and body of the request
+        in, the status code, content type and body of the response out.
+        """
+        validation_token = parse_qs(query).get("validationToken")
+        if validation_token:
+            # Subscription validation: echo the token back as plain text.
+            return 200, "text/plain", validation_token[0].encode()
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            return 400, "text/plain", b"Body is not JSON."
+        notifications = payload.get("value") or []
+        self._record(received=len(notifications))
+        tokens = payload.get("validationTokens")
+        if (
+            tokens is not None
+            and self.token_validator is not None
+            and not self.token_validator(tokens)
+        ):
+            self._record(rejected=len(notifications))
+            return 401, "text/plain", b"Invalid validation tokens."
+        events = []
+        for notification in notifications:
+            event = self._event(notification)
+            if event is None:
+                self._record(rejected=1)
+            else:
+                events.append(event)
+        loop = self._loop
+        if loop is None:
+            raise RuntimeError(
+                "NotificationReceiver has no event loop; call attach() or serve() from the loop consuming its events."
+            )
+        if events and not self._reserve(len(events)):
+            # Graph redelivers the whole batch, lifecycle events included, so none of it
+            # is acted on now.
+            self._record(dropped=len(events))
+            return 503, "text/plain", b"Too many queued notifications."
+        for event in events:
+            if event.lifecycle_event is not None and self.on_lifecycle is not None:
+                # Graph wants an answer within seconds, so renewals and the like run off
+                # the request thread.
+                threading.Thread(
+                    target=self._lifecycle,
+                    args=(event,),
+                    name="ms-teams-lifecycle",
+                    daemon=True,
+                ).start()
+            loop.call_soon_threadsafe(self._put, event)
+        return 202, "text/plain", b""
+
+    async def get(self) -> ChangeEvent:
+        return await self.queue.get()
+
+    async def events(self) -> AsyncIterator[ChangeEvent]:
+        while True:
+            yield await self.queue.get()
+
+    def serve(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        path: str = "/notifications",
+        loop: asyncio.AbstractEventLoop | None = None,
+    ) -> "ThreadingHTTPServer":
+        """
+        Serves `handle` on `http://{host}:{port}{path}` from a background thread; port 0 picks a
+        free port. Events go to `loop`, the loop already attached, or the running loop.
+        """
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer  # noqa: PLC0415
+
+        if loop is not None or self._loop is None:
+            self.attach(loop)
+        receiver = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self) -> None:
+                route, _, query = self.path.partition("?")
+                if route != path:
+                    self.send_error(404)
+                    return
+                body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+                status, content_type, content = receiver.handle(query, body)
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return server
+
+
+class SubscriptionManager:
+    """
+    Creates Graph subscriptions on chat and channel messages and keeps them alive.
+
+    Subscriptions last `lifetime` seconds and are renewed once they are within
+    `renew_margin` of expiring, by `renew_due` or by the background thread `start`
+    runs. A subscription Graph no longer knows is created again.
+
+    Args:
+        app: App whose requests create, renew and delete the subscriptions.
+        notification_url: Public HTTPS URL of the `NotificationReceiver`.
+        client_state: Secret echoed in every notification, checked by the receiver.
+        decryptor: Certificate for notifications with resource data; without one,
+            notifications only say which message changed.
+        lifecycle_url: URL for lifecycle notifications; by default the notification URL.
+        change_type: Changes notified, e.g. 'created' or 'created,updated,deleted'.
+    """
+
+    def __init__(
+        self,
+        app: "MsTeamsApp",
+        notification_url: str,
+        client_state: str,
+        decryptor: NotificationDecryptor | None = None,
+        lifecycle_url: str | None = None,
+        change_type: str = "created,updated,deleted",
+        lifetime: float = DEFAULT_LIFETIME,
+        renew_margin: float = RENEW_MARGIN,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if renew_margin >= lifetime:
+            raise ValueError("renew_margin must be shorter than lifetime.")
+        self.app = app
+        self.notification_url = notification_url
+        self.client_state = client_state
+        self.decryptor = decryptor
+        self.lifecycle_url = lifecycle_url or notification_url
+        self.change_type = change_type
+        self.lifetime = lifetime
+        self.renew_margin = renew_margin
+        self._clock = clock
+        self._lock = threading.RLock()
+        self.subscriptions: dict[str, Subscription] = {}
+        self._stop: threading.Event | None = None
+
+    def _url(self, subscription_id: str = "") -> str:
+        return f"{self.app.base_url}/subscriptions" + (
+            f"/{subscription_id}" if subscription_id else ""
+        )
+
+    def subscribe(self, resource: str) -> Subscription:
+        """
+        Subscribes to a message collection, e.g. '/chats/{id}/messages'.
+
+        Raises:
+            HTTPStatusError: If Graph rejects the subscription, e.g. because the receiver failed validation.
+        """
+        expires_at = self._clock() + self.lifetime
+        body: dict[str, Any] = {
+            "changeType": self.change_type,
+            "notificationUrl": self.notification_url,
+            "lifecycleNotificationUrl": self.lifecycle_url,
+            "resource": resource,
+            "expirationDateTime": graph_datetime(expires_at),
+            "clientState": self.client_state,
+        }
+        if self.decryptor is not None:
+            body.update(
+                includeResourceData=True,
+                encryptionCertificate=self.decryptor.certificate,
+                encryptionCertificateId=self.decryptor.certificate_id,
+            )
+        created = self.app._handle_response(self.app._post(self._url(), data=body))
+        subscription = Subscription(
+            created["id"],
+            resource,
+            parse_graph_datetime(created["expirationDateTime"]),
+            self.change_type,
+            self.decryptor is not None,
+        )
+        with self._lock:
+            self.subscriptions[subscription.id] = subscription
+        return subscription
+
+    def subscribe_chat(self, chat_id: str) -> Subscription:
+        """Subscribes to the messages of a chat, given by id or topic."""
+        return self.subscribe(
+            CHAT_MESSAGES.format(chat_id=self.app.resolver.chat(chat_id, exact=False))
+        )
+
+    def subscribe_channel(self, team_id: str, channel_id: str) -> Subscription:
+        """Subscribes to the messages and replies of a channel, given by ids or names."""
+        team_id = self.app.resolver.team(team_id, exact=False)
+        return self.subscribe(
+            CHANNEL_MESSAGES.format(
+                team_id=team_id,
+                channel_id=self.app.resolver.channel(team_id, channel_id, exact=False),
+            )
+        )
+
+    def renew(self, subscription_id: str) -> Subscription:
+        """Extends a subscription by `lifetime`, creating it again if Graph has removed it."""
+        with self._lock:
+            subscription = self.subscriptions[subscription_id]
+        expires_at = self._clock() + self.lifetime
+        response = self.app._patch(
+            self._url(subscription_id),
+            data={"expirationDateTime": graph_datetime(expires_at)},
+        )
+        if response.status_code == httpx.codes.NOT_FOUND:
+            # Forgotten only once replaced, so a failed attempt is retried on the next
+            # renewal.
+            replacement = self.subscribe(subscription.resource)
+            with self._lock:
+                self.subscriptions.pop(subscription_id, None)
+            return replacement
+        renewed = self.app._handle_response(response)
+        with self._lock:
+            subscription.expires_at = parse_graph_datetime(
+                renewed.get("expirationDateTime") or graph_datetime(expires_at)
+            )
+        return subscription
+
+    def renew_due(self) -> list[Subscription]:
+        """Renews every subscription within `renew_margin` of expiring; failures are logged and retried next time."""
+        deadline = self._clock() + self.renew_margin
+        with self._lock:
+            due = [
+                subscription.id
+                for subscription in self.subscriptions.values()
+                if subscription.expires_at <= deadline
+            ]
+        renewed = []
+        for subscription_id in due:
+            try:
+                renewed.append(self.renew(subscription_id))
+            except (httpx.HTTPError, KeyError) as e:
+                logger.warning(f"Renewing subscription {subscription_id} failed: {e}")
+        return renewed
+
+    def handle_lifecycle(self, event: ChangeEvent) -> None:
+        """
+        Reacts to a lifecycle notification: renews on `reauthorizationRequired` and subscribes
+        again on `subscriptionRemoved`. `missed` needs no action here; consumers catch up
+        with the delta tools.
+        """
+        with self._lock:
+            known = event.subscription_id in self.subscriptions
+        if not known:
+            return
+        if event.lifecycle_event in (REAUTHORIZATION_REQUIRED, SUBSCRIPTION_REMOVED):
+            self.renew(event.subscription_id)
+
+    def unsubscribe(self, subscription_id: str) -> None:
+        with self._lock:
+            self.subscriptions.pop(subscription_id, None)
+        response = self.app._delete(self._url(subscription_id))
+        if response.status_code != httpx.codes.NOT_FOUND:
+            self.app._handle_response(response)
+
+    def start(self, interval: float = 60.0) -> None:
+        """Renews due subscriptions every `interval` seconds from a background thread until `stop()`."""
+        with self._lock:
+            if self._stop is not None:
+                return
+            self._stop = stop = threading.Event()
+
+        def run() -> None:
+            while not stop.wait(interval):
+                self.renew_due()
+
+        threading.Thread(
+            target=run, name="ms-teams-subscription-renewal", daemon=True
+        ).start()
+
+    def stop(self) -> None:
+        with self._lock:
+            if self._stop is not None:
+                self._stop.set()
+                self._stop = None
+
+    def close(self) -> None:
+        """Stops renewing and deletes every subscription."""
+        self.stop()
+        with self._lock:
+            subscription_ids = list(self.subscriptions)
+        for subscription_id in subscription_ids:
+            try:
+                self.unsubscribe(subscription_id)
+            except httpx.HTTPError as e:
+                logger.warning(f"Deleting subscription {subscription_id} failed: {e}")
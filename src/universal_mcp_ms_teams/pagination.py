@@ -0,0 +1,180 @@
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager
+from typing import Any
+
+from universal_mcp_ms_teams.streaming import CollectionDecoder
+
+NEXT_LINK = "@odata.nextLink"
+
+
+class PageIterator:
+    """
+    Lazily walks a Microsoft Graph collection by following `@odata.nextLink`.
+
+    Pages are only requested as the caller consumes items, so iterating a very
+    large collection keeps at most one page in memory. Iteration stops at the
+    end of the collection or as soon as `max_items` or `max_pages` is reached;
+    in the latter case `truncated` is set, and `next_link` holds the link a caller
+    can resume from when the budget ran out on a page boundary.
+
+    Args:
+        fetch: Callable taking `(url, params)` and returning the decoded page.
+        url: URL of the first page.
+        params: Query parameters for the first page. Subsequent pages use the
+            `@odata.nextLink` as-is, which already carries the query string.
+        max_items: Stop after yielding this many items.
+        max_pages: Stop after fetching this many pages.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[str, dict[str, Any] | None], dict[str, Any]],
+        url: str,
+        params: dict[str, Any] | None = None,
+        max_items: int | None = None,
+        max_pages: int | None = None,
+    ) -> None:
+        if max_items is not None and max_items < 0:
+            raise ValueError("max_items must be a non-negative integer.")
+        if max_pages is not None and max_pages < 1:
+            raise ValueError("max_pages must be a positive integer.")
+        self._fetch = fetch
+        self.url = url
+        self.params = params
+        self.max_items = max_items
+        self.max_pages = max_pages
+        self.pages = 0
+        self.items = 0
+        self.next_link: str | None = None
+        # Set when a budget stopped iteration before the end of the collection.
+        self.truncated = False
+        self._started = False
+
+    def iter_pages(self) -> Iterator[dict[str, Any]]:
+        if self._started:
+            raise RuntimeError("PageIterator can only be consumed once.")
+        self._started = True
+        url, params = self.url, self.params
+        while url is not None:
+            page = self._fetch(url, params)
+            self.pages += 1
+            url, params = page.get(NEXT_LINK), None
+            self.next_link = url
+            yield page
+            if self.max_pages is not None and self.pages >= self.max_pages:
+                self.truncated = url is not None
+                return
+
+    def __iter__(self) -> Iterator[Any]:
+        if self.max_items == 0:
+            return
+        for page in self.iter_pages():
+            values = page.get("value", [])
+            for index, item in enumerate(values, start=1):
+                self.items += 1
+                yield item
+                if self.max_items is not None and self.items >= self.max_items:
+                    self.truncated = index < len(values) or self.next_link is not None
+                    # Items left on this page would be lost by resuming from the
+                    # next page, so only advertise a resume point on a page boundary.
+                    if index < len(values):
+                        self.next_link = None
+                    return
+
+    def collect(self) -> dict[str, Any]:
+        """
+        Drains the iterator into a single Graph-shaped collection.
+
+        Returns:
+            dict[str, Any]: `{"value": [...]}` with every item read, plus `truncated`
+            when a budget stopped iteration before the end, and `@odata.nextLink`
+            when iteration can be resumed from it.
+        """
+        result: dict[str, Any] = {"value": list(self)}
+        if self.truncated:
+            result["truncated"] = True
+        if self.next_link:
+            result[NEXT_LINK] = self.next_link
+        return result
+
+
+class StreamingPageIterator(PageIterator):
+    """
+    `PageIterator` that decodes each page incrementally instead of loading it whole.
+
+    Items are yielded as soon as they have been parsed off the wire, so memory
+    use does not grow with the page size. Graph sends `@odata.nextLink` after the
+    `value` array, so the next page is requested once the current one has been
+    read to the end.
+
+    Args:
+        open: Context manager factory taking `(url, params)` and yielding a
+            `CollectionDecoder` over the response body.
+        url: URL of the first page.
+        params: Query parameters for the first page.
+        max_items: Stop after yielding this many items.
+        max_pages: Stop after fetching this many pages.
+        transform: Applied to each item before it is yielded.
+    """
+
+    def __init__(
+        self,
+        open: Callable[
+            [str, dict[str, Any] | None], AbstractContextManager[CollectionDecoder]
+        ],
+        url: str,
+        params: dict[str, Any] | None = None,
+        max_items: int | None = None,
+        max_pages: int | None = None,
+        transform: Callable[[Any], Any] | None = None,
+    ) -> None:
+        super().__init__(
+            self._read_page, url, params, max_items=max_items, max_pages=max_pages
+        )
+        self._open = open
+        self._transform = transform
+
+    def _read_page(self, url: str, params: dict[str, Any] | None) -> dict[str, Any]:
+        with self._open(url, params) as decoder:
+            values = [
+                self._transform(item) if self._transform else item for item in decoder
+            ]
+        return {**decoder.properties, "value": values}
+
+    def __iter__(self) -> Iterator[Any]:
+        if self.max_items == 0:
+            return
+        if self._started:
+            raise RuntimeError("PageIterator can only be consumed once.")
+        self._started = True
+        url, params = self.url, self.params
+        while url is not None:
+            with self._open(url, params) as decoder:
+                items = iter(decoder)
+                stopped = False
+                for item in items:
+                    self.items += 1
+                    yield self._transform(item) if self._transform else item
+                    if self.max_items is not None and self.items >= self.max_items:
+                        stopped = True
+                        break
+                if stopped:
+                    if decoder.peek() != "]":
+                        # Stopped mid-page: resuming from the next page would skip the
+                        # rest of this one.
+                        self.pages += 1
+                        self.next_link = None
+                        self.truncated = True
+                        return
+                    # The budget ran out exactly at the end of the array; read on for
+                    # the next link.
+                    for _ in items:
+                        pass
+            self.pages += 1
+            url, params = decoder.properties.get(NEXT_LINK), None
+            self.next_link = url
+            if self.items == self.max_items or (
+                self.max_pages is not None and self.pages >= self.max_pages
+            ):
+                self.truncated = url is not None
+                return
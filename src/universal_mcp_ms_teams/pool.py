@@ -0,0 +1,358 @@
+import asyncio
+import threading
+import time
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterator, Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING, Any, Optional
+
+import httpx
+
+if TYPE_CHECKING:
+    from universal_mcp_ms_teams.app import MsTeamsApp
+
+DEFAULT_MAX_APPS = 1024
+DEFAULT_MAX_CONCURRENCY = 64
+DEFAULT_TENANT_CONCURRENCY = 4
+
+
+@dataclass
+class PoolStats:
+    leases: int = 0
+    # Leases that had to wait for a slot, and how long they waited in total.
+    queued: int = 0
+    queue_wait_seconds: float = 0.0
+    # Leases given up while waiting, on timeout or cancellation.
+    abandoned: int = 0
+    created: int = 0
+    evicted: int = 0
+
+
+class _Waiter:
+    def __init__(self, loop: asyncio.AbstractEventLoop | None = None) -> None:
+        self.granted = False
+        self.loop = loop
+        self.event = threading.Event() if loop is None else asyncio.Event()
+
+    def grant(self) -> None:
+        self.granted = True
+        if self.loop is None:
+            self.event.set()
+        else:
+            self.loop.call_soon_threadsafe(self.event.set)
+
+
+@dataclass
+class _Tenant:
+    app: Optional["MsTeamsApp"] = None
+    active: int = 0
+    waiting: deque = field(default_factory=deque)
+    # Held while the app is created, so concurrent first leases build it once.
+    creating: threading.Lock = field(default_factory=threading.Lock)
+
+
+class AppPool:
+    """
+    Keeps one `MsTeamsApp` per tenant alive across calls, for gateways serving many users' Teams connections from one process.
+
+    Apps are built by `factory` on a tenant's first lease and kept, with their cached
+    tokens and responses, until more than `max_apps` exist; then the least recently
+    used idle ones are closed. With `share_connections`, every app uses the HTTP
+    clients of the first one, so all tenants share one connection pool to Graph and
+    an app costs no sockets of its own. Apps running their tools on worker threads,
+    like `AsyncMsTeamsApp`, all share one pool of `max_concurrency` threads, so an app
+    costs no threads of its own either.
+
+    At most `max_concurrency` leases are held at once, and at most `tenant_concurrency`
+    by one tenant. When slots free up they go to waiting tenants in turn rather than to
+    the earliest waiter, so a tenant with a thousand queued calls delays another
+    tenant's single call by one slot, not by a thousand.
+
+        pool = AppPool(lambda api_key: MsTeamsApp(integration=AgentRIntegration("microsoft-teams", api_key=api_key)))
+        with pool.lease(api_key) as app:
+            app.list_chats()
+
+    Args:
+        factory: Builds the app of a tenant from its key.
+        max_apps: Apps kept alive; idle apps beyond it are evicted, least recently used first.
+        max_concurrency: Leases held at once across all tenants.
+        tenant_concurrency: Leases held at once by one tenant.
+        share_connections: Give every app the HTTP clients of the first app built.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[str], "MsTeamsApp"],
+        max_apps: int = DEFAULT_MAX_APPS,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        tenant_concurrency: int = DEFAULT_TENANT_CONCURRENCY,
+        share_connections: bool = True,
+    ) -> None:
+        if max_apps < 1 or max_concurrency < 1 or tenant_concurrency < 1:
+            raise ValueError(
+                "max_apps, max_concurrency and tenant_concurrency must be positive integers."
+            )
+        self.factory = factory
+        self.max_apps = max_apps
+        self.max_concurrency = max_concurrency
+        self.tenant_concurrency = tenant_concurrency
+        self.share_connections = share_connections
+        self.client: httpx.Client | None = None
+        self.async_client: httpx.AsyncClient | None = None
+        # Worker threads of every app's tool calls; a lease runs one call at a time, so
+        # max_concurrency are enough.
+        self.executor: ThreadPoolExecutor | None = None
+        # Most recently leased last.
+        self._tenants: OrderedDict[str, _Tenant] = OrderedDict()
+        # Tenants with waiting leases, in the order they are served.
+        self._ready: deque[str] = deque()
+        self._active = 0
+        self._apps = 0
+        self._lock = threading.Lock()
+        self._stats = PoolStats()
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                **asdict(self._stats),
+                "apps": self._apps,
+                "active": self._active,
+                "waiting": sum(
+                    len(tenant.waiting) for tenant in self._tenants.values()
+                ),
+            }
+
+    def __len__(self) -> int:
+        return self._apps
+
+    def _dispatch(self) -> None:
+        """Grants free slots to waiting tenants in turn; the caller holds the lock."""
+        while self._active < self.max_concurrency and self._ready:
+            for _ in range(len(self._ready)):
+                key = self._ready.popleft()
+                tenant = self._tenants[key]
+                if tenant.active < self.tenant_concurrency:
+                    break
+                self._ready.append(key)
+            else:
+                # Every waiting tenant is at its own cap.
+                return
+            tenant.waiting.popleft().grant()
+            tenant.active += 1
+            self._active += 1
+            if tenant.waiting:
+                self._ready.append(key)
+
+    def _enqueue(self, key: str, waiter: _Waiter) -> None:
+        with self._lock:
+            tenant = self._tenants.get(key)
+            if tenant is None:
+                tenant = self._tenants[key] = _Tenant()
+            self._tenants.move_to_end(key)
+            if not tenant.waiting:
+                self._ready.append(key)
+            tenant.waiting.append(waiter)
+            self._dispatch()
+            if not waiter.granted:
+                self._stats.queued += 1
+
+    def _abandon(self, key: str, waiter: _Waiter) -> bool:
+        """Withdraws a waiter that gave up; False if it was granted a slot meanwhile, which it then holds."""
+        with self._lock:
+            if waiter.granted:
+                return False
+            tenant = self._tenants[key]
+            tenant.waiting.remove(waiter)
+            if not tenant.waiting:
+                self._ready.remove(key)
+                if tenant.app is None and not tenant.active:
+                    del self._tenants[key]
+            self._stats.abandoned += 1
+            return True
+
+    def _app(self, key: str) -> "MsTeamsApp":
+        with self._lock:
+            tenant = self._tenants[key]
+        with tenant.creating:
+            if tenant.app is None:
+                app = self.factory(key)
+                if self.share_connections:
+                    self._share(app)
+                if hasattr(app, "executor"):
+                    self._share_executor(app)
+                with self._lock:
+                    tenant.app = app
+                    self._apps += 1
+                    self._stats.created += 1
+        return tenant.app
+
+    def _share(self, app: "MsTeamsApp") -> None:
+        with self._lock:
+            self.client = self.client or app.client
+            app._client = self.client
+            if hasattr(app, "async_client"):
+                self.async_client = self.async_client or app.async_client
+                app._async_client = self.async_client
+
+    def _share_executor(self, app: "MsTeamsApp") -> None:
+        with self._lock:
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(
+                    max_workers=self.max_concurrency, thread_name_prefix="ms-teams"
+                )
+            app._executor = self.executor
+
+    def _release(self, key: str) -> None:
+        with self._lock:
+            tenant = self._tenants[key]
+            tenant.active -= 1
+            self._active -= 1
+            if tenant.app is None and not tenant.active and not tenant.waiting:
+                # The factory failed; nothing is left to keep.
+                del self._tenants[key]
+            self._dispatch()
+            evicted = self._evict()
+        for app in evicted:
+            self._close(app)
+
+    def _evict(self) -> list["MsTeamsApp"]:
+        """Drops the least recently used idle apps beyond `max_apps`; the caller holds the lock and closes them."""
+        evicted = []
+        for key in [
+            key
+            for key, tenant in self._tenants.items()
+            if not tenant.active and not tenant.waiting
+        ]:
+            if self._apps <= self.max_apps:
+                break
+            evicted.append(self._tenants.pop(key).app)
+            self._apps -= 1
+        self._stats.evicted += len(evicted)
+        return evicted
+
+    def _close(self, app: "MsTeamsApp") -> None:
+        # Shared clients outlive the apps using them.
+        if app._client is self.client:
+            app._client = None
+        if (
+            getattr(app, "_async_client", None) is not None
+            and app._async_client is self.async_client
+        ):
+            app._async_client = None
+        if (
+            getattr(app, "_executor", None) is not None
+            and app._executor is self.executor
+        ):
+            app._executor = None
+        app.close()
+
+    @contextmanager
+    def lease(
+        self, tenant: str, timeout: float | None = None
+    ) -> Iterator["MsTeamsApp"]:
+        """
+        Waits for a slot of `tenant` and yields its app, built on first use.
+
+        Raises:
+            TimeoutError: If no slot was free within `timeout` seconds.
+        """
+        waiter = _Waiter()
+        started = time.monotonic()
+        self._enqueue(tenant, waiter)
+        if not waiter.event.wait(timeout) and self._abandon(tenant, waiter):
+            raise TimeoutError(
+                f"No slot for tenant '{tenant}' within {timeout} seconds."
+            )
+        self._record_lease(time.monotonic() - started)
+        try:
+            yield self._app(tenant)
+        finally:
+            self._release(tenant)
+
+    @asynccontextmanager
+    async def alease(
+        self, tenant: str, timeout: float | None = None
+    ) -> AsyncIterator["MsTeamsApp"]:
+        """`lease` for coroutines: waiting for a slot suspends the task instead of blocking a thread."""
+        waiter = _Waiter(asyncio.get_running_loop())
+        started = time.monotonic()
+        self._enqueue(tenant, waiter)
+        try:
+            await asyncio.wait_for(waiter.event.wait(), timeout)
+        except TimeoutError:
+            if self._abandon(tenant, waiter):
+                raise TimeoutError(
+                    f"No slot for tenant '{tenant}' within {timeout} seconds."
+                ) from None
+        except BaseException:
+            # Cancelled while waiting: a slot granted meanwhile must go back to the
+            # pool.
+            if not self._abandon(tenant, waiter):
+                self._release(tenant)
+            raise
+        self._record_lease(time.monotonic() - started)
+        try:
+            yield self._app(tenant)
+        finally:
+            self._release(tenant)
+
+    def _record_lease(self, waited: float) -> None:
+        with self._lock:
+            self._stats.leases += 1
+            self._stats.queue_wait_seconds += waited
+
+    def call(
+        self,
+        tenant: str,
+        tool: str,
+        *args: Any,
+        timeout: float | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Calls the tool named `tool` on the app of `tenant`."""
+        with self.lease(tenant, timeout) as app:
+            return getattr(app, tool)(*args, **kwargs)
+
+    async def acall(
+        self,
+        tenant: str,
+        tool: str,
+        *args: Any,
+        timeout: float | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Calls the tool named `tool` on the app of `tenant` without blocking the event loop."""
+        async with self.alease(tenant, timeout) as app:
+            method = getattr(app, tool)
+            if hasattr(app, "arun"):
+                return await app.arun(method, *args, **kwargs)
+            return await asyncio.to_thread(method, *args, **kwargs)
+
+    def close(self) -> None:
+        """Closes every app, the shared worker threads and the shared sync client; see `aclose` for the async one."""
+        with self._lock:
+            apps = [
+                tenant.app
+                for tenant in self._tenants.values()
+                if tenant.app is not None
+            ]
+            self._tenants.clear()
+            self._ready.clear()
+            self._apps = 0
+        for app in apps:
+            self._close(app)
+        if self.executor is not None:
+            self.executor.shutdown(wait=False)
+            self.executor = None
+        if self.client is not None:
+            self.client.close()
+            self.client = None
+
+    async def aclose(self) -> None:
+        self.close()
+        if self.async_client is not None:
+            await self.async_client.aclose()
+            self.async_client = None
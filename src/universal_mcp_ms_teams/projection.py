@@ -0,0 +1,220 @@
+"""
+Named projection profiles that shrink Graph payloads before they reach the caller.
+
+A profile picks the properties requested with `$select`/`$expand` for an entity
+type and trims the decoded response: OData annotations and null properties are
+dropped, and properties Graph returns despite `$select` (chat messages ignore
+it) are removed client-side. The `minimal` profile also flattens HTML message
+bodies to plain text. `full` leaves requests and responses untouched.
+"""
+
+import html
+import re
+from dataclasses import dataclass
+from typing import Any
+
+PROFILES = ("minimal", "summary", "full")
+
+DEFAULT_PROFILE = "full"
+
+# Collection control annotations that are kept because callers page or sync with them.
+KEPT_ANNOTATIONS = frozenset({"@odata.nextLink", "@odata.deltaLink", "@odata.count"})
+
+_MESSAGE_SUMMARY = [
+    "id",
+    "createdDateTime",
+    "lastModifiedDateTime",
+    "lastEditedDateTime",
+    "deletedDateTime",
+    "messageType",
+    "replyToId",
+    "subject",
+    "importance",
+    "from",
+    "body",
+    "attachments",
+    "mentions",
+    "reactions",
+]
+
+# Per entity type: profile -> (properties to keep, navigation properties to expand).
+PROJECTIONS: dict[str, dict[str, tuple[list[str], list[str]]]] = {
+    "chatMessage": {
+        "minimal": (["id", "createdDateTime", "from", "body"], []),
+        "summary": (_MESSAGE_SUMMARY, []),
+    },
+    "chat": {
+        "minimal": (["id", "topic", "chatType"], []),
+        "summary": (
+            [
+                "id",
+                "topic",
+                "chatType",
+                "createdDateTime",
+                "lastUpdatedDateTime",
+                "webUrl",
+            ],
+            [],
+        ),
+    },
+    "channel": {
+        "minimal": (["id", "displayName"], []),
+        "summary": (
+            [
+                "id",
+                "displayName",
+                "description",
+                "membershipType",
+                "createdDateTime",
+                "webUrl",
+            ],
+            [],
+        ),
+    },
+    "conversationMember": {
+        "minimal": (["id", "displayName"], []),
+        "summary": (
+            [
+                "id",
+                "displayName",
+                "roles",
+                "userId",
+                "email",
+                "visibleHistoryStartDateTime",
+            ],
+            [],
+        ),
+    },
+    "teamsTab": {
+        "minimal": (["id", "displayName"], []),
+        "summary": (["id", "displayName", "webUrl", "configuration"], []),
+    },
+    "teamsAppInstallation": {
+        "minimal": (["id"], ["teamsAppDefinition($select=teamsAppId,displayName)"]),
+        "summary": (
+            ["id"],
+            ["teamsAppDefinition($select=teamsAppId,displayName,version,description)"],
+        ),
+    },
+}
+
+# Entity types whose endpoints ignore or reject `$select`; their profiles are applied
+# client-side only.
+CLIENT_SIDE_ONLY = frozenset({"chatMessage", "conversationMember"})
+
+_TAG = re.compile(r"<[^>]+>")
+_BREAK = re.compile(r"<\s*(br|/p|/div|/li)\s*/?>", re.IGNORECASE)
+
+
+def html_to_text(content: str) -> str:
+    text = _TAG.sub("", _BREAK.sub("\n", content))
+    return html.unescape(text).strip()
+
+
+def strip_annotations(value: Any, keep: frozenset[str] = frozenset()) -> Any:
+    """Recursively drops OData annotations (`@odata.*`, `prop@odata.type`, ...) and null properties."""
+    if isinstance(value, list):
+        return [strip_annotations(item) for item in value]
+    if isinstance(value, dict):
+        return {
+            key: strip_annotations(item)
+            for key, item in value.items()
+            if item is not None and (key in keep or "@" not in key)
+        }
+    return value
+
+
+@dataclass(frozen=True)
+class Projection:
+    """
+    How one call shapes its request and response; see `projection_for`.
+
+    Explicit `select`/`expand` arguments always win over the profile's defaults,
+    and the result is then not pruned to the profile's properties.
+    """
+
+    profile: str = DEFAULT_PROFILE
+    properties: tuple[str, ...] | None = None
+    expansions: tuple[str, ...] | None = None
+    server_select: bool = True
+    prune: bool = True
+
+    @property
+    def trims(self) -> bool:
+        return self.profile != "full"
+
+    def select(self, explicit: Any | None) -> Any | None:
+        if explicit is not None or not self.server_select or not self.properties:
+            return explicit
+        return ",".join(self.properties)
+
+    def expand(self, explicit: Any | None) -> Any | None:
+        if explicit is not None or not self.expansions:
+            return explicit
+        return ",".join(self.expansions)
+
+    def shape(self, entity: Any) -> Any:
+        """Trims a single entity, e.g. one item of a collection."""
+        if not isinstance(entity, dict):
+            return entity
+        if self.prune and self.properties:
+            fields = set(self.properties) | {
+                expansion.split("(", 1)[0] for expansion in self.expansions or ()
+            }
+            entity = {key: value for key, value in entity.items() if key in fields}
+        if self.profile == "minimal":
+            body = entity.get("body")
+            if (
+                isinstance(body, dict)
+                and body.get("contentType") == "html"
+                and isinstance(body.get("content"), str)
+            ):
+                entity = {
+                    **entity,
+                    "body": {
+                        "contentType": "text",
+                        "content": html_to_text(body["content"]),
+                    },
+                }
+        return strip_annotations(entity)
+
+    def apply(self, payload: Any) -> Any:
+        """Trims an entity or a collection page according to the profile."""
+        if not self.trims or not isinstance(payload, dict):
+            return payload
+        if isinstance(payload.get("value"), list):
+            page = strip_annotations(
+                {key: value for key, value in payload.items() if key != "value"},
+                keep=KEPT_ANNOTATIONS,
+            )
+            return {**page, "value": [self.shape(item) for item in payload["value"]]}
+        return self.shape(payload)
+
+
+def projection_for(
+    entity_type: str,
+    profile: str | None,
+    select: Any | None = None,
+    expand: Any | None = None,
+) -> Projection:
+    """
+    Resolves a profile name for an entity type, given the caller's explicit `select`/`expand`.
+
+    Raises:
+        ValueError: If `profile` is not one of `PROFILES`.
+    """
+    profile = profile or DEFAULT_PROFILE
+    if profile not in PROFILES:
+        raise ValueError(
+            f"Unknown projection profile '{profile}'; expected one of {', '.join(PROFILES)}."
+        )
+    if profile == "full":
+        return Projection()
+    properties, expansions = PROJECTIONS[entity_type][profile]
+    return Projection(
+        profile,
+        tuple(properties),
+        tuple(expansions),
+        entity_type not in CLIENT_SIDE_ONLY,
+        prune=select is None and expand is None,
+    )
@@ -0,0 +1,171 @@
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+from urllib.parse import urlsplit
+
+import httpx
+
+Interceptor = Callable[["GraphRequest"], httpx.Response]
+
+_interceptor: ContextVar[Interceptor | None] = ContextVar(
+    "ms_teams_request_interceptor", default=None
+)
+
+
+@dataclass
+class GraphRequest:
+    """A single HTTP call issued by one of the `MsTeamsApp` tools."""
+
+    method: str
+    url: str
+    params: dict[str, Any] | None = None
+    data: Any = None
+    content_type: str = "application/json"
+    files: dict[str, Any] | None = None
+    headers: dict[str, str] | None = None
+    # Leave the body unread so it can be consumed incrementally; see
+    # `streaming.CollectionDecoder`.
+    stream: bool = False
+    # Send without the Graph token, e.g. to a pre-authenticated upload session URL.
+    authorize: bool = True
+
+    @property
+    def full_url(self) -> str:
+        return str(httpx.URL(self.url, params=self.params or None))
+
+    def send_kwargs(self) -> dict[str, Any]:
+        """
+        Keyword arguments for `httpx.Client.request`, encoding the body the same way
+        `APIApplication._post` does for each content type.
+        """
+        kwargs: dict[str, Any] = {
+            "params": self.params,
+            "headers": dict(self.headers or {}),
+        }
+        if self.data is None and self.files is None:
+            return kwargs
+        if self.content_type == "multipart/form-data":
+            kwargs["data"] = self.data
+            kwargs["files"] = self.files
+        elif self.content_type == "application/json":
+            kwargs["json"] = self.data
+        elif self.content_type == "application/x-www-form-urlencoded":
+            kwargs["headers"]["Content-Type"] = self.content_type
+            kwargs["data"] = self.data
+        else:
+            kwargs["headers"]["Content-Type"] = self.content_type
+            kwargs["content"] = self.data
+        return kwargs
+
+
+def graph_path(url: str) -> str:
+    """Path of a Graph URL without the API version, e.g. '/chats/{id}' for '.../v1.0/chats/{id}?$select=id'."""
+    path = urlsplit(url).path.rstrip("/")
+    for version in ("/v1.0", "/beta"):
+        if path.startswith(version):
+            return path[len(version) :]
+    return path
+
+
+def decoded_headers(response: httpx.Response) -> list[tuple[str, str]]:
+    """
+    Headers to rebuild a response from its already decoded body; without `Content-Encoding`,
+    so the copy does not try to decompress it a second time.
+    """
+    return [
+        (key, value)
+        for key, value in response.headers.multi_items()
+        if key.lower() != "content-encoding"
+    ]
+
+
+@dataclass
+class RequestTrace:
+    """What it took to complete one request: network attempts, retries and time spent waiting."""
+
+    attempts: int = 0
+    retries: int = 0
+    throttle_wait: float = 0.0
+    queue_wait: float = 0.0
+
+
+class RequestCaptured(Exception):
+    """Raised by the capturing interceptor to abort a tool right after it builds its request."""
+
+    def __init__(self, request: GraphRequest) -> None:
+        super().__init__(f"{request.method} {request.url}")
+        self.request = request
+
+
+def current_interceptor() -> Interceptor | None:
+    return _interceptor.get()
+
+
+@contextmanager
+def intercept(interceptor: Interceptor) -> Iterator[None]:
+    """
+    Routes every request made by `MsTeamsApp` in the current context to `interceptor`
+    instead of the network. The interceptor returns the `httpx.Response` the tool sees.
+    """
+    token = _interceptor.set(interceptor)
+    try:
+        yield
+    finally:
+        _interceptor.reset(token)
+
+
+@contextmanager
+def direct() -> Iterator[None]:
+    """
+    Sends the requests made in the current context to the network even while a batch
+    is capturing or replaying a tool, e.g. for lookups a tool makes before its own request.
+    """
+    token = _interceptor.set(None)
+    try:
+        yield
+    finally:
+        _interceptor.reset(token)
+
+
+def capture(func: Callable[..., Any], *args: Any, **kwargs: Any) -> GraphRequest:
+    """
+    Runs a tool only far enough to learn the request it would send.
+
+    Raises:
+        ValueError: If the tool returns without issuing a request.
+    """
+
+    def _capture(request: GraphRequest) -> httpx.Response:
+        raise RequestCaptured(request)
+
+    with intercept(_capture):
+        try:
+            func(*args, **kwargs)
+        except RequestCaptured as captured:
+            return captured.request
+    raise ValueError(f"{getattr(func, '__name__', func)!r} did not issue a request.")
+
+
+def replay(
+    func: Callable[..., Any], response: httpx.Response, *args: Any, **kwargs: Any
+) -> Any:
+    """
+    Runs a tool against an already received response so its usual response handling
+    (status checks, JSON decoding, post-processing) applies unchanged.
+
+    Raises:
+        ValueError: If the tool issues more than one request.
+    """
+    pending = [response]
+
+    def _replay(request: GraphRequest) -> httpx.Response:
+        if not pending:
+            raise ValueError(
+                f"{request.method} {request.url} was not part of the replayed call."
+            )
+        return pending.pop()
+
+    with intercept(_replay):
+        return func(*args, **kwargs)
@@ -0,0 +1,183 @@
+import re
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+import httpx
+
+from universal_mcp_ms_teams.request import direct
+from universal_mcp_ms_teams.topology import (
+    DEFAULT_TTL,
+    MISS_REFRESH_AFTER,
+    NameIndex,
+    no_match,
+    normalize,
+)
+
+if TYPE_CHECKING:
+    from universal_mcp_ms_teams.app import MsTeamsApp
+
+GUID = re.compile(
+    r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$", re.IGNORECASE
+)
+
+# Chat and channel ids, e.g. '19:abc@thread.tacv2', '19:abc@thread.v2' or
+# '19:a_b@unq.gbl.spaces'.
+THREAD_ID = re.compile(r"^19:\S+@(thread\.[a-z0-9]+|unq\.gbl\.spaces)$", re.IGNORECASE)
+
+EMAIL = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+# Users whose display name starts with the query are fetched, then matched on the whole
+# name.
+USER_CANDIDATES = 25
+
+
+def is_id(value: str) -> bool:
+    """Whether a value is already a Graph id (a GUID or a chat/channel thread id) rather than a name."""
+    return bool(GUID.match(value) or THREAD_ID.match(value))
+
+
+class NameResolver:
+    """
+    Turns the display names, chat topics and email addresses agents pass to the write tools into Graph ids.
+
+    Ids are passed through untouched. Teams, channels and chats are looked up in the
+    app's topology cache; tabs and users are fetched on first use and kept for `ttl`
+    seconds. Lookups bypass batching, so tools resolve names inside `app.batch()` too.
+
+    A write cannot be undone, so by default a name must match exactly, ignoring case
+    and spacing, and name one entity; otherwise the error lists the similar names.
+    Read tools pass `exact=False` to also accept typos and partial names.
+
+    Args:
+        app: App whose topology cache and requests serve the lookups.
+        ttl: Seconds a resolved tab or user is remembered.
+    """
+
+    def __init__(
+        self,
+        app: "MsTeamsApp",
+        ttl: float = DEFAULT_TTL,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.app = app
+        self.ttl = ttl
+        self._clock = clock
+        self._tabs: dict[tuple[str, str], tuple[float, NameIndex]] = {}
+        self._users: dict[str, tuple[float, str]] = {}
+
+    def team(self, value: str, exact: bool = True) -> str:
+        if is_id(value):
+            return value
+        with direct():
+            return self.app.topology.team_id(value, exact)
+
+    def channel(self, team_id: str, value: str, exact: bool = True) -> str:
+        if is_id(value):
+            return value
+        with direct():
+            return self.app.topology.channel_id(team_id, value, exact)
+
+    def chat(self, value: str, exact: bool = True) -> str:
+        if is_id(value):
+            return value
+        with direct():
+            return self.app.topology.chat_id(value, exact)
+
+    def _tab_index(self, team_id: str, channel_id: str, max_age: float) -> NameIndex:
+        key = (team_id, channel_id)
+        cached = self._tabs.get(key)
+        if cached is not None and self._clock() - cached[0] <= max_age:
+            return cached[1]
+        with direct():
+            tabs = self.app.get_channel_tabs(
+                team_id, channel_id, all=True, profile="minimal"
+            )["value"]
+        index = NameIndex(
+            {tab["id"]: tab["displayName"] for tab in tabs if tab.get("displayName")}
+        )
+        self._tabs[key] = (self._clock(), index)
+        return index
+
+    def tab(self, team_id: str, channel_id: str, value: str, exact: bool = True) -> str:
+        """
+        Id of the tab of a channel with this display name, or unless `exact`, the one it best matches.
+
+        Raises:
+            ValueError: If no tab or several tabs match this name.
+        """
+        if is_id(value):
+            return value
+        index = self._tab_index(team_id, channel_id, self.ttl)
+        ids = index.match(value, fuzzy=not exact)
+        if not ids:
+            index = self._tab_index(team_id, channel_id, MISS_REFRESH_AFTER)
+            ids = index.match(value, fuzzy=not exact)
+        if not ids:
+            raise no_match("tab", value, index.match(value) if exact else [], index)
+        if len(ids) > 1:
+            raise ValueError(
+                f"'{value}' matches several tabs: {index.describe(ids)}; use a more specific name or an id."
+            )
+        return ids[0]
+
+    def _find_user(self, value: str) -> str:
+        with direct():
+            if EMAIL.match(value):
+                response = self.app._get(
+                    f"{self.app.base_url}/users/{value}", params={"$select": "id"}
+                )
+                if response.status_code == httpx.codes.NOT_FOUND:
+                    raise ValueError(f"No user has the address '{value}'.")
+                return self.app._handle_response(response)["id"]
+            name = value.strip().replace("'", "''")
+            params = {
+                "$filter": f"startswith(displayName,'{name}')",
+                "$select": "id,displayName,mail",
+                "$top": USER_CANDIDATES,
+            }
+            users = self.app._handle_response(
+                self.app._get(f"{self.app.base_url}/users", params=params)
+            ).get("value", [])
+        index = NameIndex(
+            {
+                user["id"]: user["displayName"]
+                for user in users
+                if user.get("displayName")
+            }
+        )
+        ids = index.match(value, fuzzy=False)
+        if not ids:
+            raise no_match("user", value, index.match(value), index)
+        if len(ids) > 1:
+            raise ValueError(
+                f"'{value}' matches several users: {index.describe(ids)}; use an email address or an id."
+            )
+        return ids[0]
+
+    def user(self, value: str) -> str:
+        """
+        Id of the user with this id, email address (user principal name) or exact display name.
+
+        Raises:
+            ValueError: If no user or several users match.
+        """
+        if GUID.match(value):
+            return value
+        key = normalize(value)
+        cached = self._users.get(key)
+        if cached is not None and self._clock() - cached[0] <= self.ttl:
+            return cached[1]
+        user_id = self._find_user(value)
+        self._users[key] = (self._clock(), user_id)
+        return user_id
+
+    def invalidate(
+        self, team_id: str | None = None, channel_id: str | None = None
+    ) -> None:
+        """Forgets the cached tabs of one channel, or every cached tab and user."""
+        if team_id is not None and channel_id is not None:
+            self._tabs.pop((team_id, channel_id), None)
+            return
+        self._tabs.clear()
+        self._users.clear()
@@ -1,19 +1,124 @@
+"""
+MCP server entry point.
 
-from pathlib import Path
-from universal_mcp.servers import SingleMCPServer
-from universal_mcp.integrations import AgentRIntegration
-from universal_mcp.stores import EnvironmentStore
-from universal_mcp_ms_teams.app import MsTeamsApp
+Nothing is built at import: the server is created on first access to `mcp`
+(or by `main()`), registering its tools from the precomputed manifest, and
+the app with its AgentR integration is created when a tool is first called.
+`app_instance` and `integration_instance` remain available as module
+attributes and are built on first access too.
 
-env_store = EnvironmentStore()
-integration_instance = AgentRIntegration(name="microsoft-teams", store=env_store, base_url="https://api.agentr.dev")
-app_instance = MsTeamsApp(integration=integration_instance)
+Set `MS_TEAMS_CACHE_PATH` to a database file to give the app a response cache
+shared by every server worker on the host (see `shared_cache`). Gateways serving
+many users from one process keep an app per AgentR API key in `create_pool()`.
+"""
 
-mcp = SingleMCPServer(
-    app_instance=app_instance,
-)
+import os
+import threading
+from typing import Any
+
+APP_NAME = "microsoft-teams"
+AGENTR_BASE_URL = "https://api.agentr.dev"
+CACHE_PATH_VARIABLE = "MS_TEAMS_CACHE_PATH"
+
+_lock = threading.RLock()
+_app: Any | None = None
+_server: Any | None = None
+_cache: Any | None = None
+
+
+def get_cache() -> Any | None:
+    """The process's shared response cache, if `MS_TEAMS_CACHE_PATH` is set; entries are scoped per user."""
+    global _cache  # noqa: PLW0603
+    cache_path = os.environ.get(CACHE_PATH_VARIABLE)
+    if not cache_path:
+        return None
+    with _lock:
+        if _cache is None:
+            from universal_mcp_ms_teams.shared_cache import SharedResponseCache  # noqa: PLC0415
+
+            _cache = SharedResponseCache(cache_path)
+        return _cache
+
+
+def create_app(api_key: str | None = None) -> Any:
+    """
+    The app behind the server; Graph credentials are fetched from AgentR when the first request needs them.
+    Without `api_key`, AgentR's key is read from the environment.
+    """
+    from universal_mcp.integrations import AgentRIntegration  # noqa: PLC0415
+    from universal_mcp.stores import EnvironmentStore  # noqa: PLC0415
+
+    from universal_mcp_ms_teams.async_app import AsyncMsTeamsApp  # noqa: PLC0415
+
+    integration = AgentRIntegration(
+        name=APP_NAME,
+        api_key=api_key,
+        store=EnvironmentStore(),
+        base_url=AGENTR_BASE_URL,
+    )
+    return AsyncMsTeamsApp(integration=integration, cache=get_cache())
+
+
+def create_pool(**kwargs: Any) -> Any:
+    """`AppPool` of apps keyed by AgentR API key; `kwargs` are passed on to the pool."""
+    from universal_mcp_ms_teams.pool import AppPool  # noqa: PLC0415
+
+    return AppPool(create_app, **kwargs)
 
-if __name__ == "__main__":
-    mcp.run()
 
+def get_app() -> Any:
+    global _app  # noqa: PLW0603
+    with _lock:
+        if _app is None:
+            _app = create_app()
+        return _app
 
+
+def create_server(use_manifest: bool = True) -> Any:
+    """
+    MCP server exposing every tool of the app. Tools are registered from the manifest
+    without building the app; without a current manifest the app is built and introspected.
+    """
+    from universal_mcp.config import ServerConfig  # noqa: PLC0415
+    from universal_mcp.servers import BaseServer, SingleMCPServer  # noqa: PLC0415
+
+    from universal_mcp_ms_teams.manifest import lazy_tools, load_manifest  # noqa: PLC0415
+
+    manifest = load_manifest() if use_manifest else None
+    if manifest is None:
+        return SingleMCPServer(app_instance=get_app())
+    config = ServerConfig(
+        type="local",
+        name=f"{APP_NAME.title()} MCP Server for Local Development",
+        description=f"Minimal MCP server for the local {APP_NAME} application.",
+    )
+    server = BaseServer(config)
+    for tool in lazy_tools(manifest, get_app):
+        server.add_tool(tool)
+    return server
+
+
+def get_server() -> Any:
+    global _server  # noqa: PLW0603
+    with _lock:
+        if _server is None:
+            _server = create_server()
+        return _server
+
+
+def __getattr__(name: str) -> Any:
+    if name == "mcp":
+        return get_server()
+    if name == "app_instance":
+        return get_app()
+    if name == "integration_instance":
+        return get_app().integration
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def main() -> None:
+    get_server().run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+import json
+import sqlite3
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from universal_mcp_ms_teams.cache import CachedResponse, ResponseCache
+from universal_mcp_ms_teams.request import graph_path
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    identity TEXT NOT NULL,
+    url TEXT NOT NULL,
+    path TEXT NOT NULL,
+    status_code INTEGER NOT NULL,
+    headers TEXT NOT NULL,
+    content BLOB NOT NULL,
+    etag TEXT,
+    expires_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    size INTEGER NOT NULL,
+    PRIMARY KEY (identity, url)
+);
+CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at);
+CREATE INDEX IF NOT EXISTS responses_path ON responses (path);
+"""
+
+UPSERT = """
+INSERT INTO responses (identity, url, path, status_code, headers, content, etag, expires_at, accessed_at, size)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (identity, url) DO UPDATE SET
+    path = excluded.path, status_code = excluded.status_code, headers = excluded.headers, content = excluded.content,
+    etag = excluded.etag, expires_at = excluded.expires_at, accessed_at = excluded.accessed_at, size = excluded.size
+"""
+
+DEFAULT_MAX_ENTRIES = 10_000
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# A hit records its access time only if the stored one is older than this, so most hits
+# stay read-only.
+ACCESS_RESOLUTION = 30.0
+
+
+class SharedResponseCache(ResponseCache):
+    """
+    `ResponseCache` kept in a SQLite database that every process on the host can share.
+
+    Server workers pointed at the same file serve one another's responses, so a worker
+    started later begins warm, and a write made through any of them invalidates the
+    entries of all. The database runs in WAL mode: readers never block each other or
+    the writer, and writers from different processes take turns, waiting up to
+    `timeout` seconds. Expired entries that cannot be revalidated are dropped on lookup
+    and whenever a response is stored; beyond that, the least recently used entries are
+    evicted once the cache holds more than `max_entries` responses or `max_bytes` bytes
+    of bodies.
+
+    Args:
+        path: Database file, created if missing.
+        max_entries: Responses kept before the least recently used ones are evicted.
+        max_bytes: Total body size kept before the least recently used ones are evicted.
+        ttls: Per-endpoint TTL overrides in seconds, keyed by tool name.
+        timeout: Seconds to wait for another process's write to finish.
+        clock: Wall clock shared by all processes; expiry times are stored in the database.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        ttls: dict[str, float] | None = None,
+        timeout: float = 5.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        super().__init__(max_entries=max_entries, ttls=ttls, clock=clock)
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be a positive integer.")
+        self.path = str(path)
+        self.max_bytes = max_bytes
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(
+            self.path, timeout=timeout, check_same_thread=False
+        )
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            # A cache can lose its last writes on power failure; it is never worth an
+            # fsync per response.
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.executescript(SCHEMA)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute(
+                "SELECT count(*) FROM responses"
+            ).fetchone()[0]
+
+    def _lookup(
+        self, key: tuple[str, str], revalidate: bool
+    ) -> tuple[CachedResponse | None, bool]:
+        now = self._clock()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT path, status_code, headers, content, etag, expires_at, accessed_at FROM responses WHERE identity = ? AND url = ?",
+                key,
+            ).fetchone()
+            if row is None:
+                return None, False
+            path, status_code, headers, content, etag, expires_at, accessed_at = row
+            entry = CachedResponse(
+                path,
+                status_code,
+                [tuple(header) for header in json.loads(headers)],
+                content,
+                expires_at,
+                etag,
+            )
+            fresh = expires_at > now
+            if not fresh and not (revalidate and etag):
+                with self._connection:
+                    self._connection.execute(
+                        "DELETE FROM responses WHERE identity = ? AND url = ? AND expires_at <= ?",
+                        (*key, now),
+                    )
+                self._stats.expirations += 1
+                return None, False
+            if now - accessed_at >= ACCESS_RESOLUTION:
+                with self._connection:
+                    self._connection.execute(
+                        "UPDATE responses SET accessed_at = ? WHERE identity = ? AND url = ?",
+                        (now, *key),
+                    )
+            return entry, fresh
+
+    def _store(self, key: tuple[str, str], entry: CachedResponse) -> None:
+        now = self._clock()
+        with self._lock, self._connection:
+            self._connection.execute(
+                UPSERT,
+                (
+                    *key,
+                    entry.path,
+                    entry.status_code,
+                    json.dumps(entry.headers),
+                    entry.content,
+                    entry.etag,
+                    entry.expires_at,
+                    now,
+                    len(entry.content),
+                ),
+            )
+            self._trim(now)
+
+    def _trim(self, now: float) -> None:
+        self._stats.expirations += self._connection.execute(
+            "DELETE FROM responses WHERE expires_at <= ? AND etag IS NULL", (now,)
+        ).rowcount
+        count, size = self._connection.execute(
+            "SELECT count(*), total(size) FROM responses"
+        ).fetchone()
+        if count <= self.max_entries and size <= self.max_bytes:
+            return
+        evicted = []
+        for rowid, entry_size in self._connection.execute(
+            "SELECT rowid, size FROM responses ORDER BY accessed_at"
+        ):
+            if count <= self.max_entries and size <= self.max_bytes:
+                break
+            evicted.append((rowid,))
+            count -= 1
+            size -= entry_size
+        self._connection.executemany("DELETE FROM responses WHERE rowid = ?", evicted)
+        self._stats.evictions += len(evicted)
+
+    def _renew(
+        self, key: tuple[str, str], entry: CachedResponse, expires_at: float
+    ) -> None:
+        entry.expires_at = expires_at
+        with self._lock, self._connection:
+            self._connection.execute(
+                "UPDATE responses SET expires_at = ?, accessed_at = ? WHERE identity = ? AND url = ?",
+                (expires_at, self._clock(), *key),
+            )
+
+    def invalidate(self, url: str) -> int:
+        """Drops every entry, whichever process stored it, for the resource at `url`, its sub-resources and its parents."""
+        path = graph_path(url)
+        with self._lock, self._connection:
+            count = self._connection.execute(
+                "DELETE FROM responses WHERE path = ? OR substr(path, 1, ?) = ? OR substr(?, 1, length(path) + 1) = path || '/'",
+                (path, len(path) + 1, path + "/", path),
+            ).rowcount
+            self._stats.invalidations += count
+        return count
+
+    def clear(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
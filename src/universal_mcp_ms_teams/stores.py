@@ -0,0 +1,52 @@
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any
+
+from universal_mcp.exceptions import KeyNotFoundError
+from universal_mcp.stores import BaseStore
+
+
+class JsonFileStore(BaseStore):
+    """
+    Store persisting JSON-serializable values to a single file, so state such as
+    delta links survives process restarts. Writes replace the file atomically.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def _load(self) -> dict[str, Any]:
+        try:
+            return json.loads(self.path.read_text())
+        except FileNotFoundError:
+            return {}
+
+    def _dump(self, data: dict[str, Any]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        temporary.write_text(json.dumps(data))
+        os.replace(temporary, self.path)
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            data = self._load()
+        if key not in data:
+            raise KeyNotFoundError(f"Key '{key}' not found in {self.path}")
+        return data[key]
+
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            data = self._load()
+            data[key] = value
+            self._dump(data)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            data = self._load()
+            if key not in data:
+                raise KeyNotFoundError(f"Key '{key}' not found in {self.path}")
+            del data[key]
+            self._dump(data)
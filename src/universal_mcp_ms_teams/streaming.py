@@ -0,0 +1,126 @@
+"""
+Incremental decoding of Graph collection pages.
+
+`CollectionDecoder` reads a response body chunk by chunk and yields the items
+of its top-level `value` array as soon as each one is complete, so only the
+item being decoded (plus one network chunk) is held in memory, whatever the
+page size. The page's other properties, such as `@odata.nextLink`, are
+collected into `properties` as they go by.
+"""
+
+import codecs
+import json
+import re
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+# Consumed text is dropped from the buffer once this many characters have piled up.
+_COMPACT_AFTER = 1 << 16
+
+
+class CollectionDecoder:
+    """
+    Streaming decoder for a JSON object whose `value` member is an array.
+
+    Iterate it to get the array's items. Decoding errors and truncated bodies
+    raise `json.JSONDecodeError`.
+
+    Args:
+        chunks: The raw response body, e.g. `response.iter_bytes()`.
+    """
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self._chunks = iter(chunks)
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+        self._started = False
+        self.properties: dict[str, Any] = {}
+
+    def _fill(self) -> bool:
+        """Appends the next chunk to the buffer; returns False once the body is exhausted."""
+        if self._pos > _COMPACT_AFTER:
+            self._buffer = self._buffer[self._pos :]
+            self._pos = 0
+        for chunk in self._chunks:
+            if chunk:
+                self._buffer += self._text.decode(chunk)
+                return True
+        if not self._eof:
+            self._buffer += self._text.decode(b"", final=True)
+            self._eof = True
+        return False
+
+    def _error(self, message: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(message, self._buffer, self._pos)
+
+    def peek(self) -> str:
+        """Next non-whitespace character, without consuming it."""
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                raise self._error("Unexpected end of response body")
+
+    def _expect(self, *characters: str) -> str:
+        character = self.peek()
+        if character not in characters:
+            raise self._error(f"Expected {' or '.join(repr(c) for c in characters)}")
+        self._pos += 1
+        return character
+
+    def _value(self) -> Any:
+        self.peek()
+        while True:
+            pending = len(self._buffer) - self._pos
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            else:
+                # A number running up to the end of the buffer may continue in the next
+                # chunk.
+                if (
+                    end < len(self._buffer)
+                    or self._eof
+                    or not isinstance(value, (int, float))
+                ):
+                    self._pos = end
+                    return value
+            # Grow the buffer geometrically so a large value is re-parsed O(log n)
+            # times.
+            while self._fill() and len(self._buffer) - self._pos < 2 * pending:
+                pass
+
+    def __iter__(self) -> Iterator[Any]:
+        if self._started:
+            raise RuntimeError("CollectionDecoder can only be consumed once.")
+        self._started = True
+        self._expect("{")
+        if self.peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            key = self._value()
+            if not isinstance(key, str):
+                raise self._error("Expected a property name")
+            self._expect(":")
+            if key == "value" and self.peek() == "[":
+                self._pos += 1
+                if self.peek() == "]":
+                    self._pos += 1
+                else:
+                    while True:
+                        yield self._value()
+                        if self._expect(",", "]") == "]":
+                            break
+            else:
+                self.properties[key] = self._value()
+            if self._expect(",", "}") == "}":
+                return
@@ -0,0 +1,140 @@
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+import httpx
+
+from universal_mcp_ms_teams.projection import Projection
+
+if TYPE_CHECKING:
+    from universal_mcp_ms_teams.app import MsTeamsApp
+
+# Graph embeds at most this many replies in a message fetched with `$expand=replies`;
+# a thread that may be longer is completed by paging through its `replies`.
+EXPANDED_REPLY_LIMIT = 1000
+
+# Page size for the `replies` collection; Graph caps it at 50.
+REPLY_PAGE_SIZE = 50
+
+DEFAULT_CONCURRENCY = 8
+
+
+def message_order(message: dict[str, Any]) -> tuple[str, str]:
+    # Graph timestamps are UTC ISO 8601 strings, so they sort chronologically as text.
+    return message.get("createdDateTime") or "", message.get("id") or ""
+
+
+class ThreadFetcher:
+    """
+    Assembles channel threads: each root message with every reply, oldest first.
+
+    Every root is fetched with `$expand=replies`, which carries the whole thread in
+    one request unless it is longer than Graph embeds; those threads are completed
+    from their `replies` collection. Roots, and the reply pages of different threads,
+    are fetched concurrently. Replies are de-duplicated by id, since the embedded
+    replies and the paged ones overlap.
+
+    Args:
+        app: App whose requests fetch the messages.
+        projection: Shapes the root and every reply, e.g. for the 'minimal' profile.
+        max_concurrency: Threads fetched at the same time.
+    """
+
+    def __init__(
+        self,
+        app: "MsTeamsApp",
+        projection: Projection,
+        max_concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be a positive integer.")
+        self.app = app
+        self.projection = projection
+        self.max_concurrency = max_concurrency
+
+    def _messages_url(self, team_id: str, channel_id: str) -> str:
+        return f"{self.app.base_url}/teams/{team_id}/channels/{channel_id}/messages"
+
+    def _replies(
+        self, team_id: str, channel_id: str, root: dict[str, Any]
+    ) -> list[dict[str, Any]]:
+        replies = list(root.get("replies") or [])
+        next_link = root.get("replies@odata.nextLink")
+        if next_link is None and len(replies) < EXPANDED_REPLY_LIMIT:
+            return replies
+        url = (
+            next_link
+            or f"{self._messages_url(team_id, channel_id)}/{root['id']}/replies"
+        )
+        params = None if next_link else {"$top": REPLY_PAGE_SIZE}
+        for page in self.app._paginate(url, params).iter_pages():
+            replies.extend(page.get("value", []))
+        return replies
+
+    def fetch(self, team_id: str, channel_id: str, message_id: str) -> dict[str, Any]:
+        """
+        One thread: the root under 'message' and its replies, oldest first, under 'replies'.
+
+        Raises:
+            HTTPStatusError: If the root message or a page of its replies cannot be fetched.
+        """
+        response = self.app._get(
+            f"{self._messages_url(team_id, channel_id)}/{message_id}",
+            params={"$expand": "replies"},
+        )
+        root = self.app._handle_response(response)
+        replies: dict[str, dict[str, Any]] = {}
+        for reply in self._replies(team_id, channel_id, root):
+            replies.setdefault(reply.get("id"), reply)
+        ordered = sorted(replies.values(), key=message_order)
+        root = {
+            key: value for key, value in root.items() if not key.startswith("replies")
+        }
+        self.app._indexed(
+            {"value": [root, *ordered]}, team_id=team_id, channel_id=channel_id
+        )
+        return {
+            "id": root.get("id", message_id),
+            "message": self.projection.apply(root),
+            "replies": [self.projection.apply(reply) for reply in ordered],
+            "replyCount": len(ordered),
+        }
+
+    def fetch_many(
+        self, team_id: str, channel_id: str, message_ids: list[str]
+    ) -> dict[str, Any]:
+        """
+        Threads of several roots, in the order given, each root fetched once. Roots that cannot
+        be fetched are reported under 'errors' instead of failing the others.
+        """
+        unique = list(dict.fromkeys(message_ids))
+        workers = max(1, min(self.max_concurrency, len(unique)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(
+                    contextvars.copy_context().run,
+                    self.fetch,
+                    team_id,
+                    channel_id,
+                    message_id,
+                )
+                for message_id in unique
+            ]
+        threads, errors = [], []
+        for message_id, future in zip(unique, futures):
+            try:
+                threads.append(future.result())
+            except httpx.HTTPStatusError as e:
+                errors.append(
+                    {
+                        "id": message_id,
+                        "status": e.response.status_code,
+                        "error": str(e),
+                    }
+                )
+            except httpx.HTTPError as e:
+                errors.append({"id": message_id, "status": None, "error": str(e)})
+        result: dict[str, Any] = {"value": threads}
+        if errors:
+            result["errors"] = errors
+        return result
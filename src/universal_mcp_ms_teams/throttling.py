@@ -0,0 +1,230 @@
+import random
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+import httpx
+
+from universal_mcp_ms_teams.request import GraphRequest, RequestTrace, graph_path
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+DEFAULT_CONCURRENCY = {"chats": 8, "teams": 8, "users": 4, "me": 4}
+
+
+def resource_of(url: str) -> str:
+    """Graph resource family a request targets, e.g. 'chats' for '.../v1.0/chats/{id}/messages'."""
+    return graph_path(url).lstrip("/").split("/", 1)[0]
+
+
+def parse_retry_after(response: httpx.Response) -> float | None:
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
+
+
+@dataclass
+class RetryPolicy:
+    """
+    When and how long to wait before re-sending a throttled or failed request.
+
+    429 is always retried since Graph rejected the request before processing it;
+    503/504 and transport errors are only retried for idempotent methods. Without
+    a `Retry-After` header the delay is a full-jitter exponential backoff.
+    """
+
+    max_retries: int = 5
+    backoff_base: float = 0.5
+    backoff_max: float = 30.0
+
+    def should_retry(self, method: str, status_code: int | None) -> bool:
+        if status_code is None:
+            return method in IDEMPOTENT_METHODS
+        if status_code == httpx.codes.TOO_MANY_REQUESTS:
+            return True
+        return status_code in (503, 504) and method in IDEMPOTENT_METHODS
+
+    def delay(self, attempt: int, response: httpx.Response | None = None) -> float:
+        if response is not None:
+            retry_after = parse_retry_after(response)
+            if retry_after is not None:
+                return retry_after
+        return random.uniform(
+            0, min(self.backoff_max, self.backoff_base * (2**attempt))
+        )
+
+
+@dataclass
+class ThrottleStats:
+    requests: int = 0
+    retries: int = 0
+    throttled_responses: int = 0
+    throttle_wait_seconds: float = 0.0
+    queue_wait_seconds: float = 0.0
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled at `rate` tokens per second, holding at most `capacity`."""
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive.")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Takes one token and returns how long the caller must wait before using it."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+
+class ThrottleScheduler:
+    """
+    Rate limits, caps concurrency and retries Graph requests for one tenant.
+
+    Share one scheduler between every `MsTeamsApp` talking to the same tenant so the
+    token bucket and concurrency caps apply to their combined traffic.
+
+    Args:
+        rate: Sustained requests per second; `None` disables the token bucket.
+        burst: Bucket capacity, i.e. how many requests may go out back to back.
+        concurrency: Max in-flight requests per resource family ('chats', 'teams', 'users', ...).
+        default_concurrency: Cap for resource families not listed in `concurrency`.
+        retry: Retry policy for throttled and transient failures.
+    """
+
+    def __init__(
+        self,
+        rate: float | None = None,
+        burst: float | None = None,
+        concurrency: dict[str, int] | None = None,
+        default_concurrency: int = 8,
+        retry: RetryPolicy | None = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.bucket = TokenBucket(rate, burst) if rate is not None else None
+        self.concurrency = dict(
+            DEFAULT_CONCURRENCY if concurrency is None else concurrency
+        )
+        self.default_concurrency = default_concurrency
+        self.retry = retry or RetryPolicy()
+        self._sleep = sleep
+        self._semaphores: dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+        self._stats = ThrottleStats()
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return asdict(self._stats)
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._stats = ThrottleStats()
+
+    def _record(self, **increments: float) -> None:
+        with self._lock:
+            for name, value in increments.items():
+                setattr(self._stats, name, getattr(self._stats, name) + value)
+
+    def _semaphore(self, resource: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            semaphore = self._semaphores.get(resource)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(
+                    self.concurrency.get(resource, self.default_concurrency)
+                )
+                self._semaphores[resource] = semaphore
+            return semaphore
+
+    def wait_before_retry(
+        self, attempt: int, response: httpx.Response | None = None
+    ) -> float:
+        delay = self.retry.delay(attempt, response)
+        self._record(retries=1, throttle_wait_seconds=delay)
+        if delay > 0:
+            self._sleep(delay)
+        return delay
+
+    def execute(
+        self,
+        request: GraphRequest,
+        send: Callable[[GraphRequest], httpx.Response],
+        trace: RequestTrace | None = None,
+    ) -> httpx.Response:
+        """
+        Sends `request` through `send`, waiting for a rate-limit token and a concurrency
+        slot first and retrying according to the retry policy. Attempts, retries and
+        waits are also added to `trace` when given.
+
+        Returns:
+            httpx.Response: The first successful response, or the last one once retries run out.
+
+        Raises:
+            httpx.TransportError: If the last attempt failed at the transport level.
+        """
+        semaphore = self._semaphore(resource_of(request.url))
+        attempt = 0
+        while True:
+            started = time.monotonic()
+            if self.bucket is not None:
+                delay = self.bucket.reserve()
+                if delay > 0:
+                    self._sleep(delay)
+            with semaphore:
+                queued = time.monotonic() - started
+                self._record(requests=1, queue_wait_seconds=queued)
+                if trace is not None:
+                    trace.attempts += 1
+                    trace.queue_wait += queued
+                try:
+                    response = send(request)
+                except httpx.TransportError:
+                    if attempt >= self.retry.max_retries or not self.retry.should_retry(
+                        request.method, None
+                    ):
+                        raise
+                    response = None
+            if response is not None:
+                if response.status_code == httpx.codes.TOO_MANY_REQUESTS:
+                    self._record(throttled_responses=1)
+                if attempt >= self.retry.max_retries or not self.retry.should_retry(
+                    request.method, response.status_code
+                ):
+                    return response
+                response.close()
+            delay = self.wait_before_retry(attempt, response)
+            if trace is not None:
+                trace.retries += 1
+                trace.throttle_wait += delay
+            attempt += 1
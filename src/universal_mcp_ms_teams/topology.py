@@ -0,0 +1,384 @@
+import contextvars
+import difflib
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+import httpx
+
+if TYPE_CHECKING:
+    from universal_mcp_ms_teams.app import MsTeamsApp
+
+DEFAULT_TTL = 15 * 60
+
+# Chats indexed per snapshot; a user can be in tens of thousands of them.
+DEFAULT_MAX_CHATS = 2000
+DEFAULT_MAX_CHAT_PAGES = 50
+
+# A name missing from a snapshot younger than this is not worth another rebuild.
+MISS_REFRESH_AFTER = 30.0
+
+# Fuzzy matches must score at least FUZZY_CUTOFF, and those within FUZZY_MARGIN of the
+# best are ambiguous.
+FUZZY_CUTOFF = 0.8
+FUZZY_MARGIN = 0.05
+# Shorter partial names match too many names to be worth a substring match.
+MIN_PARTIAL_LENGTH = 3
+
+
+def normalize(name: str) -> str:
+    return " ".join(name.casefold().split())
+
+
+def similarity(query: str, name: str) -> float:
+    """How well a normalized query matches a normalized name, from 0 to 1."""
+    if query == name:
+        return 1.0
+    if len(query) >= MIN_PARTIAL_LENGTH and query in name:
+        # Partial names ("eng" for "Engineering") rank by how much of the name they
+        # cover.
+        return FUZZY_CUTOFF + (1 - FUZZY_CUTOFF) * len(query) / len(name)
+    return difflib.SequenceMatcher(None, query, name).ratio()
+
+
+class NameIndex:
+    """
+    Ids by display name: exact lookup (case and spacing insensitive) with a fuzzy fallback.
+
+    Args:
+        names: Display name of each id.
+    """
+
+    def __init__(self, names: dict[str, str]) -> None:
+        self.names = names
+        self._normalized = {id: normalize(name) for id, name in names.items()}
+        self._exact: dict[str, list[str]] = {}
+        for id, name in self._normalized.items():
+            self._exact.setdefault(name, []).append(id)
+
+    @classmethod
+    def of(cls, entities: dict[str, dict[str, Any]], attribute: str) -> "NameIndex":
+        return cls(
+            {
+                id: entity[attribute]
+                for id, entity in entities.items()
+                if entity.get(attribute)
+            }
+        )
+
+    def match(self, query: str, fuzzy: bool = True) -> list[str]:
+        """
+        Ids whose name is `query`, ignoring case and spacing; failing that, and unless
+        `fuzzy` is off, those matching it best, e.g. a typo or a partial name. More
+        than one id means the query is ambiguous.
+        """
+        wanted = normalize(query)
+        if wanted in self._exact:
+            return list(self._exact[wanted])
+        if not fuzzy:
+            return []
+        scored = sorted(
+            ((similarity(wanted, name), id) for id, name in self._normalized.items()),
+            reverse=True,
+        )
+        scored = [(score, id) for score, id in scored if score >= FUZZY_CUTOFF]
+        if not scored:
+            return []
+        best = scored[0][0]
+        return [id for score, id in scored if best - score < FUZZY_MARGIN]
+
+    def describe(self, ids: list[str]) -> str:
+        return ", ".join(f"{self.names[id]} ({id})" for id in ids)
+
+
+def no_match(kind: str, name: str, similar: list[str], index: NameIndex) -> ValueError:
+    """The error for a name matching nothing, listing the `similar` names a fuzzy match would have accepted."""
+    if similar:
+        return ValueError(
+            f"No {kind} matches '{name}' exactly; similar {kind}s: {index.describe(similar)}. Use the exact name or an id."
+        )
+    return ValueError(f"No {kind} matches '{name}'.")
+
+
+@dataclass
+class Topology:
+    """Snapshot of the caller's teams, their channels and chats, indexed by id and by name."""
+
+    teams: dict[str, dict[str, Any]] = field(default_factory=dict)
+    channels: dict[str, dict[str, dict[str, Any]]] = field(default_factory=dict)
+    primary_channels: dict[str, str] = field(default_factory=dict)
+    chats: dict[str, dict[str, Any]] = field(default_factory=dict)
+    errors: dict[str, str] = field(default_factory=dict)
+    # Whether chats were left out of `chats` by the chat budget.
+    chats_truncated: bool = False
+    built_at: float = 0.0
+
+    def __post_init__(self) -> None:
+        self.team_index = NameIndex.of(self.teams, "displayName")
+        self.channel_indexes = {
+            team_id: NameIndex.of(channels, "displayName")
+            for team_id, channels in self.channels.items()
+        }
+        self.chat_index = NameIndex.of(self.chats, "topic")
+
+    def channel_index(self, team_id: str) -> NameIndex:
+        return self.channel_indexes.get(team_id) or NameIndex({})
+
+    def team_ids(self, name: str) -> list[str]:
+        return self.team_index.match(name)
+
+    def channel_ids(self, team_id: str, name: str) -> list[str]:
+        return self.channel_index(team_id).match(name)
+
+    def chat_ids(self, topic: str) -> list[str]:
+        return self.chat_index.match(topic)
+
+    def to_dict(self) -> dict[str, Any]:
+        teams = [
+            {
+                **team,
+                "primaryChannelId": self.primary_channels.get(team_id),
+                "channels": list(self.channels.get(team_id, {}).values()),
+            }
+            for team_id, team in self.teams.items()
+        ]
+        result = {"teams": teams, "chats": list(self.chats.values())}
+        if self.errors:
+            result["errors"] = dict(self.errors)
+        return result
+
+
+class TopologyCache:
+    """
+    In-memory cache of the team/channel/chat topology, for name-to-id resolution without round trips.
+
+    The first use (or `warm()` at startup) lists the joined teams, then fetches
+    every team's channels and primary channel, and the chats, concurrently. After
+    `ttl` seconds the snapshot is still served while a background refresh
+    replaces it. Names are matched exactly first, then fuzzily (typos, partial
+    names). A name that is missing from a snapshot older than
+    `MISS_REFRESH_AFTER` seconds forces one refresh before resolution gives up,
+    so newly created teams and channels are found.
+
+    Args:
+        app: App whose tools fetch the topology.
+        ttl: Seconds before a snapshot is refreshed in the background.
+        max_workers: Requests issued in parallel while warming.
+        include_chats: Also index chats by topic.
+        max_chats: Chats indexed at most; the rest are left out and recorded in `errors`.
+        max_chat_pages: Pages of chats fetched at most, likewise.
+    """
+
+    def __init__(
+        self,
+        app: "MsTeamsApp",
+        ttl: float = DEFAULT_TTL,
+        max_workers: int = 8,
+        include_chats: bool = True,
+        max_chats: int | None = DEFAULT_MAX_CHATS,
+        max_chat_pages: int | None = DEFAULT_MAX_CHAT_PAGES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.app = app
+        self.ttl = ttl
+        self.max_workers = max_workers
+        self.include_chats = include_chats
+        self.max_chats = max_chats
+        self.max_chat_pages = max_chat_pages
+        self._clock = clock
+        self._topology: Topology | None = None
+        self._build_lock = threading.Lock()
+        # Held by the one background refresh running, from when it is started until it
+        # ends.
+        self._refresh_lock = threading.Lock()
+
+    def _fetch_team(self, team_id: str) -> tuple[dict[str, dict[str, Any]], str | None]:
+        channels = self.app.list_channels_for_team(
+            team_id, all=True, profile="summary"
+        )["value"]
+        primary = self.app.get_primary_team_channel(team_id, profile="minimal")
+        return {channel["id"]: channel for channel in channels}, primary.get("id")
+
+    def _build(self) -> Topology:
+        teams = {team["id"]: team for team in self.app.get_joined_teams()}
+        topology: dict[str, Any] = {
+            "teams": teams,
+            "channels": {},
+            "primary_channels": {},
+            "chats": {},
+            "errors": {},
+            "chats_truncated": False,
+        }
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="ms-teams-topology"
+        ) as pool:
+            # Copy the caller's context so the async app's event-loop bridging applies
+            # to the workers.
+            futures = {
+                team_id: pool.submit(
+                    contextvars.copy_context().run, self._fetch_team, team_id
+                )
+                for team_id in teams
+            }
+            chats = (
+                pool.submit(
+                    contextvars.copy_context().run,
+                    self.app.list_chats,
+                    all=True,
+                    profile="minimal",
+                    max_items=self.max_chats,
+                    max_pages=self.max_chat_pages,
+                )
+                if self.include_chats
+                else None
+            )
+            for team_id, future in futures.items():
+                try:
+                    topology["channels"][team_id], primary = future.result()
+                except httpx.HTTPError as e:
+                    topology["errors"][team_id] = str(e)
+                    continue
+                if primary:
+                    topology["primary_channels"][team_id] = primary
+            if chats is not None:
+                try:
+                    result = chats.result()
+                except httpx.HTTPError as e:
+                    topology["errors"]["chats"] = str(e)
+                else:
+                    topology["chats"] = {chat["id"]: chat for chat in result["value"]}
+                    if result.get("truncated"):
+                        topology["chats_truncated"] = True
+                        topology["errors"]["chats"] = (
+                            f"Only the first {len(result['value'])} chats are indexed."
+                        )
+        return Topology(**topology, built_at=self._clock())
+
+    def warm(self) -> Topology:
+        """Rebuilds the snapshot now, waiting for a rebuild already in progress instead of starting another."""
+        started = self._clock()
+        with self._build_lock:
+            if self._topology is not None and self._topology.built_at >= started:
+                return self._topology
+            self._topology = self._build()
+            return self._topology
+
+    def warm_in_background(self) -> threading.Thread | None:
+        """Starts building the snapshot on a daemon thread, e.g. when the server starts; None if a refresh is already running."""
+        if not self._refresh_lock.acquire(blocking=False):
+            return None
+        context = contextvars.copy_context()
+        thread = threading.Thread(
+            target=context.run,
+            args=(self._refresh,),
+            name="ms-teams-topology-refresh",
+            daemon=True,
+        )
+        try:
+            thread.start()
+        except BaseException:
+            self._refresh_lock.release()
+            raise
+        return thread
+
+    def _refresh(self) -> None:
+        try:
+            self.warm()
+        except Exception:
+            # Keep serving the previous snapshot (or build on first use); the next stale
+            # read retries.
+            pass
+        finally:
+            self._refresh_lock.release()
+
+    def get(self) -> Topology:
+        """Current snapshot, built on first use and refreshed in the background once stale."""
+        topology = self._topology
+        if topology is None:
+            return self.warm()
+        if self._clock() - topology.built_at > self.ttl:
+            self.warm_in_background()
+        return topology
+
+    def invalidate(self) -> None:
+        self._topology = None
+
+    def _stale(self, topology: Topology) -> bool:
+        return self._clock() - topology.built_at > MISS_REFRESH_AFTER
+
+    def _resolve(
+        self,
+        lookup: Callable[[Topology], NameIndex],
+        kind: str,
+        name: str,
+        exact: bool = False,
+    ) -> str:
+        topology = self.get()
+        index = lookup(topology)
+        ids = index.match(name, fuzzy=not exact)
+        if not ids and self._stale(topology):
+            index = lookup(self.warm())
+            ids = index.match(name, fuzzy=not exact)
+        if not ids:
+            raise no_match(kind, name, index.match(name) if exact else [], index)
+        if len(ids) > 1:
+            raise ValueError(
+                f"'{name}' matches several {kind}s: {index.describe(ids)}; use a more specific name or an id."
+            )
+        return ids[0]
+
+    def team_id(self, name: str, exact: bool = False) -> str:
+        """
+        Id of the joined team with this display name, or unless `exact`, the one it best matches.
+
+        Raises:
+            ValueError: If no team or several teams match this name.
+        """
+        return self._resolve(lambda topology: topology.team_index, "team", name, exact)
+
+    def channel_id(self, team_id: str, name: str, exact: bool = False) -> str:
+        """
+        Id of the channel of a team with this display name, or unless `exact`, the one it best matches.
+
+        Raises:
+            ValueError: If no channel or several channels of the team match this name.
+        """
+        return self._resolve(
+            lambda topology: topology.channel_index(team_id), "channel", name, exact
+        )
+
+    def primary_channel_id(self, team_id: str) -> str:
+        """
+        Id of a team's primary (General) channel.
+
+        Raises:
+            ValueError: If the team is unknown.
+        """
+        topology = self.get()
+        if team_id not in topology.primary_channels and self._stale(topology):
+            topology = self.warm()
+        if team_id not in topology.primary_channels:
+            raise ValueError(f"No primary channel is known for team '{team_id}'.")
+        return topology.primary_channels[team_id]
+
+    def chat_id(self, topic: str, exact: bool = False) -> str:
+        """
+        Id of the chat with this topic, or unless `exact`, the one it best matches. An exact
+        match is only trusted if every chat is indexed, since a chat beyond the chat budget
+        may have the same topic.
+
+        Raises:
+            ValueError: If no chat or several chats match this topic, or `exact` is set and not every chat is indexed.
+        """
+        chat_id = self._resolve(
+            lambda topology: topology.chat_index, "chat", topic, exact
+        )
+        topology = self.get()
+        if exact and topology.chats_truncated:
+            raise ValueError(
+                f"Only the first {len(topology.chats)} chats are indexed, so '{topic}' may name another chat too; use the chat id."
+            )
+        return chat_id
@@ -0,0 +1,284 @@
+import mmap
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from urllib.parse import quote
+
+import httpx
+
+from universal_mcp_ms_teams.request import GraphRequest
+
+if TYPE_CHECKING:
+    from universal_mcp_ms_teams.app import MsTeamsApp
+
+# Upload session fragments must be a multiple of 320 KiB and at most 60 MiB.
+CHUNK_ALIGNMENT = 320 * 1024
+MAX_CHUNK_SIZE = 192 * CHUNK_ALIGNMENT
+DEFAULT_CHUNK_SIZE = 16 * CHUNK_ALIGNMENT
+
+# Times the missing ranges of a session are uploaded again before giving up.
+MAX_RESUMES = 3
+
+# Folder of the sender's OneDrive that Teams itself uses for files shared in chats.
+CHAT_FILES_FOLDER = "Microsoft Teams Chat Files"
+
+Source = str | os.PathLike | bytes | bytearray | memoryview | mmap.mmap
+
+
+class UploadError(httpx.HTTPError):
+    """An upload session that still missed ranges after every resume."""
+
+
+def parse_ranges(ranges: list[str], total: int) -> list[tuple[int, int]]:
+    """Byte ranges of an upload session's `nextExpectedRanges`, e.g. '0-999' or '1000-', as [start, end) pairs."""
+    parsed = []
+    for value in ranges:
+        start, _, end = value.partition("-")
+        parsed.append((int(start), int(end) + 1 if end else total))
+    return parsed
+
+
+def attachment_id(item: dict[str, Any]) -> str:
+    # The eTag of a drive item is '"{GUID},version"'; Teams identifies file attachments
+    # by that GUID.
+    return item["eTag"].strip('"').split(",")[0].strip("{}").lower()
+
+
+def file_message(item: dict[str, Any], content: str | None = None) -> dict[str, Any]:
+    """Message payload carrying an uploaded drive item as a file attachment."""
+    reference = attachment_id(item)
+    return {
+        "body": {
+            "contentType": "html",
+            "content": f'{content or ""}<attachment id="{reference}"></attachment>',
+        },
+        "attachments": [
+            {
+                "id": reference,
+                "contentType": "reference",
+                "contentUrl": item["webUrl"],
+                "name": item["name"],
+            }
+        ],
+    }
+
+
+@contextmanager
+def open_source(source: Source) -> Iterator[memoryview]:
+    """A read-only view of `source`; files are memory-mapped instead of read into memory."""
+    if not isinstance(source, (str, os.PathLike)):
+        yield memoryview(source).cast("B")
+        return
+    with open(source, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            yield memoryview(b"")
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            view = memoryview(mapped)
+            try:
+                yield view
+            finally:
+                view.release()
+
+
+class Uploader:
+    """
+    Uploads files to OneDrive and SharePoint through resumable upload sessions.
+
+    The file is sent in fragments of `chunk_size` bytes straight from a memory map, so
+    one fragment at a time is copied into memory however large the file is. A session
+    only accepts the range it expects next, so the fragments of one file go one after
+    another in offset order; upload several files at once for parallelism. Fragments
+    go to the session's pre-authenticated URL without the Graph token, but through the
+    app's throttle scheduler, so 429s and transient failures are retried after their
+    `Retry-After`. A fragment that still fails stops the round, and the next one
+    resumes from the ranges the session says it still expects.
+
+    Args:
+        app: App whose requests create the session and upload the fragments.
+        chunk_size: Bytes per fragment; a multiple of 320 KiB up to 60 MiB.
+        max_resumes: Rounds of re-uploading missing ranges before giving up.
+    """
+
+    def __init__(
+        self,
+        app: "MsTeamsApp",
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_resumes: int = MAX_RESUMES,
+    ) -> None:
+        if (
+            chunk_size <= 0
+            or chunk_size % CHUNK_ALIGNMENT
+            or chunk_size > MAX_CHUNK_SIZE
+        ):
+            raise ValueError(
+                f"chunk_size must be a multiple of {CHUNK_ALIGNMENT} bytes up to {MAX_CHUNK_SIZE}."
+            )
+        self.app = app
+        self.chunk_size = chunk_size
+        self.max_resumes = max_resumes
+
+    def chat_item_url(self, name: str) -> str:
+        return f"{self.app.base_url}/me/drive/root:/{quote(CHAT_FILES_FOLDER)}/{quote(name)}:"
+
+    def channel_item_url(self, team_id: str, channel_id: str, name: str) -> str:
+        folder = self.app._handle_response(
+            self.app._get(
+                f"{self.app.base_url}/teams/{team_id}/channels/{channel_id}/filesFolder"
+            )
+        )
+        return f"{self.app.base_url}/drives/{folder['parentReference']['driveId']}/items/{folder['id']}:/{quote(name)}:"
+
+    def share_with_chat(self, item: dict[str, Any], chat_id: str) -> None:
+        """
+        Gives the other members of a chat read access to an item of the sender's OneDrive, as
+        Teams does when a file is shared in a chat; without it they see the attachment but cannot open it.
+        """
+        owner = ((item.get("createdBy") or {}).get("user") or {}).get("id")
+        members = self.app._paginate(f"{self.app.base_url}/chats/{chat_id}/members")
+        recipients = [
+            {"objectId": member["userId"]}
+            for member in members
+            if member.get("userId") and member["userId"] != owner
+        ]
+        if not recipients:
+            return
+        payload = {
+            "recipients": recipients,
+            "roles": ["read"],
+            "requireSignIn": True,
+            "sendInvitation": False,
+        }
+        self.app._handle_response(
+            self.app._post(
+                f"{self.app.base_url}/me/drive/items/{item['id']}/invite", data=payload
+            )
+        )
+
+    def upload(
+        self, source: Source, item_url: str, conflict_behavior: str = "rename"
+    ) -> dict[str, Any]:
+        """
+        Uploads `source` (a file path or a bytes-like object such as an mmap) to the drive item
+        addressed by `item_url`, e.g. '.../drives/{id}/items/{folder-id}:/report.pdf:'.
+
+        Returns:
+            The uploaded drive item.
+
+        Raises:
+            HTTPStatusError: If Graph refuses the session or a fragment for a reason other than a transient failure.
+            UploadError: If ranges are still missing after `max_resumes` rounds.
+            ValueError: If the file is empty.
+        """
+        with open_source(source) as view:
+            total = len(view)
+            if total == 0:
+                raise ValueError("Cannot upload an empty file.")
+            session = self.app._handle_response(
+                self.app._post(
+                    f"{item_url}/createUploadSession",
+                    data={
+                        "item": {"@microsoft.graph.conflictBehavior": conflict_behavior}
+                    },
+                )
+            )
+            upload_url = session["uploadUrl"]
+            try:
+                return self._upload(upload_url, view, total)
+            except BaseException:
+                # Release the partly uploaded file on the server instead of leaving it
+                # until the session expires.
+                try:
+                    self._session_request("DELETE", upload_url).close()
+                except httpx.HTTPError:
+                    pass
+                raise
+
+    def _upload(self, upload_url: str, view: memoryview, total: int) -> dict[str, Any]:
+        ranges = [(0, total)]
+        for _ in range(self.max_resumes + 1):
+            if not ranges:
+                raise UploadError(
+                    f"Upload to {upload_url} expects no more bytes but did not return the uploaded item."
+                )
+            for start, end in self._fragments(ranges):
+                response = self._put(upload_url, view, start, end, total)
+                if response is None:
+                    # Later fragments would arrive out of order; ask the session where
+                    # to go on from.
+                    break
+                if response.status_code in (200, 201):
+                    return response.json()
+            ranges = self._missing(upload_url, total)
+        raise UploadError(
+            f"Upload to {upload_url} still misses {ranges} after {self.max_resumes} resumes."
+        )
+
+    def _session_request(
+        self,
+        method: str,
+        upload_url: str,
+        content: bytes | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        # The upload URL carries its own authorization; the Graph token must not be sent
+        # to it.
+        request = GraphRequest(
+            method,
+            upload_url,
+            data=content,
+            content_type="application/octet-stream",
+            headers=headers,
+            authorize=False,
+        )
+        return self.app._execute(request)
+
+    def _fragments(self, ranges: list[tuple[int, int]]) -> list[tuple[int, int]]:
+        fragments = []
+        for start, end in ranges:
+            for offset in range(start, end, self.chunk_size):
+                fragments.append((offset, min(offset + self.chunk_size, end)))
+        return fragments
+
+    def _put(
+        self, upload_url: str, view: memoryview, start: int, end: int, total: int
+    ) -> httpx.Response | None:
+        """Sends one fragment; returns None if it failed in a way a later resume can make up for."""
+        try:
+            response = self._session_request(
+                "PUT",
+                upload_url,
+                bytes(view[start:end]),
+                {"Content-Range": f"bytes {start}-{end - 1}/{total}"},
+            )
+        except httpx.TransportError:
+            return None
+        # The scheduler already retried these, after their Retry-After.
+        if (
+            response.status_code >= httpx.codes.INTERNAL_SERVER_ERROR
+            or response.status_code == httpx.codes.TOO_MANY_REQUESTS
+        ):
+            return None
+        # 416: the session already has these bytes, e.g. from an attempt whose answer
+        # was lost.
+        if (
+            response.is_error
+            and response.status_code != httpx.codes.REQUESTED_RANGE_NOT_SATISFIABLE
+        ):
+            response.raise_for_status()
+        return response
+
+    def _missing(self, upload_url: str, total: int) -> list[tuple[int, int]]:
+        response = self._session_request("GET", upload_url)
+        response.raise_for_status()
+        return parse_ranges(response.json().get("nextExpectedRanges") or [], total)
+
+
+def upload_name(source: Source, name: str | None) -> str:
+    if name:
+        return name
+    if isinstance(source, (str, os.PathLike)):
+        return Path(source).name
+    raise ValueError("A name is required to upload a buffer.")
@@ -0,0 +1,210 @@
+"""
+Load benchmark for the `MsTeamsApp` tools against the local `MockGraph`.
+
+Every tool returned by `list_tools()` is called `iterations` times from a pool of
+`concurrency` threads. The report gives per-tool latency percentiles, Graph
+requests issued per call, throughput and bytes transferred.
+
+    python tests/benchmark.py --iterations 50 --concurrency 16 --latency 0.02
+"""
+
+import argparse
+import inspect
+import json
+import math
+import sys
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from typing import Any
+from unittest.mock import MagicMock
+
+import httpx
+from mock_graph import CHANNEL_ID, CHAT_ID, TAB_ID, TEAM_ID, MockGraph
+
+from universal_mcp_ms_teams.app import MsTeamsApp
+from universal_mcp_ms_teams.throttling import ThrottleScheduler
+
+# Values for required parameters that cannot be derived from their names.
+ARGUMENT_OVERRIDES = {
+    "content": "benchmark message",
+    "team_id": TEAM_ID,
+    "channel_id": CHANNEL_ID,
+    "chat_id": CHAT_ID,
+    "teamsTab_id": TAB_ID,
+    "message_ids": ["m1", "m2"],
+    "targets": [{"chat_id": CHAT_ID}, {"team_id": TEAM_ID, "channel_id": CHANNEL_ID}],
+}
+
+# Tools that read or write local files; they only run when selected explicitly.
+EXCLUDED_TOOLS = {"download_message_files", "send_file_message"}
+
+
+def percentile(samples: list[float], q: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[max(0, math.ceil(q / 100 * len(ordered)) - 1)]
+
+
+def tool_arguments(tool: Callable[..., Any]) -> dict[str, Any]:
+    """Fills every required parameter of a tool with a placeholder id or value."""
+    arguments = {}
+    for name, parameter in inspect.signature(tool).parameters.items():
+        if parameter.default is inspect.Parameter.empty:
+            arguments[name] = ARGUMENT_OVERRIDES.get(
+                name, f"{name.replace('_', '-')}-1"
+            )
+    return arguments
+
+
+@dataclass
+class ToolResult:
+    name: str
+    calls: int = 0
+    errors: int = 0
+    requests: int = 0
+    latencies: list[float] = field(default_factory=list, repr=False)
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "requests_per_call": self.requests / self.calls if self.calls else 0.0,
+            "p50_ms": percentile(self.latencies, 50) * 1000,
+            "p95_ms": percentile(self.latencies, 95) * 1000,
+            "p99_ms": percentile(self.latencies, 99) * 1000,
+        }
+
+
+@dataclass
+class BenchmarkReport:
+    tools: dict[str, dict[str, Any]]
+    wall_seconds: float
+    calls_per_second: float
+    requests_per_second: float
+    graph: dict[str, int]
+
+    def to_text(self) -> str:
+        lines = [
+            f"{'tool':<40} {'calls':>6} {'errors':>6} {'req/call':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}"
+        ]
+        for name, row in self.tools.items():
+            lines.append(
+                f"{name:<40} {row['calls']:>6} {row['errors']:>6} {row['requests_per_call']:>8.2f} {row['p50_ms']:>8.2f} {row['p95_ms']:>8.2f} {row['p99_ms']:>8.2f}"
+            )
+        lines.append(
+            f"wall {self.wall_seconds:.2f}s, {self.calls_per_second:.1f} calls/s, {self.requests_per_second:.1f} requests/s"
+        )
+        lines.append(
+            f"graph requests {self.graph['requests']} (throttled {self.graph['throttled']}), bytes sent {self.graph['bytes_received']}, bytes received {self.graph['bytes_sent']}"
+        )
+        return "\n".join(lines)
+
+
+def make_app(graph: MockGraph, **kwargs: Any) -> MsTeamsApp:
+    integration = MagicMock()
+    integration.get_credentials.return_value = {"access_token": "benchmark"}
+    app = MsTeamsApp(
+        integration=integration,
+        throttle=ThrottleScheduler(default_concurrency=64, concurrency={}),
+        **kwargs,
+    )
+    app._client = httpx.Client(transport=graph.transport())
+    return app
+
+
+def run(
+    iterations: int = 10,
+    concurrency: int = 8,
+    graph: MockGraph | None = None,
+    app: MsTeamsApp | None = None,
+    tools: list[str] | None = None,
+) -> BenchmarkReport:
+    graph = graph or MockGraph()
+    app = app or make_app(graph)
+    selected = [
+        tool
+        for tool in app.list_tools()
+        if (
+            tool.__name__ in tools
+            if tools is not None
+            else tool.__name__ not in EXCLUDED_TOOLS
+        )
+    ]
+    results = {tool.__name__: ToolResult(tool.__name__) for tool in selected}
+    graph.reset_stats()
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for tool in selected:
+            result = results[tool.__name__]
+            arguments = tool_arguments(tool)
+            before = graph.stats["requests"]
+
+            def call(
+                tool: Callable[..., Any] = tool, arguments: dict[str, Any] = arguments
+            ) -> tuple[float, bool]:
+                call_started = time.perf_counter()
+                try:
+                    tool(**arguments)
+                    return time.perf_counter() - call_started, True
+                except Exception:
+                    return time.perf_counter() - call_started, False
+
+            for latency, ok in pool.map(lambda _: call(), range(iterations)):
+                result.calls += 1
+                result.errors += not ok
+                result.latencies.append(latency)
+            result.requests = graph.stats["requests"] - before
+    wall = time.perf_counter() - started
+    total_calls = sum(result.calls for result in results.values())
+    stats = graph.stats
+    return BenchmarkReport(
+        {name: result.summary() for name, result in results.items()},
+        wall,
+        total_calls / wall,
+        stats["requests"] / wall,
+        stats,
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.0,
+        help="seconds added to every Graph response",
+    )
+    parser.add_argument(
+        "--throttle-every",
+        type=int,
+        default=0,
+        help="answer every n-th request with 429",
+    )
+    parser.add_argument("--collection-size", type=int, default=120)
+    parser.add_argument(
+        "--tool",
+        action="append",
+        dest="tools",
+        help="only benchmark this tool (repeatable)",
+    )
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+    graph = MockGraph(
+        collection_size=args.collection_size,
+        latency=args.latency,
+        throttle_every=args.throttle_every,
+    )
+    report = run(args.iterations, args.concurrency, graph=graph, tools=args.tools)
+    print(json.dumps(asdict(report), indent=2) if args.json else report.to_text())  # noqa: T201 - CLI output
+    return 0 if all(row["errors"] == 0 for row in report.tools.values()) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
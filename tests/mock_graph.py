@@ -0,0 +1,255 @@
+"""
+In-process stand-in for Microsoft Graph used by the tests and the benchmark.
+
+It answers every route `MsTeamsApp` calls with synthetic data: collections are
+paginated with `$top`/`@odata.nextLink`, `/$batch` envelopes are unpacked and
+dispatched, every `throttle_every`-th request is answered with 429 and a
+`Retry-After`, and each response can be delayed by `latency` seconds.
+
+Use `transport()` / `async_transport()` to plug it into an httpx client, or
+`serve()` to expose it on a local port.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, urlencode, urlsplit
+
+import httpx
+
+BASE_URL = "https://graph.microsoft.com/v1.0"
+
+COLLECTIONS = frozenset(
+    {
+        "chats",
+        "joinedTeams",
+        "channels",
+        "installedApps",
+        "members",
+        "messages",
+        "replies",
+        "tabs",
+        "delta",
+    }
+)
+
+MESSAGE_COLLECTIONS = frozenset({"messages", "replies", "delta"})
+
+# Ids shaped like Graph's, which the write tools pass through instead of resolving them
+# as names.
+TEAM_ID = "6c1f3a0e-2b7d-4c8e-9f10-1a2b3c4d5e6f"
+CHANNEL_ID = "19:channel-1@thread.tacv2"
+CHAT_ID = "19:chat-1@thread.v2"
+TAB_ID = "0d9e8f7a-6b5c-4d3e-8f2a-1b0c9d8e7f6a"
+
+
+class MockGraph:
+    def __init__(
+        self,
+        collection_size: int = 120,
+        page_size: int = 20,
+        latency: float = 0.0,
+        throttle_every: int = 0,
+        retry_after: float = 0.0,
+        message_bytes: int = 512,
+    ) -> None:
+        self.collection_size = collection_size
+        self.page_size = page_size
+        self.latency = latency
+        self.throttle_every = throttle_every
+        self.retry_after = retry_after
+        self.message_bytes = message_bytes
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.requests = 0
+            self.throttled = 0
+            self.bytes_received = 0
+            self.bytes_sent = 0
+            self.paths: list[tuple[str, str]] = []
+
+    @property
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "throttled": self.throttled,
+                "bytes_received": self.bytes_received,
+                "bytes_sent": self.bytes_sent,
+            }
+
+    def transport(self) -> httpx.MockTransport:
+        def handler(request: httpx.Request) -> httpx.Response:
+            if self.latency:
+                time.sleep(self.latency)
+            return self.handle(request)
+
+        return httpx.MockTransport(handler)
+
+    def async_transport(self) -> httpx.MockTransport:
+        async def handler(request: httpx.Request) -> httpx.Response:
+            if self.latency:
+                await asyncio.sleep(self.latency)
+            return self.handle(request)
+
+        return httpx.MockTransport(handler)
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        body = request.read()
+        with self._lock:
+            self.requests += 1
+            self.bytes_received += len(body)
+            self.paths.append((request.method, request.url.path))
+            throttle = self.throttle_every and self.requests % self.throttle_every == 0
+            if throttle:
+                self.throttled += 1
+        if throttle:
+            status, headers, payload = (
+                429,
+                {"Retry-After": str(self.retry_after)},
+                {"error": {"code": "TooManyRequests"}},
+            )
+        else:
+            status, headers, payload = self.route(
+                request.method, str(request.url), json.loads(body) if body else None
+            )
+        content = json.dumps(payload).encode() if payload is not None else b""
+        with self._lock:
+            self.bytes_sent += len(content)
+        if content:
+            headers = {**headers, "Content-Type": "application/json"}
+        return httpx.Response(status, headers=headers, content=content, request=request)
+
+    def route(
+        self, method: str, url: str, body: Any
+    ) -> tuple[int, dict[str, str], Any]:
+        parts = urlsplit(url)
+        path = parts.path.split("/v1.0", 1)[-1].rstrip("/")
+        query = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+        segments = [segment for segment in path.split("/") if segment]
+        if not segments:
+            return 404, {}, {"error": {"code": "NotFound"}}
+        if method == "POST" and segments == ["$batch"]:
+            return 200, {}, self.batch(body)
+        if method == "GET" and segments[-1] in COLLECTIONS:
+            return 200, {}, self.collection(url.split("?", 1)[0], segments[-1], query)
+        if method == "GET":
+            return (
+                200,
+                {"ETag": f'W/"{segments[-1]}"'},
+                self.entity(
+                    segments[-2] if len(segments) > 1 else "", segments[-1], query
+                ),
+            )
+        if method == "POST":
+            return 201, {}, {**(body or {}), "id": f"new-{len(segments)}"}
+        if method == "PUT":
+            return (
+                201,
+                {},
+                {**(body or {}), "id": segments[-2] if len(segments) > 1 else "new"},
+            )
+        return 204, {}, None
+
+    def entity(self, collection: str, id: str, query: dict[str, str]) -> dict[str, Any]:
+        if collection in MESSAGE_COLLECTIONS:
+            entity = self.message(id)
+        else:
+            entity = {
+                "id": id,
+                "displayName": f"{collection or 'entity'} {id}",
+                "description": "synthetic",
+                "createdDateTime": "2024-01-01T00:00:00Z",
+            }
+        if "$select" in query:
+            fields = set(query["$select"].split(",")) | {"id"}
+            entity = {key: value for key, value in entity.items() if key in fields}
+        return entity
+
+    def message(self, id: str) -> dict[str, Any]:
+        return {
+            "id": id,
+            "@odata.etag": f'W/"{id}"',
+            "messageType": "message",
+            "createdDateTime": "2024-01-01T00:00:00Z",
+            "lastModifiedDateTime": "2024-01-01T00:00:00Z",
+            "from": {"user": {"id": "u1", "displayName": "Someone"}},
+            "body": {
+                "contentType": "html",
+                "content": "<p>" + "x" * self.message_bytes + "</p>",
+            },
+            "reactions": [],
+            "mentions": [],
+            "attachments": [],
+        }
+
+    def collection(self, url: str, name: str, query: dict[str, str]) -> dict[str, Any]:
+        top = min(int(query.get("$top", self.page_size)), self.page_size * 5)
+        offset = int(query.get("$skiptoken", query.get("$skip", 0)))
+        ids = range(offset, min(offset + top, self.collection_size))
+        page: dict[str, Any] = {
+            "value": [self.entity(name, str(i), query) for i in ids]
+        }
+        if offset + top < self.collection_size:
+            page["@odata.nextLink"] = (
+                f"{url}?{urlencode({**query, '$skiptoken': offset + top})}"
+            )
+        elif name == "delta":
+            page["@odata.deltaLink"] = f"{url}?{urlencode({'$deltatoken': 'latest'})}"
+        return page
+
+    def batch(self, body: dict[str, Any]) -> dict[str, Any]:
+        responses = []
+        for sub_request in body.get("requests", []):
+            status, headers, payload = self.route(
+                sub_request["method"],
+                BASE_URL + sub_request["url"],
+                sub_request.get("body"),
+            )
+            responses.append(
+                {
+                    "id": sub_request["id"],
+                    "status": status,
+                    "headers": headers,
+                    "body": payload,
+                }
+            )
+        return {"responses": responses}
+
+    def serve(
+        self, host: str = "127.0.0.1", port: int = 0
+    ) -> tuple[ThreadingHTTPServer, str]:
+        """Starts a threaded HTTP server in the background; returns it with its base URL."""
+        graph = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _respond(self) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                request = httpx.Request(
+                    self.command,
+                    f"http://{self.headers['Host']}{self.path}",
+                    headers=dict(self.headers),
+                    content=self.rfile.read(length),
+                )
+                if graph.latency:
+                    time.sleep(graph.latency)
+                response = graph.handle(request)
+                self.send_response(response.status_code)
+                for key, value in response.headers.items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(response.content)
+
+            do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _respond
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return server, f"http://{host}:{server.server_address[1]}/v1.0"
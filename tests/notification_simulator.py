@@ -0,0 +1,202 @@
+"""
+Graph's side of change notifications, for testing `universal_mcp_ms_teams.notifications`.
+
+`NotificationSimulator` answers `/subscriptions` requests through an httpx mock
+transport, validating each new subscription against its notification URL the way
+Graph does, and posts notifications (encrypted when the subscription includes
+resource data) to the receiver over real HTTP.
+"""
+
+import base64
+import hashlib
+import hmac
+import json
+import os
+import time
+import uuid
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any
+
+import httpx
+
+MAX_LIFETIME = 60 * 60
+
+TENANT_ID = "55555555-5555-4555-8555-555555555555"
+
+
+def _timestamp(value: str) -> float:
+    return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+
+
+def encrypt(
+    resource: dict[str, Any], certificate: str, certificate_id: str
+) -> dict[str, Any]:
+    """An `encryptedContent` object for `resource`, encrypted for a base64 DER certificate."""
+    from cryptography import x509  # noqa: PLC0415
+    from cryptography.hazmat.primitives import hashes, padding  # noqa: PLC0415
+    from cryptography.hazmat.primitives.asymmetric import padding as asymmetric  # noqa: PLC0415
+    from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes  # noqa: PLC0415
+
+    public_key = x509.load_der_x509_certificate(
+        base64.b64decode(certificate)
+    ).public_key()
+    key = os.urandom(32)
+    padder = padding.PKCS7(128).padder()
+    padded = padder.update(json.dumps(resource).encode()) + padder.finalize()
+    encryptor = Cipher(algorithms.AES(key), modes.CBC(key[:16])).encryptor()
+    data = encryptor.update(padded) + encryptor.finalize()
+    return {
+        "data": base64.b64encode(data).decode(),
+        "dataSignature": base64.b64encode(
+            hmac.new(key, data, hashlib.sha256).digest()
+        ).decode(),
+        "dataKey": base64.b64encode(
+            public_key.encrypt(
+                key,
+                asymmetric.OAEP(
+                    mgf=asymmetric.MGF1(hashes.SHA1()),
+                    algorithm=hashes.SHA1(),
+                    label=None,
+                ),
+            )
+        ).decode(),
+        "encryptionCertificateId": certificate_id,
+        "encryptionCertificateThumbprint": "simulated",
+    }
+
+
+class NotificationSimulator:
+    def __init__(self, clock: Callable[[], float] = time.time) -> None:
+        self._clock = clock
+        self.subscriptions: dict[str, dict[str, Any]] = {}
+        self.requests: list[tuple[str, str]] = []
+
+    def transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self)
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path.removeprefix("/v1.0")
+        self.requests.append((request.method, path))
+        if path == "/subscriptions" and request.method == "POST":
+            return self._create(json.loads(request.content))
+        subscription_id = path.removeprefix("/subscriptions/")
+        subscription = self.subscriptions.get(subscription_id)
+        if subscription is None:
+            return httpx.Response(404, json={"error": {"code": "ResourceNotFound"}})
+        if request.method == "PATCH":
+            expiration = json.loads(request.content)["expirationDateTime"]
+            if _timestamp(expiration) > self._clock() + MAX_LIFETIME:
+                return httpx.Response(400, json={"error": {"code": "ExtensionError"}})
+            subscription["expirationDateTime"] = expiration
+            return httpx.Response(200, json=subscription)
+        if request.method == "DELETE":
+            del self.subscriptions[subscription_id]
+            return httpx.Response(204)
+        return httpx.Response(200, json=subscription)
+
+    def _create(self, body: dict[str, Any]) -> httpx.Response:
+        if _timestamp(body["expirationDateTime"]) > self._clock() + MAX_LIFETIME:
+            return httpx.Response(
+                400,
+                json={
+                    "error": {
+                        "code": "InvalidRequest",
+                        "message": "Expiration too far in the future.",
+                    }
+                },
+            )
+        if body.get("includeResourceData") and not body.get("encryptionCertificate"):
+            return httpx.Response(
+                400,
+                json={
+                    "error": {
+                        "code": "InvalidRequest",
+                        "message": "Missing encryptionCertificate.",
+                    }
+                },
+            )
+        token = uuid.uuid4().hex
+        try:
+            validation = httpx.post(
+                body["notificationUrl"], params={"validationToken": token}, timeout=10
+            )
+        except httpx.HTTPError:
+            validation = None
+        if (
+            validation is None
+            or validation.status_code != 200
+            or validation.text != token
+        ):
+            return httpx.Response(
+                400,
+                json={
+                    "error": {
+                        "code": "ValidationError",
+                        "message": "Subscription validation request failed.",
+                    }
+                },
+            )
+        subscription = {**body, "id": str(uuid.uuid4())}
+        self.subscriptions[subscription["id"]] = subscription
+        return httpx.Response(201, json=subscription)
+
+    def _post(
+        self,
+        subscription: dict[str, Any],
+        notification: dict[str, Any],
+        url: str | None = None,
+    ) -> httpx.Response:
+        notification = {
+            "subscriptionId": subscription["id"],
+            "clientState": subscription["clientState"],
+            "tenantId": TENANT_ID,
+            **notification,
+        }
+        return httpx.post(
+            url or subscription["notificationUrl"],
+            json={"value": [notification]},
+            timeout=10,
+        )
+
+    def notify(
+        self,
+        subscription_id: str,
+        message: dict[str, Any],
+        change_type: str = "created",
+        client_state: str | None = None,
+    ) -> httpx.Response:
+        """Posts a notification that `message` changed, as Graph would for this subscription."""
+        subscription = self.subscriptions[subscription_id]
+        resource = subscription["resource"].lstrip("/") + f"('{message['id']}')"
+        notification: dict[str, Any] = {
+            "changeType": change_type,
+            "resource": resource,
+            "resourceData": {
+                "id": message["id"],
+                "@odata.type": "#Microsoft.Graph.chatMessage",
+            },
+        }
+        if client_state is not None:
+            notification["clientState"] = client_state
+        if subscription.get("includeResourceData"):
+            notification["encryptedContent"] = encrypt(
+                message,
+                subscription["encryptionCertificate"],
+                subscription["encryptionCertificateId"],
+            )
+        return self._post(subscription, notification)
+
+    def lifecycle(self, subscription_id: str, event: str) -> httpx.Response:
+        subscription = self.subscriptions[subscription_id]
+        if event == "subscriptionRemoved":
+            del self.subscriptions[subscription_id]
+        return self._post(
+            subscription,
+            {"lifecycleEvent": event},
+            subscription.get("lifecycleNotificationUrl"),
+        )
+
+    def remove(self, subscription_id: str) -> None:
+        """Drops a subscription the way Graph does when it expires or access is revoked."""
+        del self.subscriptions[subscription_id]
@@ -0,0 +1,165 @@
+"""
+Cold-start benchmark for the MCP server.
+
+Each measurement runs in a fresh interpreter and reports, in milliseconds:
+
+- `import`: importing `universal_mcp_ms_teams.server`, which builds nothing;
+- `dependencies`: importing universal_mcp's server stack and the app module,
+  the part of the cold start this package does not control;
+- `registration`: creating the server and registering every tool, with the
+  precomputed manifest (`manifest`) and by introspecting the tools (`introspected`);
+- `package_import`: the self time of this package's own modules, from `-X importtime`.
+
+`BUDGET_MS` is the startup budget for the parts this package controls.
+
+    python tests/startup_benchmark.py --repeat 5
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+
+PACKAGE = "universal_mcp_ms_teams"
+
+# Milliseconds allowed for what this package adds to a cold start.
+BUDGET_MS = {"import": 50.0, "package_import": 100.0, "registration": 75.0}
+
+SCRIPT = """
+import json, time
+started = time.perf_counter()
+import universal_mcp_ms_teams.server as server
+imported = time.perf_counter()
+import universal_mcp.servers, universal_mcp_ms_teams.app, universal_mcp_ms_teams.async_app, universal_mcp_ms_teams.manifest
+loaded = time.perf_counter()
+mcp = server.create_server(use_manifest={use_manifest})
+registered = time.perf_counter()
+tools = len(mcp._tool_manager.list_tools())
+print(json.dumps({{"import": imported - started, "dependencies": loaded - imported, "registration": registered - loaded, "tools": tools}}))
+"""
+
+
+def _environment() -> dict[str, str]:
+    environment = {
+        **os.environ,
+        "PYTHONPATH": os.pathsep.join(
+            filter(None, [str(SRC), os.environ.get("PYTHONPATH")])
+        ),
+        "LOGURU_LEVEL": "WARNING",
+    }
+    # Building the app in the introspected run creates an AgentR integration, which
+    # wants a key.
+    environment.setdefault("AGENTR_API_KEY", "benchmark")
+    return environment
+
+
+def _run(code: str, *flags: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code],
+        capture_output=True,
+        text=True,
+        env=_environment(),
+        check=True,
+    )
+
+
+def measure_server(use_manifest: bool) -> dict[str, float]:
+    return json.loads(
+        _run(SCRIPT.format(use_manifest=use_manifest)).stdout.strip().splitlines()[-1]
+    )
+
+
+def package_import_ms() -> float:
+    """Self time of this package's modules while importing the server and the app, from `-X importtime`."""
+    stderr = _run(
+        f"import {PACKAGE}.server, {PACKAGE}.async_app", "-X", "importtime"
+    ).stderr
+    total = 0
+    for line in stderr.splitlines():
+        if line.startswith("import time:") and line.rsplit("|", 1)[
+            -1
+        ].strip().startswith(PACKAGE):
+            total += int(line.split("|")[0].split(":")[1])
+    return total / 1000
+
+
+@dataclass
+class StartupReport:
+    import_ms: float
+    dependencies_ms: float
+    registration_ms: dict[str, float]
+    package_import_ms: float
+    tools: int
+
+    @property
+    def within_budget(self) -> dict[str, bool]:
+        return {
+            "import": self.import_ms <= BUDGET_MS["import"],
+            "package_import": self.package_import_ms <= BUDGET_MS["package_import"],
+            "registration": self.registration_ms["manifest"]
+            <= BUDGET_MS["registration"],
+        }
+
+    def to_text(self) -> str:
+        budget = self.within_budget
+        lines = [
+            f"{'import server':<28} {self.import_ms:>9.1f} ms  budget {BUDGET_MS['import']:.0f} ms {'ok' if budget['import'] else 'OVER'}",
+            f"{'package modules (self)':<28} {self.package_import_ms:>9.1f} ms  budget {BUDGET_MS['package_import']:.0f} ms {'ok' if budget['package_import'] else 'OVER'}",
+            f"{'register (manifest)':<28} {self.registration_ms['manifest']:>9.1f} ms  budget {BUDGET_MS['registration']:.0f} ms {'ok' if budget['registration'] else 'OVER'}",
+            f"{'register (introspected)':<28} {self.registration_ms['introspected']:>9.1f} ms",
+            f"{'dependencies':<28} {self.dependencies_ms:>9.1f} ms",
+            f"{self.tools} tools",
+        ]
+        return "\n".join(lines)
+
+
+def run(repeat: int = 3) -> StartupReport:
+    """Median of `repeat` cold starts for each measurement."""
+    manifest = [measure_server(True) for _ in range(repeat)]
+    introspected = [measure_server(False) for _ in range(repeat)]
+    if {run["tools"] for run in manifest + introspected} != {manifest[0]["tools"]}:
+        raise AssertionError(
+            "The manifest and introspection registered different numbers of tools."
+        )
+    return StartupReport(
+        import_ms=statistics.median(run["import"] for run in manifest) * 1000,
+        dependencies_ms=statistics.median(run["dependencies"] for run in manifest)
+        * 1000,
+        registration_ms={
+            "manifest": statistics.median(run["registration"] for run in manifest)
+            * 1000,
+            "introspected": statistics.median(
+                run["registration"] for run in introspected
+            )
+            * 1000,
+        },
+        package_import_ms=statistics.median(package_import_ms() for _ in range(repeat)),
+        tools=manifest[0]["tools"],
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+    report = run(args.repeat)
+    text = (
+        json.dumps({**asdict(report), "within_budget": report.within_budget}, indent=2)
+        if args.json
+        else report.to_text()
+    )
+    print(text)  # noqa: T201 - CLI output
+    return 0 if all(report.within_budget.values()) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,11 +7,15 @@ from universal_mcp.utils.testing import (
 
 from universal_mcp_ms_teams.app import MsTeamsApp
 
+
 @pytest.fixture
 def app_instance():
     mock_integration = MagicMock()
-    mock_integration.get_credentials.return_value = {"access_token": "dummy_access_token"}
+    mock_integration.get_credentials.return_value = {
+        "access_token": "dummy_access_token"
+    }
     return MsTeamsApp(integration=mock_integration)
 
+
 def test_application(app_instance):
     check_application_instance(app_instance, app_name="ms-teams")
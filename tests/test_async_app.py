@@ -0,0 +1,51 @@
+import asyncio
+import inspect
+import time
+from unittest.mock import MagicMock
+
+import httpx
+
+from universal_mcp_ms_teams.async_app import AsyncMsTeamsApp
+
+
+def make_app(handler):
+    mock_integration = MagicMock()
+    mock_integration.get_credentials.return_value = {
+        "access_token": "dummy_access_token"
+    }
+    app = AsyncMsTeamsApp(integration=mock_integration, http2=False)
+    app._async_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return app
+
+
+def test_tools_are_coroutines_with_original_signature():
+    app = make_app(lambda request: httpx.Response(200, json={}))
+    tools = app.list_tools()
+    assert all(inspect.iscoroutinefunction(tool) for tool in tools)
+    get_chat = next(tool for tool in tools if tool.__name__ == "get_chat")
+    assert list(inspect.signature(get_chat).parameters) == [
+        "chat_id",
+        "select",
+        "expand",
+        "profile",
+    ]
+
+
+def test_concurrent_calls_overlap():
+    async def handler(request):
+        await asyncio.sleep(0.2)
+        assert request.headers["Authorization"] == "Bearer dummy_access_token"
+        return httpx.Response(200, json={"id": request.url.path.rsplit("/", 1)[-1]})
+
+    async def main():
+        async with make_app(handler) as app:
+            get_chat = next(
+                tool for tool in app.list_tools() if tool.__name__ == "get_chat"
+            )
+            started = time.perf_counter()
+            results = await asyncio.gather(*(get_chat(f"c{i}") for i in range(10)))
+            return results, time.perf_counter() - started
+
+    results, elapsed = asyncio.run(main())
+    assert [result["id"] for result in results] == [f"c{i}" for i in range(10)]
+    assert elapsed < 1.0
@@ -0,0 +1,83 @@
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+from mock_graph import CHAT_ID
+
+from universal_mcp_ms_teams.app import MsTeamsApp
+
+
+@pytest.fixture
+def app_instance():
+    return MsTeamsApp(integration=MagicMock())
+
+
+def batch_responder(app, handler):
+    envelopes = []
+
+    def send(request):
+        envelopes.append(request.data)
+        responses = [handler(sub_request) for sub_request in request.data["requests"]]
+        return httpx.Response(
+            200,
+            json={"responses": responses},
+            request=httpx.Request("POST", request.url),
+        )
+
+    app._send = MagicMock(side_effect=send)
+    return envelopes
+
+
+def test_batch_packs_and_unpacks(app_instance):
+    def handler(sub_request):
+        if sub_request["url"] == "/chats/missing":
+            return {
+                "id": sub_request["id"],
+                "status": 404,
+                "body": {"error": {"code": "NotFound"}},
+            }
+        return {
+            "id": sub_request["id"],
+            "status": 200,
+            "body": {"id": sub_request["url"].split("/")[-1].split("?")[0]},
+        }
+
+    envelopes = batch_responder(app_instance, handler)
+    with app_instance.batch() as batch:
+        items = [
+            batch.add(app_instance.get_chat, f"c{i}", select=["id"]) for i in range(25)
+        ]
+        missing = batch.add(app_instance.get_chat, "missing")
+
+    assert [len(envelope["requests"]) for envelope in envelopes] == [20, 6]
+    assert envelopes[0]["requests"][0] == {
+        "id": "1",
+        "method": "GET",
+        "url": "/chats/c0?%24select=id",
+    }
+    assert [item.result()["id"] for item in items] == [f"c{i}" for i in range(25)]
+    assert not missing.ok
+    with pytest.raises(httpx.HTTPStatusError):
+        missing.result()
+
+
+def test_batch_depends_on(app_instance):
+    def handler(sub_request):
+        status = 400 if sub_request["method"] == "POST" else 200
+        return {"id": sub_request["id"], "status": status, "body": {}}
+
+    envelopes = batch_responder(app_instance, handler)
+    batch = app_instance.batch(max_batch_size=1)
+    created = batch.add(app_instance.send_chat_message, CHAT_ID, "hello")
+    follow_up = batch.add(app_instance.get_chat, CHAT_ID, depends_on=[created])
+    batch.execute()
+
+    assert len(envelopes) == 1
+    assert envelopes[0]["requests"][0]["body"] == {"body": {"content": "hello"}}
+    assert follow_up.exception().response.status_code == 424
+
+
+def test_batch_validates_arguments_when_adding(app_instance):
+    batch = app_instance.batch()
+    with pytest.raises(ValueError):
+        batch.add(app_instance.get_chat, None)
@@ -0,0 +1,49 @@
+import benchmark
+from mock_graph import MockGraph
+
+# Tools that build a cached aggregate from many requests on their first call, or fetch
+# several resources per call.
+AGGREGATE_TOOLS = {"get_topology", "get_threads"}
+
+
+def test_every_tool_runs_with_one_request_per_call():
+    graph = MockGraph(collection_size=20)
+    # Without coalescing, so identical concurrent calls are counted one request each.
+    report = benchmark.run(
+        iterations=3,
+        concurrency=4,
+        graph=graph,
+        app=benchmark.make_app(graph, coalesce=False),
+    )
+    assert report.tools
+    for name, row in report.tools.items():
+        assert row["errors"] == 0, name
+        if name not in AGGREGATE_TOOLS:
+            assert row["requests_per_call"] == 1.0, name
+
+
+def test_throttled_requests_are_retried():
+    graph = MockGraph(throttle_every=3)
+    report = benchmark.run(
+        iterations=4,
+        concurrency=2,
+        graph=graph,
+        app=benchmark.make_app(graph, coalesce=False),
+        tools=["get_chat", "list_chats"],
+    )
+    assert graph.throttled > 0
+    assert all(row["errors"] == 0 for row in report.tools.values())
+    assert report.graph["requests"] == 8 + graph.throttled
+
+
+def test_local_server_serves_paginated_collections():
+    graph = MockGraph(collection_size=45)
+    server, base_url = graph.serve()
+    try:
+        app = benchmark.make_app(graph)
+        app._client = None
+        app.base_url = base_url
+        assert len(app.list_chats(top=20, all=True)["value"]) == 45
+        assert graph.stats["requests"] == 3
+    finally:
+        server.shutdown()
@@ -0,0 +1,108 @@
+import json
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+from mock_graph import TEAM_ID, MockGraph
+
+from universal_mcp_ms_teams.app import MsTeamsApp
+from universal_mcp_ms_teams.broadcast import Broadcast, PostLimiter
+
+
+def make_app(transport):
+    integration = MagicMock()
+    integration.get_credentials.return_value = {"access_token": "dummy_access_token"}
+    app = MsTeamsApp(integration=integration)
+    app.post_limiter = PostLimiter(sleep=lambda delay: None)
+    app._client = httpx.Client(transport=transport)
+    return app
+
+
+def test_plan_keeps_one_post_per_conversation_per_envelope():
+    targets = [
+        {"chat_id": "a"},
+        {"chat_id": "a"},
+        {"team_id": "t", "channel_id": "c"},
+        {"team_id": "t", "channel_id": "c", "message_id": "m"},
+        {"chat_id": "b"},
+    ]
+    plan = Broadcast(MagicMock(), max_batch_size=2).plan(targets)
+    assert plan == [[0, 2], [1, 3], [4]]
+
+
+def test_broadcast_batches_every_target():
+    graph = MockGraph()
+    app = make_app(graph.transport())
+    targets = (
+        [{"chat_id": f"19:chat-{i}@thread.v2"} for i in range(30)]
+        + [
+            {"team_id": TEAM_ID, "channel_id": f"19:channel-{i}@thread.tacv2"}
+            for i in range(10)
+        ]
+        + [
+            {
+                "team_id": TEAM_ID,
+                "channel_id": "19:channel-0@thread.tacv2",
+                "message_id": "m1",
+            }
+        ]
+    )
+    result = app.broadcast_message(targets, "hello", max_concurrency=3)
+    assert result["sent"] == 41 and result["failed"] == 0
+    assert [entry["target"] for entry in result["results"]] == targets
+    assert all(
+        entry["status_code"] == 201 and entry["message_id"]
+        for entry in result["results"]
+    )
+    assert graph.paths == [("POST", "/v1.0/$batch")] * 3
+
+
+def test_broadcast_reports_partial_failures():
+    def handler(request):
+        body = json.loads(request.content)
+        responses = [
+            {
+                "id": sub["id"],
+                "status": 403 if "denied" in sub["url"] else 201,
+                "body": {"id": "m"},
+            }
+            for sub in body["requests"]
+        ]
+        return httpx.Response(200, json={"responses": responses})
+
+    app = make_app(httpx.MockTransport(handler))
+    result = app.broadcast_message(
+        [{"chat_id": "19:ok@thread.v2"}, {"chat_id": "19:denied@thread.v2"}], "hello"
+    )
+    assert (result["sent"], result["failed"]) == (1, 1)
+    assert result["results"][1]["ok"] is False
+    assert result["results"][1]["status_code"] == 403
+
+
+def test_broadcast_reports_rejected_envelopes():
+    app = make_app(
+        httpx.MockTransport(
+            lambda request: httpx.Response(400, json={"error": {"code": "BadRequest"}})
+        )
+    )
+    result = app.broadcast_message(
+        [{"chat_id": "19:a@thread.v2"}, {"chat_id": "19:b@thread.v2"}], "hello"
+    )
+    assert result["failed"] == 2
+    assert {entry["status_code"] for entry in result["results"]} == {400}
+
+
+def test_invalid_target_sends_nothing():
+    graph = MockGraph()
+    app = make_app(graph.transport())
+    with pytest.raises(ValueError):
+        app.broadcast_message([{"chat_id": "a"}, {"team_id": "t"}], "hello")
+    assert graph.requests == 0
+
+
+def test_post_limiter_spaces_posts_per_conversation():
+    sleeps = []
+    limiter = PostLimiter(rate=1, burst=1, sleep=sleeps.append)
+    limiter.wait(["chats/a", "chats/b"])
+    limiter.wait(["chats/b"])
+    assert sleeps == [pytest.approx(1, abs=0.05)]
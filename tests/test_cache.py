@@ -0,0 +1,134 @@
+import json
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+from mock_graph import CHAT_ID
+
+from universal_mcp_ms_teams.app import MsTeamsApp
+from universal_mcp_ms_teams.cache import ResponseCache
+
+
+@pytest.fixture
+def clock():
+    return [0.0]
+
+
+@pytest.fixture
+def app_instance(clock):
+    mock_integration = MagicMock()
+    mock_integration.get_credentials.return_value = {
+        "access_token": "dummy_access_token"
+    }
+    app = MsTeamsApp(
+        integration=mock_integration,
+        cache=ResponseCache(
+            max_entries=2, ttls={"get_chat": 10}, clock=lambda: clock[0]
+        ),
+    )
+    app.requests = []
+
+    def handler(request):
+        app.requests.append((request.method, request.url.path))
+        return httpx.Response(
+            200,
+            json={"id": request.url.path.rsplit("/", 1)[-1], "n": len(app.requests)},
+        )
+
+    app._client = httpx.Client(transport=httpx.MockTransport(handler))
+    return app
+
+
+def test_hits_until_ttl_expires(app_instance, clock):
+    first = app_instance.get_chat("c1")
+    assert app_instance.get_chat("c1") == first
+    assert app_instance.get_chat("c1", select=["id"]) != first
+    clock[0] = 11
+    assert app_instance.get_chat("c1") != first
+    assert app_instance.cache.stats == {
+        "hits": 1,
+        "misses": 3,
+        "evictions": 0,
+        "expirations": 1,
+        "invalidations": 0,
+        "revalidations": 0,
+        "bytes_saved": 0,
+        "size": 2,
+    }
+
+
+def test_write_invalidates_resource_and_parents(app_instance):
+    app_instance.get_chat(CHAT_ID)
+    app_instance.get_chat_member_details(CHAT_ID, "m1")
+    app_instance.add_member_to_chat(CHAT_ID, displayName="someone")
+    assert len(app_instance.cache) == 0
+    app_instance.get_chat(CHAT_ID)
+    assert app_instance.requests.count(("GET", f"/v1.0/chats/{CHAT_ID}")) == 2
+
+
+def test_lru_eviction_and_uncached_endpoints(app_instance):
+    for chat_id in ("c1", "c2", "c3"):
+        app_instance.get_chat(chat_id)
+    app_instance.list_chat_messages("c1")
+    app_instance.list_chat_messages("c1")
+    assert app_instance.cache.stats["evictions"] == 1
+    assert app_instance.requests.count(("GET", "/v1.0/chats/c1/messages")) == 2
+
+
+def test_revalidates_with_etag(clock):
+    mock_integration = MagicMock()
+    mock_integration.get_credentials.return_value = {
+        "access_token": "dummy_access_token"
+    }
+    app = MsTeamsApp(
+        integration=mock_integration, cache=ResponseCache(clock=lambda: clock[0])
+    )
+    seen = []
+
+    def handler(request):
+        seen.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == 'W/"1"':
+            return httpx.Response(304)
+        return httpx.Response(
+            200,
+            headers={"ETag": 'W/"1"'},
+            json={"id": "m1", "body": {"content": "x" * 1000}},
+        )
+
+    app._client = httpx.Client(transport=httpx.MockTransport(handler))
+    first = app.get_chat_message_detail("c1", "m1")
+    assert app.get_chat_message_detail("c1", "m1") == first
+    assert seen == [None, 'W/"1"']
+    assert app.cache.stats["revalidations"] == 1
+    assert app.cache.stats["bytes_saved"] > 1000
+
+
+def test_parses_a_revalidated_body_once(clock, monkeypatch):
+    mock_integration = MagicMock()
+    mock_integration.get_credentials.return_value = {
+        "access_token": "dummy_access_token"
+    }
+    app = MsTeamsApp(
+        integration=mock_integration, cache=ResponseCache(clock=lambda: clock[0])
+    )
+
+    def handler(request):
+        if request.headers.get("If-None-Match") == 'W/"1"':
+            return httpx.Response(304)
+        return httpx.Response(
+            200, json={"id": "m1", "@odata.etag": 'W/"1"', "body": {"content": "x"}}
+        )
+
+    app._client = httpx.Client(transport=httpx.MockTransport(handler))
+    loads = json.loads
+    parsed = []
+    monkeypatch.setattr(
+        json,
+        "loads",
+        lambda *args, **kwargs: parsed.append(args) or loads(*args, **kwargs),
+    )
+    first = app.get_chat_message_detail("c1", "m1")
+    assert app.get_chat_message_detail("c1", "m1") == first
+    assert app.get_chat_message_detail("c1", "m1") == first
+    assert app.cache.stats["revalidations"] == 2
+    assert len(parsed) == 1
@@ -0,0 +1,117 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+from mock_graph import TEAM_ID
+
+from universal_mcp_ms_teams.app import MsTeamsApp
+from universal_mcp_ms_teams.coalescing import RequestCoalescer
+from universal_mcp_ms_teams.request import GraphRequest
+from universal_mcp_ms_teams.throttling import RetryPolicy, ThrottleScheduler
+
+
+class SlowGraph:
+    """Holds every response until released, so concurrent calls overlap."""
+
+    def __init__(self, status_code: int = 200) -> None:
+        self.status_code = status_code
+        self.release = threading.Event()
+        self.requests: list[str] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(
+            f"{request.method} {request.url.path}?{request.url.query.decode()}"
+        )
+        self.release.wait(5)
+        return httpx.Response(
+            self.status_code,
+            json={"value": [{"id": TEAM_ID, "displayName": "Engineering"}]},
+        )
+
+
+def make_app(graph, **kwargs):
+    integration = MagicMock()
+    integration.get_credentials.return_value = {"access_token": "dummy_access_token"}
+    app = MsTeamsApp(integration=integration, **kwargs)
+    app._client = httpx.Client(transport=httpx.MockTransport(graph))
+    return app
+
+
+def wait_until(condition) -> None:
+    deadline = time.monotonic() + 5
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+
+
+def test_identical_concurrent_gets_share_one_request():
+    graph = SlowGraph()
+    app = make_app(graph)
+    with ThreadPoolExecutor(8) as pool:
+        futures = [pool.submit(app.get_joined_teams) for _ in range(8)]
+        wait_until(lambda: app.coalescer.stats["shared"] == 7)
+        graph.release.set()
+        results = [future.result() for future in futures]
+    assert len(graph.requests) == 1
+    assert all(result == results[0] for result in results)
+    assert app.coalescer.stats == {"sent": 1, "shared": 7, "in_flight": 0}
+
+
+def test_different_params_are_not_shared():
+    graph = SlowGraph()
+    graph.release.set()
+    app = make_app(graph)
+    with ThreadPoolExecutor(2) as pool:
+        list(pool.map(lambda top: app.list_channels_for_team(TEAM_ID, top=top), [1, 2]))
+    assert len(graph.requests) == 2
+
+
+def test_errors_reach_every_waiter():
+    graph = SlowGraph(status_code=503)
+    app = make_app(graph, throttle=ThrottleScheduler(retry=RetryPolicy(max_retries=0)))
+    with ThreadPoolExecutor(4) as pool:
+        futures = [pool.submit(app.get_joined_teams) for _ in range(4)]
+        wait_until(lambda: app.coalescer.stats["shared"] == 3)
+        graph.release.set()
+        for future in futures:
+            with pytest.raises(httpx.HTTPStatusError):
+                future.result()
+    assert len(graph.requests) == 1
+
+
+def test_only_gets_from_the_same_caller_are_coalesced():
+    coalescer = RequestCoalescer()
+    release = threading.Event()
+    sent = []
+
+    def send(request):
+        sent.append(request.method)
+        release.wait(5)
+        return httpx.Response(
+            200, json={}, request=httpx.Request(request.method, request.full_url)
+        )
+
+    calls = [
+        (GraphRequest("GET", "https://graph/me/joinedTeams"), "alice"),
+        (GraphRequest("GET", "https://graph/me/joinedTeams"), "bob"),
+        (GraphRequest("POST", "https://graph/chats", data={}), "alice"),
+        (GraphRequest("POST", "https://graph/chats", data={}), "alice"),
+    ]
+    with ThreadPoolExecutor(4) as pool:
+        futures = [
+            pool.submit(
+                coalescer.fetch, request, lambda identity=identity: identity, send
+            )
+            for request, identity in calls
+        ]
+        wait_until(lambda: len(sent) == 4)
+        release.set()
+        [future.result() for future in futures]
+    assert sorted(sent) == ["GET", "GET", "POST", "POST"]
+
+
+def test_coalescing_can_be_disabled():
+    assert make_app(SlowGraph(), coalesce=False).coalescer is None
@@ -0,0 +1,198 @@
+import base64
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from importlib.metadata import version
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+from universal_mcp.integrations import AgentRIntegration
+
+from universal_mcp_ms_teams.app import MsTeamsApp
+from universal_mcp_ms_teams.credentials import (
+    TokenCache,
+    expiry_of,
+    forget_memoized_credentials,
+    identity,
+)
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def integration(*tokens, expires_in=3600):
+    mock = MagicMock()
+    mock.get_credentials.side_effect = [
+        {"access_token": token, "expires_in": expires_in} for token in tokens
+    ]
+    return mock
+
+
+def jwt(exp: int) -> str:
+    payload = (
+        base64.urlsafe_b64encode(json.dumps({"exp": exp}).encode()).decode().rstrip("=")
+    )
+    return f"e30.{payload}.signature"
+
+
+def test_expiry_of():
+    assert expiry_of({"expires_in": 60}, 100.0) == 160.0
+    assert expiry_of({"expires_at": 500}, 100.0) == 500.0
+    assert expiry_of({"expires_at": 500_000_000_000}, 100.0) == 500_000_000.0
+    assert expiry_of({"expires_at": "1970-01-01T00:10:00Z"}, 100.0) == 600.0
+    assert expiry_of({"access_token": jwt(900)}, 100.0) == 900.0
+    assert expiry_of({"access_token": "opaque"}, 100.0, default_lifetime=50) == 150.0
+
+
+def test_token_is_reused_until_the_refresh_margin():
+    clock = Clock()
+    cache = TokenCache(refresh_margin=300, clock=clock)
+    source = integration("t1", "t2")
+    assert cache.headers(source)["Authorization"] == "Bearer t1"
+    clock.now += 3000
+    assert cache.headers(source)["Authorization"] == "Bearer t1"
+    assert source.get_credentials.call_count == 1
+
+
+def test_refresh_runs_in_the_background_once():
+    clock = Clock()
+    cache = TokenCache(refresh_margin=300, clock=clock)
+    release = threading.Event()
+    tokens = iter(["t1", "t2"])
+
+    def fetch():
+        token = next(tokens)
+        if token == "t2":
+            release.wait(5)
+        return {"access_token": token, "expires_in": 3600}
+
+    source = MagicMock()
+    source.get_credentials.side_effect = fetch
+    cache.get(source)
+    clock.now += 3400
+    # Inside the margin the current token is served while a single refresh runs.
+    with ThreadPoolExecutor(8) as pool:
+        assert set(
+            pool.map(lambda _: cache.get(source)["access_token"], range(32))
+        ) == {"t1"}
+    release.set()
+    for thread in threading.enumerate():
+        if thread.name == "ms-teams-token-refresh":
+            thread.join(5)
+    assert cache.get(source)["access_token"] == "t2"
+    assert source.get_credentials.call_count == 2
+
+
+def test_concurrent_cold_callers_share_one_fetch():
+    cache = TokenCache()
+    started = threading.Event()
+    release = threading.Event()
+
+    def fetch():
+        started.set()
+        release.wait(5)
+        return {"access_token": "t1"}
+
+    source = MagicMock()
+    source.get_credentials.side_effect = fetch
+    with ThreadPoolExecutor(16) as pool:
+        futures = [pool.submit(cache.get, source) for _ in range(16)]
+        started.wait(5)
+        release.set()
+        assert {future.result()["access_token"] for future in futures} == {"t1"}
+    assert source.get_credentials.call_count == 1
+
+
+def test_failed_fetch_reaches_every_waiter_and_is_not_cached():
+    cache = TokenCache()
+    source = MagicMock()
+    source.get_credentials.side_effect = [
+        RuntimeError("credential endpoint down"),
+        {"access_token": "t1"},
+    ]
+    with pytest.raises(RuntimeError):
+        cache.get(source)
+    assert cache.get(source)["access_token"] == "t1"
+
+
+def test_expired_token_is_fetched_again_and_agentr_memo_is_cleared():
+    clock = Clock()
+    cache = TokenCache(clock=clock)
+    source = AgentRIntegration(
+        "microsoft-teams", api_key="k1", base_url="https://api.agentr.dev"
+    )
+    source.client = MagicMock(api_key="k1", base_url="https://api.agentr.dev")
+    source.client.get_credentials.side_effect = [
+        {"access_token": token, "expires_in": 60} for token in ("t1", "t2")
+    ]
+    assert cache.get(source)["access_token"] == "t1"
+    clock.now += 61
+    assert cache.get(source)["access_token"] == "t2"
+    assert source.client.get_credentials.call_count == 2
+
+
+def test_memoized_agentr_credentials_are_forgotten():
+    # Pins the private attribute `forget_memoized_credentials` relies on; revisit it
+    # when upgrading universal_mcp.
+    assert version("universal_mcp").startswith("0.1."), version("universal_mcp")
+    source = AgentRIntegration(
+        "microsoft-teams", api_key="k1", base_url="https://api.agentr.dev"
+    )
+    source.client = MagicMock()
+    source.client.get_credentials.side_effect = [
+        {"access_token": "t1"},
+        {"access_token": "t2"},
+    ]
+    assert (
+        source.get_credentials() == source.get_credentials() == {"access_token": "t1"}
+    )
+    forget_memoized_credentials(source)
+    assert source.get_credentials() == {"access_token": "t2"}
+    other = integration("t1")
+    forget_memoized_credentials(other)
+    assert other.get_credentials.call_count == 0
+
+
+def test_agentr_integrations_with_the_same_key_share_a_token():
+    def agentr(api_key):
+        source = integration(f"{api_key}-token")
+        source.name = "microsoft-teams"
+        source.client = SimpleNamespace(
+            api_key=api_key, base_url="https://api.agentr.dev"
+        )
+        return source
+
+    first, second, other = agentr("k1"), agentr("k1"), agentr("k2")
+    assert identity(first) == identity(second) != identity(other)
+    assert identity(MagicMock()) is None
+    cache = TokenCache()
+    assert cache.get(first) == cache.get(second)
+    assert cache.get(other)["access_token"] == "k2-token"
+    assert second.get_credentials.call_count == 0
+
+
+def test_app_reuses_the_token_and_retries_once_after_a_401():
+    source = integration("revoked", "t2")
+    seen = []
+
+    def graph(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers["Authorization"])
+        if request.headers["Authorization"] == "Bearer revoked":
+            return httpx.Response(
+                401, json={"error": {"code": "InvalidAuthenticationToken"}}
+            )
+        return httpx.Response(200, json={"value": []})
+
+    app = MsTeamsApp(integration=source, token_cache=TokenCache())
+    app._client = httpx.Client(transport=httpx.MockTransport(graph))
+    app.list_chats()
+    app.list_chats()
+    assert seen == ["Bearer revoked", "Bearer t2", "Bearer t2"]
+    assert source.get_credentials.call_count == 2
@@ -0,0 +1,187 @@
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from universal_mcp_ms_teams.app import MsTeamsApp
+from universal_mcp_ms_teams.stores import JsonFileStore
+
+DELTA_URL = "https://graph.microsoft.com/v1.0/teams/t1/channels/c1/messages/delta"
+
+
+@pytest.fixture
+def app_instance(tmp_path):
+    mock_integration = MagicMock()
+    mock_integration.get_credentials.return_value = {
+        "access_token": "dummy_access_token"
+    }
+    return MsTeamsApp(
+        integration=mock_integration, state_store=JsonFileStore(tmp_path / "sync.json")
+    )
+
+
+def serve(app, handler):
+    app.requests = []
+
+    def record(request):
+        app.requests.append(request)
+        return handler(request)
+
+    app._client = httpx.Client(transport=httpx.MockTransport(record))
+
+
+def test_channel_sync_follows_delta_link(app_instance):
+    def handler(request):
+        if "token=next" in str(request.url):
+            return httpx.Response(
+                200,
+                json={
+                    "value": [
+                        {"id": "2", "lastEditedDateTime": "2024-01-01T00:00:00Z"}
+                    ],
+                    "@odata.deltaLink": f"{DELTA_URL}?token=delta1",
+                },
+            )
+        if "token=delta1" in str(request.url):
+            return httpx.Response(
+                200,
+                json={
+                    "value": [{"id": "3", "deletedDateTime": "2024-01-02T00:00:00Z"}],
+                    "@odata.deltaLink": f"{DELTA_URL}?token=delta2",
+                },
+            )
+        return httpx.Response(
+            200,
+            json={"value": [{"id": "1"}], "@odata.nextLink": f"{DELTA_URL}?token=next"},
+        )
+
+    serve(app_instance, handler)
+    first = app_instance.sync_channel_messages("t1", "c1")
+    assert [m["id"] for m in first["value"]] == ["1", "2"]
+    assert first["counts"] == {"new": 1, "edited": 1, "deleted": 0}
+
+    second = app_instance.sync_channel_messages("t1", "c1")
+    assert second["counts"] == {"new": 0, "edited": 0, "deleted": 1}
+    assert (
+        app_instance.sync_state.get("channel", "t1", "c1")
+        == f"{DELTA_URL}?token=delta2"
+    )
+
+
+def test_channel_sync_restarts_after_expired_delta_link(app_instance):
+    app_instance.sync_state.set(f"{DELTA_URL}?token=old", "channel", "t1", "c1")
+
+    def handler(request):
+        if "token=old" in str(request.url):
+            return httpx.Response(410, json={"error": {"code": "resyncRequired"}})
+        return httpx.Response(
+            200,
+            json={
+                "value": [{"id": "1"}],
+                "@odata.deltaLink": f"{DELTA_URL}?token=fresh",
+            },
+        )
+
+    serve(app_instance, handler)
+    assert app_instance.sync_channel_messages("t1", "c1")["counts"]["new"] == 1
+    assert (
+        app_instance.sync_state.get("channel", "t1", "c1") == f"{DELTA_URL}?token=fresh"
+    )
+
+
+def test_chat_sync_filters_on_watermark(app_instance):
+    serve(
+        app_instance,
+        lambda request: httpx.Response(
+            200,
+            json={
+                "value": [
+                    {"id": "1", "lastModifiedDateTime": "2024-03-01T10:00:00.5Z"},
+                    {"id": "0", "lastModifiedDateTime": "2024-03-01T09:00:00Z"},
+                ]
+            },
+        ),
+    )
+    app_instance.sync_chat_messages("c1")
+    assert "$filter" not in app_instance.requests[0].url.params
+    app_instance.sync_chat_messages("c1")
+    assert (
+        app_instance.requests[1].url.params["$filter"]
+        == "lastModifiedDateTime gt 2024-03-01T09:59:59.500Z"
+    )
+
+
+def test_chat_sync_keeps_messages_modified_at_the_watermark(app_instance):
+    pages = [
+        [{"id": "1", "lastModifiedDateTime": "2024-03-01T10:00:00Z"}],
+        # "2" was modified in the same instant as "1" but only became visible after the
+        # first sync.
+        [
+            {"id": "2", "lastModifiedDateTime": "2024-03-01T10:00:00.000Z"},
+            {"id": "1", "lastModifiedDateTime": "2024-03-01T10:00:00Z"},
+        ],
+        [
+            {"id": "2", "lastModifiedDateTime": "2024-03-01T10:00:00Z"},
+            {"id": "1", "lastModifiedDateTime": "2024-03-01T10:00:00Z"},
+        ],
+    ]
+    serve(
+        app_instance,
+        lambda request: httpx.Response(
+            200, json={"value": pages[len(app_instance.requests) - 1]}
+        ),
+    )
+    synced = [
+        [m["id"] for m in app_instance.sync_chat_messages("c1")["value"]] for _ in pages
+    ]
+    assert synced == [["1"], ["2"], []]
+    assert app_instance.sync_state.get("chat", "c1") == {
+        "at": "2024-03-01T10:00:00Z",
+        "seen": {"1": "2024-03-01T10:00:00Z", "2": "2024-03-01T10:00:00.000Z"},
+    }
+
+
+def test_chat_sync_returns_messages_edited_inside_the_overlap(app_instance):
+    pages = [
+        [
+            {"id": "1", "lastModifiedDateTime": "2024-03-01T10:00:00Z"},
+            {"id": "0", "lastModifiedDateTime": "2024-03-01T09:00:00Z"},
+        ],
+        [
+            {
+                "id": "1",
+                "lastModifiedDateTime": "2024-03-01T10:00:00.300Z",
+                "lastEditedDateTime": "2024-03-01T10:00:00.300Z",
+            },
+            {"id": "1b", "lastModifiedDateTime": "2024-03-01T09:59:59.800Z"},
+        ],
+    ]
+    serve(
+        app_instance,
+        lambda request: httpx.Response(
+            200, json={"value": pages[len(app_instance.requests) - 1]}
+        ),
+    )
+    app_instance.sync_chat_messages("c1")
+    second = app_instance.sync_chat_messages("c1")
+    assert second["counts"] == {"new": 1, "edited": 1, "deleted": 0}
+    # Messages older than the overlap are not remembered.
+    assert set(app_instance.sync_state.get("chat", "c1")["seen"]) == {"1", "1b"}
+
+
+def test_chat_sync_reads_a_timestamp_only_watermark(app_instance):
+    app_instance.sync_state.set("2024-03-01T10:00:00Z", "chat", "c1")
+    serve(
+        app_instance,
+        lambda request: httpx.Response(
+            200,
+            json={
+                "value": [{"id": "1", "lastModifiedDateTime": "2024-03-01T10:00:00Z"}]
+            },
+        ),
+    )
+    assert app_instance.sync_chat_messages("c1")["counts"]["new"] == 1
+    assert (
+        app_instance.requests[0].url.params["$filter"]
+        == "lastModifiedDateTime gt 2024-03-01T09:59:59.000Z"
+    )
@@ -0,0 +1,267 @@
+import io
+import json
+import threading
+import time
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+from mock_graph import CHAT_ID
+
+from universal_mcp_ms_teams.app import MsTeamsApp
+from universal_mcp_ms_teams.downloads import (
+    MIN_CHUNK_SIZE,
+    Download,
+    Downloader,
+    share_id,
+)
+
+MESSAGE = f"/v1.0/chats/{CHAT_ID}/messages/m1"
+IMAGE = bytes(range(256)) * 1024
+REPORT = b"report " * 50_000
+REPORT_URL = "https://contoso.sharepoint.com/sites/eng/Shared Documents/report.pdf"
+STORAGE = "https://files.example.com/download/report.pdf"
+
+
+class FailingStream(httpx.SyncByteStream):
+    """Body that breaks off after `limit` bytes, like a dropped connection."""
+
+    def __init__(self, content: bytes, limit: int) -> None:
+        self.content = content
+        self.limit = limit
+
+    def __iter__(self):
+        yield self.content[: self.limit]
+        raise httpx.ReadError("connection reset")
+
+
+class FileGraph:
+    def __init__(self, fail_after=None, latency=0.0, etag='"v1"'):
+        self.fail_after = fail_after
+        self.etag = etag
+        self.latency = latency
+        self.requests = []
+        self.in_flight = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, request):
+        with self._lock:
+            self.requests.append(
+                (
+                    request.url.host,
+                    request.url.path,
+                    request.headers.get("Range"),
+                    request.headers.get("Authorization"),
+                )
+            )
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        try:
+            time.sleep(self.latency)
+            return self.route(request)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    def ranged(self, request, content):
+        start = 0
+        if "Range" in request.headers:
+            start = int(request.headers["Range"].removeprefix("bytes=").rstrip("-"))
+            if start >= len(content):
+                return httpx.Response(
+                    416, headers={"Content-Range": f"bytes */{len(content)}"}
+                )
+        body = content[start:]
+        headers = {
+            "Content-Type": "application/octet-stream",
+            "Content-Length": str(len(body)),
+            "ETag": self.etag,
+        }
+        if start:
+            headers["Content-Range"] = (
+                f"bytes {start}-{len(content) - 1}/{len(content)}"
+            )
+        status = 206 if start else 200
+        if self.fail_after is not None and start == 0:
+            return httpx.Response(
+                status, headers=headers, stream=FailingStream(body, self.fail_after)
+            )
+        return httpx.Response(status, headers=headers, content=body)
+
+    def route(self, request):
+        path = request.url.path
+        if request.url.host == "files.example.com":
+            return self.ranged(request, REPORT)
+        if path == MESSAGE:
+            return httpx.Response(
+                200,
+                json={
+                    "id": "m1",
+                    "attachments": [
+                        {
+                            "id": "a1",
+                            "contentType": "reference",
+                            "contentUrl": REPORT_URL,
+                            "name": "report.pdf",
+                        },
+                        {
+                            "id": "a2",
+                            "contentType": "application/vnd.microsoft.card.adaptive",
+                            "content": "{}",
+                        },
+                    ],
+                },
+            )
+        if path == f"{MESSAGE}/hostedContents":
+            return httpx.Response(
+                200,
+                json={
+                    "value": [
+                        {"id": "aWQ9MSx0eXBlPTE=", "contentType": "image/png"},
+                        {"id": "aWQ9Mix0eXBlPTE=", "contentType": "image/png"},
+                    ]
+                },
+            )
+        if path.startswith(f"{MESSAGE}/hostedContents/") and path.endswith("/$value"):
+            return self.ranged(request, IMAGE)
+        if path == f"/v1.0/shares/{share_id(REPORT_URL)}/driveItem/content":
+            return httpx.Response(302, headers={"Location": STORAGE})
+        return httpx.Response(404, json={"error": {"code": "NotFound"}})
+
+
+def make_app(graph):
+    integration = MagicMock()
+    integration.get_credentials.return_value = {"access_token": "dummy_access_token"}
+    app = MsTeamsApp(integration=integration)
+    app._client = httpx.Client(transport=httpx.MockTransport(graph))
+    return app
+
+
+def test_message_files_are_downloaded_in_parallel(tmp_path):
+    graph = FileGraph(latency=0.05)
+    result = make_app(graph).download_message_files(
+        "m1", str(tmp_path), chat_id=CHAT_ID
+    )
+    assert "errors" not in result
+    names = sorted(item["name"] for item in result["value"])
+    assert names[-1] == "report.pdf" and all(
+        name.startswith("hostedContent-") and name.endswith(".png")
+        for name in names[:2]
+    )
+    for item in result["value"]:
+        assert (tmp_path / item["name"]).read_bytes() == (
+            REPORT if item["name"] == "report.pdf" else IMAGE
+        )
+    assert not list(tmp_path.glob("*.part"))
+    assert graph.peak >= 2
+
+
+def test_redirected_storage_never_sees_the_graph_token(tmp_path):
+    graph = FileGraph()
+    make_app(graph).download_message_files(
+        "m1", str(tmp_path), chat_id=CHAT_ID, hosted_contents=False
+    )
+    [storage] = [
+        request for request in graph.requests if request[0] == "files.example.com"
+    ]
+    assert storage[3] is None
+    assert all(
+        request[3] == "Bearer dummy_access_token"
+        for request in graph.requests
+        if request[0] == "graph.microsoft.com"
+    )
+
+
+def test_interrupted_download_resumes_with_a_range_request():
+    graph = FileGraph(fail_after=100_000)
+    sink = io.BytesIO()
+    result = Downloader(make_app(graph)).download(Download(STORAGE, "report.pdf"), sink)
+    assert sink.getvalue() == REPORT
+    assert result.bytes == len(REPORT) and result.resumes == 1
+    assert [request[2] for request in graph.requests] == [None, "bytes=100000-"]
+
+
+def test_partial_file_is_resumed(tmp_path):
+    graph = FileGraph()
+    (tmp_path / "report.pdf.part").write_bytes(REPORT[:1000])
+    (tmp_path / "report.pdf.part.json").write_text(
+        json.dumps({"url": STORAGE, "size": len(REPORT), "etag": '"v1"'})
+    )
+    result = Downloader(make_app(graph)).download(
+        Download(STORAGE, "report.pdf"), tmp_path / "report.pdf"
+    )
+    assert (tmp_path / "report.pdf").read_bytes() == REPORT
+    assert result.resumed_from == 1000
+    assert graph.requests[0][2] == "bytes=1000-"
+    assert not (tmp_path / "report.pdf.part.json").exists()
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        None,
+        {"url": "https://files.example.com/download/other.pdf"},
+        {"url": STORAGE, "etag": '"v0"'},
+        {"url": STORAGE, "size": 1000},
+    ],
+)
+def test_partial_file_of_another_source_is_discarded(tmp_path, source):
+    graph = FileGraph()
+    (tmp_path / "report.pdf.part").write_bytes(b"x" * 1000)
+    if source is not None:
+        (tmp_path / "report.pdf.part.json").write_text(json.dumps(source))
+    result = Downloader(make_app(graph)).download(
+        Download(STORAGE, "report.pdf"), tmp_path / "report.pdf"
+    )
+    assert (tmp_path / "report.pdf").read_bytes() == REPORT
+    assert result.resumed_from == 0 and result.bytes == len(REPORT)
+    assert graph.requests[-1][2] is None
+
+
+def test_chunks_stay_within_the_memory_ceiling():
+    chunks = []
+    downloader = Downloader(
+        make_app(FileGraph()), max_memory=4 * MIN_CHUNK_SIZE, max_concurrency=4
+    )
+    downloader.download(Download(STORAGE, "report.pdf"), chunks.append)
+    assert b"".join(chunks) == REPORT
+    assert max(len(chunk) for chunk in chunks) <= MIN_CHUNK_SIZE
+
+
+def test_failures_are_reported_per_file(tmp_path):
+    downloads = [
+        Download(STORAGE, "report.pdf"),
+        Download("https://graph.microsoft.com/v1.0/missing/$value", "report.pdf"),
+    ]
+    result = Downloader(make_app(FileGraph())).download_many(downloads, tmp_path)
+    assert [item["path"] for item in result["value"]] == [str(tmp_path / "report.pdf")]
+    assert result["errors"] == [
+        {"name": "report.pdf", "status": 404, "error": result["errors"][0]["error"]}
+    ]
+    # Files with the same name are kept apart.
+    assert not (tmp_path / "report (2).pdf").exists()
+
+
+def test_existing_files_are_kept_unless_overwritten(tmp_path):
+    (tmp_path / "report.pdf").write_bytes(b"mine")
+    app = make_app(FileGraph())
+    result = app.download_message_files(
+        "m1", str(tmp_path), chat_id=CHAT_ID, hosted_contents=False
+    )
+    assert [item["name"] for item in result["value"]] == ["report.pdf"]
+    assert result["value"][0]["path"] == str(tmp_path / "report (2).pdf")
+    assert (tmp_path / "report.pdf").read_bytes() == b"mine"
+    app.download_message_files(
+        "m1", str(tmp_path), chat_id=CHAT_ID, hosted_contents=False, overwrite=True
+    )
+    assert (tmp_path / "report.pdf").read_bytes() == REPORT
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "report (2).pdf",
+        "report.pdf",
+    ]
+
+
+def test_message_needs_a_conversation(tmp_path):
+    with pytest.raises(ValueError):
+        make_app(FileGraph()).download_message_files("m1", str(tmp_path))
@@ -0,0 +1,130 @@
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+from mock_graph import CHANNEL_ID, CHAT_ID, TEAM_ID
+from universal_mcp.exceptions import KeyNotFoundError
+from universal_mcp.stores import MemoryStore
+
+from universal_mcp_ms_teams.app import MsTeamsApp
+from universal_mcp_ms_teams.idempotency import IdempotencyKeys
+from universal_mcp_ms_teams.throttling import ThrottleScheduler
+
+URL = f"https://graph.microsoft.com/v1.0/chats/{CHAT_ID}/messages"
+
+
+def make_app(handler, store=None):
+    integration = MagicMock()
+    integration.get_credentials.return_value = {"access_token": "dummy_access_token"}
+    app = MsTeamsApp(
+        integration=integration,
+        throttle=ThrottleScheduler(sleep=lambda delay: None),
+        idempotency_store=store,
+    )
+    app._client = httpx.Client(transport=httpx.MockTransport(handler))
+    return app
+
+
+class Graph:
+    """Chat that accepts posts but fails the first `failures` of them in the given way."""
+
+    def __init__(self, failures=0, failure="timeout"):
+        self.failures = failures
+        self.failure = failure
+        self.posts = 0
+        self.messages = []
+
+    def __call__(self, request):
+        if request.method == "GET":
+            return httpx.Response(200, json={"value": list(reversed(self.messages))})
+        self.posts += 1
+        message = {
+            "id": f"m{len(self.messages) + 1}",
+            "createdDateTime": "2099-01-01T00:00:00Z",
+            "body": {"contentType": "text", "content": "hi"},
+        }
+        if self.failure == "lost" or self.posts > self.failures:
+            self.messages.append(message)
+        if self.posts <= self.failures:
+            if self.failure == "503":
+                return httpx.Response(503)
+            raise httpx.ReadTimeout("timed out", request=request)
+        return httpx.Response(201, json=message)
+
+
+def test_retry_with_same_key_returns_original_message():
+    graph = Graph()
+    app = make_app(graph)
+    first = app.send_chat_message(CHAT_ID, "hi", idempotency_key="k1")
+    again = app.send_chat_message(CHAT_ID, "hi", idempotency_key="k1")
+    assert first == again
+    assert graph.posts == 1
+    app.send_chat_message(CHAT_ID, "hi")
+    assert graph.posts == 2
+
+
+def test_timed_out_post_that_landed_is_not_reposted():
+    graph = Graph(failures=1, failure="lost")
+    app = make_app(graph)
+    message = app.send_chat_message(CHAT_ID, "hi", idempotency_key="k1")
+    assert message["id"] == "m1"
+    assert graph.posts == 1
+
+
+def test_timed_out_post_that_did_not_land_is_reposted():
+    graph = Graph(failures=2, failure="503")
+    app = make_app(graph)
+    assert (
+        app.send_channel_message(TEAM_ID, CHANNEL_ID, "hi", idempotency_key="k1")["id"]
+        == "m1"
+    )
+    assert graph.posts == 3
+
+
+def test_unresolved_key_is_probed_on_next_call():
+    graph = Graph(failures=10, failure="timeout")
+    app = make_app(graph)
+    app.throttle.retry.max_retries = 0
+    with pytest.raises(httpx.ReadTimeout):
+        app.send_chat_message(CHAT_ID, "hi", idempotency_key="k1")
+    assert app.idempotency.get("k1")["state"] == "pending"
+    graph.messages.append(
+        {
+            "id": "late",
+            "createdDateTime": "2099-01-01T00:00:00Z",
+            "body": {"content": "hi"},
+        }
+    )
+    assert app.send_chat_message(CHAT_ID, "hi", idempotency_key="k1")["id"] == "late"
+    assert graph.posts == 1
+
+
+def test_rejected_post_releases_the_key():
+    app = make_app(
+        lambda request: httpx.Response(403, json={"error": {"code": "Forbidden"}})
+    )
+    with pytest.raises(httpx.HTTPStatusError):
+        app.send_chat_message(CHAT_ID, "hi", idempotency_key="k1")
+    assert app.idempotency.get("k1") is None
+
+
+def test_key_reused_for_different_message_is_rejected():
+    app = make_app(Graph())
+    app.send_chat_message(CHAT_ID, "hi", idempotency_key="k1")
+    with pytest.raises(ValueError):
+        app.send_chat_message(CHAT_ID, "other", idempotency_key="k1")
+
+
+def test_keys_expire():
+    now = [0.0]
+    store = MemoryStore()
+    keys = IdempotencyKeys(store, ttl=10, clock=lambda: now[0])
+    keys.complete("a", "f", {"id": "1"})
+    now[0] = 5
+    keys.complete("b", "f", {"id": "2"})
+    assert keys.get("a")["result"] == {"id": "1"}
+    now[0] = 12
+    keys.complete("c", "f", {"id": "3"})
+    with pytest.raises(KeyNotFoundError):
+        store.get("ms-teams-idempotency:a")
+    assert keys.get("b") is not None
@@ -0,0 +1,107 @@
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+from mock_graph import MockGraph
+
+from universal_mcp_ms_teams.app import MsTeamsApp
+from universal_mcp_ms_teams.instrumentation import (
+    Histogram,
+    InMemorySink,
+    Instrumentation,
+    PrometheusSink,
+    Sink,
+)
+from universal_mcp_ms_teams.throttling import ThrottleScheduler
+
+
+def make_app(graph, *sinks):
+    integration = MagicMock()
+    integration.get_credentials.return_value = {"access_token": "dummy_access_token"}
+    instrumentation = Instrumentation(*sinks) if sinks else None
+    app = MsTeamsApp(
+        integration=integration,
+        throttle=ThrottleScheduler(sleep=lambda delay: None),
+        instrumentation=instrumentation,
+    )
+    app._client = httpx.Client(transport=graph.transport())
+    return app
+
+
+def tool(app, name):
+    return next(tool for tool in app.list_tools() if tool.__name__ == name)
+
+
+def test_tools_are_not_wrapped_without_instrumentation():
+    app = make_app(MockGraph())
+    assert app.list_tools()[0] == app.list_chats
+
+
+def test_records_tool_and_request_metrics():
+    graph = MockGraph(collection_size=45, throttle_every=2)
+    sink = InMemorySink()
+    app = make_app(graph, sink)
+    list_chats = tool(app, "list_chats")
+    assert list_chats.__name__ == "list_chats"
+    assert len(list_chats(top=20, all=True)["value"]) == 45
+    snapshot = sink.snapshot()
+    assert snapshot["tools"]["list_chats"]["calls"] == 1
+    assert snapshot["tools"]["list_chats"]["requests"] == 3
+    assert snapshot["tools"]["list_chats"]["retries"] == graph.throttled
+    endpoint = snapshot["requests"]["list_chats GET chats"]
+    assert endpoint["requests"] == 3
+    assert endpoint["attempts"] == 3 + graph.throttled
+    assert endpoint["statuses"] == {"200": 3}
+    assert endpoint["response_bytes"] == graph.bytes_sent - graph.throttled * len(
+        b'{"error": {"code": "TooManyRequests"}}'
+    )
+
+
+def test_failed_tool_is_reported_and_reraised():
+    class Recorder(Sink):
+        def __init__(self):
+            self.events = []
+
+        def tool_started(self, tool):
+            return "handle"
+
+        def tool_finished(self, event, handle):
+            self.events.append((event, handle))
+
+    recorder = Recorder()
+    app = make_app(MockGraph(), recorder)
+    with pytest.raises(ValueError):
+        tool(app, "list_chats")(all=True, max_items=-1)
+    event, handle = recorder.events[0]
+    assert handle == "handle"
+    assert not event.ok and event.error == "ValueError"
+
+
+def test_histogram_quantiles():
+    histogram = Histogram((0.1, 1.0))
+    for value in (0.05, 0.05, 0.5, 2.0):
+        histogram.observe(value)
+    assert histogram.counts == [2, 1, 1]
+    assert histogram.quantile(0.5) == 0.1
+    assert histogram.quantile(0.75) == 1.0
+    assert histogram.quantile(1.0) == 2.0
+
+
+def test_prometheus_rendering_and_endpoint():
+    sink = PrometheusSink()
+    app = make_app(MockGraph(), sink)
+    tool(app, "get_chat")(chat_id="c1")
+    text = sink.render()
+    assert 'ms_teams_tool_calls_total{tool="get_chat",outcome="ok"} 1' in text
+    assert (
+        'ms_teams_graph_requests_total{tool="get_chat",method="GET",resource="chats",status="200"} 1'
+        in text
+    )
+    assert 'ms_teams_tool_duration_seconds_bucket{tool="get_chat",le="+Inf"} 1' in text
+    server = sink.serve(port=0)
+    try:
+        response = httpx.get(f"http://127.0.0.1:{server.server_address[1]}/metrics")
+        assert response.status_code == 200
+        assert response.text == sink.render()
+    finally:
+        server.shutdown()
@@ -0,0 +1,98 @@
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from universal_mcp_ms_teams.app import MsTeamsApp
+from universal_mcp_ms_teams.message_index import MessageIndex
+
+
+def message(id, content, modified="2024-01-01T00:00:00Z", **extra):
+    return {
+        "id": id,
+        "createdDateTime": "2024-01-01T00:00:00Z",
+        "lastModifiedDateTime": modified,
+        "from": {"user": {"displayName": "Ada Lovelace"}},
+        "body": {"contentType": "html", "content": content},
+        **extra,
+    }
+
+
+def test_search_ranks_and_scopes_hits(tmp_path):
+    index = MessageIndex(tmp_path / "index.db")
+    index.add(
+        [
+            message("1", "<p>quarterly <b>budget</b> review</p>"),
+            message("2", "budget budget budget"),
+        ],
+        chat_id="c1",
+    )
+    index.add([message("3", "budget for the offsite")], team_id="t1", channel_id="ch1")
+    hits = index.search("budget")
+    assert [hit["message_id"] for hit in hits][0] == "2"
+    assert {hit["message_id"] for hit in hits} == {"1", "2", "3"}
+    assert (
+        index.search("quarterly review")[0]["snippet"] == "[quarterly] budget [review]"
+    )
+    assert [hit["message_id"] for hit in index.search("budget", channel_id="ch1")] == [
+        "3"
+    ]
+    assert index.search("lovelace", chat_id="c1")[0]["sender"] == "Ada Lovelace"
+    assert index.search('"unbalanced') == []
+
+
+def test_updates_and_deletions_are_incremental():
+    index = MessageIndex()
+    assert index.add([message("1", "draft")], chat_id="c1") == 1
+    assert index.add([message("1", "draft")], chat_id="c1") == 0
+    assert (
+        index.add(
+            [message("1", "final", modified="2024-01-02T00:00:00Z")], chat_id="c1"
+        )
+        == 1
+    )
+    assert index.search("draft") == []
+    assert index.search("final")[0]["message_id"] == "1"
+    index.add([{"id": "1", "@removed": {"reason": "deleted"}}], chat_id="c1")
+    assert index.count() == 0
+
+
+def make_app(index):
+    pages = {
+        "/v1.0/chats/c1/messages": {
+            "value": [message("1", "launch plan")],
+            "@odata.nextLink": "https://graph.microsoft.com/v1.0/chats/c1/messages?page=2",
+        },
+        "/v1.0/chats/c1/messages/1/replies": {
+            "value": [message("2", "launch moved", replyToId="1")]
+        },
+    }
+
+    def handler(request):
+        if request.url.params.get("page") == "2":
+            return httpx.Response(200, json={"value": [message("3", "launch retro")]})
+        return httpx.Response(200, json=pages[request.url.path])
+
+    integration = MagicMock()
+    integration.get_credentials.return_value = {"access_token": "dummy_access_token"}
+    app = MsTeamsApp(integration=integration, index=index)
+    app._client = httpx.Client(transport=httpx.MockTransport(handler))
+    return app
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_fetched_messages_feed_the_index(stream):
+    app = make_app(MessageIndex())
+    app.list_chat_messages(chat_id="c1", all=True, stream=stream, profile="minimal")
+    app.read_chat_replies(chat_id="c1", chatMessage_id="1")
+    hits = app.search_local_messages("launch")["value"]
+    assert {hit["message_id"] for hit in hits} == {"1", "2", "3"}
+    assert next(hit for hit in hits if hit["message_id"] == "2")["reply_to_id"] == "1"
+    assert app.search_local_messages in [tool for tool in app.list_tools()]
+
+
+def test_search_tool_requires_an_index():
+    app = make_app(None)
+    assert "search_local_messages" not in [tool.__name__ for tool in app.list_tools()]
+    with pytest.raises(ValueError):
+        app.search_local_messages("launch")
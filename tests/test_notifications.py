@@ -0,0 +1,282 @@
+import asyncio
+import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+from mock_graph import CHANNEL_ID, CHAT_ID, TEAM_ID
+from notification_simulator import NotificationSimulator, encrypt
+
+from universal_mcp_ms_teams.app import MsTeamsApp
+from universal_mcp_ms_teams.notifications import (
+    SUBSCRIPTION_REMOVED,
+    NotificationDecryptor,
+    NotificationReceiver,
+    SubscriptionManager,
+)
+
+SECRET = "client-state-secret"
+MESSAGE = {"id": "1700000000000", "body": {"contentType": "text", "content": "hello"}}
+
+
+def make_app(simulator):
+    integration = MagicMock()
+    integration.get_credentials.return_value = {"access_token": "dummy_access_token"}
+    app = MsTeamsApp(integration=integration)
+    app._client = httpx.Client(transport=simulator.transport())
+    return app
+
+
+def make_decryptor(certificate_id="cert-1"):
+    pytest.importorskip("cryptography")
+    from cryptography import x509  # noqa: PLC0415
+    from cryptography.hazmat.primitives import hashes, serialization  # noqa: PLC0415
+    from cryptography.hazmat.primitives.asymmetric import rsa  # noqa: PLC0415
+    from cryptography.x509.oid import NameOID  # noqa: PLC0415
+
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "notifications")])
+    now = datetime.datetime.now(datetime.UTC)
+    certificate = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(1)
+        .not_valid_before(now)
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .sign(key, hashes.SHA256())
+    )
+    key_pem = key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+    return NotificationDecryptor(
+        key_pem, certificate.public_bytes(serialization.Encoding.PEM), certificate_id
+    )
+
+
+def serve(receiver):
+    server = receiver.serve()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/notifications"
+
+
+def test_subscribe_validates_and_notifications_reach_the_queue():
+    async def main():
+        simulator = NotificationSimulator()
+        receiver = NotificationReceiver(SECRET)
+        server, url = serve(receiver)
+        try:
+            manager = SubscriptionManager(
+                make_app(simulator), url, SECRET, change_type="created"
+            )
+            subscription = await asyncio.to_thread(manager.subscribe_chat, CHAT_ID)
+            assert subscription.resource == f"/chats/{CHAT_ID}/messages"
+            assert (
+                await asyncio.to_thread(simulator.notify, subscription.id, MESSAGE)
+            ).status_code == 202
+            event = await asyncio.wait_for(receiver.get(), 5)
+        finally:
+            server.shutdown()
+        return subscription, event
+
+    subscription, event = asyncio.run(main())
+    assert event.subscription_id == subscription.id
+    assert event.change_type == "created"
+    assert event.resource_data["id"] == MESSAGE["id"]
+    assert event.message is None
+
+
+def test_subscribe_fails_when_the_receiver_does_not_validate():
+    simulator = NotificationSimulator()
+    manager = SubscriptionManager(
+        make_app(simulator), "http://127.0.0.1:9/notifications", SECRET
+    )
+    with pytest.raises(httpx.HTTPStatusError):
+        manager.subscribe_chat(CHAT_ID)
+    assert manager.subscriptions == {}
+
+
+def test_resource_data_is_decrypted():
+    decryptor = make_decryptor()
+
+    async def main():
+        simulator = NotificationSimulator()
+        receiver = NotificationReceiver(SECRET, decryptor=decryptor)
+        server, url = serve(receiver)
+        try:
+            manager = SubscriptionManager(
+                make_app(simulator), url, SECRET, decryptor=decryptor
+            )
+            subscription = await asyncio.to_thread(
+                manager.subscribe_channel, TEAM_ID, CHANNEL_ID
+            )
+            await asyncio.to_thread(simulator.notify, subscription.id, MESSAGE)
+            return simulator, subscription, await asyncio.wait_for(receiver.get(), 5)
+        finally:
+            server.shutdown()
+
+    simulator, subscription, event = asyncio.run(main())
+    assert simulator.subscriptions[subscription.id]["includeResourceData"] is True
+    assert subscription.resource == f"/teams/{TEAM_ID}/channels/{CHANNEL_ID}/messages"
+    assert event.message == MESSAGE
+
+
+def test_tampered_or_foreign_notifications_are_rejected():
+    decryptor = make_decryptor()
+    receiver = NotificationReceiver(SECRET, decryptor=decryptor)
+    receiver.attach(asyncio.new_event_loop())
+    foreign = encrypt(MESSAGE, make_decryptor("cert-2").certificate, "cert-2")
+    tampered = encrypt(MESSAGE, decryptor.certificate, "cert-1")
+    tampered["dataSignature"] = foreign["dataSignature"]
+    notifications = [
+        {"subscriptionId": "s1", "clientState": "wrong", "changeType": "created"},
+        {
+            "subscriptionId": "s1",
+            "clientState": SECRET,
+            "changeType": "created",
+            "encryptedContent": foreign,
+        },
+        {
+            "subscriptionId": "s1",
+            "clientState": SECRET,
+            "changeType": "created",
+            "encryptedContent": tampered,
+        },
+    ]
+    status, _, _ = receiver.handle(
+        "", httpx.Request("POST", "/", json={"value": notifications}).read()
+    )
+    assert status == 202
+    assert receiver.stats == {
+        "received": 3,
+        "delivered": 0,
+        "rejected": 3,
+        "dropped": 0,
+        "queued": 0,
+    }
+
+
+def test_full_queue_pushes_back():
+    receiver = NotificationReceiver(SECRET, max_queue=1)
+    loop = asyncio.new_event_loop()
+    receiver.attach(loop)
+    body = httpx.Request(
+        "POST",
+        "/",
+        json={"value": [{"subscriptionId": "s1", "clientState": SECRET}] * 2},
+    ).read()
+    assert receiver.handle("", body)[0] == 503
+    assert receiver.handle("validationToken=abc%20def", b"") == (
+        200,
+        "text/plain",
+        b"abc def",
+    )
+    loop.close()
+
+
+def test_concurrent_posts_never_overfill_the_queue():
+    receiver = NotificationReceiver(SECRET, max_queue=5)
+    # The loop is not running, so accepted events stay scheduled until it runs.
+    loop = asyncio.new_event_loop()
+    receiver.attach(loop)
+    body = httpx.Request(
+        "POST", "/", json={"value": [{"subscriptionId": "s1", "clientState": SECRET}]}
+    ).read()
+    with ThreadPoolExecutor(max_workers=10) as pool:
+        statuses = list(pool.map(lambda _: receiver.handle("", body)[0], range(10)))
+    assert sorted(statuses) == [202] * 5 + [503] * 5
+    loop.run_until_complete(asyncio.sleep(0))
+    assert receiver.stats == {
+        "received": 10,
+        "delivered": 5,
+        "rejected": 0,
+        "dropped": 5,
+        "queued": 5,
+    }
+    loop.close()
+
+
+def test_lifecycle_events_of_a_rejected_batch_are_not_handled():
+    handled = []
+    receiver = NotificationReceiver(SECRET, max_queue=1)
+    receiver.on_lifecycle = handled.append
+    loop = asyncio.new_event_loop()
+    receiver.attach(loop)
+    body = httpx.Request(
+        "POST",
+        "/",
+        json={
+            "value": [
+                {
+                    "subscriptionId": "s1",
+                    "clientState": SECRET,
+                    "lifecycleEvent": SUBSCRIPTION_REMOVED,
+                }
+            ]
+            * 2
+        },
+    ).read()
+    assert receiver.handle("", body)[0] == 503
+    time.sleep(0.05)
+    assert handled == []
+    loop.close()
+
+
+def test_subscriptions_are_renewed_before_they_expire():
+    clock = [time.time()]
+    simulator = NotificationSimulator(clock=lambda: clock[0])
+    receiver = NotificationReceiver(SECRET)
+    receiver.attach(asyncio.new_event_loop())
+    server, url = serve(receiver)
+    try:
+        manager = SubscriptionManager(
+            make_app(simulator),
+            url,
+            SECRET,
+            lifetime=3600,
+            renew_margin=900,
+            clock=lambda: clock[0],
+        )
+        subscription = manager.subscribe_chat(CHAT_ID)
+        first_expiry = subscription.expires_at
+        assert manager.renew_due() == []
+        clock[0] += 2800
+        assert manager.renew_due() == [subscription]
+        assert subscription.expires_at > first_expiry
+        # A subscription Graph dropped is created again on its next renewal.
+        simulator.remove(subscription.id)
+        clock[0] += 2800
+        [renewed] = manager.renew_due()
+        assert renewed.id != subscription.id and renewed.id in simulator.subscriptions
+        assert list(manager.subscriptions) == [renewed.id]
+        manager.close()
+        assert simulator.subscriptions == {}
+    finally:
+        server.shutdown()
+
+
+def test_subscription_removed_lifecycle_event_resubscribes():
+    simulator = NotificationSimulator()
+    receiver = NotificationReceiver(SECRET)
+    receiver.attach(asyncio.new_event_loop())
+    server, url = serve(receiver)
+    try:
+        manager = SubscriptionManager(make_app(simulator), url, SECRET)
+        receiver.on_lifecycle = manager.handle_lifecycle
+        subscription = manager.subscribe_chat(CHAT_ID)
+        simulator.lifecycle(subscription.id, SUBSCRIPTION_REMOVED)
+        deadline = time.monotonic() + 5
+        while (
+            subscription.id in manager.subscriptions or not manager.subscriptions
+        ) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert (
+            list(manager.subscriptions) == list(simulator.subscriptions)
+            and subscription.id not in manager.subscriptions
+        )
+    finally:
+        server.shutdown()
@@ -0,0 +1,86 @@
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from universal_mcp_ms_teams.app import MsTeamsApp
+from universal_mcp_ms_teams.pagination import NEXT_LINK, PageIterator
+
+
+def make_fetch(pages):
+    calls = []
+
+    def fetch(url, params):
+        calls.append((url, params))
+        return pages[url]
+
+    return fetch, calls
+
+
+PAGES = {
+    "p1": {"value": [1, 2, 3], NEXT_LINK: "p2"},
+    "p2": {"value": [4, 5, 6], NEXT_LINK: "p3"},
+    "p3": {"value": [7]},
+}
+
+
+def test_follows_next_link_lazily():
+    fetch, calls = make_fetch(PAGES)
+    iterator = iter(PageIterator(fetch, "p1", {"$top": 3}))
+    assert next(iterator) == 1
+    assert calls == [("p1", {"$top": 3})]
+    assert list(iterator) == [2, 3, 4, 5, 6, 7]
+    assert calls == [("p1", {"$top": 3}), ("p2", None), ("p3", None)]
+
+
+def test_max_pages_reports_resume_link():
+    fetch, _ = make_fetch(PAGES)
+    result = PageIterator(fetch, "p1", max_pages=2).collect()
+    assert result == {"value": [1, 2, 3, 4, 5, 6], "truncated": True, NEXT_LINK: "p3"}
+
+
+def test_max_items_mid_page_has_no_resume_link():
+    fetch, calls = make_fetch(PAGES)
+    result = PageIterator(fetch, "p1", max_items=4).collect()
+    # Cut off mid-page: no resume link, but the caller still learns the result is
+    # partial.
+    assert result == {"value": [1, 2, 3, 4], "truncated": True}
+    assert len(calls) == 2
+
+
+def test_budget_reaching_the_end_is_not_truncated():
+    fetch, _ = make_fetch(PAGES)
+    assert PageIterator(fetch, "p1", max_items=7).collect() == {
+        "value": [1, 2, 3, 4, 5, 6, 7]
+    }
+
+
+def test_max_items_zero_fetches_nothing():
+    fetch, calls = make_fetch(PAGES)
+    assert PageIterator(fetch, "p1", max_items=0).collect() == {"value": []}
+    assert calls == []
+
+
+def test_invalid_budget():
+    with pytest.raises(ValueError):
+        PageIterator(lambda url, params: {}, "p1", max_pages=0)
+
+
+def test_list_chat_messages_all_pages():
+    app = MsTeamsApp(integration=MagicMock())
+    base = f"{app.base_url}/chats/c1/messages"
+    responses = {
+        base: {"value": [{"id": "1"}], NEXT_LINK: f"{base}?$skiptoken=x"},
+        f"{base}?$skiptoken=x": {"value": [{"id": "2"}]},
+    }
+    request = httpx.Request("GET", base)
+    app._get = MagicMock(
+        side_effect=lambda url, params=None: httpx.Response(
+            200, json=responses[url], request=request
+        )
+    )
+
+    assert app.list_chat_messages("c1", top=1, all=True) == {
+        "value": [{"id": "1"}, {"id": "2"}]
+    }
+    assert [item["id"] for item in app.iter_chat_messages("c1", max_items=1)] == ["1"]
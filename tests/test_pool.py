@@ -0,0 +1,166 @@
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+from mock_graph import CHAT_ID, MockGraph
+
+from universal_mcp_ms_teams.app import MsTeamsApp
+from universal_mcp_ms_teams.async_app import AsyncMsTeamsApp
+from universal_mcp_ms_teams.pool import AppPool
+
+
+def make_pool(graph=None, **kwargs):
+    graph = graph or MockGraph()
+
+    def factory(tenant):
+        integration = MagicMock()
+        integration.get_credentials.return_value = {
+            "access_token": f"token-of-{tenant}"
+        }
+        app = MsTeamsApp(integration=integration)
+        app._client = httpx.Client(transport=graph.transport())
+        return app
+
+    return AppPool(factory, **kwargs)
+
+
+def wait_until(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.005)
+    assert condition()
+
+
+def test_apps_are_kept_per_tenant_and_share_one_client():
+    pool = make_pool()
+    with pool.lease("alice") as alice:
+        pass
+    assert pool.call("alice", "get_chat", CHAT_ID)["id"] == CHAT_ID
+    with pool.lease("alice") as again, pool.lease("bob") as bob:
+        assert again is alice and bob is not alice
+        assert alice.client is bob.client is pool.client
+    assert pool.stats["created"] == 2 and len(pool) == 2
+
+
+def test_least_recently_used_idle_app_is_evicted():
+    pool = make_pool(max_apps=2)
+    apps = {}
+    for tenant in ("alice", "bob", "alice", "carol"):
+        with pool.lease(tenant) as app:
+            apps[tenant] = app
+    assert len(pool) == 2 and pool.stats["evicted"] == 1
+    with pool.lease("alice") as app:
+        assert app is apps["alice"]
+    # The evicted app let go of the shared client instead of closing it.
+    assert apps["bob"]._client is None and not pool.client.is_closed
+
+
+def test_tenant_concurrency_is_capped():
+    pool = make_pool(tenant_concurrency=2)
+    active, peak, lock = [0], [0], threading.Lock()
+
+    def call():
+        with pool.lease("noisy"):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.02)
+            with lock:
+                active[0] -= 1
+
+    threads = [threading.Thread(target=call) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert peak[0] == 2
+    assert pool.stats["queued"] >= 4
+
+
+def test_a_noisy_tenant_does_not_starve_others():
+    pool = make_pool(max_concurrency=1)
+    order = []
+
+    def call(tenant):
+        with pool.lease(tenant):
+            order.append(tenant)
+
+    with pool.lease("noisy"):
+        threads = [threading.Thread(target=call, args=("noisy",)) for _ in range(10)]
+        for thread in threads:
+            thread.start()
+        wait_until(lambda: pool.stats["waiting"] == 10)
+        threads.append(threading.Thread(target=call, args=("quiet",)))
+        threads[-1].start()
+        wait_until(lambda: pool.stats["waiting"] == 11)
+    for thread in threads:
+        thread.join()
+    assert order.index("quiet") <= 1
+
+
+def test_waiting_for_a_slot_times_out():
+    pool = make_pool(max_concurrency=1)
+    with pool.lease("alice"):
+        with pytest.raises(TimeoutError):
+            with pool.lease("bob", timeout=0.05):
+                pass
+    assert pool.stats["abandoned"] == 1 and pool.stats["waiting"] == 0
+    with pool.lease("bob", timeout=1):
+        pass
+
+
+def test_async_leases_return_slots_of_cancelled_waiters():
+    pool = make_pool(max_concurrency=1)
+
+    async def main():
+        release = asyncio.Event()
+
+        async def hold():
+            async with pool.alease("alice"):
+                await release.wait()
+
+        holder = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(pool.acall("bob", "get_chat", CHAT_ID))
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        release.set()
+        await holder
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        return await pool.acall("bob", "get_chat", CHAT_ID, timeout=1)
+
+    assert asyncio.run(main())["id"] == CHAT_ID
+    assert pool.stats["active"] == 0
+
+
+def test_async_apps_share_one_bounded_executor():
+    graph = MockGraph()
+
+    def factory(tenant):
+        integration = MagicMock()
+        integration.get_credentials.return_value = {
+            "access_token": f"token-of-{tenant}"
+        }
+        app = AsyncMsTeamsApp(integration=integration, http2=False)
+        app._async_client = httpx.AsyncClient(transport=graph.async_transport())
+        return app
+
+    pool = AppPool(factory, max_apps=1, max_concurrency=3)
+
+    async def main():
+        first = await pool.acall("alice", "get_chat", CHAT_ID)
+        second = await pool.acall("bob", "get_chat", CHAT_ID)
+        return first, second
+
+    assert [chat["id"] for chat in asyncio.run(main())] == [CHAT_ID, CHAT_ID]
+    assert pool.stats["evicted"] == 1 and pool.executor._max_workers == 3
+    # Evicting alice's app left the executor bob's app still uses running.
+    with pool.lease("bob") as bob:
+        assert bob.executor is pool.executor
+        assert bob.executor.submit(lambda: "still running").result() == "still running"
+    pool.close()
+    assert pool.executor is None
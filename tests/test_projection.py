@@ -0,0 +1,109 @@
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+from mock_graph import MockGraph
+
+from universal_mcp_ms_teams.app import MsTeamsApp
+from universal_mcp_ms_teams.projection import (
+    html_to_text,
+    projection_for,
+    strip_annotations,
+)
+
+
+def make_app(graph, **kwargs):
+    integration = MagicMock()
+    integration.get_credentials.return_value = {"access_token": "dummy_access_token"}
+    app = MsTeamsApp(integration=integration, **kwargs)
+    app._client = httpx.Client(transport=graph.transport())
+    return app
+
+
+def test_full_profile_leaves_requests_and_responses_untouched():
+    graph = MockGraph(collection_size=2)
+    page = make_app(graph).list_chat_messages(chat_id="c1")
+    assert page["value"][0]["@odata.etag"] == 'W/"0"'
+    assert "reactions" in page["value"][0]
+    assert graph.paths == [("GET", "/v1.0/chats/c1/messages")]
+
+
+def test_minimal_messages_are_trimmed_client_side():
+    graph = MockGraph(collection_size=45, message_bytes=8)
+    page = make_app(graph).list_chat_messages(chat_id="c1", profile="minimal", all=True)
+    assert len(page["value"]) == 45
+    assert page["value"][0] == {
+        "id": "0",
+        "createdDateTime": "2024-01-01T00:00:00Z",
+        "from": {"user": {"id": "u1", "displayName": "Someone"}},
+        "body": {"contentType": "text", "content": "xxxxxxxx"},
+    }
+
+
+def test_server_side_select_for_chats_and_app_default_profile():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(
+            200,
+            json={
+                "@odata.context": "ctx",
+                "@odata.nextLink": "next",
+                "value": [
+                    {"id": "1", "topic": None, "chatType": "group", "webUrl": "u"}
+                ],
+            },
+        )
+
+    integration = MagicMock()
+    integration.get_credentials.return_value = {"access_token": "dummy_access_token"}
+    app = MsTeamsApp(integration=integration, projection="summary")
+    app._client = httpx.Client(transport=httpx.MockTransport(handler))
+    page = app.list_chats()
+    assert (
+        requests[0].url.params["$select"]
+        == "id,topic,chatType,createdDateTime,lastUpdatedDateTime,webUrl"
+    )
+    assert page == {
+        "@odata.nextLink": "next",
+        "value": [{"id": "1", "chatType": "group", "webUrl": "u"}],
+    }
+    app.list_chats(select=["topic"], profile="minimal")
+    assert requests[1].url.params["$select"] == "topic"
+
+
+def test_explicit_select_is_not_pruned():
+    projection = projection_for("chatMessage", "summary", select=["id", "etag"])
+    assert projection.select(["id", "etag"]) == ["id", "etag"]
+    assert projection.apply({"id": "1", "etag": "2", "@odata.etag": "3"}) == {
+        "id": "1",
+        "etag": "2",
+    }
+
+
+def test_app_installations_expand_their_definition():
+    projection = projection_for("teamsAppInstallation", "minimal")
+    assert (
+        projection.expand(None) == "teamsAppDefinition($select=teamsAppId,displayName)"
+    )
+    assert projection.apply(
+        {"id": "1", "teamsAppDefinition": {"displayName": "App"}, "teamsApp": {}}
+    ) == {"id": "1", "teamsAppDefinition": {"displayName": "App"}}
+
+
+def test_unknown_profile_is_rejected():
+    with pytest.raises(ValueError):
+        projection_for("chat", "tiny")
+    with pytest.raises(ValueError):
+        MsTeamsApp(integration=MagicMock(), projection="tiny")
+
+
+def test_helpers():
+    assert (
+        html_to_text("<p>Hi &amp; bye</p><p>next<br/>line</p>")
+        == "Hi & bye\nnext\nline"
+    )
+    assert strip_annotations(
+        {"a@odata.type": "t", "b": [{"@odata.type": "x", "c": None, "d": 1}]}
+    ) == {"b": [{"d": 1}]}
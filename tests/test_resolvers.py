@@ -0,0 +1,255 @@
+import json
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+from mock_graph import CHANNEL_ID, CHAT_ID, TEAM_ID
+
+from universal_mcp_ms_teams.app import MsTeamsApp
+from universal_mcp_ms_teams.broadcast import PostLimiter
+from universal_mcp_ms_teams.resolvers import is_id
+from universal_mcp_ms_teams.topology import NameIndex
+
+ENGINEERING = "11111111-1111-4111-8111-111111111111"
+MARKETING = "22222222-2222-4222-8222-222222222222"
+GENERAL = "19:general@thread.tacv2"
+RELEASES = "19:releases@thread.tacv2"
+LAUNCH_CHAT = "19:launch@thread.v2"
+WIKI_TAB = "33333333-3333-4333-8333-333333333333"
+ADA = "44444444-4444-4444-8444-444444444444"
+
+
+class Graph:
+    def __init__(self) -> None:
+        self.requests: list[tuple[str, str]] = []
+        self.bodies: list[dict] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path.removeprefix("/v1.0/")
+        self.requests.append((request.method, path))
+        if request.method != "GET":
+            body = json.loads(request.content) if request.content else None
+            self.bodies.append(body)
+            if path == "$batch":
+                return httpx.Response(
+                    200,
+                    json={
+                        "responses": [
+                            {"id": sub["id"], "status": 201, "body": {"id": "m1"}}
+                            for sub in body["requests"]
+                        ]
+                    },
+                )
+            return httpx.Response(201, json={"id": "created"})
+        if path == "me/joinedTeams":
+            return httpx.Response(
+                200,
+                json={
+                    "value": [
+                        {"id": ENGINEERING, "displayName": "Engineering"},
+                        {"id": MARKETING, "displayName": "Marketing"},
+                    ]
+                },
+            )
+        if path == "chats":
+            return httpx.Response(
+                200,
+                json={
+                    "value": [
+                        {"id": LAUNCH_CHAT, "topic": "Product launch"},
+                        {"id": "19:review@thread.v2", "topic": "Design review"},
+                    ]
+                },
+            )
+        if path.endswith("/channels"):
+            return httpx.Response(
+                200,
+                json={
+                    "value": [
+                        {"id": GENERAL, "displayName": "General"},
+                        {"id": RELEASES, "displayName": "Releases"},
+                    ]
+                },
+            )
+        if path.endswith("/primaryChannel"):
+            return httpx.Response(200, json={"id": GENERAL})
+        if path.endswith("/tabs"):
+            return httpx.Response(
+                200, json={"value": [{"id": WIKI_TAB, "displayName": "Team Wiki"}]}
+            )
+        if path == "users/ada@example.com":
+            return httpx.Response(200, json={"id": ADA})
+        if path.startswith("users/"):
+            return httpx.Response(
+                404, json={"error": {"code": "Request_ResourceNotFound"}}
+            )
+        if path == "users":
+            return httpx.Response(
+                200, json={"value": [{"id": ADA, "displayName": "Ada Lovelace"}]}
+            )
+        return httpx.Response(404, json={"error": {"code": "NotFound"}})
+
+    def writes(self) -> list[tuple[str, str]]:
+        return [request for request in self.requests if request[0] != "GET"]
+
+
+def make_app(graph):
+    integration = MagicMock()
+    integration.get_credentials.return_value = {"access_token": "dummy_access_token"}
+    app = MsTeamsApp(integration=integration)
+    app.post_limiter = PostLimiter(sleep=lambda delay: None)
+    app._client = httpx.Client(transport=httpx.MockTransport(graph))
+    return app
+
+
+def test_is_id():
+    assert (
+        is_id(TEAM_ID)
+        and is_id(CHANNEL_ID)
+        and is_id(CHAT_ID)
+        and is_id("19:a_b@unq.gbl.spaces")
+    )
+    assert not is_id("Engineering") and not is_id("c1")
+
+
+def test_name_index_matches_exactly_then_fuzzily():
+    index = NameIndex({"a": "Release Planning", "b": "Releases", "c": "Design"})
+    assert index.match("release  planning") == ["a"]
+    assert index.match("Relase Planning") == ["a"]
+    assert index.match("desig") == ["c"]
+    assert index.match("Finance") == []
+    assert NameIndex({"a": "Sales EMEA", "b": "Sales APAC"}).match("sales") == [
+        "b",
+        "a",
+    ]
+
+
+def test_ids_are_passed_through_without_lookups():
+    graph = Graph()
+    make_app(graph).send_channel_message(TEAM_ID, CHANNEL_ID, "hi")
+    assert graph.requests == [
+        ("POST", f"teams/{TEAM_ID}/channels/{CHANNEL_ID}/messages")
+    ]
+
+
+def test_channel_message_by_team_and_channel_name():
+    graph = Graph()
+    app = make_app(graph)
+    app.send_channel_message("engineering", " releases", "hi")
+    app.send_channel_message("Engineering", "General", "again")
+    assert graph.writes() == [
+        ("POST", f"teams/{ENGINEERING}/channels/{RELEASES}/messages"),
+        ("POST", f"teams/{ENGINEERING}/channels/{GENERAL}/messages"),
+    ]
+    assert graph.requests.count(("GET", "me/joinedTeams")) == 1
+
+
+def test_writes_refuse_names_that_only_match_fuzzily():
+    graph = Graph()
+    app = make_app(graph)
+    with pytest.raises(ValueError, match=rf"similar channels: Releases \({RELEASES}\)"):
+        app.send_channel_message("Engineering", "releses", "hi")
+    with pytest.raises(ValueError, match="similar teams: Engineering"):
+        app.send_channel_message("eng", "General", "hi")
+    with pytest.raises(ValueError, match="similar tabs: Team Wiki"):
+        app.update_tab_info("Engineering", "General", "wiki", displayName="Docs")
+    with pytest.raises(ValueError, match="similar users: Ada Lovelace"):
+        app.add_member_to_chat(LAUNCH_CHAT, user="Ada")
+    assert graph.writes() == []
+    # Read tools still accept them.
+    assert app.resolver.channel(ENGINEERING, "releses", exact=False) == RELEASES
+
+
+def test_writes_refuse_topics_when_not_every_chat_is_indexed():
+    graph = Graph()
+    app = make_app(graph)
+    app.topology.max_chats = 1
+    with pytest.raises(ValueError, match="use the chat id"):
+        app.send_chat_message("Product launch", "hi")
+    assert graph.writes() == []
+
+
+def test_chat_message_by_topic():
+    graph = Graph()
+    make_app(graph).send_chat_message("product launch", "hi")
+    assert graph.writes() == [("POST", f"chats/{LAUNCH_CHAT}/messages")]
+
+
+def test_unknown_names_raise_before_writing():
+    graph = Graph()
+    app = make_app(graph)
+    with pytest.raises(ValueError, match="No team matches"):
+        app.send_channel_message("Finance", "General", "hi")
+    with pytest.raises(ValueError, match="No channel matches"):
+        app.send_channel_message("Engineering", "Random", "hi")
+    assert graph.writes() == []
+
+
+def test_tab_by_name():
+    graph = Graph()
+    app = make_app(graph)
+    app.update_tab_info("Engineering", "General", "team wiki", displayName="Wiki")
+    app.update_tab_info("Engineering", "General", "Team Wiki", displayName="Docs")
+    assert (
+        graph.writes()
+        == [("PATCH", f"teams/{ENGINEERING}/channels/{GENERAL}/tabs/{WIKI_TAB}")] * 2
+    )
+    # Renaming a tab forgets the channel's tabs, so the next lookup sees the new name.
+    assert (
+        graph.requests.count(("GET", f"teams/{ENGINEERING}/channels/{GENERAL}/tabs"))
+        == 2
+    )
+
+
+def test_member_by_email_or_display_name():
+    graph = Graph()
+    app = make_app(graph)
+    app.add_member_to_chat("Product launch", user="ada@example.com")
+    app.add_member_to_chat(LAUNCH_CHAT, user="Ada Lovelace", roles=[])
+    assert graph.bodies == [
+        {
+            "@odata.type": "#microsoft.graph.aadUserConversationMember",
+            "user@odata.bind": f"https://graph.microsoft.com/v1.0/users('{ADA}')",
+            "roles": ["owner"],
+        },
+        {
+            "@odata.type": "#microsoft.graph.aadUserConversationMember",
+            "user@odata.bind": f"https://graph.microsoft.com/v1.0/users('{ADA}')",
+            "roles": [],
+        },
+    ]
+    with pytest.raises(ValueError, match="No user has the address"):
+        app.add_member_to_chat(LAUNCH_CHAT, user="nobody@example.com")
+
+
+def test_names_resolve_inside_batches():
+    graph = Graph()
+    app = make_app(graph)
+    with app.batch() as batch:
+        item = batch.add(app.send_channel_message, "Engineering", "Releases", "hi")
+    assert item.result() == {"id": "m1"}
+    assert graph.writes() == [("POST", "$batch")]
+    assert (
+        graph.bodies[0]["requests"][0]["url"]
+        == f"/teams/{ENGINEERING}/channels/{RELEASES}/messages"
+    )
+
+
+def test_broadcast_by_name():
+    graph = Graph()
+    app = make_app(graph)
+    result = app.broadcast_message(
+        [
+            {"team_id": "Engineering", "channel_id": "Releases"},
+            {"team_id": ENGINEERING, "channel_id": RELEASES},
+            {"chat_id": "Product launch"},
+        ],
+        "hi",
+    )
+    assert result["sent"] == 3
+    assert result["results"][0]["target"] == {
+        "team_id": "Engineering",
+        "channel_id": "Releases",
+    }
+    # The same channel given by name and by id is never posted to twice in one envelope.
+    assert graph.writes() == [("POST", "$batch")] * 2
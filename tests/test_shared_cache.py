@@ -0,0 +1,118 @@
+import base64
+import json
+import multiprocessing
+from unittest.mock import MagicMock
+
+import httpx
+from mock_graph import CHAT_ID
+
+from universal_mcp_ms_teams import server
+from universal_mcp_ms_teams.app import MsTeamsApp
+from universal_mcp_ms_teams.shared_cache import SharedResponseCache
+
+CHAT_IDS = [f"19:chat-{n}@thread.v2" for n in range(20)]
+
+
+def token(**claims):
+    payload = base64.urlsafe_b64encode(json.dumps(claims).encode()).decode().rstrip("=")
+    return f"header.{payload}.signature"
+
+
+def make_app(cache, access_token="dummy_access_token"):
+    integration = MagicMock()
+    integration.get_credentials.return_value = {"access_token": access_token}
+    app = MsTeamsApp(integration=integration, cache=cache, coalesce=False)
+    app.requests = []
+
+    def handler(request):
+        app.requests.append((request.method, request.url.path))
+        return httpx.Response(
+            200, json={"id": request.url.path.rsplit("/", 1)[-1], "topic": "x" * 100}
+        )
+
+    app._client = httpx.Client(transport=httpx.MockTransport(handler))
+    return app
+
+
+def worker(path):
+    """One server worker: reads every chat through the shared cache and returns the Graph requests it made."""
+    app = make_app(SharedResponseCache(path))
+    for chat_id in CHAT_IDS * 3:
+        app.get_chat(chat_id)
+    return len(app.requests)
+
+
+def test_a_new_worker_starts_warm(tmp_path):
+    first = make_app(SharedResponseCache(tmp_path / "cache.db"))
+    value = first.get_chat(CHAT_ID)
+    second = make_app(SharedResponseCache(tmp_path / "cache.db"))
+    assert second.get_chat(CHAT_ID) == value
+    assert second.requests == [] and second.cache.stats["hits"] == 1
+
+
+def test_processes_share_the_cache(tmp_path):
+    path = str(tmp_path / "cache.db")
+    with multiprocessing.get_context("spawn").Pool(4) as pool:
+        requests = pool.map(worker, [path] * 4)
+    # Workers racing on the same chat may each fetch it once, but no worker fetches a
+    # chat twice.
+    assert len(CHAT_IDS) <= sum(requests) <= 4 * len(CHAT_IDS)
+    assert len(SharedResponseCache(path)) == len(CHAT_IDS)
+    assert worker(path) == 0
+
+
+def test_writes_invalidate_entries_of_other_workers(tmp_path):
+    first = make_app(SharedResponseCache(tmp_path / "cache.db"))
+    second = make_app(SharedResponseCache(tmp_path / "cache.db"))
+    first.get_chat(CHAT_ID)
+    second.add_member_to_chat(CHAT_ID, displayName="someone")
+    first.get_chat(CHAT_ID)
+    assert first.requests.count(("GET", f"/v1.0/chats/{CHAT_ID}")) == 2
+
+
+def test_expired_and_least_recently_used_entries_are_evicted(tmp_path):
+    clock = [1000.0]
+    cache = SharedResponseCache(
+        tmp_path / "cache.db",
+        max_bytes=350,
+        ttls={"get_chat": 10},
+        clock=lambda: clock[0],
+    )
+    app = make_app(cache)
+    for chat_id in CHAT_IDS[:3]:
+        clock[0] += 1
+        app.get_chat(chat_id)
+    # Three ~140 byte bodies exceed 350 bytes: the oldest one goes.
+    assert cache.stats["evictions"] == 1 and len(cache) == 2
+    clock[0] += 5
+    app.get_chat(CHAT_IDS[2])
+    assert cache.stats["hits"] == 1
+    clock[0] += 60
+    app.get_chat(CHAT_IDS[2])
+    assert cache.stats["expirations"] >= 1
+    assert len(app.requests) == 4
+
+
+def test_entries_are_shared_across_tokens_of_the_same_user(tmp_path):
+    claims = {"tid": "tenant-1", "oid": "user-1"}
+    first = make_app(SharedResponseCache(tmp_path / "cache.db"), token(exp=1, **claims))
+    second = make_app(
+        SharedResponseCache(tmp_path / "cache.db"), token(exp=2, **claims)
+    )
+    other = make_app(
+        SharedResponseCache(tmp_path / "cache.db"),
+        token(exp=1, tid="tenant-1", oid="user-2"),
+    )
+    for app in (first, second, other):
+        app.get_chat(CHAT_ID)
+    assert (len(first.requests), len(second.requests), len(other.requests)) == (1, 0, 1)
+
+
+def test_server_workers_use_the_configured_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("AGENTR_API_KEY", "dummy_api_key")
+    monkeypatch.setattr(server, "_cache", None)
+    monkeypatch.setenv(server.CACHE_PATH_VARIABLE, str(tmp_path / "cache.db"))
+    app = server.create_app()
+    assert isinstance(app.cache, SharedResponseCache) and app.cache.path == str(
+        tmp_path / "cache.db"
+    )
@@ -0,0 +1,124 @@
+import asyncio
+import json
+import subprocess
+import sys
+from unittest.mock import MagicMock
+
+import httpx
+import startup_benchmark
+from loguru import logger
+from mock_graph import CHAT_ID, MockGraph
+from universal_mcp.servers import SingleMCPServer
+
+from universal_mcp_ms_teams import server
+from universal_mcp_ms_teams.async_app import AsyncMsTeamsApp
+from universal_mcp_ms_teams.manifest import (
+    LazyTool,
+    build_manifest,
+    lazy_tools,
+    load_manifest,
+)
+
+
+def make_app(graph):
+    integration = MagicMock()
+    integration.get_credentials.return_value = {"access_token": "dummy_access_token"}
+    app = AsyncMsTeamsApp(integration=integration, http2=False)
+    app._async_client = httpx.AsyncClient(transport=graph.async_transport())
+    return app
+
+
+def test_manifest_is_current():
+    manifest = load_manifest()
+    assert manifest is not None, (
+        "Regenerate it with: python -m universal_mcp_ms_teams.manifest"
+    )
+    # Only the tool modules are hashed, so also check that nothing else changed a
+    # schema.
+    assert manifest["tools"] == json.loads(json.dumps(build_manifest()["tools"])), (
+        "Regenerate it with: python -m universal_mcp_ms_teams.manifest"
+    )
+
+
+def test_stale_manifest_is_ignored_with_a_warning(tmp_path):
+    path = tmp_path / "tool_manifest.json"
+    path.write_text(json.dumps({**load_manifest(), "source_hash": "outdated"}))
+    warnings = []
+    sink = logger.add(warnings.append, level="WARNING")
+    try:
+        assert load_manifest(path) is None
+    finally:
+        logger.remove(sink)
+    assert len(warnings) == 1 and "stale" in warnings[0]
+
+
+def test_import_builds_nothing():
+    code = "import json, sys, universal_mcp_ms_teams.server; print(json.dumps(sorted(m for m in sys.modules if m.startswith(('universal_mcp', 'httpx')))))"
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        env=startup_benchmark._environment(),
+        check=True,
+    )
+    assert json.loads(result.stdout) == [
+        "universal_mcp_ms_teams",
+        "universal_mcp_ms_teams.server",
+    ]
+
+
+def test_manifest_tools_match_introspection():
+    introspected = SingleMCPServer(
+        app_instance=make_app(MockGraph())
+    )._tool_manager.list_tools()
+    tools = lazy_tools(build_manifest(), lambda: None)
+    assert [
+        (tool.name, tool.description, tool.inputSchema) for tool in introspected
+    ] == [(tool.name, tool.description, tool.parameters) for tool in tools]
+
+
+def test_server_registers_from_manifest_without_building_the_app(monkeypatch):
+    monkeypatch.setattr(server, "_app", None)
+    monkeypatch.setattr(
+        server,
+        "create_app",
+        MagicMock(side_effect=AssertionError("app built at startup")),
+    )
+    mcp = server.create_server()
+    tools = mcp._tool_manager.get_tools_by_app()
+    assert tools and all(isinstance(tool, LazyTool) for tool in tools)
+    assert {tool.name for tool in tools} == {
+        f"microsoft-teams_{entry['name']}" for entry in load_manifest()["tools"]
+    }
+
+
+def test_lazy_tool_builds_the_app_on_first_call():
+    graph = MockGraph()
+    built = []
+
+    def factory():
+        if not built:
+            built.append(make_app(graph))
+        return built[0]
+
+    tools = {tool.name: tool for tool in lazy_tools(load_manifest(), factory)}
+    get_chat = tools["microsoft-teams_get_chat"]
+    assert not built and get_chat.fn_metadata is None
+
+    async def main():
+        first = await get_chat.run({"chat_id": CHAT_ID})
+        second = await tools["microsoft-teams_get_chat"].run(
+            {"chat_id": CHAT_ID, "profile": "minimal"}
+        )
+        await built[0].aclose()
+        return first, second
+
+    first, second = asyncio.run(main())
+    assert first["description"] == "synthetic" and second == {"id": CHAT_ID}
+    assert len(built) == 1 and graph.requests == 2
+
+
+def test_startup_stays_within_budget():
+    report = startup_benchmark.run(repeat=1)
+    assert report.registration_ms["manifest"] < report.registration_ms["introspected"]
+    assert report.within_budget["registration"] and report.within_budget["import"]
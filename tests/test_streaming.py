@@ -0,0 +1,122 @@
+import asyncio
+import json
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+from mock_graph import MockGraph
+
+from universal_mcp_ms_teams.app import MsTeamsApp
+from universal_mcp_ms_teams.async_app import AsyncMsTeamsApp
+from universal_mcp_ms_teams.streaming import CollectionDecoder
+
+PAGE = {
+    "@odata.context": "ctx",
+    "value": [{"id": "1", "n": 12345, "text": "héllo ✓"}, [1, 2.5], "x", None, True],
+    "@odata.nextLink": "next",
+}
+
+
+def chunked(data: bytes, size: int):
+    return (data[i : i + size] for i in range(0, len(data), size))
+
+
+@pytest.mark.parametrize("size", [1, 3, 7, 1024])
+def test_decoder_yields_items_across_any_chunking(size):
+    decoder = CollectionDecoder(
+        chunked(json.dumps(PAGE, ensure_ascii=False).encode(), size)
+    )
+    assert list(decoder) == PAGE["value"]
+    assert decoder.properties == {"@odata.context": "ctx", "@odata.nextLink": "next"}
+
+
+def test_decoder_yields_before_the_body_is_complete():
+    received = []
+
+    def body():
+        yield b'{"value": [{"id": "1"}, '
+        received.append("second chunk")
+        yield b'{"id": "2"}]}'
+
+    items = iter(CollectionDecoder(body()))
+    assert next(items) == {"id": "1"}
+    assert received == []
+    assert next(items) == {"id": "2"}
+
+
+@pytest.mark.parametrize("body", [b'{"value": [1, 2', b'{"value": [1 2]}', b"[1]", b""])
+def test_decoder_rejects_malformed_bodies(body):
+    with pytest.raises(json.JSONDecodeError):
+        list(CollectionDecoder(chunked(body, 2)))
+
+
+def make_app(graph, cls=MsTeamsApp):
+    integration = MagicMock()
+    integration.get_credentials.return_value = {"access_token": "dummy_access_token"}
+    app = cls(integration=integration)
+    app._client = httpx.Client(transport=graph.transport())
+    return app
+
+
+def test_streamed_iteration_follows_next_links():
+    graph = MockGraph(collection_size=45)
+    messages = make_app(graph).iter_chat_messages(chat_id="c1", top=20, stream=True)
+    assert [message["id"] for message in messages] == [str(i) for i in range(45)]
+    assert messages.pages == 3
+    assert messages.next_link is None and not messages.truncated
+
+
+def test_streamed_iteration_budgets():
+    graph = MockGraph(collection_size=45)
+    app = make_app(graph)
+    mid_page = app.iter_chat_replies(
+        chat_id="c1", chatMessage_id="m1", top=20, stream=True, max_items=25
+    )
+    assert len(list(mid_page)) == 25
+    assert mid_page.next_link is None and mid_page.truncated
+    page_boundary = app.iter_chat_messages(
+        chat_id="c1", top=20, stream=True, max_items=20
+    )
+    assert len(list(page_boundary)) == 20
+    assert "skiptoken=20" in page_boundary.next_link
+    assert (
+        app.list_chat_messages(
+            chat_id="c1", top=20, stream=True, all=True, max_pages=1
+        )["@odata.nextLink"]
+        == page_boundary.next_link
+    )
+
+
+def test_streamed_collection_applies_projection():
+    graph = MockGraph(collection_size=30, message_bytes=4)
+    page = make_app(graph).list_chat_messages(
+        chat_id="c1", top=20, stream=True, all=True, profile="minimal"
+    )
+    assert len(page["value"]) == 30
+    assert page["value"][0]["body"] == {"contentType": "text", "content": "xxxx"}
+
+
+def test_streamed_error_is_raised():
+    app = make_app(MockGraph())
+    app._client = httpx.Client(
+        transport=httpx.MockTransport(
+            lambda request: httpx.Response(404, json={"error": {"code": "NotFound"}})
+        )
+    )
+    with pytest.raises(httpx.HTTPStatusError):
+        list(app.iter_chat_messages(chat_id="c1", stream=True))
+
+
+def test_async_app_streams_through_the_event_loop():
+    graph = MockGraph(collection_size=45)
+    app = make_app(graph, AsyncMsTeamsApp)
+    app._async_client = httpx.AsyncClient(transport=graph.async_transport())
+
+    async def main():
+        page = await app.arun(
+            app.list_chat_messages, chat_id="c1", top=20, stream=True, all=True
+        )
+        await app.aclose()
+        return page
+
+    assert len(asyncio.run(main())["value"]) == 45
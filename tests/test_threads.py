@@ -0,0 +1,132 @@
+import threading
+import time
+from unittest.mock import MagicMock
+
+import httpx
+from mock_graph import CHANNEL_ID, TEAM_ID
+
+from universal_mcp_ms_teams.app import MsTeamsApp
+from universal_mcp_ms_teams.threads import EXPANDED_REPLY_LIMIT
+
+MESSAGES = f"/v1.0/teams/{TEAM_ID}/channels/{CHANNEL_ID}/messages"
+
+
+def message(id, minute, html=False):
+    content = f"<p>message {id}</p>" if html else f"message {id}"
+    return {
+        "id": id,
+        "createdDateTime": f"2024-01-01T10:{minute:02d}:00Z",
+        "body": {"contentType": "html" if html else "text", "content": content},
+        "@odata.etag": id,
+    }
+
+
+class ThreadGraph:
+    """Channel whose roots embed their replies, one of them with more replies than Graph embeds."""
+
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.requests = []
+        self.in_flight = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+        # 'r1' has replies out of order; 'big' embeds a truncated reply list.
+        self.replies = {
+            "r1": [message("r1-b", 5), message("r1-a", 2)],
+            "r2": [],
+            "big": [
+                message(f"big-{i:04d}", i % 60)
+                for i in range(EXPANDED_REPLY_LIMIT + 30)
+            ],
+        }
+
+    def __call__(self, request):
+        with self._lock:
+            self.requests.append((request.url.path, dict(request.url.params)))
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        try:
+            time.sleep(self.latency)
+            return self.route(request)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    def route(self, request):
+        path = request.url.path.removeprefix(MESSAGES + "/")
+        root, _, rest = path.partition("/")
+        if root not in self.replies:
+            return httpx.Response(404, json={"error": {"code": "NotFound"}})
+        replies = self.replies[root]
+        if rest == "replies":
+            skip = int(request.url.params.get("$skiptoken", 0))
+            top = int(request.url.params.get("$top", 50))
+            page = {"value": replies[skip : skip + top]}
+            if skip + top < len(replies):
+                page["@odata.nextLink"] = str(
+                    request.url.copy_merge_params({"$skiptoken": skip + top})
+                )
+            return httpx.Response(200, json=page)
+        assert request.url.params["$expand"] == "replies"
+        return httpx.Response(
+            200,
+            json={
+                **message(root, 0, html=True),
+                "replies": replies[:EXPANDED_REPLY_LIMIT],
+                "replies@odata.context": "ctx",
+            },
+        )
+
+
+def make_app(graph):
+    integration = MagicMock()
+    integration.get_credentials.return_value = {"access_token": "dummy_access_token"}
+    app = MsTeamsApp(integration=integration)
+    app._client = httpx.Client(transport=httpx.MockTransport(graph))
+    return app
+
+
+def test_thread_in_one_request_with_replies_in_order():
+    graph = ThreadGraph()
+    thread = make_app(graph).get_thread(TEAM_ID, CHANNEL_ID, "r1")
+    assert [reply["id"] for reply in thread["replies"]] == ["r1-a", "r1-b"]
+    assert thread["message"]["id"] == "r1" and "replies" not in thread["message"]
+    assert thread["replyCount"] == 2
+    assert len(graph.requests) == 1
+
+
+def test_long_thread_is_completed_from_the_replies_collection():
+    graph = ThreadGraph()
+    thread = make_app(graph).get_thread(TEAM_ID, CHANNEL_ID, "big", profile="minimal")
+    ids = [reply["id"] for reply in thread["replies"]]
+    assert len(ids) == len(set(ids)) == EXPANDED_REPLY_LIMIT + 30
+    assert ids == sorted(ids, key=lambda id: (f"{int(id[4:]) % 60:02d}", id))
+    assert thread["message"]["body"] == {
+        "contentType": "text",
+        "content": "message big",
+    }
+    assert "@odata.etag" not in thread["replies"][0]
+    assert graph.requests[1] == (f"{MESSAGES}/big/replies", {"$top": "50"})
+
+
+def test_threads_are_fetched_concurrently_in_order_with_errors_reported():
+    graph = ThreadGraph(latency=0.05)
+    result = make_app(graph).get_threads(
+        TEAM_ID, CHANNEL_ID, ["r2", "missing", "r1", "r2"]
+    )
+    assert [thread["id"] for thread in result["value"]] == ["r2", "r1"]
+    assert (
+        result["errors"][0]["id"] == "missing" and result["errors"][0]["status"] == 404
+    )
+    assert len(graph.requests) == 3
+    assert graph.peak == 3
+
+
+def test_threads_feed_the_local_index():
+    graph = ThreadGraph()
+    app = make_app(graph)
+    app.index = MagicMock()
+    app.get_thread(TEAM_ID, CHANNEL_ID, "r1")
+    [(messages,), scope] = app.index.add.call_args
+    assert [m["id"] for m in messages] == ["r1", "r1-a", "r1-b"]
+    assert scope == {"team_id": TEAM_ID, "channel_id": CHANNEL_ID}
@@ -0,0 +1,121 @@
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from universal_mcp_ms_teams.app import MsTeamsApp
+from universal_mcp_ms_teams.request import GraphRequest
+from universal_mcp_ms_teams.throttling import (
+    RetryPolicy,
+    ThrottleScheduler,
+    TokenBucket,
+    resource_of,
+)
+
+URL = "https://graph.microsoft.com/v1.0/chats/c1"
+
+
+def responder(*statuses, headers=None):
+    responses = iter(statuses)
+
+    def send(request):
+        return httpx.Response(
+            next(responses),
+            headers=headers or {},
+            json={},
+            request=httpx.Request(request.method, request.url),
+        )
+
+    return send
+
+
+def test_retries_429_honoring_retry_after():
+    sleeps = []
+    scheduler = ThrottleScheduler(sleep=sleeps.append)
+    response = scheduler.execute(
+        GraphRequest("POST", URL),
+        responder(429, 429, 201, headers={"Retry-After": "3"}),
+    )
+    assert response.status_code == 201
+    assert sleeps == [3.0, 3.0]
+    assert scheduler.stats == {
+        "requests": 3,
+        "retries": 2,
+        "throttled_responses": 2,
+        "throttle_wait_seconds": 6.0,
+        "queue_wait_seconds": pytest.approx(0, abs=0.1),
+    }
+
+
+def test_does_not_retry_non_idempotent_503():
+    scheduler = ThrottleScheduler(sleep=lambda delay: None)
+    assert (
+        scheduler.execute(GraphRequest("POST", URL), responder(503, 200)).status_code
+        == 503
+    )
+    assert (
+        scheduler.execute(GraphRequest("GET", URL), responder(503, 200)).status_code
+        == 200
+    )
+
+
+def test_gives_up_after_max_retries():
+    sleeps = []
+    scheduler = ThrottleScheduler(
+        retry=RetryPolicy(max_retries=2, backoff_base=1, backoff_max=1.5),
+        sleep=sleeps.append,
+    )
+    assert (
+        scheduler.execute(
+            GraphRequest("GET", URL), responder(429, 429, 429, 200)
+        ).status_code
+        == 429
+    )
+    assert len(sleeps) == 2
+    assert all(0 <= delay <= 1.5 for delay in sleeps)
+
+
+def test_token_bucket_spaces_requests():
+    now = [0.0]
+    bucket = TokenBucket(rate=2, capacity=2, clock=lambda: now[0])
+    assert [bucket.reserve() for _ in range(4)] == [0.0, 0.0, 0.5, 1.0]
+    now[0] = 10.0
+    assert bucket.reserve() == 0.0
+
+
+def test_resource_of():
+    assert resource_of(URL) == "chats"
+    assert resource_of("https://graph.microsoft.com/v1.0/teams/t1/channels") == "teams"
+
+
+def test_app_retries_throttled_batch_items():
+    app = MsTeamsApp(
+        integration=MagicMock(), throttle=ThrottleScheduler(sleep=lambda delay: None)
+    )
+    attempts = []
+
+    def send(request):
+        attempts.append([sub_request["id"] for sub_request in request.data["requests"]])
+        responses = [
+            {
+                "id": sub_request["id"],
+                "status": 429
+                if len(attempts) == 1 and sub_request["id"] == "2"
+                else 200,
+                "headers": {"Retry-After": "1"},
+                "body": {"id": sub_request["id"]},
+            }
+            for sub_request in request.data["requests"]
+        ]
+        return httpx.Response(
+            200,
+            json={"responses": responses},
+            request=httpx.Request("POST", request.url),
+        )
+
+    app._send = MagicMock(side_effect=send)
+    with app.batch() as batch:
+        items = [batch.add(app.get_chat, chat_id) for chat_id in ("a", "b", "c")]
+
+    assert attempts == [["1", "2", "3"], ["2"]]
+    assert [item.result()["id"] for item in items] == ["1", "2", "3"]
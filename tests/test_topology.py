@@ -0,0 +1,191 @@
+import threading
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+from mock_graph import MockGraph
+
+from universal_mcp_ms_teams.app import MsTeamsApp
+from universal_mcp_ms_teams.topology import TopologyCache
+
+TEAMS = {"t1": "Engineering", "t2": "Sales", "t3": "sales"}
+CHANNELS = {
+    "t1": {"c1": "General", "c2": "Release  Planning"},
+    "t2": {"c3": "General"},
+    "t3": {"c4": "General"},
+}
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def handler(requests: list[str], teams: dict[str, str] = TEAMS):
+    def handle(request: httpx.Request) -> httpx.Response:
+        path = request.url.path.removeprefix("/v1.0/")
+        requests.append(path)
+        segments = path.split("/")
+        if path == "me/joinedTeams":
+            return httpx.Response(
+                200,
+                json={
+                    "value": [
+                        {"id": id, "displayName": name} for id, name in teams.items()
+                    ]
+                },
+            )
+        if path == "chats":
+            return httpx.Response(
+                200,
+                json={
+                    "value": [
+                        {"id": "chat-1", "topic": "Launch", "chatType": "group"},
+                        {"id": "chat-2", "topic": None, "chatType": "oneOnOne"},
+                    ]
+                },
+            )
+        if segments[-1] == "channels":
+            if segments[1] == "t3":
+                return httpx.Response(403, json={"error": {"code": "Forbidden"}})
+            return httpx.Response(
+                200,
+                json={
+                    "value": [
+                        {"id": id, "displayName": name}
+                        for id, name in CHANNELS[segments[1]].items()
+                    ]
+                },
+            )
+        if segments[-1] == "primaryChannel":
+            return httpx.Response(200, json={"id": next(iter(CHANNELS[segments[1]]))})
+        return httpx.Response(404, json={"error": {"code": "NotFound"}})
+
+    return handle
+
+
+def make_app(transport):
+    integration = MagicMock()
+    integration.get_credentials.return_value = {"access_token": "dummy_access_token"}
+    app = MsTeamsApp(integration=integration)
+    app._client = httpx.Client(transport=transport)
+    return app
+
+
+def test_warm_indexes_teams_channels_and_chats():
+    requests = []
+    app = make_app(httpx.MockTransport(handler(requests)))
+    topology = app.topology.warm()
+    assert topology.team_ids(" engineering ") == ["t1"]
+    assert topology.channel_ids("t1", "release planning") == ["c2"]
+    assert topology.primary_channels == {"t1": "c1", "t2": "c3"}
+    assert topology.chat_ids("launch") == ["chat-1"]
+    assert "t3" in topology.errors
+    assert requests.count("me/joinedTeams") == 1 and len(requests) == 1 + 2 * 2 + 1 + 1
+
+
+def test_resolution_is_served_from_memory():
+    requests = []
+    app = make_app(httpx.MockTransport(handler(requests)))
+    assert app.topology.team_id("Engineering") == "t1"
+    assert app.topology.channel_id("t1", "General") == "c1"
+    assert app.topology.primary_channel_id("t2") == "c3"
+    assert app.topology.chat_id("Launch") == "chat-1"
+    assert requests.count("me/joinedTeams") == 1
+
+
+def test_ambiguous_and_unknown_names_raise():
+    app = make_app(httpx.MockTransport(handler([])))
+    with pytest.raises(ValueError, match=r"Sales \(t2\), sales \(t3\)"):
+        app.topology.team_id("Sales")
+    with pytest.raises(ValueError, match="No channel matches"):
+        app.topology.channel_id("t1", "Random")
+
+
+def test_missing_name_triggers_one_rebuild_of_an_old_snapshot():
+    requests, teams = [], dict(TEAMS)
+    clock = Clock()
+    app = make_app(httpx.MockTransport(handler(requests, teams)))
+    app.topology = TopologyCache(app, clock=clock)
+    app.topology.warm()
+    teams["t4"] = "Design"
+    CHANNELS["t4"] = {"c5": "General"}
+    try:
+        with pytest.raises(ValueError):
+            app.topology.team_id("Design")
+        assert requests.count("me/joinedTeams") == 1
+        clock.now = 60
+        assert app.topology.team_id("Design") == "t4"
+        assert requests.count("me/joinedTeams") == 2
+    finally:
+        del CHANNELS["t4"]
+
+
+def test_stale_snapshot_is_served_while_refreshing_in_background():
+    requests = []
+    clock = Clock()
+    app = make_app(httpx.MockTransport(handler(requests)))
+    app.topology = TopologyCache(app, ttl=10, clock=clock)
+    first = app.topology.get()
+    clock.now = 11
+    assert app.topology.get() is first
+    for thread in threading.enumerate():
+        if thread.name == "ms-teams-topology-refresh":
+            thread.join()
+    assert app.topology.get() is not first
+    assert requests.count("me/joinedTeams") == 2
+
+
+def test_stale_readers_start_one_refresh():
+    clock = Clock()
+    graph = MockGraph(collection_size=5, latency=0.01)
+    app = make_app(graph.transport())
+    app.topology = TopologyCache(app, ttl=10, clock=clock)
+    app.topology.get()
+    clock.now = 11
+    threads = [threading.Thread(target=app.topology.get) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    for thread in threading.enumerate():
+        if thread.name == "ms-teams-topology-refresh":
+            thread.join()
+    assert graph.paths.count(("GET", "/v1.0/me/joinedTeams")) == 2
+    # The refresh let go of its lock, so the next stale read can start another.
+    assert app.topology.warm_in_background() is not None
+
+
+def test_chats_beyond_the_budget_are_recorded_as_errors():
+    app = make_app(httpx.MockTransport(handler([])))
+    app.topology = TopologyCache(app, max_chats=1)
+    topology = app.topology.warm()
+    assert list(topology.chats) == ["chat-1"]
+    assert topology.errors["chats"] == "Only the first 1 chats are indexed."
+
+
+def test_concurrent_first_use_builds_once():
+    graph = MockGraph(collection_size=5, latency=0.01)
+    app = make_app(graph.transport())
+    threads = [threading.Thread(target=app.topology.get) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert graph.paths.count(("GET", "/v1.0/me/joinedTeams")) == 1
+
+
+def test_get_topology_tool():
+    app = make_app(httpx.MockTransport(handler([])))
+    result = app.get_topology()
+    engineering = next(team for team in result["teams"] if team["id"] == "t1")
+    assert engineering["primaryChannelId"] == "c1"
+    assert [channel["displayName"] for channel in engineering["channels"]] == [
+        "General",
+        "Release  Planning",
+    ]
+    assert [chat["id"] for chat in result["chats"]] == ["chat-1", "chat-2"]
+    assert "t3" in result["errors"]
@@ -0,0 +1,367 @@
+import asyncio
+import json
+import mmap
+import threading
+import uuid
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+from mock_graph import CHANNEL_ID, CHAT_ID, TEAM_ID
+
+from universal_mcp_ms_teams.app import MsTeamsApp
+from universal_mcp_ms_teams.async_app import AsyncMsTeamsApp
+from universal_mcp_ms_teams.throttling import RetryPolicy, ThrottleScheduler
+from universal_mcp_ms_teams.uploads import CHUNK_ALIGNMENT, Uploader, UploadError
+
+CONTENT = bytes(range(251)) * 50_000
+DRIVE_ID = "b!channel-drive"
+FOLDER_ID = "01FOLDER"
+SENDER_ID = "sender-user-id"
+MEMBER_ID = "member-user-id"
+
+
+class UploadGraph:
+    """
+    Graph's drive upload sessions: a session accepts only the range it expects next, and
+    the fragment ending the file creates the item.
+    """
+
+    def __init__(self, fail_once=(), failure=None):
+        # Fragment offsets answered with `failure` (503 by default) the first time they
+        # arrive.
+        self.fail_once = set(fail_once)
+        self.failure = failure or (lambda: httpx.Response(503))
+        self.sessions = {}
+        self.items = {}
+        self.requests = []
+        self.messages = []
+        self.invites = []
+        self._lock = threading.Lock()
+
+    def __call__(self, request):
+        with self._lock:
+            self.requests.append(
+                (
+                    request.method,
+                    request.url.host,
+                    request.url.path,
+                    request.headers.get("Authorization"),
+                )
+            )
+        if request.url.host == "upload.example.com":
+            return self.upload(request)
+        path = request.url.path.removeprefix("/v1.0")
+        if path == f"/teams/{TEAM_ID}/channels/{CHANNEL_ID}/filesFolder":
+            return httpx.Response(
+                200,
+                json={
+                    "id": FOLDER_ID,
+                    "name": "General",
+                    "parentReference": {"driveId": DRIVE_ID},
+                },
+            )
+        if path.endswith(":/createUploadSession"):
+            session = uuid.uuid4().hex
+            location = path.removesuffix(":/createUploadSession").rsplit("/", 1)[-1]
+            behavior = json.loads(request.content)["item"][
+                "@microsoft.graph.conflictBehavior"
+            ]
+            self.sessions[session] = {
+                "path": path,
+                "name": location,
+                "behavior": behavior,
+                "chunks": {},
+                "total": None,
+            }
+            return httpx.Response(
+                200,
+                json={
+                    "uploadUrl": f"https://upload.example.com/sessions/{session}",
+                    "expirationDateTime": "2030-01-01T00:00:00Z",
+                },
+            )
+        if path.endswith(("/members", "/invite")):
+            return self.share(request, path)
+        if path.endswith("/messages") and request.method == "POST":
+            message = {"id": str(len(self.messages) + 1), **json.loads(request.content)}
+            self.messages.append((path, message))
+            return httpx.Response(201, json=message)
+        return httpx.Response(404, json={"error": {"code": "itemNotFound"}})
+
+    def share(self, request, path):
+        if path.endswith("/members"):
+            return httpx.Response(
+                200,
+                json={
+                    "value": [
+                        {"id": "m1", "userId": SENDER_ID},
+                        {"id": "m2", "userId": MEMBER_ID},
+                    ]
+                },
+            )
+        self.invites.append((path, json.loads(request.content)))
+        return httpx.Response(200, json={"value": [{"id": "p1", "roles": ["read"]}]})
+
+    def missing(self, session):
+        expected, offset = [], 0
+        for start, chunk in sorted(session["chunks"].items()):
+            if start > offset:
+                expected.append(f"{offset}-{start - 1}")
+            offset = max(offset, start + len(chunk))
+        if session["total"] is None or offset < session["total"]:
+            expected.append(f"{offset}-")
+        return expected
+
+    def upload(self, request):
+        session = self.sessions.get(request.url.path.rsplit("/", 1)[-1])
+        if session is None:
+            return httpx.Response(404, json={"error": {"code": "itemNotFound"}})
+        if request.method == "GET":
+            return httpx.Response(
+                200, json={"nextExpectedRanges": self.missing(session)}
+            )
+        if request.method == "DELETE":
+            del self.sessions[request.url.path.rsplit("/", 1)[-1]]
+            return httpx.Response(204)
+        return self.put(session, request)
+
+    def put(self, session, request):
+        span, total = request.headers["Content-Range"].removeprefix("bytes ").split("/")
+        start, end = (int(value) for value in span.split("-"))
+        with self._lock:
+            if start in self.fail_once:
+                self.fail_once.discard(start)
+                return self.failure()
+            expected = self.missing(session)[0]
+            if start != int(expected.split("-")[0]):
+                return httpx.Response(
+                    416,
+                    json={
+                        "error": {
+                            "code": "invalidRange",
+                            "message": f"Expected a range starting at {expected}",
+                        }
+                    },
+                )
+            session["total"] = int(total)
+            session["chunks"][start] = request.content
+            assert len(request.content) == end - start + 1
+            if end + 1 < int(total):
+                return httpx.Response(
+                    202, json={"nextExpectedRanges": self.missing(session)}
+                )
+            content = b"".join(chunk for _, chunk in sorted(session["chunks"].items()))
+            item_id = (
+                self.items.get(session["path"], {}).get("id")
+                if session["behavior"] == "replace"
+                else None
+            )
+            guid = item_id or str(uuid.uuid4()).upper()
+            item = {
+                "id": guid,
+                "name": session["name"],
+                "size": len(content),
+                "eTag": f'"{{{guid}}},1"',
+                "webUrl": f"https://contoso.sharepoint.com/files/{session['name']}",
+                "createdBy": {"user": {"id": SENDER_ID}},
+            }
+            self.items[session["path"]] = {**item, "content": content}
+            return httpx.Response(201, json=item)
+
+
+def make_app(graph, throttle=None):
+    integration = MagicMock()
+    integration.get_credentials.return_value = {"access_token": "dummy_access_token"}
+    app = MsTeamsApp(integration=integration, throttle=throttle)
+    app._client = httpx.Client(transport=httpx.MockTransport(graph))
+    return app
+
+
+@pytest.fixture
+def report(tmp_path):
+    path = tmp_path / "report.bin"
+    path.write_bytes(CONTENT)
+    return path
+
+
+def test_file_is_uploaded_in_chunks_and_posted_to_a_chat(report):
+    graph = UploadGraph()
+    app = make_app(graph)
+    app.send_file_message(str(report), chat_id=CHAT_ID, content="Weekly report")
+    [item] = graph.items.values()
+    assert item["content"] == CONTENT
+    assert [
+        method for method, host, _, _ in graph.requests if host == "upload.example.com"
+    ] == ["PUT"] * 3
+    # The other members can open the file in the sender's OneDrive.
+    [(path, invite)] = graph.invites
+    assert path == f"/me/drive/items/{item['id']}/invite"
+    assert invite == {
+        "recipients": [{"objectId": MEMBER_ID}],
+        "roles": ["read"],
+        "requireSignIn": True,
+        "sendInvitation": False,
+    }
+    [(path, message)] = graph.messages
+    assert path == f"/chats/{CHAT_ID}/messages"
+    [attachment] = message["attachments"]
+    assert attachment == {
+        "id": item["id"].lower(),
+        "contentType": "reference",
+        "contentUrl": item["webUrl"],
+        "name": "report.bin",
+    }
+    assert (
+        message["body"]["content"]
+        == f'Weekly report<attachment id="{attachment["id"]}"></attachment>'
+    )
+    assert any(
+        path.startswith("/v1.0/me/drive/root:/Microsoft Teams Chat Files/report.bin:")
+        for _, _, path, _ in graph.requests
+    )
+
+
+def test_fragments_never_carry_the_graph_token(report):
+    graph = UploadGraph()
+    make_app(graph).send_file_message(
+        str(report), team_id=TEAM_ID, channel_id=CHANNEL_ID
+    )
+    assert all(
+        auth is None
+        for _, host, _, auth in graph.requests
+        if host == "upload.example.com"
+    )
+    assert all(
+        auth == "Bearer dummy_access_token"
+        for _, host, _, auth in graph.requests
+        if host == "graph.microsoft.com"
+    )
+    assert next(iter(graph.items)).startswith(
+        f"/drives/{DRIVE_ID}/items/{FOLDER_ID}:/report.bin:"
+    )
+    assert graph.invites == []
+
+
+def test_async_app_fragments_never_carry_the_graph_token(report):
+    graph = UploadGraph()
+    integration = MagicMock()
+    integration.get_credentials.return_value = {"access_token": "dummy_access_token"}
+    app = AsyncMsTeamsApp(integration=integration, http2=False)
+    app._async_client = httpx.AsyncClient(transport=httpx.MockTransport(graph))
+
+    async def main():
+        async with app:
+            return await app.arun(app.send_file_message, str(report), chat_id=CHAT_ID)
+
+    asyncio.run(main())
+    fragments = [
+        auth
+        for method, host, _, auth in graph.requests
+        if host == "upload.example.com" and method == "PUT"
+    ]
+    assert fragments and all(auth is None for auth in fragments)
+    assert all(
+        auth == "Bearer dummy_access_token"
+        for _, host, _, auth in graph.requests
+        if host == "graph.microsoft.com"
+    )
+
+
+def test_failed_fragments_are_resumed_from_the_expected_ranges():
+    graph = UploadGraph(fail_once={CHUNK_ALIGNMENT, 3 * CHUNK_ALIGNMENT})
+    uploader = Uploader(
+        make_app(graph, ThrottleScheduler(retry=RetryPolicy(max_retries=0))),
+        chunk_size=CHUNK_ALIGNMENT,
+    )
+    item = uploader.upload(
+        CONTENT,
+        f"https://graph.microsoft.com/v1.0/drives/{DRIVE_ID}/items/{FOLDER_ID}:/report.bin:",
+    )
+    assert (
+        graph.items[
+            f"/drives/{DRIVE_ID}/items/{FOLDER_ID}:/report.bin:/createUploadSession"
+        ]["content"]
+        == CONTENT
+    )
+    assert item["size"] == len(CONTENT)
+    assert [
+        method for method, host, _, _ in graph.requests if host == "upload.example.com"
+    ].count("GET") == 2
+
+
+def test_throttled_fragments_wait_for_retry_after():
+    sleeps = []
+    graph = UploadGraph(
+        fail_once={CHUNK_ALIGNMENT},
+        failure=lambda: httpx.Response(429, headers={"Retry-After": "7"}),
+    )
+    uploader = Uploader(
+        make_app(graph, ThrottleScheduler(sleep=sleeps.append)),
+        chunk_size=CHUNK_ALIGNMENT,
+    )
+    uploader.upload(CONTENT, uploader.chat_item_url("report.bin"))
+    assert sleeps == [7.0]
+    assert "GET" not in [
+        method for method, host, _, _ in graph.requests if host == "upload.example.com"
+    ]
+
+
+def test_memory_mapped_buffer_is_uploaded(report):
+    graph = UploadGraph()
+    uploader = Uploader(make_app(graph), chunk_size=CHUNK_ALIGNMENT)
+    with (
+        open(report, "rb") as file,
+        mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+    ):
+        uploader.upload(mapped, uploader.chat_item_url("report.bin"))
+    [item] = graph.items.values()
+    assert item["content"] == CONTENT
+
+
+def test_session_is_cancelled_when_resumes_run_out():
+    graph = UploadGraph(fail_once={0})
+    uploader = Uploader(
+        make_app(graph, ThrottleScheduler(retry=RetryPolicy(max_retries=0))),
+        chunk_size=CHUNK_ALIGNMENT,
+        max_resumes=0,
+    )
+    with pytest.raises(UploadError):
+        uploader.upload(CONTENT, uploader.chat_item_url("report.bin"))
+    assert graph.sessions == {} and graph.items == {}
+
+
+def test_idempotent_retry_keeps_the_attachment(report, tmp_path):
+    graph = UploadGraph()
+    app = make_app(graph)
+    first = app.send_file_message(
+        str(report), chat_id=CHAT_ID, idempotency_key="report-1"
+    )
+    second = app.send_file_message(
+        str(report), chat_id=CHAT_ID, idempotency_key="report-1"
+    )
+    assert second == first and len(graph.messages) == 1
+    # The retry found the key already sent before uploading or sharing anything again.
+    assert [
+        method for method, host, _, _ in graph.requests if host == "upload.example.com"
+    ].count("PUT") == 3
+    assert len(graph.invites) == 1
+    (tmp_path / "other.bin").write_bytes(b"other")
+    with pytest.raises(ValueError):
+        app.send_file_message(
+            str(tmp_path / "other.bin"),
+            chat_id=CHAT_ID,
+            name="report.bin",
+            idempotency_key="report-1",
+        )
+
+
+def test_invalid_arguments(report, tmp_path):
+    app = make_app(UploadGraph())
+    with pytest.raises(ValueError):
+        app.send_file_message(str(report))
+    with pytest.raises(ValueError):
+        Uploader(app, chunk_size=CHUNK_ALIGNMENT + 1)
+    (tmp_path / "empty.txt").write_bytes(b"")
+    with pytest.raises(ValueError):
+        app.send_file_message(str(tmp_path / "empty.txt"), chat_id=CHAT_ID)